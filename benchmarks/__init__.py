@@ -0,0 +1,2 @@
+# quiz_project/benchmarks/__init__.py
+# Plik inicjalizujący pakiet 'benchmarks'. Skrypty uruchamiamy przez: python -m benchmarks.<nazwa>
@@ -0,0 +1,86 @@
+# quiz_project/benchmarks/bench_charts.py
+"""
+Compares the results-chart backends: renders per second and peak RSS.
+
+Each backend is measured in a fresh subprocess, so the cost of importing
+matplotlib is included in its memory figure.
+
+Usage:
+    python -m benchmarks.bench_charts [--renders 50] [--backends matplotlib svg png]
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, PROJECT_ROOT)
+
+
+def _peak_rss_kb() -> int:
+    """Returns the peak resident set size of this process in kilobytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak # macOS raportuje w bajtach
+
+
+def run_worker(backend: str, renders: int) -> dict:
+    """
+    Renders 'renders' charts with one backend in the current process.
+
+    Args:
+        backend (str): Chart backend name.
+        renders (int): Number of charts to render.
+
+    Returns:
+        dict: Measured renders per second and peak RSS.
+    """
+    rss_before = _peak_rss_kb()
+    start = time.perf_counter()
+    from quiz_player.charts import get_chart_renderer
+    renderer, _ = get_chart_renderer(backend)
+    with tempfile.TemporaryDirectory() as reports_directory:
+        first_render = None
+        for i in range(renders):
+            renderer(i % 7 + 1, i % 5, f"Benchmark {i}", reports_directory)
+            if first_render is None:
+                first_render = time.perf_counter() - start # Zawiera koszt importu backendu
+    elapsed = time.perf_counter() - start
+    return {
+        "backend": backend,
+        "renders": renders,
+        "seconds": round(elapsed, 4),
+        "first_render_seconds": round(first_render, 4),
+        "renders_per_second": round(renders / elapsed, 2),
+        "peak_rss_kb": _peak_rss_kb(),
+        "rss_growth_kb": _peak_rss_kb() - rss_before,
+    }
+
+
+def main(argv=None):
+    """Runs every requested backend in its own subprocess and prints a JSON report."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--renders", type=int, default=50)
+    parser.add_argument("--backends", nargs="+", default=["matplotlib", "svg", "png"])
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(run_worker(args.worker, args.renders)))
+        return
+
+    results = []
+    for backend in args.backends:
+        completed = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_charts", "--worker", backend,
+             "--renders", str(args.renders)],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, check=True)
+        results.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+    print(json.dumps(results, indent=4))
+
+
+if __name__ == "__main__":
+    main()
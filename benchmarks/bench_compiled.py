@@ -0,0 +1,75 @@
+# quiz_project/benchmarks/bench_compiled.py
+"""
+Measures the per-question serve cost of a plain Quiz versus a CompiledQuiz.
+
+"Serve" covers what the player does for one answered question: rendering the
+question block, grading the answer and building the feedback for a wrong answer.
+
+Usage:
+    python -m benchmarks.bench_compiled [--questions 1000] [--options 4] [--repeat 5]
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models.question import Question
+from models.quiz import Quiz
+from quiz_data.compiled import QuizCompiler
+
+
+def build_quiz(num_questions: int, num_options: int) -> Quiz:
+    """Builds a synthetic quiz with the given shape."""
+    questions = [Question(f"Pytanie numer {i}: które z poniższych zdań jest prawdziwe?",
+                          [f"Odpowiedź {j} do pytania {i} z polskimi znakami żółć" for j in range(num_options)],
+                          i % num_options)
+                 for i in range(num_questions)]
+    return Quiz("Benchmark", "Quiz do pomiarów", questions)
+
+
+def serve_plain(quiz: Quiz, answer_index: int):
+    """Serves every question the way play_quiz did before compilation."""
+    for question in quiz.questions:
+        question.display()
+        question.is_correct(answer_index)
+        if not question.is_correct(answer_index):
+            f"Niepoprawna odpowiedź. Poprawna to: {question.options[question.correct_answer_index]}"
+
+
+def serve_compiled(compiled, answer_index: int):
+    """Serves every question from the compiled artifact."""
+    for i in range(len(compiled)):
+        compiled.display(i)
+        if not compiled.is_correct(i, 1 << answer_index):
+            compiled.feedback[i]
+
+
+def main(argv=None):
+    """Runs the benchmark and prints per-question costs as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--questions", type=int, default=1000)
+    parser.add_argument("--options", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    quiz = build_quiz(args.questions, args.options)
+    compile_seconds = min(timeit.repeat(lambda: QuizCompiler.compile(quiz), number=1, repeat=args.repeat))
+    compiled = QuizCompiler.compile(quiz)
+
+    plain = min(timeit.repeat(lambda: serve_plain(quiz, 1), number=1, repeat=args.repeat))
+    fast = min(timeit.repeat(lambda: serve_compiled(compiled, 1), number=1, repeat=args.repeat))
+    print(json.dumps({
+        "questions": args.questions,
+        "options": args.options,
+        "plain_ns_per_question": round(plain / args.questions * 1e9),
+        "compiled_ns_per_question": round(fast / args.questions * 1e9),
+        "speedup": round(plain / fast, 2),
+        "compile_ms": round(compile_seconds * 1000, 3)
+    }, indent=4))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# quiz_project/benchmarks/bench_storage.py
+"""
+Measures the disk footprint and the load latency of compressed quiz storage against
+plain JSON, on a synthetic catalog (see benchmarks.corpus).
+
+Sizes are reported as file bytes and as allocated disk blocks, for plain JSON, per-file
+gzip, zlib without a dictionary and zlib with the trained preset dictionary (whose size
+is counted once for the whole catalog). Load latency is the time of QuizDataManager.load_quiz
+per file, plain and compressed, plus the decompression alone.
+
+Usage:
+    python -m benchmarks.bench_storage [--quizzes 200] [--questions 20] [--seed 1] [--repeat 5]
+"""
+import argparse
+import gzip
+import json
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.corpus import CorpusSpec, generate_corpus
+from quiz_data import compression
+from quiz_data.manager import QuizDataManager
+
+
+def disk_usage(directory: str, names: list) -> dict:
+    """Returns the file bytes and the allocated disk bytes of quiz files."""
+    stats = [os.stat(os.path.join(directory, name + ".json")) for name in names]
+    return {"bytes": sum(stat.st_size for stat in stats),
+            "disk_bytes": sum(stat.st_blocks * 512 for stat in stats)}
+
+
+def load_all(directory: str, names: list):
+    """Loads every quiz of the catalog."""
+    for name in names:
+        QuizDataManager.load_quiz(name, directory, verbose=False)
+
+
+def main(argv=None):
+    """Runs the benchmark and prints the sizes and per-file latencies as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--quizzes", type=int, default=200)
+    parser.add_argument("--questions", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp(prefix="quiz_storage_")
+    try:
+        plain_dir = os.path.join(workdir, "plain")
+        compressed_dir = os.path.join(workdir, "compressed")
+        generate_corpus(CorpusSpec(seed=args.seed, quizzes=args.quizzes, questions=args.questions), plain_dir)
+        shutil.copytree(plain_dir, compressed_dir)
+        summary = compression.recompress_catalog(compressed_dir)
+        names = QuizDataManager.list_available_quizzes(plain_dir)
+
+        contents = [compression.read_quiz_bytes(os.path.join(plain_dir, name + ".json")) for name in names]
+        stored = []
+        for name in names:
+            with open(os.path.join(compressed_dir, name + ".json"), 'rb') as f:
+                stored.append(f.read())
+        plain = disk_usage(plain_dir, names)
+        dictionary = summary["dictionary_bytes"]
+
+        def per_file_us(func):
+            seconds = min(timeit.repeat(func, number=1, repeat=args.repeat))
+            return round(seconds / len(names) * 1e6, 1)
+
+        print(json.dumps({
+            "quizzes": len(names),
+            "questions": args.questions,
+            "plain": plain,
+            "gzip_bytes": sum(len(gzip.compress(content, 9)) for content in contents),
+            "zlib_bytes": sum(len(compression.compress(content, compressed_dir, version=0)) for content in contents),
+            "zlib_dictionary": {**disk_usage(compressed_dir, names), "dictionary_bytes": dictionary},
+            "ratio": round(plain["bytes"] / (summary["stored_bytes"] + dictionary), 2),
+            "plain_load_us": per_file_us(lambda: load_all(plain_dir, names)),
+            "compressed_load_us": per_file_us(lambda: load_all(compressed_dir, names)),
+            "decompress_us": per_file_us(lambda: [compression.decompress(data, compressed_dir) for data in stored])
+        }, indent=4))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+# quiz_project/benchmarks/corpus.py
+"""
+Deterministic generator of synthetic quiz corpora for benchmarks and load tests.
+
+The same seed and parameters always produce byte-identical files, whatever the number
+of worker processes: every quiz is generated from its own random generator derived
+from (seed, quiz number), and repeated questions are drawn from a shared pool of
+template questions that every worker can regenerate on its own. Files are written with
+QuizDataManager.save_quiz, exactly like quizzes created in the application.
+
+Usage:
+    python -m benchmarks.corpus data/corpus --quizzes 1000 --questions 1000 [--seed 1]
+        [--options 3-5] [--question-words 12] [--option-words 3] [--duplicates 0.05]
+        [--multi 0.1] [--text 0.05] [--ascii] [--workers 8] [--index]
+"""
+import argparse
+import hashlib
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models.question import MultiAnswerQuestion, Question, TextAnswerQuestion
+from models.quiz import Quiz
+from utils.sampling import make_rng
+
+# Słownictwo z polskimi znakami; wersję bez znaków diakrytycznych daje opcja --ascii
+WORDS = (
+    "stolica województwo rzeka jezioro góra miasto państwo granica morze wyżyna nizina pojezierze "
+    "źródło ujście dopływ wieś gmina powiat ludność gęstość klimat opad wiatr śnieg mróz upał "
+    "zamek król królowa książę wojna pokój traktat bitwa powstanie sejm ustawa konstytucja wiek "
+    "funkcja zmienna pętla lista słownik krotka zbiór klasa obiekt metoda moduł pakiet wyjątek "
+    "liczba całkowita zmiennoprzecinkowa łańcuch znak bajt tablica wskaźnik pamięć wątek proces "
+    "komórka tkanka narząd serce płuco wątroba krew kość mięsień nerw mózg oddech żołądek jelito "
+    "pierwiastek związek kwas zasada sól tlen wodór węgiel azot żelazo miedź złoto srebro cząsteczka "
+    "który która które jaki jaka jakie największy najdłuższy najwyższy pierwszy ostatni główny "
+    "polski europejski światowy średniowieczny współczesny łaciński grecki słowiański północny "
+    "południowy wschodni zachodni ważny znany rzadki częsty wielki mały nowy stary długi krótki"
+).split()
+
+_ASCII_FOLDS = str.maketrans("ąćęłńóśźżĄĆĘŁŃÓŚŹŻ", "acelnoszzACELNOSZZ")
+MAX_POOL_SIZE = 100000 # Górna granica puli pytań powtarzanych w wielu quizach
+
+
+class CorpusSpec:
+    """
+    Parameters of a synthetic corpus.
+
+    Attributes:
+        seed (int): Seed of the whole corpus.
+        quizzes (int): Number of quiz files.
+        questions (int): Questions per quiz.
+        min_options (int): Minimum number of options of a choice question.
+        max_options (int): Maximum number of options of a choice question.
+        question_words (float): Mean length of a question text in words (log-normal).
+        option_words (float): Mean length of an option in words (log-normal).
+        duplicate_ratio (float): Share of questions copied, with small changes, from a
+                                 pool of questions repeated across the corpus.
+        multi_ratio (float): Share of multi-answer questions.
+        text_ratio (float): Share of free-text questions.
+        polish (bool): Keep Polish diacritics (otherwise ASCII only).
+    """
+
+    def __init__(self, seed: int = 1, quizzes: int = 10, questions: int = 100, min_options: int = 3,
+                 max_options: int = 5, question_words: float = 12, option_words: float = 3,
+                 duplicate_ratio: float = 0.05, multi_ratio: float = 0.1, text_ratio: float = 0.05,
+                 polish: bool = True):
+        """
+        Initializes and validates the parameters (see the class attributes).
+
+        Raises:
+            ValueError: If a count, length or ratio is out of range.
+        """
+        if quizzes < 1 or questions < 1:
+            raise ValueError("Number of quizzes and questions must be positive.")
+        if not 2 <= min_options <= max_options:
+            raise ValueError("Option counts must satisfy 2 <= min_options <= max_options.")
+        if question_words < 1 or option_words < 1:
+            raise ValueError("Mean text lengths must be at least one word.")
+        if not all(0.0 <= ratio <= 1.0 for ratio in (duplicate_ratio, multi_ratio, text_ratio)) \
+                or multi_ratio + text_ratio > 1.0:
+            raise ValueError("Ratios must be between 0 and 1 (multi + text at most 1).")
+        self.seed = seed
+        self.quizzes = quizzes
+        self.questions = questions
+        self.min_options = min_options
+        self.max_options = max_options
+        self.question_words = question_words
+        self.option_words = option_words
+        self.duplicate_ratio = duplicate_ratio
+        self.multi_ratio = multi_ratio
+        self.text_ratio = text_ratio
+        self.polish = polish
+
+    @property
+    def pool_size(self) -> int:
+        """int: Number of template questions behind the duplicates (each is used about 3 times)."""
+        return max(1, min(MAX_POOL_SIZE, round(self.quizzes * self.questions * self.duplicate_ratio / 3)))
+
+    def quiz_name(self, quiz_number: int) -> str:
+        """Returns the file name (without .json) of a quiz."""
+        return f"quiz_{quiz_number:0{max(4, len(str(self.quizzes - 1)))}d}"
+
+    def to_dict(self) -> dict:
+        """Returns the parameters as a dictionary (stored in the corpus manifest)."""
+        return dict(vars(self))
+
+
+def _words(rng, mean: float, polish: bool) -> str:
+    """Returns a phrase whose length in words follows a log-normal distribution with the given mean."""
+    sigma = 0.5
+    count = max(1, min(60, round(rng.lognormvariate(math.log(mean) - sigma * sigma / 2, sigma))))
+    phrase = " ".join(rng.choices(WORDS, k=count))
+    return phrase if polish else phrase.translate(_ASCII_FOLDS)
+
+
+def _new_question(rng, spec: CorpusSpec, label: str):
+    """Generates one question of a random type."""
+    text = f"{label} {_words(rng, spec.question_words, spec.polish).capitalize()}?"
+    kind = rng.random()
+    if kind < spec.text_ratio:
+        answer = _words(rng, spec.option_words, spec.polish)
+        return TextAnswerQuestion(text, [answer])
+    option_count = rng.randint(spec.min_options, spec.max_options)
+    # Numer opcji na początku gwarantuje, że opcje są różne
+    options = [f"{i + 1}) {_words(rng, spec.option_words, spec.polish)}" for i in range(option_count)]
+    if kind < spec.text_ratio + spec.multi_ratio:
+        return MultiAnswerQuestion(text, options, sorted(rng.sample(range(option_count), 2)))
+    return Question(text, options, rng.randrange(option_count))
+
+
+@lru_cache(maxsize=4096)
+def _pool_question(seed: int, template: int, spec_key: tuple):
+    """Regenerates a template question of the duplicate pool (pure function of its arguments)."""
+    spec = CorpusSpec(*spec_key)
+    return _new_question(make_rng(f"{seed}:pool:{template}"), spec, f"[{template}]")
+
+
+def _spec_key(spec: CorpusSpec) -> tuple:
+    """Returns the constructor arguments of a spec as a hashable tuple."""
+    return tuple(spec.to_dict().values())
+
+
+def generate_quiz(spec: CorpusSpec, quiz_number: int) -> Quiz:
+    """
+    Generates one quiz of a corpus; the result depends only on the spec and the quiz number.
+
+    Args:
+        spec (CorpusSpec): The corpus parameters.
+        quiz_number (int): The 0-based number of the quiz.
+
+    Returns:
+        Quiz: The generated quiz.
+    """
+    rng = make_rng(f"{spec.seed}:quiz:{quiz_number}")
+    questions = []
+    for index in range(spec.questions):
+        if rng.random() < spec.duplicate_ratio:
+            template = _pool_question(spec.seed, rng.randrange(spec.pool_size), _spec_key(spec))
+            data = template.to_dict() # Kopia - pytania z puli nie mogą być współdzielone między quizami
+            if rng.random() < 0.5:
+                word = rng.choice(WORDS) if spec.polish else rng.choice(WORDS).translate(_ASCII_FOLDS)
+                data["question_text"] = data["question_text"].rstrip("?") + " " + word + "?"
+            questions.append(Question.from_dict(data))
+        else:
+            questions.append(_new_question(rng, spec, f"{index + 1}."))
+    title = f"Quiz {quiz_number}: {_words(rng, 3, spec.polish).capitalize()}"
+    return Quiz(title, _words(rng, 8, spec.polish), questions)
+
+
+def _write_quizzes(spec_key: tuple, directory: str, quiz_numbers: range) -> list:
+    """Worker: generates and saves a range of quizzes, returning (name, size, sha256) of each file."""
+    import quiz_search.index
+    from quiz_data.manager import QuizDataManager
+
+    auto_update = quiz_search.index.AUTO_UPDATE
+    quiz_search.index.AUTO_UPDATE = False # Indeks budujemy raz na końcu (opcja --index)
+    spec = CorpusSpec(*spec_key)
+    written = []
+    try:
+        for quiz_number in quiz_numbers:
+            name = spec.quiz_name(quiz_number)
+            QuizDataManager.save_quiz(generate_quiz(spec, quiz_number), name, directory, verbose=False)
+            with open(os.path.join(directory, name + ".json"), 'rb') as f:
+                content = f.read()
+            written.append((name, len(content), hashlib.sha256(content).hexdigest()))
+    finally:
+        quiz_search.index.AUTO_UPDATE = auto_update # Przy workers=1 działamy w procesie wywołującym
+    return written
+
+
+def generate_corpus(spec: CorpusSpec, directory: str, workers: int = None) -> dict:
+    """
+    Writes a corpus into a directory using a pool of worker processes.
+
+    Args:
+        spec (CorpusSpec): The corpus parameters.
+        directory (str): Destination directory (created if missing).
+        workers (int, optional): Number of worker processes. Defaults to the CPU count;
+                                 1 generates in the current process.
+
+    Returns:
+        dict: The manifest: parameters, file and question counts, total bytes, elapsed
+              seconds and a digest of all files (equal digests = identical corpora).
+    """
+    os.makedirs(directory, exist_ok=True)
+    workers = max(1, min(workers or os.cpu_count() or 1, spec.quizzes))
+    started = time.perf_counter()
+    # Kilka zadań na proces wyrównuje obciążenie; podział nie wpływa na treść plików
+    chunk = max(1, math.ceil(spec.quizzes / (workers * 4)))
+    ranges = [range(start, min(start + chunk, spec.quizzes)) for start in range(0, spec.quizzes, chunk)]
+    if workers == 1:
+        batches = [_write_quizzes(_spec_key(spec), directory, quiz_range) for quiz_range in ranges]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            batches = list(executor.map(_write_quizzes, [_spec_key(spec)] * len(ranges),
+                                        [directory] * len(ranges), ranges))
+    files = [entry for batch in batches for entry in batch]
+    digest = hashlib.sha256("".join(file_hash for _, _, file_hash in files).encode('ascii')).hexdigest()
+    return {
+        "spec": spec.to_dict(),
+        "directory": directory,
+        "files": len(files),
+        "questions": spec.quizzes * spec.questions,
+        "bytes": sum(size for _, size, _ in files),
+        "seconds": round(time.perf_counter() - started, 3),
+        "workers": workers,
+        "digest": digest
+    }
+
+
+def _parse_range(value: str) -> tuple[int, int]:
+    """Parses an option-count range such as '3-5' or '4'."""
+    low, _, high = value.partition("-")
+    return int(low), int(high or low)
+
+
+def main(argv=None):
+    """Generates a corpus and prints its manifest as JSON."""
+    parser = argparse.ArgumentParser(description="Generator syntetycznych katalogów quizów.")
+    parser.add_argument("directory", help="Katalog docelowy.")
+    parser.add_argument("--seed", type=int, default=1, help="Ziarno generatora (ten sam seed = identyczne pliki).")
+    parser.add_argument("--quizzes", type=int, default=10, help="Liczba plików quizów.")
+    parser.add_argument("--questions", type=int, default=100, help="Liczba pytań w quizie.")
+    parser.add_argument("--options", type=_parse_range, default=(3, 5), help="Liczba opcji, np. 4 lub 3-5.")
+    parser.add_argument("--question-words", type=float, default=12, help="Średnia długość pytania w słowach.")
+    parser.add_argument("--option-words", type=float, default=3, help="Średnia długość opcji w słowach.")
+    parser.add_argument("--duplicates", type=float, default=0.05, help="Udział powtórzonych pytań (0-1).")
+    parser.add_argument("--multi", type=float, default=0.1, help="Udział pytań wielokrotnego wyboru (0-1).")
+    parser.add_argument("--text", type=float, default=0.05, help="Udział pytań z odpowiedzią tekstową (0-1).")
+    parser.add_argument("--ascii", action="store_true", help="Bez polskich znaków diakrytycznych.")
+    parser.add_argument("--workers", type=int, help="Liczba procesów (domyślnie liczba rdzeni).")
+    parser.add_argument("--index", action="store_true", help="Zbuduj indeks wyszukiwania po wygenerowaniu.")
+    args = parser.parse_args(argv)
+
+    spec = CorpusSpec(args.seed, args.quizzes, args.questions, args.options[0], args.options[1],
+                      args.question_words, args.option_words, args.duplicates, args.multi, args.text,
+                      not args.ascii)
+    manifest = generate_corpus(spec, args.directory, args.workers)
+    if args.index:
+        from quiz_search.index import QuestionIndex
+        with QuestionIndex(args.directory) as index:
+            index.refresh()
+    print(json.dumps(manifest, indent=4, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
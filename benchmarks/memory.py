@@ -0,0 +1,193 @@
+# quiz_project/benchmarks/memory.py
+"""
+Memory benchmark harness based on tracemalloc snapshots.
+
+For every scenario and scale it reports the peak and retained memory (see
+utils.helpers.measure_memory) and the allocation sites that grew the most. Results
+can be saved as a JSON baseline and compared later; scenarios whose peak memory grew
+by more than the threshold are reported as regressions and the exit code is 1.
+
+Scenarios:
+    load_quiz    - loading one quiz file of N questions (retained = the Quiz object)
+    sessions     - N concurrent play sessions of a 50-question quiz (compiled quiz,
+                   question order and answer records, as held by QuizPlayer.play_quiz)
+    catalog      - listing a directory of N quiz files and building the quiz picker index
+
+Usage:
+    python -m benchmarks.memory [--profile quick|full] [--scenarios load_quiz] [--save memory.json]
+    python -m benchmarks.memory --compare memory.json [--threshold 0.1]
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.suite import build_quiz, compare_results
+from utils.helpers import measure_memory
+
+MEMORY_FORMAT_VERSION = 1
+DEFAULT_THRESHOLD = 0.10 # Pomiary pamięci są powtarzalne - wystarczy niższy próg niż dla czasu
+SESSION_QUESTIONS = 50
+
+PROFILES = {
+    "quick": {"load_quiz": (10, 1000, 10000), "sessions": (10, 100), "catalog": (10, 1000)},
+    "full": {"load_quiz": (10, 1000, 100000, 1000000), "sessions": (10, 100, 1000), "catalog": (10, 1000, 100000)},
+}
+
+
+# --- Scenariusze: przygotowanie (poza pomiarem) zwraca bezargumentową funkcję do zmierzenia ---
+
+def scenario_load_quiz(scale: int, workdir: str):
+    """Loading a quiz file of 'scale' questions."""
+    from quiz_data.manager import QuizDataManager
+    QuizDataManager.save_quiz(build_quiz(scale), "benchmark", workdir, verbose=False)
+    build_quiz.cache_clear() # Wzorcowy quiz nie może zawyżać wyniku pomiaru
+    return lambda: QuizDataManager.load_quiz("benchmark", workdir, verbose=False)
+
+
+def scenario_sessions(scale: int, workdir: str):
+    """Holding 'scale' concurrent sessions, each with its compiled quiz and answer records."""
+    from quiz_data.compiled import QuizCompiler
+    from quiz_data.manager import QuizDataManager
+    from utils.permutation import FeistelPermutation
+
+    QuizDataManager.save_quiz(build_quiz(SESSION_QUESTIONS), "benchmark", workdir, verbose=False)
+    QuizCompiler.load("benchmark", workdir) # Artefakt .compiled powstaje przed pomiarem
+
+    def open_sessions():
+        sessions = []
+        for session in range(scale):
+            # Ta sama ścieżka co QuizPlayer.play_quiz: aktualny artefakt, bez parsowania pliku źródłowego
+            compiled = QuizCompiler.load("benchmark", workdir)
+            order = FeistelPermutation(len(compiled), (session, "questions"))
+            answers = [{
+                "question_index": i,
+                "question_text": compiled.question_texts[i],
+                "user_choice_index": 0,
+                "is_correct": compiled.is_correct(i, 1),
+                "score": 1.0,
+                "correct_answer_index": 0,
+                "options": compiled.options[i],
+                "answered_at": time.time()
+            } for i in order]
+            sessions.append((compiled, order, answers))
+        return sessions
+    return open_sessions
+
+
+def scenario_catalog(scale: int, workdir: str):
+    """Listing a directory of 'scale' quiz files and indexing the names for the picker."""
+    from quiz_data.manager import QuizDataManager
+    from quiz_search.picker import QuizPicker
+
+    for i in range(scale):
+        open(os.path.join(workdir, f"quiz_{i:07d}.json"), 'w').close()
+
+    def build_listing():
+        picker = QuizPicker(QuizDataManager.list_available_quizzes(workdir))
+        next(picker.matches("quiz"), None) # Wymusza budowę drzewa prefiksów
+        return picker
+    return build_listing
+
+
+SCENARIOS = {
+    "load_quiz": scenario_load_quiz,
+    "sessions": scenario_sessions,
+    "catalog": scenario_catalog,
+}
+
+
+def run_memory_suite(profile: str = "quick", scenarios=None, top: int = 5) -> dict:
+    """
+    Runs the memory scenarios.
+
+    Args:
+        profile (str): Scale profile, 'quick' or 'full'. Defaults to 'quick'.
+        scenarios (list[str], optional): Names of the scenarios to run. Defaults to all.
+        top (int): Number of allocation sites reported per scenario. Defaults to 5.
+
+    Returns:
+        dict: Results keyed "scenario@scale" with peak/retained bytes, bytes per item and
+              the top allocation sites, plus environment metadata.
+
+    Raises:
+        ValueError: If the profile or a scenario name is unknown.
+    """
+    import quiz_search.index
+
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown profile: {profile}")
+    unknown = set(scenarios or ()) - set(SCENARIOS)
+    if unknown:
+        raise ValueError(f"Unknown memory scenarios: {', '.join(sorted(unknown))}")
+
+    auto_update = quiz_search.index.AUTO_UPDATE
+    quiz_search.index.AUTO_UPDATE = False # Indeks wyszukiwania nie jest przedmiotem pomiaru
+    results = {}
+    try:
+        for name in scenarios or SCENARIOS:
+            for scale in PROFILES[profile][name]:
+                with tempfile.TemporaryDirectory() as workdir:
+                    func = SCENARIOS[name](scale, workdir)
+                    result, report = measure_memory(func, top=top)
+                    del result
+                results[f"{name}@{scale}"] = {
+                    "scenario": name,
+                    "scale": scale,
+                    **report,
+                    "bytes_per_item": round(report["retained_bytes"] / scale, 1)
+                }
+                print(f"{name}@{scale}: peak {report['peak_bytes']} B, retained {report['retained_bytes']} B",
+                      file=sys.stderr)
+    finally:
+        quiz_search.index.AUTO_UPDATE = auto_update
+    return {
+        "v": MEMORY_FORMAT_VERSION,
+        "profile": profile,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "created": round(time.time()),
+        "results": results
+    }
+
+
+def main(argv=None) -> int:
+    """Runs the memory scenarios (or compares saved results) and prints JSON; returns 1 on regressions."""
+    parser = argparse.ArgumentParser(description="Pomiary pamięci (tracemalloc) dla modeli i warstwy danych.")
+    parser.add_argument("--profile", default="quick", choices=sorted(PROFILES), help="Zestaw skal.")
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), help="Uruchom tylko wybrane scenariusze.")
+    parser.add_argument("--top", type=int, default=5, help="Liczba miejsc alokacji w raporcie.")
+    parser.add_argument("--save", help="Zapisz wyniki jako plik bazowy JSON.")
+    parser.add_argument("--compare", help="Porównaj szczytowe zużycie pamięci z plikiem bazowym JSON.")
+    parser.add_argument("--results", help="Porównaj zapisane wyniki zamiast uruchamiać pomiary.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Względny wzrost pamięci uznawany za regresję (domyślnie 0.1 = 10%%).")
+    args = parser.parse_args(argv)
+
+    if args.results:
+        with open(args.results, 'r', encoding='utf-8') as f:
+            current = json.load(f)
+    else:
+        current = run_memory_suite(args.profile, args.scenarios, args.top)
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=4)
+
+    if not args.compare:
+        print(json.dumps(current, indent=4))
+        return 0
+    with open(args.compare, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    report = compare_results(baseline, current, args.threshold, metric="peak_bytes")
+    print(json.dumps(report, indent=4))
+    return 1 if report["regressions"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
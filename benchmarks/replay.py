@@ -0,0 +1,308 @@
+# quiz_project/benchmarks/replay.py
+"""
+Transcript replay and load generator for the interactive flows.
+
+A transcript is a recorded sequence of answers to the prompts of one interactive flow
+(create, edit, compose or play), stored as JSON:
+
+    {"name": "play_python", "flow": "play", "options": {"scoring": "partial"},
+     "inputs": ["5", "3", "2", ...], "expect": ["Twój wynik:"]}
+
+'options' are passed to the flow function (e.g. QuizPlayer.play_quiz), 'expect' lists
+texts that must appear in the flow's output. The answers are fed through utils.console,
+so the flows run unchanged. Transcripts refer to quizzes by their number in the picker,
+so they are tied to the catalog they were recorded against.
+
+Every virtual user runs in its own worker process and in its own sandbox: a working
+directory with a copy of the catalog (restored before every session), so created quizzes,
+results logs and charts never touch the real data. Each user replays all transcripts
+'iterations' times; the report gives the throughput and session latency per flow and the
+latency of every flow step (the work done between two prompts, labelled with the prompt
+that follows it).
+
+Usage:
+    python -m benchmarks.replay record play -o play.json      # nagranie sesji z klawiatury
+    python -m benchmarks.replay run benchmarks/transcripts/*.json --users 8 --iterations 20
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils import console
+
+QUIZ_DIRECTORY = "data/quiz_examples"
+RESULTS_DIRECTORY = "data/results"
+END_STEP = "(koniec)" # Etykieta pracy wykonanej po ostatniej odpowiedzi
+QUANTILES = (0.5, 0.95, 0.99)
+
+_QUOTED = re.compile(r"'[^']*'")
+_NUMBER = re.compile(r"\d+")
+
+
+def _flow(name: str):
+    """Returns the function running an interactive flow (imported lazily)."""
+    from quiz_creator.creator import QuizCreator
+    from quiz_player.player import QuizPlayer
+    flows = {
+        "create": QuizCreator.create_new_quiz,
+        "edit": QuizCreator.edit_existing_quiz,
+        "compose": QuizCreator.compose_exam,
+        "play": QuizPlayer.play_quiz,
+    }
+    if name not in flows:
+        raise ValueError(f"Unknown flow: {name} (expected one of: {', '.join(flows)})")
+    return flows[name]
+
+
+def step_label(prompt: str) -> str:
+    """
+    Turns a prompt into a step label shared by all its occurrences: quoted values and
+    numbers (e.g. "Opcja 3: ", "obecny: 'Geografia'") are replaced by placeholders.
+    """
+    label = _NUMBER.sub("#", _QUOTED.sub("'…'", prompt.strip()))
+    return label[:60]
+
+
+def load_transcripts(paths) -> list:
+    """
+    Loads transcripts from JSON files (a file holds one transcript or a list of them).
+
+    Raises:
+        ValueError: If a transcript has no flow or no inputs list.
+    """
+    transcripts = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        for transcript in data if isinstance(data, list) else [data]:
+            if "flow" not in transcript or not isinstance(transcript.get("inputs"), list):
+                raise ValueError(f"{path}: a transcript needs 'flow' and an 'inputs' list.")
+            transcript.setdefault("name", os.path.splitext(os.path.basename(path))[0])
+            transcripts.append(transcript)
+    return transcripts
+
+
+def replay(transcript: dict) -> dict:
+    """
+    Replays one transcript in the current working directory.
+
+    Args:
+        transcript (dict): The transcript (see the module docstring).
+
+    Returns:
+        dict: 'name', 'flow', 'ok', 'error' (None when ok), 'seconds' (the whole session),
+              'unused' (answers left over) and 'steps' ([label, seconds] pairs).
+    """
+    flow = _flow(transcript["flow"])
+    scripted = console.ScriptedInput(transcript["inputs"])
+    output = io.StringIO()
+    error = None
+    started = time.perf_counter()
+    try:
+        with console.use_console(scripted), contextlib.redirect_stdout(output):
+            flow(**transcript.get("options", {}))
+    except console.TranscriptExhausted as e:
+        error = str(e)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    scripted.finish(END_STEP)
+    seconds = time.perf_counter() - started
+
+    if error is None:
+        missing = [text for text in transcript.get("expect", ()) if text not in output.getvalue()]
+        if missing:
+            error = f"Expected output not found: {missing}"
+    return {
+        "name": transcript["name"],
+        "flow": transcript["flow"],
+        "ok": error is None,
+        "error": error,
+        "seconds": seconds,
+        "unused": len(scripted.answers) - scripted.position,
+        "steps": [[step_label(prompt), step_seconds] for prompt, step_seconds in scripted.steps]
+    }
+
+
+def _run_virtual_user(user: int, transcripts: list, iterations: int, catalog: str, workdir: str) -> list:
+    """
+    Runs one virtual user: all transcripts, 'iterations' times, in a private sandbox.
+    The catalog is restored before every session (outside the measured time).
+
+    The working directory is changed for the duration of the run (the flows use relative
+    paths), so in-process runs must not overlap with other work in the same process.
+    """
+    from quiz_player.charts import ChartRenderingService
+    from quiz_results.log import ResultsLog
+    from utils.tracing import TRACER
+
+    sandbox = os.path.join(workdir, f"user-{user}")
+    os.makedirs(sandbox)
+    previous_directory = os.getcwd()
+    os.chdir(sandbox)
+    try:
+        sessions = []
+        for _ in range(iterations):
+            for transcript in transcripts:
+                # Każda sesja zaczyna od katalogu, wobec którego nagrano transkrypt
+                shutil.rmtree(QUIZ_DIRECTORY, ignore_errors=True)
+                shutil.copytree(catalog, QUIZ_DIRECTORY)
+                sessions.append(replay(transcript))
+        # Wykresy i dziennik wyników muszą trafić do piaskownicy, zanim wrócimy do katalogu
+        ChartRenderingService.shared().shutdown(wait=True)
+        ResultsLog.close_shared(RESULTS_DIRECTORY)
+    finally:
+        os.chdir(previous_directory)
+    if TRACER.enabled:
+        # Procesy robocze puli kończą się bez atexit - ślad każdego użytkownika zapisujemy tu
+        TRACER.export()
+        TRACER.clear()
+    return sessions
+
+
+def _percentiles(values: list) -> dict:
+    """Returns the mean, p50/p95/p99 (nearest rank) and maximum of a list of seconds."""
+    ordered = sorted(values)
+    summary = {"mean": round(sum(ordered) / len(ordered), 6)}
+    for q in QUANTILES:
+        summary[f"p{round(q * 100)}"] = round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 6)
+    summary["max"] = round(ordered[-1], 6)
+    return summary
+
+
+def summarize(sessions: list, wall_seconds: float) -> dict:
+    """
+    Aggregates replayed sessions into per-flow and per-step statistics.
+
+    Args:
+        sessions (list[dict]): Results of replay().
+        wall_seconds (float): Wall-clock duration of the whole run.
+
+    Returns:
+        dict: 'sessions', 'errors', 'throughput' (sessions per second), 'flows' and
+              'steps' (keyed "flow: label"), with latencies in seconds.
+    """
+    flows = {}
+    steps = {}
+    for session in sessions:
+        flows.setdefault(session["flow"], []).append(session)
+        for label, seconds in session["steps"]:
+            steps.setdefault(f"{session['flow']}: {label}", []).append(seconds)
+    errors = [session for session in sessions if not session["ok"]]
+    return {
+        "sessions": len(sessions),
+        "errors": len(errors),
+        "error_samples": sorted({f"{session['name']}: {session['error']}" for session in errors})[:10],
+        "wall_seconds": round(wall_seconds, 3),
+        "throughput": round(len(sessions) / wall_seconds, 2) if wall_seconds else None,
+        "flows": {
+            flow: {
+                "sessions": len(flow_sessions),
+                "errors": sum(1 for session in flow_sessions if not session["ok"]),
+                "throughput": round(len(flow_sessions) / wall_seconds, 2) if wall_seconds else None,
+                "latency": _percentiles([session["seconds"] for session in flow_sessions])
+            } for flow, flow_sessions in flows.items()
+        },
+        "steps": {key: {"count": len(values), **_percentiles(values)} for key, values in steps.items()}
+    }
+
+
+def run_load(transcripts: list, users: int = 1, iterations: int = 1, catalog: str = QUIZ_DIRECTORY) -> dict:
+    """
+    Replays the transcripts with many virtual users running in parallel worker processes.
+
+    Args:
+        transcripts (list[dict]): Transcripts to replay (see load_transcripts()).
+        users (int): Number of virtual users; each gets its own process and sandbox.
+                     A single user runs in the calling process. Defaults to 1.
+        iterations (int): How many times every user replays all transcripts. Defaults to 1.
+        catalog (str): Quiz directory copied into every sandbox. Defaults to the app catalog.
+
+    Returns:
+        dict: The summary produced by summarize(), plus 'users' and 'iterations'.
+
+    Raises:
+        ValueError: If users or iterations is not positive or a flow is unknown.
+    """
+    if users < 1 or iterations < 1:
+        raise ValueError("users and iterations must be positive integers.")
+    for transcript in transcripts:
+        _flow(transcript["flow"])
+    catalog = os.path.abspath(catalog)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        started = time.perf_counter()
+        if users == 1:
+            sessions = _run_virtual_user(0, transcripts, iterations, catalog, workdir)
+        else:
+            with ProcessPoolExecutor(max_workers=users) as executor:
+                futures = [executor.submit(_run_virtual_user, user, transcripts, iterations, catalog, workdir)
+                           for user in range(users)]
+                sessions = [session for future in futures for session in future.result()]
+        wall_seconds = time.perf_counter() - started
+    return {"users": users, "iterations": iterations, **summarize(sessions, wall_seconds)}
+
+
+def record(flow: str, options: dict = None, name: str = None) -> dict:
+    """
+    Runs a flow interactively (with the real catalog) and records the answers as a transcript.
+
+    Args:
+        flow (str): Flow name ('create', 'edit', 'compose' or 'play').
+        options (dict, optional): Arguments passed to the flow function.
+        name (str, optional): Transcript name. Defaults to the flow name.
+
+    Returns:
+        dict: The transcript.
+    """
+    recorder = console.RecordingInput()
+    with console.use_console(recorder):
+        _flow(flow)(**(options or {}))
+    transcript = {"name": name or flow, "flow": flow, "inputs": recorder.answers}
+    if options:
+        transcript["options"] = options
+    return transcript
+
+
+def main(argv=None) -> int:
+    """Records a transcript or replays transcripts under load; prints JSON, returns 1 on errors."""
+    parser = argparse.ArgumentParser(description="Nagrywanie i odtwarzanie sesji interaktywnych (test obciążeniowy).")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = subparsers.add_parser("record", help="Nagraj odpowiedzi z klawiatury jako transkrypt.")
+    record_parser.add_argument("flow", choices=["create", "edit", "compose", "play"])
+    record_parser.add_argument("-o", "--output", required=True, help="Plik JSON transkryptu.")
+    record_parser.add_argument("--options", type=json.loads, default=None,
+                               help="Argumenty przepływu w JSON, np. '{\"scoring\": \"partial\"}'.")
+
+    run_parser = subparsers.add_parser("run", help="Odtwórz transkrypty wieloma wirtualnymi użytkownikami.")
+    run_parser.add_argument("transcripts", nargs="+", help="Pliki JSON z transkryptami.")
+    run_parser.add_argument("--users", type=int, default=os.cpu_count() or 1,
+                            help="Liczba wirtualnych użytkowników (procesów).")
+    run_parser.add_argument("--iterations", type=int, default=1, help="Powtórzenia wszystkich transkryptów.")
+    run_parser.add_argument("--catalog", default=QUIZ_DIRECTORY, help="Katalog quizów kopiowany do piaskownic.")
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        transcript = record(args.flow, args.options, os.path.splitext(os.path.basename(args.output))[0])
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(transcript, f, ensure_ascii=False, indent=4)
+        print(json.dumps(transcript, ensure_ascii=False, indent=4))
+        return 0
+
+    report = run_load(load_transcripts(args.transcripts), args.users, args.iterations, args.catalog)
+    print(json.dumps(report, ensure_ascii=False, indent=4))
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
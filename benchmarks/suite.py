@@ -0,0 +1,288 @@
+# quiz_project/benchmarks/suite.py
+"""
+Benchmark suite of the code paths that scale with quiz and catalog size.
+
+Every case is measured with utils.helpers.measure_function_performance at several scales
+(number of questions, quiz files or rendered charts) and reported as the time per run
+and per item. Results can be saved as a JSON baseline and later compared against it:
+cases slower than the baseline by more than the threshold are reported as regressions
+and the exit code is 1.
+
+Usage:
+    python -m benchmarks.suite [--profile quick|full] [--cases save_quiz load_quiz] [--save baseline.json]
+    python -m benchmarks.suite --compare baseline.json [--threshold 0.25]
+    python -m benchmarks.suite --compare baseline.json --results current.json
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from functools import lru_cache
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models.question import MultiAnswerQuestion, Question
+from models.quiz import Quiz
+from utils.helpers import measure_function_performance
+
+SUITE_FORMAT_VERSION = 1
+DEFAULT_THRESHOLD = 0.25 # Spowolnienie o ponad 25% względem bazowego pomiaru to regresja
+MIN_MEASURE_SECONDS = 0.05 # Szybkie przypadki powtarzamy, aż pomiar potrwa co najmniej tyle
+
+# Skale: liczba pytań w quizie, liczba plików w katalogu, liczba renderowanych wykresów
+PROFILES = {
+    "quick": {"questions": (10, 1000, 10000), "files": (10, 1000), "charts": (10,)},
+    "full": {"questions": (10, 1000, 100000, 1000000), "files": (10, 1000, 100000), "charts": (10, 100)},
+}
+
+
+@lru_cache(maxsize=2)
+def build_quiz(num_questions: int) -> Quiz:
+    """Builds (once per scale) a synthetic quiz; every tenth question has several correct answers."""
+    return Quiz("Benchmark", "Quiz do pomiarów", build_questions(num_questions))
+
+
+def build_questions(num_questions: int) -> list:
+    """Builds synthetic questions with four options and Polish characters."""
+    questions = []
+    for i in range(num_questions):
+        options = [f"Odpowiedź {j} do pytania {i} (żółć)" for j in range(4)]
+        text = f"Pytanie numer {i}: które z poniższych zdań jest prawdziwe?"
+        if i % 10 == 9:
+            questions.append(MultiAnswerQuestion(text, options, [0, i % 3 + 1]))
+        else:
+            questions.append(Question(text, options, i % 4))
+    return questions
+
+
+def _answers_for(num_questions: int) -> list:
+    """Returns an answer sheet (1-based option numbers) for build_quiz(num_questions)."""
+    return [[1, 2] if i % 10 == 9 else i % 3 + 1 for i in range(num_questions)]
+
+
+# --- Przypadki: każdy zwraca bezargumentową funkcję do zmierzenia ---
+
+def case_question_construction(scale: int, workdir: str):
+    """Constructing Question objects."""
+    return lambda: build_questions(scale)
+
+
+def case_quiz_to_dict(scale: int, workdir: str):
+    """Serializing a quiz to a dictionary."""
+    return build_quiz(scale).to_dict
+
+
+def case_quiz_from_dict(scale: int, workdir: str):
+    """Building a quiz from its dictionary."""
+    data = build_quiz(scale).to_dict()
+    return lambda: Quiz.from_dict(data)
+
+
+def case_save_quiz(scale: int, workdir: str):
+    """Writing a quiz file."""
+    from quiz_data.manager import QuizDataManager
+    quiz = build_quiz(scale)
+    return lambda: QuizDataManager.save_quiz(quiz, "benchmark", workdir, verbose=False)
+
+
+def case_load_quiz(scale: int, workdir: str):
+    """Reading and parsing a quiz file."""
+    from quiz_data.manager import QuizDataManager
+    QuizDataManager.save_quiz(build_quiz(scale), "benchmark", workdir, verbose=False)
+    return lambda: QuizDataManager.load_quiz("benchmark", workdir, verbose=False)
+
+
+def case_grade_answers(scale: int, workdir: str):
+    """Grading a full answer sheet with partial credit."""
+    from models.scoring import get_scoring_policy
+    from quiz_data.compiled import QuizCompiler
+    from quiz_player.grading import grade_answers
+    compiled = QuizCompiler.compile(build_quiz(scale))
+    answers = _answers_for(scale)
+    policy = get_scoring_policy("partial")
+    return lambda: grade_answers(compiled, answers, policy)
+
+
+def case_list_available_quizzes(scale: int, workdir: str):
+    """Listing a catalog directory of 'scale' files."""
+    from quiz_data.manager import QuizDataManager
+    for i in range(scale):
+        # Listowanie patrzy tylko na nazwy plików - puste pliki wystarczą
+        open(os.path.join(workdir, f"quiz_{i:07d}.json"), 'w').close()
+    return lambda: QuizDataManager.list_available_quizzes(workdir)
+
+
+def case_render_chart(scale: int, workdir: str, backend: str = "png"):
+    """Rendering 'scale' results charts."""
+    from quiz_player.charts import get_chart_renderer
+    renderer, _ = get_chart_renderer(backend)
+
+    def render():
+        for i in range(scale):
+            renderer(i % 7 + 1, i % 5, f"Benchmark {i % 10}", workdir)
+    return render
+
+
+# Nazwa przypadku -> (rodzaj skali, funkcja przygotowująca)
+CASES = {
+    "question_construction": ("questions", case_question_construction),
+    "quiz_to_dict": ("questions", case_quiz_to_dict),
+    "quiz_from_dict": ("questions", case_quiz_from_dict),
+    "save_quiz": ("questions", case_save_quiz),
+    "load_quiz": ("questions", case_load_quiz),
+    "grade_answers": ("questions", case_grade_answers),
+    "list_available_quizzes": ("files", case_list_available_quizzes),
+    "render_chart": ("charts", case_render_chart),
+}
+
+
+def measure(func) -> float:
+    """
+    Measures a function with measure_function_performance, calibrating the number of runs
+    so that fast cases are timed over at least MIN_MEASURE_SECONDS.
+
+    Returns:
+        float: Seconds per run (best of the repetitions).
+    """
+    start = time.perf_counter()
+    func() # Rozgrzewka i kalibracja
+    single = time.perf_counter() - start
+    num_runs = max(1, min(10000, int(MIN_MEASURE_SECONDS / max(single, 1e-9))))
+    repeat = 3 if single < 1.0 else 1 # Długie przypadki (skala 1M) mierzymy raz
+    return measure_function_performance(func, num_runs=num_runs, repeat=repeat, verbose=False)
+
+
+def run_suite(profile: str = "quick", cases=None, chart_backend: str = "png") -> dict:
+    """
+    Runs the benchmark suite.
+
+    The search-index update done by save_quiz is switched off, so persistence is
+    measured on its own (the index has its own cost profile).
+
+    Args:
+        profile (str): Scale profile, 'quick' or 'full'. Defaults to 'quick'.
+        cases (list[str], optional): Names of the cases to run. Defaults to all.
+        chart_backend (str): Backend used by the render_chart case. Defaults to 'png'.
+
+    Returns:
+        dict: Suite results with environment metadata; results are keyed "case@scale".
+
+    Raises:
+        ValueError: If the profile or a case name is unknown.
+    """
+    import quiz_search.index
+
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown profile: {profile}")
+    unknown = set(cases or ()) - set(CASES)
+    if unknown:
+        raise ValueError(f"Unknown benchmark cases: {', '.join(sorted(unknown))}")
+
+    auto_update = quiz_search.index.AUTO_UPDATE
+    quiz_search.index.AUTO_UPDATE = False
+    results = {}
+    try:
+        for name in cases or CASES:
+            scale_kind, setup = CASES[name]
+            for scale in PROFILES[profile][scale_kind]:
+                with tempfile.TemporaryDirectory() as workdir:
+                    if name == "render_chart":
+                        func = setup(scale, workdir, chart_backend)
+                    else:
+                        func = setup(scale, workdir)
+                    seconds = measure(func)
+                results[f"{name}@{scale}"] = {
+                    "case": name,
+                    "scale": scale,
+                    "seconds": seconds,
+                    "ns_per_item": round(seconds / scale * 1e9, 1)
+                }
+                print(f"{name}@{scale}: {seconds:.6f} s", file=sys.stderr)
+    finally:
+        quiz_search.index.AUTO_UPDATE = auto_update
+    return {
+        "v": SUITE_FORMAT_VERSION,
+        "profile": profile,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "created": round(time.time()),
+        "results": results
+    }
+
+
+def compare_results(baseline: dict, current: dict, threshold: float = DEFAULT_THRESHOLD,
+                    metric: str = "seconds") -> dict:
+    """
+    Compares suite results with a baseline.
+
+    Only cases present in both are compared; the change is the relative difference of
+    the metric (positive = slower or larger).
+
+    Args:
+        baseline (dict): Results saved earlier by run_suite().
+        current (dict): New results.
+        threshold (float): Relative increase above which a case is a regression.
+        metric (str): Compared field of the results. Defaults to "seconds"
+                      (benchmarks.memory compares "peak_bytes").
+
+    Returns:
+        dict: 'threshold', 'metric', 'comparison' (one entry per common case) and
+              'regressions' (the keys of the cases worse than the threshold allows).
+    """
+    comparison = []
+    for key, result in current["results"].items():
+        base = baseline["results"].get(key)
+        if base is None or not base.get(metric):
+            continue
+        change = result[metric] / base[metric] - 1
+        comparison.append({"key": key, "baseline": base[metric], "current": result[metric],
+                           "change": round(change, 4), "regression": change > threshold})
+    return {
+        "threshold": threshold,
+        "metric": metric,
+        "comparison": comparison,
+        "regressions": [entry["key"] for entry in comparison if entry["regression"]]
+    }
+
+
+def _load_json(file_path: str) -> dict:
+    """Loads a JSON file."""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main(argv=None) -> int:
+    """Runs the suite (or compares saved results) and prints JSON; returns 1 on regressions."""
+    parser = argparse.ArgumentParser(description="Zestaw benchmarków operacji zależnych od rozmiaru danych.")
+    parser.add_argument("--profile", default="quick", choices=sorted(PROFILES), help="Zestaw skal.")
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), help="Uruchom tylko wybrane przypadki.")
+    parser.add_argument("--chart-backend", default="png", help="Backend wykresów (png, svg, matplotlib).")
+    parser.add_argument("--save", help="Zapisz wyniki jako plik bazowy JSON.")
+    parser.add_argument("--compare", help="Porównaj z plikiem bazowym JSON.")
+    parser.add_argument("--results", help="Porównaj zapisane wyniki zamiast uruchamiać benchmarki.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Względne spowolnienie uznawane za regresję (domyślnie 0.25 = 25%%).")
+    args = parser.parse_args(argv)
+
+    if args.results:
+        current = _load_json(args.results)
+    else:
+        current = run_suite(args.profile, args.cases, args.chart_backend)
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=4)
+
+    if not args.compare:
+        print(json.dumps(current, indent=4))
+        return 0
+    report = compare_results(_load_json(args.compare), current, args.threshold)
+    print(json.dumps(report, indent=4))
+    return 1 if report["regressions"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,24 @@
 # quiz_project/main.py
+"""
+Quiz Application entry point.
+
+Without arguments the interactive menu is started. Subcommands run headless and print
+JSON, so they can be used in scripts and batch jobs:
+
+    python main.py list
+    python main.py show python
+    python main.py validate [python geografia ...]
+    python main.py convert python.json python.csv
+    python main.py grade python --answers odpowiedzi.json [--scoring partial]
+    python main.py stats [python]
+    python main.py warmup [--workers 4] [--quarantine]
+    python main.py compress [--plain] [--no-train]
+    python main.py play python --answers odpowiedzi.json
+    python main.py --profile sample grade python --answers odpowiedzi.json
+"""
+import argparse
+import contextlib
+import json
 import sys
 import os
 
@@ -6,13 +26,18 @@ import os
 # To jest ważne, gdy uruchamiasz main.py bezpośrednio z katalogu quiz_project/
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__))))
 
-from quiz_creator.creator import QuizCreator
-from quiz_player.player import QuizPlayer
-from quiz_data.manager import QuizDataManager # Aby pokazać, że manager działa
+# Moduły aplikacji importujemy dopiero w poleceniach, które ich potrzebują,
+# więc np. 'validate' nie ładuje kreatora, odtwarzacza ani backendu wykresów
+QUIZ_DIRECTORY = "data/quiz_examples"
+RESULTS_DIRECTORY = "data/results"
+# Nazwy sesji profilowania dla opcji menu
+MENU_SESSIONS = {'1': "create", '2': "play", '3': "edit", '4': "random_exam", '5': "compose"}
+
 
 def clear_screen():
-    """Clears the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    """Clears the terminal screen (ANSI escape codes; no shell process is spawned)."""
+    if sys.stdout.isatty():
+        print("\033[2J\033[H", end="", flush=True)
 
 def display_menu():
     """Displays the main menu options to the user."""
@@ -20,41 +45,298 @@ def display_menu():
     print("1. Utwórz nowy quiz")
     print("2. Odtwórz quiz")
     print("3. Edytuj istniejący quiz") # Nowa opcja
-    print("4. Wyjdź")
+    print("4. Losowy egzamin z quizu (N pytań)")
+    print("5. Złóż egzamin z wielu quizów")
+    print("6. Wyjdź")
     print("-------------------")
 
-def main():
+def run_menu(profile_mode: str = None, profile_interval: float = None):
     """
-    Main function to run the Quiz Application.
+    Runs the interactive Quiz Application.
     It provides a menu for the user to choose between creating a quiz,
-    playing a quiz, editing a quiz, or exiting the application.
+    playing a quiz, editing a quiz, playing a random exam drawn from a quiz,
+    composing an exam from many quizzes, or exiting the application.
+
+    When profiling is enabled (profile_mode or QUIZ_PROFILE), every menu action is
+    profiled as a separate session; waiting for the menu choice is not included.
+
+    Args:
+        profile_mode (str, optional): 'cprofile' or 'sample'. Defaults to QUIZ_PROFILE.
+        profile_interval (float, optional): Sampling interval in seconds.
     """
+    from quiz_creator.creator import QuizCreator
+    from quiz_player.player import QuizPlayer
+    from utils import console
+    from utils.profiling import profiled
+
     print("Witaj w Aplikacji Quizowej!")
+    from quiz_data import warmup
+    if warmup.WARMUP_ON_START: # Sprawdzenie i wczytanie katalogu przed pierwszym wyborem (QUIZ_WARMUP=1)
+        from quiz_results.log import recent_play_counts
+        print(warmup.format_summary(warmup.warm_up(QUIZ_DIRECTORY, play_counts=recent_play_counts(RESULTS_DIRECTORY))))
 
     while True:
         display_menu()
-        choice = input("Wybierz opcję (1-4): ").strip() # Zmieniono zakres wyboru
+        choice = console.input("Wybierz opcję (1-6): ").strip() # Zmieniono zakres wyboru
 
         clear_screen() # Clear screen for cleaner interaction
 
-        if choice == '1':
-            QuizCreator.create_new_quiz()
-        elif choice == '2':
-            QuizPlayer.play_quiz()
-        elif choice == '3': # Nowa logika dla edycji
-            QuizCreator.edit_existing_quiz()
-        elif choice == '4': # Zmieniono numer opcji wyjścia
+        session = MENU_SESSIONS.get(choice)
+        with profiled(session, profile_mode, interval=profile_interval) if session else contextlib.nullcontext():
+            if choice == '1':
+                QuizCreator.create_new_quiz()
+            elif choice == '2':
+                QuizPlayer.play_quiz()
+            elif choice == '3': # Nowa logika dla edycji
+                QuizCreator.edit_existing_quiz()
+            elif choice == '4': # Losowanie N pytań z wybranego quizu
+                QuizPlayer.play_quiz(random_mode=True)
+            elif choice == '5': # Egzamin złożony z pytań wielu quizów
+                QuizCreator.compose_exam()
+        if choice == '6': # Zmieniono numer opcji wyjścia
             print("Dziękujemy za skorzystanie z aplikacji. Do widzenia!")
             break
-        else:
-            print("Nieprawidłowy wybór. Proszę wybrać opcję 1, 2, 3 lub 4.") # Zmieniono komunikat
-        
+        elif session is None:
+            print("Nieprawidłowy wybór. Proszę wybrać opcję od 1 do 6.") # Zmieniono komunikat
+
         # Optional: Pause before showing menu again for better readability
-        if choice in ['1', '2', '3']: # Zmieniono warunek
-            input("\nNaciśnij Enter, aby kontynuować...")
+        if choice in ['1', '2', '3', '4', '5']: # Zmieniono warunek
+            console.input("\nNaciśnij Enter, aby kontynuować...")
             clear_screen()
 
 
-if __name__ == "__main__":
-    main()
+# --- Polecenia wsadowe (bez interakcji, wynik w JSON) ---
+
+def _quiz_name(value: str) -> str:
+    """Returns a quiz name without the .json extension."""
+    return value[:-len(".json")] if value.endswith(".json") else value
+
+def command_list(args) -> tuple:
+    """Lists the quizzes of the directory with their titles (when indexed)."""
+    from quiz_data.manager import QuizDataManager
+    from quiz_search.index import QuestionIndex
+
+    titles = QuestionIndex.load_titles(args.directory)
+    names = QuizDataManager.list_available_quizzes(args.directory)
+    return [{"name": name, "title": titles.get(name)} for name in names], 0
+
+def command_show(args) -> tuple:
+    """Prints a quiz with its fingerprint."""
+    from quiz_data.manager import QuizDataManager
+
+    quiz = QuizDataManager.load_quiz(_quiz_name(args.quiz), args.directory, verbose=False)
+    return {"name": _quiz_name(args.quiz), "fingerprint": quiz.fingerprint(), **quiz.to_dict()}, 0
+
+def command_validate(args) -> tuple:
+    """Validates quizzes given by name or path (all quizzes of the directory by default)."""
+    from quiz_creator.validator import QuizValidator
+    from quiz_data.manager import QuizDataManager
+
+    targets = args.quizzes or QuizDataManager.list_available_quizzes(args.directory)
+    reports = []
+    for target in targets:
+        file_path = target if os.path.isfile(target) else os.path.join(args.directory, _quiz_name(target) + ".json")
+        errors, warnings = QuizValidator.validate_file(file_path)
+        reports.append({"quiz": target, "valid": not errors, "errors": errors, "warnings": warnings})
+    all_valid = all(report["valid"] for report in reports)
+    return {"valid": all_valid, "quizzes": reports}, 0 if all_valid else 1
+
+def command_convert(args) -> tuple:
+    """Converts a quiz between the JSON and CSV formats (chosen by file extension)."""
+    from quiz_data.csv_format import read_quiz_csv, write_quiz_csv
+    from quiz_data.manager import QuizDataManager
+
+    source_format = os.path.splitext(args.source)[1].lower()
+    destination_format = os.path.splitext(args.destination)[1].lower()
+    if {source_format, destination_format} - {".json", ".csv"}:
+        raise ValueError("Supported formats are .json and .csv.")
+    if source_format == ".csv":
+        title = args.title or os.path.splitext(os.path.basename(args.source))[0]
+        quiz = read_quiz_csv(args.source, title)
+    else:
+        quiz = QuizDataManager.load_quiz(os.path.basename(args.source), os.path.dirname(args.source) or ".",
+                                         verbose=False)
+    if destination_format == ".csv":
+        write_quiz_csv(quiz, args.destination)
+    else:
+        QuizDataManager.save_quiz(quiz, os.path.basename(args.destination),
+                                  os.path.dirname(args.destination) or ".", verbose=False)
+    return {"source": args.source, "destination": args.destination, "title": quiz.title,
+            "questions": len(quiz.questions)}, 0
+
+def _grade(args):
+    """Loads the compiled quiz and the answer sheet and grades them."""
+    from models.scoring import get_scoring_policy
+    from quiz_data.compiled import QuizCompiler
+    from quiz_player.grading import grade_answers, load_answer_sheet
+
+    compiled = QuizCompiler.load(_quiz_name(args.quiz), args.directory)
+    answers = load_answer_sheet(args.answers)
+    return compiled, answers, grade_answers(compiled, answers, get_scoring_policy(args.scoring))
+
+def command_grade(args) -> tuple:
+    """Grades an answer sheet without recording a session."""
+    _, _, result = _grade(args)
+    return {"quiz": _quiz_name(args.quiz), **result}, 0
+
+def command_play(args) -> tuple:
+    """Plays a quiz with answers read from a file and records the session like an interactive game."""
+    import time
+    from quiz_player.player import QuizPlayer
+
+    started_at = time.time()
+    compiled, answers, result = _grade(args)
+    finished_at = time.time()
+    user_answers = []
+    for entry, answer in zip(result["results"], answers):
+        if isinstance(answer, list):
+            choice = sorted(number - 1 for number in answer)
+        elif isinstance(answer, int):
+            choice = answer - 1
+        else:
+            choice = answer # Tekst odpowiedzi albo None (pominięte pytanie)
+        user_answers.append({"question_index": entry["question_index"], "user_choice_index": choice,
+                             "is_correct": entry["is_correct"], "score": entry["score"],
+                             "answered_at": finished_at})
+    QuizPlayer.record_session(None, _quiz_name(args.quiz), user_answers, started_at, finished_at,
+                              fingerprint=compiled.fingerprint, scoring=result["scoring"])
+    return {"quiz": _quiz_name(args.quiz), "fingerprint": compiled.fingerprint, **result}, 0
+
+def command_stats(args) -> tuple:
+    """Summarizes recorded sessions per quiz, with per-question statistics for a single quiz."""
+    from quiz_results.log import read_results
+
+    summaries = {}
+    for record in read_results(args.results):
+        if args.quiz and record.get("name") != _quiz_name(args.quiz):
+            continue
+        summary = summaries.setdefault(record.get("name"), {"sessions": 0, "total_score": 0.0, "best_score": None})
+        summary["sessions"] += 1
+        summary["total_score"] += record["score"]
+        if summary["best_score"] is None or record["score"] > summary["best_score"]:
+            summary["best_score"] = record["score"]
+    output = [{"quiz": name, "sessions": summary["sessions"], "best_score": summary["best_score"],
+               "mean_score": round(summary["total_score"] / summary["sessions"], 4)}
+              for name, summary in sorted(summaries.items(), key=lambda item: str(item[0]))]
+    if not args.quiz:
+        return output, 0
 
+    from quiz_data.compiled import QuizCompiler
+    from quiz_results.analytics import ItemAnalytics
+
+    compiled = QuizCompiler.load(_quiz_name(args.quiz), args.directory)
+    result = output[0] if output else {"quiz": _quiz_name(args.quiz), "sessions": 0,
+                                       "best_score": None, "mean_score": None}
+    result["fingerprint"] = compiled.fingerprint
+    result["items"] = ItemAnalytics.load_merged(args.results).report(compiled.fingerprint, compiled.answer_key)
+    return result, 0
+
+def command_warmup(args) -> tuple:
+    """Loads and validates every quiz in parallel, reporting (or quarantining) corrupt files."""
+    from quiz_data.warmup import warm_up
+    from quiz_results.log import recent_play_counts
+
+    summary = warm_up(args.directory, args.workers, args.quarantine,
+                      play_counts=recent_play_counts(args.results))
+    return summary, 0 if not summary["corrupt"] else 1
+
+def command_compress(args) -> tuple:
+    """Rewrites the catalog compressed with a newly trained dictionary (or as plain JSON)."""
+    from quiz_data.compression import recompress_catalog
+
+    summary = recompress_catalog(args.directory, compressed=not args.plain, train=not args.no_train)
+    return summary, 0
+
+def build_parser() -> argparse.ArgumentParser:
+    """Builds the parser of the headless subcommands."""
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--directory", default=QUIZ_DIRECTORY, help="Katalog z quizami.")
+
+    from utils.profiling import PROFILE_MODES
+
+    parser = argparse.ArgumentParser(description="Aplikacja Quizowa. Bez polecenia uruchamia menu interaktywne.")
+    parser.add_argument("--profile", choices=PROFILE_MODES,
+                        help="Profiluj polecenie lub każdą sesję menu (pliki .prof/.collapsed w data/profiles).")
+    parser.add_argument("--profile-interval", type=float, help="Odstęp próbek profilera 'sample' w sekundach.")
+    subparsers = parser.add_subparsers(dest="command")
+
+    subparser = subparsers.add_parser("list", parents=[common], help="Lista quizów.")
+    subparser.set_defaults(handler=command_list)
+
+    subparser = subparsers.add_parser("show", parents=[common], help="Treść quizu.")
+    subparser.add_argument("quiz", help="Nazwa quizu (bez .json).")
+    subparser.set_defaults(handler=command_show)
+
+    subparser = subparsers.add_parser("validate", parents=[common], help="Sprawdzenie poprawności quizów.")
+    subparser.add_argument("quizzes", nargs="*", help="Nazwy quizów lub ścieżki plików; domyślnie wszystkie.")
+    subparser.set_defaults(handler=command_validate)
+
+    subparser = subparsers.add_parser("convert", help="Konwersja quizu JSON <-> CSV.")
+    subparser.add_argument("source", help="Plik źródłowy (.json lub .csv).")
+    subparser.add_argument("destination", help="Plik docelowy (.json lub .csv).")
+    subparser.add_argument("--title", help="Tytuł quizu tworzonego z pliku CSV (domyślnie nazwa pliku).")
+    subparser.set_defaults(handler=command_convert)
+
+    for name, handler, help_text in (("grade", command_grade, "Ocena arkusza odpowiedzi."),
+                                     ("play", command_play, "Rozegranie quizu z odpowiedziami z pliku.")):
+        subparser = subparsers.add_parser(name, parents=[common], help=help_text)
+        subparser.add_argument("quiz", help="Nazwa quizu (bez .json).")
+        subparser.add_argument("--answers", required=True,
+                               help="Plik JSON z listą odpowiedzi (numery opcji od 1, listy lub tekst).")
+        subparser.add_argument("--scoring", help="Punktacja: all_or_nothing, partial lub negative.")
+        subparser.set_defaults(handler=handler)
+
+    subparser = subparsers.add_parser("stats", parents=[common], help="Statystyki rozegranych sesji.")
+    subparser.add_argument("quiz", nargs="?", help="Nazwa quizu; domyślnie podsumowanie wszystkich.")
+    subparser.add_argument("--results", default=RESULTS_DIRECTORY, help="Katalog z wynikami.")
+    subparser.set_defaults(handler=command_stats)
+
+    subparser = subparsers.add_parser("warmup", parents=[common],
+                                      help="Równoległe wczytanie i sprawdzenie wszystkich quizów.")
+    subparser.add_argument("--workers", type=int, help="Liczba procesów (domyślnie liczba rdzeni).")
+    subparser.add_argument("--quarantine", action="store_true",
+                           help="Przenieś uszkodzone pliki do podkatalogu .quarantine.")
+    subparser.add_argument("--results", default=RESULTS_DIRECTORY,
+                           help="Katalog z wynikami (najczęściej grane quizy trafiają do pamięci podręcznej).")
+    subparser.set_defaults(handler=command_warmup)
+
+    subparser = subparsers.add_parser("compress", parents=[common],
+                                      help="Kompresja katalogu quizów wspólnym słownikiem zlib.")
+    subparser.add_argument("--plain", action="store_true", help="Przywróć pliki do zwykłego JSON.")
+    subparser.add_argument("--no-train", action="store_true",
+                           help="Użyj najnowszego zapisanego słownika zamiast uczyć nowy.")
+    subparser.set_defaults(handler=command_compress)
+    return parser
+
+def main(argv=None) -> int:
+    """
+    Main function to run the Quiz Application.
+
+    Args:
+        argv (list[str], optional): Command-line arguments. Defaults to sys.argv[1:].
+
+    Returns:
+        int: The exit code (0 on success, 1 when a command failed or found invalid quizzes).
+    """
+    from utils.profiling import profiled
+
+    args = build_parser().parse_args(sys.argv[1:] if argv is None else argv)
+    if args.command is None:
+        run_menu(args.profile, args.profile_interval)
+        return 0
+
+    try:
+        # Komunikaty modułów (np. menedżera danych) trafiają na stderr - stdout zawiera tylko JSON
+        with contextlib.redirect_stdout(sys.stderr), \
+                profiled(args.command, args.profile, interval=args.profile_interval):
+            result, exit_code = args.handler(args)
+    except (OSError, ValueError, KeyError) as e:
+        result, exit_code = {"error": str(e)}, 1
+    except Exception as e: # Np. plik z poprawnym JSON-em o złej strukturze - wynik nadal jest JSON-em
+        result, exit_code = {"error": f"{type(e).__name__}: {e}"}, 1
+    print(json.dumps(result, indent=4, ensure_ascii=False))
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,6 @@
 import json
+from models.scoring import indices_to_mask, mask_to_indices
+from utils.text import AnswerMatcher
 
 class Question:
     """
@@ -35,17 +37,24 @@ class Question:
         self.options = [opt.strip() for opt in options]
         self.correct_answer_index = correct_answer_index
 
-    def display(self) -> str:
+    def display(self, option_order=None) -> str:
         """
         Returns a formatted string for displaying the question and its options.
 
+        Args:
+            option_order (sequence, optional): Original option indices in the order they
+                                               should be shown (e.g. a per-session shuffle).
+                                               Defaults to the stored order.
+
         Returns:
             str: A string representation of the question.
         """
-        display_str = f"Pytanie: {self.question_text}\n"
-        for i, option in enumerate(self.options):
-            display_str += f"  {i + 1}. {option}\n"
-        return display_str
+        if option_order is None:
+            option_order = range(len(self.options))
+        # Jedno łączenie zamiast wielokrotnego += (każde += kopiuje cały dotychczasowy napis)
+        lines = [f"Pytanie: {self.question_text}"]
+        lines.extend(f"  {i + 1}. {self.options[option_index]}" for i, option_index in enumerate(option_order))
+        return "\n".join(lines) + "\n"
 
     def is_correct(self, user_answer_index: int) -> bool:
         """
@@ -59,6 +68,27 @@ class Question:
         """
         return user_answer_index == self.correct_answer_index
 
+    @property
+    def correct_mask(self) -> int:
+        """
+        int: Bitmask of the correct options (bit i set = option i is correct).
+        """
+        return 1 << self.correct_answer_index
+
+    @property
+    def is_multi_answer(self) -> bool:
+        """
+        bool: Whether more than one option may be chosen.
+        """
+        return False
+
+    @property
+    def is_text_answer(self) -> bool:
+        """
+        bool: Whether the answer is typed instead of chosen from the options.
+        """
+        return False
+
     def to_dict(self) -> dict:
         """
         Converts the Question object to a dictionary for JSON serialization.
@@ -76,13 +106,27 @@ class Question:
     def from_dict(cls, data: dict):
         """
         Creates a Question object from a dictionary (for JSON deserialization).
+        Dictionaries with 'correct_answer_indices' produce a MultiAnswerQuestion and
+        dictionaries with "type": "text" a TextAnswerQuestion.
 
         Args:
             data (dict): A dictionary containing question data.
 
         Returns:
-            Question: A new Question object.
+            Question: A new Question (or MultiAnswerQuestion/TextAnswerQuestion) object.
         """
+        if data.get("type") == "text":
+            return TextAnswerQuestion(
+                question_text=data["question_text"],
+                accepted_answers=data["accepted_answers"],
+                answer_patterns=data.get("answer_patterns", [])
+            )
+        if "correct_answer_indices" in data:
+            return MultiAnswerQuestion(
+                question_text=data["question_text"],
+                options=data["options"],
+                correct_answer_indices=data["correct_answer_indices"]
+            )
         return cls(
             question_text=data["question_text"],
             options=data["options"],
@@ -100,3 +144,193 @@ class Question:
         Returns an official string representation of the Question object for debugging.
         """
         return f"Question('{self.question_text}', {self.options}, {self.correct_answer_index})"
+
+
+class MultiAnswerQuestion(Question):
+    """
+    Represents a question with one or more correct options.
+
+    The correct set is stored as an integer bitmask, so grading an answer is a single
+    comparison (or a few bitwise operations for partial credit, see models.scoring).
+
+    Attributes:
+        correct_mask (int): Bitmask of the correct options.
+        correct_answer_index (int): The lowest correct option index (kept for code that
+                                    expects a single correct answer).
+    """
+
+    def __init__(self, question_text: str, options: list, correct_answer_indices: list):
+        """
+        Initializes a new MultiAnswerQuestion object.
+
+        Args:
+            question_text (str): The text of the question.
+            options (list): A list of possible answer options (strings).
+            correct_answer_indices (list[int]): The 0-based indices of all correct answers.
+
+        Raises:
+            ValueError: If inputs are invalid (e.g., no correct answers, index out of bounds).
+        """
+        if not isinstance(correct_answer_indices, (list, tuple, set)) or not correct_answer_indices:
+            raise ValueError("Correct answer indices must be a non-empty list.")
+        if not all(isinstance(i, int) for i in correct_answer_indices):
+            raise ValueError("Correct answer indices must be integers.")
+        super().__init__(question_text, options, min(correct_answer_indices))
+        if max(correct_answer_indices) >= len(self.options):
+            raise ValueError("Correct answer index is out of bounds or not an integer.")
+        self._correct_mask = indices_to_mask(correct_answer_indices)
+
+    @property
+    def correct_mask(self) -> int:
+        """
+        int: Bitmask of the correct options (bit i set = option i is correct).
+        """
+        return self._correct_mask
+
+    @property
+    def is_multi_answer(self) -> bool:
+        """
+        bool: Whether more than one option may be chosen.
+        """
+        return True
+
+    @property
+    def correct_answer_indices(self) -> list[int]:
+        """
+        list[int]: The 0-based indices of the correct answers, in increasing order.
+        """
+        return mask_to_indices(self._correct_mask)
+
+    def is_correct(self, user_answer_indices) -> bool:
+        """
+        Checks if the user chose exactly the set of correct options.
+
+        Args:
+            user_answer_indices (iterable[int]): The 0-based indices of the chosen options.
+
+        Returns:
+            bool: True if the answer is correct, False otherwise.
+        """
+        return indices_to_mask(user_answer_indices) == self._correct_mask
+
+    def to_dict(self) -> dict:
+        """
+        Converts the MultiAnswerQuestion object to a dictionary for JSON serialization.
+
+        Returns:
+            dict: A dictionary representation of the question.
+        """
+        return {
+            "question_text": self.question_text,
+            "options": self.options,
+            "correct_answer_indices": self.correct_answer_indices
+        }
+
+    def __str__(self):
+        """
+        Returns a human-readable string representation of the MultiAnswerQuestion object.
+        """
+        correct = [self.options[i] for i in self.correct_answer_indices]
+        return f"Pytanie: '{self.question_text}', Opcje: {self.options}, Poprawne: {correct}"
+
+    def __repr__(self):
+        """
+        Returns an official string representation of the MultiAnswerQuestion object for debugging.
+        """
+        return f"MultiAnswerQuestion('{self.question_text}', {self.options}, {self.correct_answer_indices})"
+
+
+class TextAnswerQuestion(Question):
+    """
+    Represents a question answered by typing text instead of choosing an option.
+
+    Accepted answers are compared after normalization (case folding, Polish diacritic
+    folding, whitespace collapse), so "Łódź", "lodz" and " LODZ " are the same answer.
+    Optional regular expressions accept further variants; they are compiled once and
+    cached (see utils.text.AnswerMatcher).
+
+    Attributes:
+        options (list): The accepted answers (the first one is shown as the correct answer).
+        answer_patterns (list): Regular expressions matched against the normalized answer.
+        matcher (AnswerMatcher): The precompiled matcher used for grading.
+    """
+
+    def __init__(self, question_text: str, accepted_answers: list, answer_patterns: list = None):
+        """
+        Initializes a new TextAnswerQuestion object.
+
+        Args:
+            question_text (str): The text of the question.
+            accepted_answers (list): A non-empty list of accepted answers (strings).
+            answer_patterns (list, optional): Regular expressions of further accepted answers.
+
+        Raises:
+            ValueError: If inputs are invalid (e.g., no accepted answers, invalid pattern).
+        """
+        if not isinstance(accepted_answers, list) or not accepted_answers:
+            raise ValueError("Accepted answers must be a non-empty list.")
+        super().__init__(question_text, accepted_answers, 0)
+        answer_patterns = answer_patterns or []
+        if not all(isinstance(pattern, str) and pattern for pattern in answer_patterns):
+            raise ValueError("Answer patterns must be non-empty strings.")
+        self.answer_patterns = list(answer_patterns)
+        self.matcher = AnswerMatcher(self.options, self.answer_patterns)
+
+    @property
+    def is_text_answer(self) -> bool:
+        """
+        bool: Whether the answer is typed instead of chosen from the options.
+        """
+        return True
+
+    def display(self, option_order=None) -> str:
+        """
+        Returns a formatted string for displaying the question (accepted answers are not shown).
+
+        Args:
+            option_order (sequence, optional): Ignored; text questions have no options to order.
+
+        Returns:
+            str: A string representation of the question.
+        """
+        return f"Pytanie: {self.question_text}\n"
+
+    def is_correct(self, user_answer: str) -> bool:
+        """
+        Checks a typed answer against the accepted answers and patterns.
+
+        Args:
+            user_answer (str): The answer typed by the user.
+
+        Returns:
+            bool: True if the answer is accepted, False otherwise.
+        """
+        return self.matcher.matches(user_answer)
+
+    def to_dict(self) -> dict:
+        """
+        Converts the TextAnswerQuestion object to a dictionary for JSON serialization.
+
+        Returns:
+            dict: A dictionary representation of the question.
+        """
+        data = {
+            "type": "text",
+            "question_text": self.question_text,
+            "accepted_answers": self.options
+        }
+        if self.answer_patterns:
+            data["answer_patterns"] = self.answer_patterns
+        return data
+
+    def __str__(self):
+        """
+        Returns a human-readable string representation of the TextAnswerQuestion object.
+        """
+        return f"Pytanie: '{self.question_text}', Akceptowane odpowiedzi: {self.options}"
+
+    def __repr__(self):
+        """
+        Returns an official string representation of the TextAnswerQuestion object for debugging.
+        """
+        return f"TextAnswerQuestion('{self.question_text}', {self.options}, {self.answer_patterns})"
@@ -1,3 +1,5 @@
+import hashlib
+import json
 from .question import Question 
 
 class Quiz:
@@ -61,6 +63,26 @@ class Quiz:
             raise IndexError("Question index is out of bounds.")
         self.questions.pop(index)
 
+    def remove_questions(self, indices) -> int:
+        """
+        Removes several questions in a single pass over the question list
+        (instead of one list shift per removed question).
+
+        Args:
+            indices (iterable[int]): The 0-based indices of the questions to remove.
+
+        Returns:
+            int: The number of removed questions.
+
+        Raises:
+            IndexError: If an index is out of bounds.
+        """
+        to_remove = set(indices)
+        if any(not isinstance(index, int) or not (0 <= index < len(self.questions)) for index in to_remove):
+            raise IndexError("Question index is out of bounds.")
+        self.questions = [q for i, q in enumerate(self.questions) if i not in to_remove]
+        return len(to_remove)
+
     def to_dict(self) -> dict:
         """
         Converts the Quiz object to a dictionary for JSON serialization.
@@ -75,6 +97,20 @@ class Quiz:
             "questions": [q.to_dict() for q in self.questions]
         }
 
+    def fingerprint(self) -> str:
+        """
+        Returns a short content hash identifying this exact version of the quiz.
+
+        The hash is computed from the canonical JSON form of to_dict(), so two quizzes
+        with the same title, description and questions share a fingerprint, and any
+        edit produces a new one.
+
+        Returns:
+            str: A 16-character hexadecimal fingerprint.
+        """
+        canonical = json.dumps(self.to_dict(), sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16]
+
     @classmethod
     def from_dict(cls, data: dict):
         """
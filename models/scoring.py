@@ -0,0 +1,162 @@
+import os
+
+
+def indices_to_mask(indices) -> int:
+    """
+    Converts option indices into an integer bitmask (bit i set = option i chosen).
+
+    Args:
+        indices (iterable[int]): 0-based option indices.
+
+    Returns:
+        int: The bitmask.
+
+    Raises:
+        ValueError: If an index is negative.
+    """
+    mask = 0
+    for index in indices:
+        if index < 0:
+            raise ValueError("Option indices must be non-negative.")
+        mask |= 1 << index
+    return mask
+
+
+def mask_to_indices(mask: int) -> list[int]:
+    """
+    Converts a bitmask back into sorted option indices.
+
+    Args:
+        mask (int): The bitmask.
+
+    Returns:
+        list[int]: The indices of the set bits, in increasing order.
+    """
+    indices = []
+    while mask:
+        lowest = mask & -mask
+        indices.append(lowest.bit_length() - 1)
+        mask ^= lowest
+    return indices
+
+
+class ScoringPolicy:
+    """
+    Base class of the policies that turn answer bitmasks into points.
+
+    Every question is worth at most 1 point. Subclasses implement score(); grade_sheet()
+    grades a whole answer sheet with bitwise operations only.
+    """
+
+    name = "base"
+
+    def score(self, correct_mask: int, answer_mask: int) -> float:
+        """
+        Scores one answer.
+
+        Args:
+            correct_mask (int): Bitmask of the correct options.
+            answer_mask (int): Bitmask of the chosen options.
+
+        Returns:
+            float: Points for the answer.
+        """
+        raise NotImplementedError
+
+    def grade_sheet(self, correct_masks, answer_masks) -> tuple[float, list[float]]:
+        """
+        Grades a whole answer sheet.
+
+        Args:
+            correct_masks (sequence[int]): Answer key, one bitmask per question.
+            answer_masks (sequence[int]): Chosen options, one bitmask per question.
+
+        Returns:
+            tuple[float, list[float]]: The total score and the score of each question.
+
+        Raises:
+            ValueError: If the key and the sheet have different lengths.
+        """
+        if len(correct_masks) != len(answer_masks):
+            raise ValueError("Answer sheet and answer key must have the same number of questions.")
+        scores = [self.score(correct, answer) for correct, answer in zip(correct_masks, answer_masks)]
+        return sum(scores), scores
+
+
+class AllOrNothingScoring(ScoringPolicy):
+    """1 point only when exactly the correct set of options is chosen."""
+
+    name = "all_or_nothing"
+
+    def score(self, correct_mask: int, answer_mask: int) -> float:
+        """Scores one answer: 1 for an exact match, otherwise 0."""
+        return 1.0 if answer_mask == correct_mask else 0.0
+
+
+class PartialCreditScoring(ScoringPolicy):
+    """
+    Each correct option chosen earns an equal share of the point; each wrong option
+    chosen takes one share away. The score never drops below 0.
+    """
+
+    name = "partial"
+
+    def score(self, correct_mask: int, answer_mask: int) -> float:
+        """Scores one answer: (hits - false picks) / number of correct options, at least 0."""
+        hits = (answer_mask & correct_mask).bit_count()
+        false_picks = (answer_mask & ~correct_mask).bit_count()
+        return max(0.0, (hits - false_picks) / correct_mask.bit_count())
+
+
+class NegativeMarkingScoring(ScoringPolicy):
+    """
+    1 point for an exact match, 0 for no answer and a penalty for any other answer,
+    which discourages guessing.
+
+    Attributes:
+        penalty (float): Points subtracted for a wrong answer.
+    """
+
+    name = "negative"
+
+    def __init__(self, penalty: float = 0.25):
+        """
+        Initializes the policy.
+
+        Args:
+            penalty (float): Points subtracted for a wrong answer. Defaults to 0.25.
+        """
+        self.penalty = penalty
+
+    def score(self, correct_mask: int, answer_mask: int) -> float:
+        """Scores one answer: 1, 0 (skipped) or -penalty."""
+        if answer_mask == correct_mask:
+            return 1.0
+        return 0.0 if answer_mask == 0 else -self.penalty
+
+
+SCORING_POLICIES = {
+    AllOrNothingScoring.name: AllOrNothingScoring,
+    PartialCreditScoring.name: PartialCreditScoring,
+    NegativeMarkingScoring.name: NegativeMarkingScoring,
+}
+
+
+def get_scoring_policy(name: str = None) -> ScoringPolicy:
+    """
+    Returns a scoring policy by name.
+
+    Args:
+        name (str, optional): 'all_or_nothing', 'partial' or 'negative'. Defaults to the
+                              QUIZ_SCORING environment variable, or 'all_or_nothing'.
+
+    Returns:
+        ScoringPolicy: A policy instance.
+
+    Raises:
+        ValueError: If the name is unknown.
+    """
+    name = (name or os.environ.get("QUIZ_SCORING", AllOrNothingScoring.name)).lower()
+    if name not in SCORING_POLICIES:
+        raise ValueError(f"Unknown scoring policy: {name}")
+    return SCORING_POLICIES[name]()
@@ -0,0 +1,129 @@
+# quiz_project/quiz_creator/composer.py
+import fnmatch
+import hashlib
+import re
+from models.question import Question
+from models.quiz import Quiz
+from quiz_data.manager import QuizDataManager
+from utils.sampling import make_rng, reservoir_sample
+
+# Jeden element specyfikacji: "<liczba> from <wzorzec>" (dopuszczamy też polskie "z")
+_STRATUM_PATTERN = re.compile(r"^\s*(\d+)\s+(?:from|z)\s+(\S+)\s*$", re.IGNORECASE)
+
+
+class ExamComposer:
+    """
+    Builds composite exams by drawing questions from many quiz files.
+
+    An exam is described by a specification such as "5 from geografia*, 10 from python":
+    each comma-separated part (a stratum) names how many questions to draw from the quiz
+    files whose names match a shell-style pattern. Source quizzes are streamed one file at
+    a time through QuizDataManager and sampled with a reservoir, so only the selected
+    questions (and short hashes of the questions already seen) are kept in memory.
+    """
+
+    @staticmethod
+    def parse_spec(spec: str) -> list[tuple[int, str]]:
+        """
+        Parses an exam specification.
+
+        Args:
+            spec (str): A specification such as "5 from geografia*, 10 from python".
+
+        Returns:
+            list[tuple[int, str]]: (number of questions, quiz name pattern) for each stratum.
+
+        Raises:
+            ValueError: If the specification is empty or a part cannot be parsed.
+        """
+        strata = []
+        for part in spec.split(","):
+            if not part.strip():
+                continue
+            match = _STRATUM_PATTERN.match(part)
+            if not match:
+                raise ValueError(f"Invalid exam specification part: '{part.strip()}'. "
+                                 "Expected '<count> from <pattern>'.")
+            strata.append((int(match.group(1)), match.group(2)))
+        if not strata:
+            raise ValueError("Exam specification cannot be empty.")
+        return strata
+
+    @staticmethod
+    def question_key(question: Question) -> bytes:
+        """
+        Returns a short hash identifying a question regardless of whitespace and letter case.
+
+        Args:
+            question (Question): The question.
+
+        Returns:
+            bytes: A 12-byte digest of the normalized question data.
+        """
+        normalized = "\x1f".join(" ".join(part.casefold().split())
+                                 for part in [question.question_text, *question.options])
+        normalized += f"\x1e{question.correct_mask}"
+        return hashlib.blake2b(normalized.encode('utf-8'), digest_size=12).digest()
+
+    @staticmethod
+    def _stream_questions(names, directory: str, excluded_keys: set):
+        """
+        Yields (key, question) for every distinct question of the given quizzes.
+
+        Quizzes are loaded lazily, one at a time; unreadable files are skipped with a message.
+        """
+        seen_keys = set()
+        for name in names:
+            try:
+                quiz = QuizDataManager.load_quiz(name, directory, verbose=False)
+            except Exception as e:
+                print(f"Pominięto quiz '{name}': {e}")
+                continue
+            for question in quiz.questions:
+                key = ExamComposer.question_key(question)
+                if key in seen_keys or key in excluded_keys:
+                    continue
+                seen_keys.add(key)
+                yield key, question
+
+    @staticmethod
+    def compose(spec: str, title: str, description: str = "", directory: str = "data/quiz_examples",
+                seed=None) -> Quiz:
+        """
+        Composes a new quiz according to an exam specification.
+
+        Identical questions (same normalized text, options and correct answer) are counted
+        once, also across strata. For a given seed and catalog the result is reproducible.
+
+        Args:
+            spec (str): Exam specification, e.g. "5 from geografia*, 10 from python".
+            title (str): Title of the composed quiz.
+            description (str, optional): Description of the composed quiz.
+            directory (str): Directory with the source quizzes. Defaults to "data/quiz_examples".
+            seed (int, optional): Seed of the draw.
+
+        Returns:
+            Quiz: The composed quiz with copies of the drawn questions.
+
+        Raises:
+            ValueError: If the specification is invalid, a pattern matches no quizzes or
+                        a stratum has fewer distinct questions than requested.
+        """
+        strata = ExamComposer.parse_spec(spec)
+        rng = make_rng(seed)
+        available_quizzes = QuizDataManager.list_available_quizzes(directory)
+        selected_keys = set()
+        exam = Quiz(title, description)
+
+        for count, pattern in strata:
+            names = fnmatch.filter(available_quizzes, pattern)
+            if not names:
+                raise ValueError(f"No quizzes match the pattern '{pattern}'.")
+            drawn = reservoir_sample(ExamComposer._stream_questions(names, directory, selected_keys), count, rng)
+            if len(drawn) < count:
+                raise ValueError(f"Pattern '{pattern}' provides only {len(drawn)} distinct questions, "
+                                 f"{count} requested.")
+            for key, question in drawn:
+                selected_keys.add(key)
+                exam.add_question(Question.from_dict(question.to_dict()))
+        return exam
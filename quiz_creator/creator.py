@@ -1,8 +1,17 @@
 # quiz_project/quiz_creator/creator.py
-from models.question import Question
+import os
+import sqlite3
+from models.question import MultiAnswerQuestion, Question
 from models.quiz import Quiz
+from quiz_creator.composer import ExamComposer
+from quiz_creator.navigator import PAGE_SIZE, QuestionNavigator
 from quiz_data.manager import QuizDataManager
-import os
+from quiz_results.log import recent_play_counts
+from quiz_search.duplicates import NearDuplicateDetector
+from quiz_search.index import QuestionIndex
+from quiz_search.picker import QuizPicker
+from utils import console
+from utils.tracing import span, traced
 
 class QuizCreator:
     """
@@ -13,6 +22,7 @@ class QuizCreator:
     """
 
     @staticmethod
+    @traced()
     def create_new_quiz():
         """
         Guides the user through creating a new quiz, question by question.
@@ -23,14 +33,14 @@ class QuizCreator:
 
         # Get quiz title
         while True:
-            title = input("Podaj tytuł quizu (np. 'Geografia Polski'): ").strip()
+            title = console.input("Podaj tytuł quizu (np. 'Geografia Polski'): ").strip()
             if title:
                 break
             else:
                 print("Tytuł quizu nie może być pusty. Spróbuj ponownie.")
 
         # Get quiz description (optional)
-        description = input("Podaj krótki opis quizu (opcjonalnie): ").strip()
+        description = console.input("Podaj krótki opis quizu (opcjonalnie): ").strip()
 
         new_quiz = Quiz(title, description)
         print(f"Quiz '{title}' został utworzony. Teraz dodaj pytania.")
@@ -47,24 +57,106 @@ class QuizCreator:
         QuizCreator._save_quiz_with_prompt(new_quiz)
 
     @staticmethod
+    @traced("similar_questions")
+    def _show_similar_questions(question_text: str, search_index: QuestionIndex = None,
+                                directory: str = "data/quiz_examples", limit: int = 3):
+        """
+        Prints the catalog questions most similar to a new question text.
+
+        On the first call the search index is refreshed in the background (only changed
+        quiz files are reindexed), so the hint is shown at once from the stored index; the
+        index is reused for the following questions. Search errors are reported and ignored.
+
+        Args:
+            question_text (str): Text of the question being added.
+            search_index (QuestionIndex, optional): Index returned by a previous call.
+            directory (str): The quiz directory. Defaults to "data/quiz_examples".
+            limit (int): Maximum number of similar questions shown. Defaults to 3.
+
+        Returns:
+            QuestionIndex: The index to pass to the next call (None if it is unavailable).
+        """
+        try:
+            if search_index is None:
+                search_index = QuestionIndex(directory)
+                # Zapis quizu aktualizuje indeks na bieżąco; w tle dochodzą tylko pliki zmienione poza programem
+                search_index.refresh_in_background()
+            results = search_index.search(question_text, limit)
+        except (sqlite3.Error, OSError) as e:
+            print(f"Wyszukiwanie podobnych pytań jest niedostępne: {e}")
+            return None
+        if results:
+            print("Podobne pytania w katalogu:")
+            for result in results:
+                print(f"  - [{result['quiz']}] {result['question_text']}")
+        return search_index
+
+    @staticmethod
+    @traced("near_duplicates")
+    def _warn_near_duplicates(question: Question, quiz: Quiz, detector: NearDuplicateDetector = None,
+                              directory: str = "data/quiz_examples") -> NearDuplicateDetector:
+        """
+        Warns when a just-added question is a likely near duplicate of a catalog question or
+        of another question of the edited quiz, then remembers it for the following checks.
+
+        Catalog questions are looked up by the LSH bands stored in the search index (kept
+        current by save_quiz and the background refresh of _show_similar_questions), so
+        the catalog is never hashed again; the detector is reused for the following calls.
+
+        Args:
+            question (Question): The question that was added (already the last one in the quiz).
+            quiz (Quiz): The quiz being edited.
+            detector (NearDuplicateDetector, optional): Detector returned by a previous call.
+            directory (str): The quiz directory. Defaults to "data/quiz_examples".
+
+        Returns:
+            NearDuplicateDetector: The detector to pass to the next call.
+        """
+        if detector is None:
+            detector = NearDuplicateDetector(index=QuestionIndex(directory))
+            for i, existing in enumerate(quiz.questions[:-1]):
+                detector.add((quiz.title, i), existing)
+        try:
+            duplicates = detector.find_duplicates(question)
+        except (sqlite3.Error, OSError) as e:
+            print(f"Sprawdzanie podobnych pytań w katalogu jest niedostępne: {e}")
+            duplicates = []
+        if duplicates:
+            print("Uwaga: to pytanie jest bardzo podobne do:")
+            for (source, _), label, similarity in duplicates[:3]:
+                print(f"  - [{source}] {label} (podobieństwo {similarity:.0%})")
+        detector.add((quiz.title, len(quiz.questions) - 1), question)
+        return detector
+
+    @staticmethod
+    @traced("add_questions")
     def _add_questions_to_quiz(quiz: Quiz):
         """
         Helper method to interactively add questions to a given quiz object.
         Used by both create_new_quiz and edit_existing_quiz.
         """
+        search_index = None
+        duplicate_detector = None
         while True:
             print("\n--- Dodawanie nowego pytania ---")
-            question_text = input("Wpisz treść pytania (naciśnij Enter, aby zakończyć dodawanie pytań): ").strip()
+            question_text = console.input("Wpisz treść pytania (naciśnij Enter, aby zakończyć dodawanie pytań): ").strip()
 
             if not question_text:
                 print("Zakończono dodawanie pytań.")
+                if search_index is not None:
+                    search_index.close()
+                if duplicate_detector is not None:
+                    duplicate_detector.close()
                 break
 
+            # Zanim autor wpisze opcje, pokazujemy podobne pytania już istniejące w katalogu
+            search_index = QuizCreator._show_similar_questions(question_text, search_index)
+
             options = []
             option_count = 1
             print("Wpisuj opcje odpowiedzi. Naciśnij Enter na pustej linii, aby zakończyć dodawanie opcji.")
             while True:
-                option = input(f"Opcja {option_count}: ").strip()
+                option = console.input(f"Opcja {option_count}: ").strip()
                 if not option:
                     if len(options) < 2: # A question needs at least 2 options
                         print("Pytanie musi mieć co najmniej dwie opcje odpowiedzi.")
@@ -77,7 +169,7 @@ class QuizCreator:
                     options.append(option)
                     option_count += 1
 
-            correct_answer_index = -1
+            correct_answer_indices = []
             while True:
                 try:
                     # Display options with numbers for user to choose
@@ -85,10 +177,11 @@ class QuizCreator:
                     for i, opt in enumerate(options):
                         print(f"  {i + 1}. {opt}")
 
-                    user_input = input("Wpisz numer poprawnej odpowiedzi: ").strip()
-                    correct_answer_index = int(user_input) - 1 # Convert to 0-based index
+                    user_input = console.input("Wpisz numer poprawnej odpowiedzi (kilka numerów oddziel przecinkami): ").strip()
+                    # Convert to 0-based indices; several numbers make a multi-answer question
+                    correct_answer_indices = sorted({int(part) - 1 for part in user_input.split(",")})
 
-                    if 0 <= correct_answer_index < len(options):
+                    if all(0 <= index < len(options) for index in correct_answer_indices):
                         break
                     else:
                         print("Nieprawidłowy numer opcji. Wpisz numer z listy.")
@@ -98,9 +191,13 @@ class QuizCreator:
                     print(f"Wystąpił nieoczekiwany błąd podczas wyboru poprawnej odpowiedzi: {e}")
 
             try:
-                question = Question(question_text, options, correct_answer_index)
+                if len(correct_answer_indices) > 1:
+                    question = MultiAnswerQuestion(question_text, options, correct_answer_indices)
+                else:
+                    question = Question(question_text, options, correct_answer_indices[0])
                 quiz.add_question(question)
                 print("Pytanie dodane pomyślnie!")
+                duplicate_detector = QuizCreator._warn_near_duplicates(question, quiz, duplicate_detector)
             except ValueError as e:
                 print(f"Błąd podczas tworzenia pytania: {e}. To pytanie nie zostało dodane.")
             except TypeError as e:
@@ -109,13 +206,14 @@ class QuizCreator:
                 print(f"Wystąpił nieoczekiwany błąd podczas dodawania pytania do quizu: {e}")
 
     @staticmethod
+    @traced("save_prompt")
     def _save_quiz_with_prompt(quiz: Quiz):
         """
         Helper method to prompt user for filename and save the quiz.
         Handles existing file overwrite confirmation.
         """
         while True:
-            filename = input("Podaj nazwę pliku, pod którą zapisać quiz (bez rozszerzenia .json): ").strip()
+            filename = console.input("Podaj nazwę pliku, pod którą zapisać quiz (bez rozszerzenia .json): ").strip()
             if not filename:
                 print("Nazwa pliku nie może być pusta.")
                 continue
@@ -126,7 +224,7 @@ class QuizCreator:
             # Check for existing file and ask for overwrite confirmation
             full_path = os.path.join("data/quiz_examples", filename + ".json")
             if os.path.exists(full_path):
-                overwrite = input(f"Plik '{filename}.json' już istnieje. Czy chcesz go nadpisać? (tak/nie): ").lower()
+                overwrite = console.input(f"Plik '{filename}.json' już istnieje. Czy chcesz go nadpisać? (tak/nie): ").lower()
                 if overwrite != 'tak':
                     print("Zapisywanie quizu anulowane.")
                     return # Exit without saving if user doesn't want to overwrite
@@ -139,6 +237,33 @@ class QuizCreator:
             print(f"Wystąpił błąd podczas zapisywania quizu: {e}")
 
     @staticmethod
+    @traced()
+    def compose_exam():
+        """
+        Guides the user through composing an exam from questions drawn across many quizzes,
+        e.g. "5 from geografia*, 10 from python", and saves it as a new quiz.
+        """
+        print("\n--- Składanie egzaminu z wielu quizów ---")
+        spec = console.input("Podaj specyfikację (np. '5 from geografia*, 10 from python'): ").strip()
+
+        while True:
+            title = console.input("Podaj tytuł egzaminu: ").strip()
+            if title:
+                break
+            print("Tytuł egzaminu nie może być pusty. Spróbuj ponownie.")
+
+        seed_input = console.input("Ziarno losowania (Enter = losowe): ").strip()
+        try:
+            exam = ExamComposer.compose(spec, title, seed=int(seed_input) if seed_input else None)
+        except ValueError as e:
+            print(f"Nie udało się złożyć egzaminu: {e}")
+            return
+
+        print(f"Złożono egzamin '{exam.title}' z {len(exam.questions)} pytań.")
+        QuizCreator._save_quiz_with_prompt(exam)
+
+    @staticmethod
+    @traced()
     def edit_existing_quiz():
         """
         Allows the user to select an existing quiz and modify its properties or questions.
@@ -150,24 +275,11 @@ class QuizCreator:
             print("Brak dostępnych quizów do edycji. Najpierw utwórz quiz.")
             return
 
-        print("Dostępne quizy do edycji:")
-        for i, quiz_name in enumerate(available_quizzes):
-            print(f"  {i + 1}. {quiz_name}")
-
-        selected_quiz_name = None
-        while True:
-            try:
-                choice = input("Wybierz numer quizu do edycji: ").strip()
-                choice_index = int(choice) - 1
-                if 0 <= choice_index < len(available_quizzes):
-                    selected_quiz_name = available_quizzes[choice_index]
-                    break
-                else:
-                    print("Nieprawidłowy numer. Wpisz numer z listy.")
-            except ValueError:
-                print("To nie jest liczba. Wpisz numer quizu.")
-            except Exception as e:
-                print(f"Wystąpił nieoczekiwany błąd podczas wyboru quizu: {e}")
+        with span("select_quiz", quizzes=len(available_quizzes)):
+            picker = QuizPicker.for_catalog(available_quizzes, QuestionIndex.load_titles())
+            selected_quiz_name = picker.choose("Wybierz numer quizu do edycji: ", "Dostępne quizy do edycji:",
+                                               on_show=lambda names: QuizDataManager.prefetch(
+                                                   names, play_counts=recent_play_counts))
 
         quiz_to_edit = None
         try:
@@ -180,6 +292,9 @@ class QuizCreator:
             print(f"Wystąpił błąd podczas ładowania quizu '{selected_quiz_name}': {e}")
             return
 
+        # Indeks wyszukiwania pytań budowany raz na sesję edycji
+        navigator = QuestionNavigator(quiz_to_edit)
+
         # Main editing loop
         while True:
             print(f"\n--- Edycja quizu: {quiz_to_edit.title} ---")
@@ -187,26 +302,29 @@ class QuizCreator:
             print("2. Dodaj nowe pytanie")
             print("3. Edytuj istniejące pytanie")
             print("4. Usuń pytanie")
-            print("5. Zakończ edycję i zapisz zmiany")
-            print("6. Anuluj edycję (nie zapisuj zmian)")
+            print("5. Usuń wszystkie pytania pasujące do wyszukiwania")
+            print("6. Zakończ edycję i zapisz zmiany")
+            print("7. Anuluj edycję (nie zapisuj zmian)")
 
-            edit_choice = input("Wybierz opcję edycji (1-6): ").strip()
+            edit_choice = console.input("Wybierz opcję edycji (1-7): ").strip()
 
             if edit_choice == '1':
                 print("\n--- Edycja tytułu i opisu ---")
-                new_title = input(f"Nowy tytuł quizu (obecny: '{quiz_to_edit.title}'): ").strip()
+                new_title = console.input(f"Nowy tytuł quizu (obecny: '{quiz_to_edit.title}'): ").strip()
                 if new_title:
                     quiz_to_edit.title = new_title
                 else:
                     print("Tytuł nie może być pusty, pozostawiono obecny.")
 
-                new_description = input(f"Nowy opis quizu (obecny: '{quiz_to_edit.description}'): ").strip()
+                new_description = console.input(f"Nowy opis quizu (obecny: '{quiz_to_edit.description}'): ").strip()
                 quiz_to_edit.description = new_description
                 print("Tytuł i opis zaktualizowane.")
 
             elif edit_choice == '2':
                 print("\n--- Dodawanie nowego pytania do quizu ---")
+                questions_before = len(quiz_to_edit.questions)
                 QuizCreator._add_questions_to_quiz(quiz_to_edit)
+                navigator.added(quiz_to_edit.questions[questions_before:])
                 print("Powrót do menu edycji.")
 
             elif edit_choice == '3':
@@ -215,37 +333,39 @@ class QuizCreator:
                     continue
 
                 print("\n--- Edycja istniejącego pytania ---")
-                print("Obecne pytania:")
-                for i, q in enumerate(quiz_to_edit.questions):
-                    print(f"  {i + 1}. {q.question_text}")
+                q_index = navigator.select("Wpisz numer pytania do edycji")
+                if q_index is None:
+                    continue
 
                 try:
-                    q_index_input = input("Wpisz numer pytania do edycji: ").strip()
-                    q_index = int(q_index_input) - 1
-
                     if 0 <= q_index < len(quiz_to_edit.questions):
                         question_to_edit = quiz_to_edit.questions[q_index]
                         print(f"\nEdytujesz pytanie: {question_to_edit.question_text}")
 
                         # Edit question text
-                        new_q_text = input(f"Nowa treść pytania (obecna: '{question_to_edit.question_text}'): ").strip()
+                        new_q_text = console.input(f"Nowa treść pytania (obecna: '{question_to_edit.question_text}'): ").strip()
                         if new_q_text:
                             question_to_edit.question_text = new_q_text
+                            navigator.replace(question_to_edit, question_to_edit)
                         else:
                             print("Treść pytania nie może być pusta, pozostawiono obecną.")
 
+                        if question_to_edit.is_text_answer:
+                            print("Akceptowane odpowiedzi pytania tekstowego edytuje się w pliku quizu.")
+                            continue
+
                         # Edit options
                         print("\nEdytuj opcje odpowiedzi. Naciśnij Enter, aby pozostawić bez zmian.")
                         new_options = []
                         for i, opt in enumerate(question_to_edit.options):
-                            edited_opt = input(f"Opcja {i+1} (obecna: '{opt}'): ").strip()
+                            edited_opt = console.input(f"Opcja {i+1} (obecna: '{opt}'): ").strip()
                             new_options.append(edited_opt if edited_opt else opt)
                         
                         # Allow adding new options
                         while True:
-                            add_more = input("Dodać nową opcję? (tak/nie): ").lower().strip()
+                            add_more = console.input("Dodać nową opcję? (tak/nie): ").lower().strip()
                             if add_more == 'tak':
-                                new_opt = input("Wpisz nową opcję: ").strip()
+                                new_opt = console.input("Wpisz nową opcję: ").strip()
                                 if new_opt and new_opt not in new_options:
                                     new_options.append(new_opt)
                                 elif new_opt:
@@ -268,17 +388,27 @@ class QuizCreator:
 
                         while True:
                             try:
-                                current_correct = question_to_edit.correct_answer_index
-                                new_correct_input = input(f"Nowy numer poprawnej odpowiedzi (obecny: {current_correct + 1}): ").strip()
+                                if question_to_edit.is_multi_answer:
+                                    current_correct = ",".join(str(i + 1) for i in question_to_edit.correct_answer_indices)
+                                else:
+                                    current_correct = question_to_edit.correct_answer_index + 1
+                                new_correct_input = console.input(f"Nowy numer poprawnej odpowiedzi (obecny: {current_correct}): ").strip()
                                 if not new_correct_input: # If user presses Enter, keep old one
                                     question_to_edit.options = new_options # Update options before setting index
                                     print("Poprawna odpowiedź pozostawiona bez zmian.")
                                     break
 
-                                new_correct_index = int(new_correct_input) - 1
-                                if 0 <= new_correct_index < len(new_options):
-                                    question_to_edit.options = new_options # Update options first
-                                    question_to_edit.correct_answer_index = new_correct_index
+                                new_correct_indices = sorted({int(part) - 1 for part in new_correct_input.split(",")})
+                                if all(0 <= index < len(new_options) for index in new_correct_indices):
+                                    # Zmiana liczby poprawnych odpowiedzi może wymagać innego typu pytania
+                                    if len(new_correct_indices) > 1:
+                                        question_to_edit = MultiAnswerQuestion(question_to_edit.question_text,
+                                                                               new_options, new_correct_indices)
+                                    else:
+                                        question_to_edit = Question(question_to_edit.question_text,
+                                                                    new_options, new_correct_indices[0])
+                                    navigator.replace(quiz_to_edit.questions[q_index], question_to_edit)
+                                    quiz_to_edit.questions[q_index] = question_to_edit
                                     print("Pytanie zaktualizowane pomyślnie!")
                                     break
                                 else:
@@ -299,35 +429,45 @@ class QuizCreator:
                     continue
 
                 print("\n--- Usuwanie pytania ---")
-                print("Obecne pytania:")
-                for i, q in enumerate(quiz_to_edit.questions):
-                    print(f"  {i + 1}. {q.question_text}")
-                
-                try:
-                    q_index_input = input("Wpisz numer pytania do usunięcia: ").strip()
-                    q_index = int(q_index_input) - 1
+                q_index = navigator.select("Wpisz numer pytania do usunięcia")
+                if q_index is None:
+                    continue
 
+                try:
                     if 0 <= q_index < len(quiz_to_edit.questions):
-                        removed_question_text = quiz_to_edit.questions[q_index].question_text
+                        removed_question = quiz_to_edit.questions[q_index]
                         quiz_to_edit.remove_question(q_index)
-                        print(f"Pytanie '{removed_question_text}' zostało usunięte.")
+                        navigator.removed([removed_question])
+                        print(f"Pytanie '{removed_question.question_text}' zostało usunięte.")
                     else:
                         print("Nieprawidłowy numer pytania.")
-                except ValueError:
-                    print("To nie jest liczba. Wpisz numer pytania.")
                 except IndexError:
                     print("Nieprawidłowy indeks pytania.") # Should be caught by the if condition
                 except Exception as e:
                     print(f"Wystąpił nieoczekiwany błąd podczas usuwania pytania: {e}")
 
             elif edit_choice == '5':
+                query = console.input("Usuń pytania zawierające tekst: ").strip()
+                matches = navigator.search(query)
+                if not matches:
+                    print("Żadne pytanie nie pasuje do wyszukiwania.")
+                    continue
+                print(f"Pasujących pytań: {len(matches)}. Pierwsze z nich:")
+                for position in matches[:PAGE_SIZE]:
+                    print(f"  {position + 1}. {quiz_to_edit.questions[position].question_text}")
+                if console.input(f"Usunąć wszystkie {len(matches)} pytań? (tak/nie): ").lower().strip() == 'tak':
+                    print(f"Usunięto pytań: {navigator.delete_matching(query)}.")
+                else:
+                    print("Anulowano usuwanie.")
+
+            elif edit_choice == '6':
                 # Save changes
                 QuizCreator._save_quiz_with_prompt(quiz_to_edit)
                 print("Zakończono edycję quizu.")
                 break
-            elif edit_choice == '6':
+            elif edit_choice == '7':
                 print("Anulowano edycję. Zmiany nie zostaną zapisane.")
                 break
             else:
-                print("Nieprawidłowy wybór. Proszę wybrać opcję 1-6.")
+                print("Nieprawidłowy wybór. Proszę wybrać opcję 1-7.")
 
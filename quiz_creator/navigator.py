@@ -0,0 +1,221 @@
+# quiz_project/quiz_creator/navigator.py
+from models.question import Question
+from models.quiz import Quiz
+from utils import console
+from utils.text import normalize_answer
+
+# Do tej liczby pytań edytor wyświetla pełną listę (jak dotychczas)
+FULL_LIST_LIMIT = 30
+PAGE_SIZE = 10
+
+
+class QuestionNavigator:
+    """
+    Paged navigation and search over the questions of a quiz being edited.
+
+    The search index is built once per editing session (on the first search) and then
+    kept up to date as questions are edited or deleted, so listing a page or searching does not rescan the
+    whole quiz. Substring queries of three or more characters use a trigram index (the
+    candidates are then verified with a plain substring test); shorter queries match the
+    beginnings of words. Text is compared after case and diacritic folding.
+
+    Questions are tracked by identity, so edits and deletions never shift index entries.
+    """
+
+    def __init__(self, quiz: Quiz):
+        """
+        Initializes the navigator of a quiz.
+
+        Args:
+            quiz (Quiz): The quiz being edited.
+        """
+        self.quiz = quiz
+        self._texts = None # Pytanie -> znormalizowana treść; None do pierwszego wyszukiwania
+        self._trigrams = {}
+        self._word_prefixes = {}
+        self._positions = None
+
+    def _ensure_index(self):
+        """Builds the search index on first use."""
+        if self._texts is None:
+            self._texts = {}
+            for question in self.quiz.questions:
+                self._index(question)
+
+    @staticmethod
+    def _trigrams_of(text: str) -> set:
+        """Returns the character trigrams of a normalized text."""
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+
+    @staticmethod
+    def _short_prefixes_of(text: str) -> set:
+        """Returns the one- and two-character beginnings of the words of a normalized text."""
+        return {word[:length] for word in text.split() for length in (1, 2) if len(word) >= length}
+
+    def _index(self, question: Question):
+        """Adds a question to the index."""
+        text = normalize_answer(question.question_text)
+        self._texts[question] = text
+        for trigram in self._trigrams_of(text):
+            self._trigrams.setdefault(trigram, set()).add(question)
+        for prefix in self._short_prefixes_of(text):
+            self._word_prefixes.setdefault(prefix, set()).add(question)
+
+    def _unindex(self, question: Question):
+        """Removes a question from the index."""
+        text = self._texts.pop(question, None)
+        if text is None:
+            return
+        for trigram in self._trigrams_of(text):
+            self._trigrams[trigram].discard(question)
+        for prefix in self._short_prefixes_of(text):
+            self._word_prefixes[prefix].discard(question)
+
+    def _position(self, question: Question) -> int:
+        """Returns the current 0-based position of an indexed question."""
+        if self._positions is None:
+            self._positions = {q: i for i, q in enumerate(self.quiz.questions)}
+        return self._positions[question]
+
+    def replace(self, old: Question, new: Question):
+        """
+        Updates the index after a question's text was edited or the question was replaced.
+
+        Args:
+            old (Question): The question as it was indexed.
+            new (Question): The question now stored in the quiz (may be the same object).
+        """
+        if self._texts is not None:
+            self._unindex(old)
+            self._index(new)
+        if old is not new:
+            self._positions = None
+
+    def removed(self, questions):
+        """
+        Updates the index after questions were deleted from the quiz.
+
+        Args:
+            questions (iterable[Question]): The deleted questions.
+        """
+        if self._texts is not None:
+            for question in questions:
+                self._unindex(question)
+        self._positions = None
+
+    def added(self, questions):
+        """
+        Updates the index after questions were appended to the quiz.
+
+        Args:
+            questions (iterable[Question]): The new questions.
+        """
+        if self._texts is not None:
+            for question in questions:
+                self._index(question)
+        self._positions = None
+
+    def search(self, query: str) -> list[int]:
+        """
+        Finds the questions whose text contains the query (or, for queries shorter than
+        three characters, has a word starting with it).
+
+        Args:
+            query (str): The searched text.
+
+        Returns:
+            list[int]: 0-based positions of the matching questions, in quiz order.
+        """
+        needle = normalize_answer(query)
+        if not needle:
+            return []
+        self._ensure_index()
+        if len(needle) < 3:
+            if " " in needle:
+                candidates = {q for q, text in self._texts.items() if needle in text}
+            else:
+                candidates = self._word_prefixes.get(needle, set())
+        else:
+            postings = sorted((self._trigrams.get(trigram, set()) for trigram in self._trigrams_of(needle)), key=len)
+            candidates = set(postings[0]).intersection(*postings[1:]) if postings else set()
+            candidates = {q for q in candidates if needle in self._texts[q]}
+        return sorted(self._position(q) for q in candidates)
+
+    def _print_page(self, positions, page: int):
+        """Prints one page of questions given by their positions."""
+        questions = self.quiz.questions
+        start = page * PAGE_SIZE
+        for position in positions[start:start + PAGE_SIZE]:
+            print(f"  {position + 1}. {questions[position].question_text}")
+
+    def select(self, prompt: str):
+        """
+        Lets the user pick a question.
+
+        Small quizzes are listed in full and a single number is asked for. Larger quizzes
+        are shown a page at a time: 'n'/'p' change the page, '/text' searches, '/' clears
+        the search, and any question number can be typed directly.
+
+        Args:
+            prompt (str): Prompt asking for the question number.
+
+        Returns:
+            int | None: The 0-based index of the selected question, or None when the user
+                        gave up or typed an invalid number (a message is printed).
+        """
+        questions = self.quiz.questions
+        if len(questions) <= FULL_LIST_LIMIT:
+            print("Obecne pytania:")
+            for i, q in enumerate(questions):
+                print(f"  {i + 1}. {q.question_text}")
+            return self._parse_number(console.input(f"{prompt}: ").strip())
+
+        positions = range(len(questions)) # Bez wyszukiwania - wszystkie pytania, bez kopiowania listy
+        page = 0
+        while True:
+            page_count = max(1, -(-len(positions) // PAGE_SIZE))
+            print(f"Pytania (strona {page + 1}/{page_count}, wyników: {len(positions)}):")
+            self._print_page(positions, page)
+            choice = console.input(f"{prompt} ('n'/'p' - strona, '/tekst' - szukaj, Enter - powrót): ").strip()
+            if not choice:
+                return None
+            if choice.lower() == "n":
+                page = min(page + 1, page_count - 1)
+            elif choice.lower() == "p":
+                page = max(page - 1, 0)
+            elif choice.startswith("/"):
+                query = choice[1:].strip()
+                positions = self.search(query) if query else range(len(questions))
+                page = 0
+            else:
+                return self._parse_number(choice)
+
+    def _parse_number(self, choice: str):
+        """Converts a typed 1-based question number to an index, printing a message if it is invalid."""
+        try:
+            index = int(choice) - 1
+        except ValueError:
+            print("To nie jest liczba. Wpisz numer pytania.")
+            return None
+        if 0 <= index < len(self.quiz.questions):
+            return index
+        print("Nieprawidłowy numer pytania.")
+        return None
+
+    def delete_matching(self, query: str) -> int:
+        """
+        Deletes every question matching a search query in a single pass.
+
+        Args:
+            query (str): The searched text (see search()).
+
+        Returns:
+            int: The number of deleted questions.
+        """
+        positions = self.search(query)
+        if not positions:
+            return 0
+        removed = [self.quiz.questions[position] for position in positions]
+        self.quiz.remove_questions(positions)
+        self.removed(removed)
+        return len(removed)
@@ -0,0 +1,89 @@
+# quiz_project/quiz_creator/validator.py
+import json
+import os
+from models.question import Question
+from quiz_data.compression import read_quiz_bytes
+
+
+class QuizValidator:
+    """
+    Checks quiz data before it is loaded or played.
+
+    Quiz.from_dict() stops at the first problem; the validator reports every problem
+    of a quiz at once, each with the number of the question it concerns, so a broken
+    file can be fixed in one go. Problems that do not prevent loading (duplicate
+    questions, duplicate options) are reported as warnings.
+    """
+
+    @staticmethod
+    def validate(data) -> tuple[list[str], list[str]]:
+        """
+        Validates a quiz dictionary (the JSON form of a quiz).
+
+        Args:
+            data: The decoded JSON content of a quiz file.
+
+        Returns:
+            tuple[list[str], list[str]]: The errors and the warnings; the quiz is valid
+                                         when there are no errors.
+        """
+        errors, warnings = [], []
+        if not isinstance(data, dict):
+            return ["Quiz must be a JSON object."], warnings
+
+        title = data.get("title")
+        if not isinstance(title, str) or not title.strip():
+            errors.append("Quiz title cannot be empty.")
+        if not isinstance(data.get("description", ""), str):
+            errors.append("Quiz description must be a string.")
+
+        questions = data.get("questions", [])
+        if not isinstance(questions, list):
+            errors.append("'questions' must be a list.")
+            return errors, warnings
+        if not questions:
+            warnings.append("Quiz has no questions.")
+
+        seen_texts = {}
+        for number, question_data in enumerate(questions, start=1):
+            if not isinstance(question_data, dict):
+                errors.append(f"Question {number}: must be a JSON object.")
+                continue
+            try:
+                question = Question.from_dict(question_data)
+            except KeyError as e:
+                errors.append(f"Question {number}: missing key {e}.")
+                continue
+            except (ValueError, TypeError) as e:
+                errors.append(f"Question {number}: {e}")
+                continue
+            # Duplikaty nie blokują wczytania quizu, ale zwykle są pomyłką autora
+            key = question.question_text.casefold()
+            if key in seen_texts:
+                warnings.append(f"Question {number}: same text as question {seen_texts[key]}.")
+            else:
+                seen_texts[key] = number
+            if len({option.casefold() for option in question.options}) < len(question.options):
+                warnings.append(f"Question {number}: duplicate options.")
+        return errors, warnings
+
+    @staticmethod
+    def validate_file(file_path: str) -> tuple[list[str], list[str]]:
+        """
+        Reads and validates a quiz file.
+
+        Args:
+            file_path (str): Path to the quiz JSON file.
+
+        Returns:
+            tuple[list[str], list[str]]: The errors and the warnings (see validate()).
+        """
+        if not os.path.exists(file_path):
+            return [f"Quiz file not found: {file_path}"], []
+        try:
+            data = json.loads(read_quiz_bytes(file_path))
+        except json.JSONDecodeError as e:
+            return [f"Invalid JSON format: {e}"], []
+        except (OSError, ValueError) as e: # Także UnicodeDecodeError i uszkodzony plik skompresowany
+            return [f"Cannot read file: {e}"], []
+        return QuizValidator.validate(data)
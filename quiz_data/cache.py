@@ -0,0 +1,237 @@
+# quiz_project/quiz_data/cache.py
+"""
+Speculative prefetching of quizzes into a shared, memory-budgeted cache.
+
+When a quiz listing is shown, the most likely choices (the quizzes played most often
+in the recent sessions, in listing order otherwise) are parsed in a small background
+thread pool while the user reads the list and types. QuizDataManager.load_quiz then
+takes the prefetched quiz instead of parsing the file again; a load that is still in
+progress is waited for rather than repeated.
+
+Entries are taken once (the caller becomes the owner of the Quiz object, which the
+editor may modify) and are discarded when the file changed since it was prefetched.
+The memory used by prefetched quizzes that were not taken (yet) is limited by a budget;
+the size of a parsed quiz is estimated from the size of its JSON content.
+
+Settings: QUIZ_PREFETCH=0 disables prefetching, QUIZ_PREFETCH_BUDGET_MB (default 64) is
+the memory budget and QUIZ_PREFETCH_WORKERS (default 2) the number of loader threads.
+"""
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from quiz_data.compression import content_size
+
+PREFETCH_ENABLED = os.environ.get("QUIZ_PREFETCH", "1") == "1"
+PREFETCH_BUDGET_BYTES = int(float(os.environ.get("QUIZ_PREFETCH_BUDGET_MB", "64")) * 1024 * 1024)
+PREFETCH_WORKERS = int(os.environ.get("QUIZ_PREFETCH_WORKERS", "2"))
+PREFETCH_LIMIT = 3 # Ile najbardziej prawdopodobnych quizów wczytujemy z jednej listy
+RECENT_SESSIONS = 200 # Liczba ostatnich sesji, z których liczymy popularność quizów
+MEMORY_FACTOR = 4 # Obiekty quizu zajmują ok. 2-4x więcej niż plik JSON (pomiar: utils.helpers.measure_memory)
+
+
+def file_signature(file_path: str):
+    """Returns (mtime_ns, size) of a file, or None if it does not exist."""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def rank_candidates(names: list, play_counts: dict, limit: int = PREFETCH_LIMIT) -> list:
+    """
+    Orders the quizzes of a listing by how likely they are to be chosen.
+
+    Args:
+        names (list[str]): Quiz names in listing order.
+        play_counts (dict): Quiz name -> number of recent sessions.
+        limit (int): Maximum number of candidates.
+
+    Returns:
+        list[str]: The most often played quizzes first; ties keep the listing order.
+    """
+    order = sorted(range(len(names)), key=lambda position: -play_counts.get(names[position], 0))
+    return [names[position] for position in order[:limit]]
+
+
+class QuizCache:
+    """
+    Shared cache of prefetched quizzes keyed by file path.
+
+    Attributes:
+        budget_bytes (int): Maximum estimated memory of cached and loading quizzes.
+        used_bytes (int): Estimated memory of the cached and loading quizzes.
+        hits (int): Loads served from the cache (or from a load already in progress).
+        wasted (int): Prefetched quizzes evicted or discarded without being used.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, budget_bytes: int = PREFETCH_BUDGET_BYTES, max_workers: int = PREFETCH_WORKERS):
+        """
+        Initializes an empty cache.
+
+        Args:
+            budget_bytes (int): Memory budget in bytes. Defaults to QUIZ_PREFETCH_BUDGET_MB.
+            max_workers (int): Number of loader threads. Defaults to QUIZ_PREFETCH_WORKERS.
+
+        Raises:
+            ValueError: If the budget or the number of workers is not positive.
+        """
+        if budget_bytes < 1 or max_workers < 1:
+            raise ValueError("budget_bytes and max_workers must be positive integers.")
+        self.budget_bytes = budget_bytes
+        self.max_workers = max_workers
+        self.used_bytes = 0
+        self.hits = 0
+        self.wasted = 0
+        self._entries = {} # ścieżka -> (sygnatura pliku, szacowany rozmiar, Future z quizem); kolejność = wiek
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Creates the loader pool on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="quiz-prefetch")
+        return self._executor
+
+    def _drop(self, file_path: str, wasted: bool):
+        """Removes an entry (the caller holds the lock)."""
+        signature, size, future = self._entries.pop(file_path)
+        self.used_bytes -= size
+        if wasted:
+            self.wasted += 1
+            future.cancel() # Jeszcze nierozpoczęte wczytywanie nie jest już potrzebne
+
+    def prefetch(self, file_paths: list, loader) -> list:
+        """
+        Starts loading files in the background, within the memory budget.
+
+        Cached entries that are not among the requested files are evicted (oldest first)
+        when room is needed; files that still do not fit are skipped.
+
+        Args:
+            file_paths (list[str]): Files to load, most likely first.
+            loader (callable): Function loading a file path into a Quiz.
+
+        Returns:
+            list[str]: The file paths whose loading was started.
+        """
+        started = []
+        file_paths = [os.path.abspath(file_path) for file_path in file_paths]
+        wanted = set(file_paths)
+        with self._lock:
+            for file_path in file_paths:
+                signature = file_signature(file_path)
+                entry = self._entries.get(file_path)
+                if signature is None or (entry is not None and entry[0] == signature):
+                    continue
+                if entry is not None:
+                    self._drop(file_path, wasted=True) # Plik zmienił się od poprzedniego wczytania
+                size = content_size(file_path, signature[1]) * MEMORY_FACTOR
+                for old_path in [path for path in self._entries if path not in wanted]:
+                    if self.used_bytes + size <= self.budget_bytes:
+                        break
+                    self._drop(old_path, wasted=True)
+                if self.used_bytes + size > self.budget_bytes:
+                    continue
+                future = self._get_executor().submit(loader, file_path)
+                self._entries[file_path] = (signature, size, future)
+                self.used_bytes += size
+                started.append(file_path)
+        return started
+
+    def put(self, file_path: str, quiz, signature) -> bool:
+        """
+        Stores a quiz loaded elsewhere (e.g. by the catalog warm-up in a worker process),
+        within the memory budget. Existing entries are never evicted for it.
+
+        Args:
+            file_path (str): Path of the quiz file.
+            quiz (Quiz): The loaded quiz.
+            signature (tuple): File signature taken before the file was read (see file_signature()).
+
+        Returns:
+            bool: Whether the quiz was stored.
+        """
+        file_path = os.path.abspath(file_path)
+        size = content_size(file_path, signature[1]) * MEMORY_FACTOR
+        future = Future()
+        future.set_result(quiz)
+        with self._lock:
+            entry = self._entries.get(file_path)
+            if entry is not None and entry[0] == signature:
+                return True # Ten sam plik jest już w pamięci (lub właśnie się wczytuje)
+            if entry is not None:
+                self._drop(file_path, wasted=True)
+            if self.used_bytes + size > self.budget_bytes:
+                return False
+            self._entries[file_path] = (signature, size, future)
+            self.used_bytes += size
+        return True
+
+    def submit(self, func, *args):
+        """
+        Runs a function in the loader pool, e.g. ranking the candidates of a listing
+        without delaying the user interface.
+
+        Returns:
+            concurrent.futures.Future: The future of the call.
+        """
+        with self._lock:
+            return self._get_executor().submit(func, *args)
+
+    def take(self, file_path: str):
+        """
+        Takes a prefetched quiz out of the cache, waiting for a load in progress.
+
+        Args:
+            file_path (str): Path of the quiz file.
+
+        Returns:
+            Quiz: The quiz, or None when it is not cached, failed to load or the file
+                  changed since it was prefetched.
+        """
+        file_path = os.path.abspath(file_path)
+        with self._lock:
+            entry = self._entries.get(file_path)
+            if entry is None:
+                return None
+            self._drop(file_path, wasted=False)
+        signature, _, future = entry
+        try:
+            quiz = future.result()
+        except Exception:
+            return None # Błąd zgłosi zwykłe wczytanie pliku
+        if file_signature(file_path) != signature:
+            self.wasted += 1
+            return None
+        self.hits += 1
+        return quiz
+
+    def clear(self):
+        """Drops all entries (loads in progress finish in the background)."""
+        with self._lock:
+            for file_path in list(self._entries):
+                self._drop(file_path, wasted=False)
+
+    def shutdown(self, wait: bool = True):
+        """Clears the cache and stops the loader pool."""
+        self.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    @classmethod
+    def shared(cls):
+        """
+        Returns the process-wide cache, creating it on first use.
+
+        Returns:
+            QuizCache: The shared cache.
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
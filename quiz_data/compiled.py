@@ -0,0 +1,281 @@
+# quiz_project/quiz_data/compiled.py
+import hashlib
+import json
+import os
+import threading
+from array import array
+from models.quiz import Quiz
+from utils.text import AnswerMatcher
+from quiz_data.manager import QuizDataManager
+
+COMPILED_FORMAT_VERSION = 3
+COMPILED_DIRECTORY_NAME = ".compiled" # Podkatalog z artefaktami obok plików quizów
+
+
+class CompiledQuiz:
+    """
+    A play-ready form of a quiz.
+
+    Everything the player needs per question is precomputed once: the rendered display
+    block, the option texts (for shuffled rendering), the incorrect-answer feedback and
+    a packed answer key of correct-option bitmasks, so serving a question is a tuple
+    lookup and grading is a single integer comparison (or a few bitwise operations
+    under a partial-credit policy). Typed answers are graded by a precompiled
+    AnswerMatcher.
+
+    Attributes:
+        title (str): The title of the quiz.
+        description (str): The description of the quiz.
+        fingerprint (str): Content hash of the source quiz (see Quiz.fingerprint()).
+        question_texts (tuple[str]): Text of every question.
+        options (tuple[tuple[str]]): Options of every question.
+        display_blocks (tuple[str]): Pre-rendered Question.display() output.
+        feedback (tuple[str]): Message shown after an incorrect answer.
+        answer_key (array): Bitmask of the correct options of every question.
+        multi_answer (tuple[bool]): Whether each question accepts several options.
+        text_matchers (tuple): AnswerMatcher of every free-text question, None for the others.
+    """
+
+    __slots__ = ("title", "description", "fingerprint", "question_texts", "options",
+                 "display_blocks", "feedback", "answer_key", "multi_answer", "text_matchers")
+
+    def __init__(self, title: str, description: str, fingerprint: str, question_texts, options,
+                 display_blocks, feedback, answer_key, multi_answer=None, text_matchers=None):
+        """
+        Initializes a compiled quiz. Use QuizCompiler.compile() to build one from a Quiz.
+        """
+        self.title = title
+        self.description = description
+        self.fingerprint = fingerprint
+        self.question_texts = tuple(question_texts)
+        self.options = tuple(tuple(opts) for opts in options)
+        self.display_blocks = tuple(display_blocks)
+        self.feedback = tuple(feedback)
+        self.answer_key = answer_key if isinstance(answer_key, (array, tuple)) else QuizCompiler.pack_answer_key(answer_key)
+        self.multi_answer = tuple(multi_answer) if multi_answer is not None else (False,) * len(self.question_texts)
+        self.text_matchers = tuple(text_matchers) if text_matchers is not None else (None,) * len(self.question_texts)
+
+    def __len__(self) -> int:
+        """Returns the number of questions."""
+        return len(self.question_texts)
+
+    def display(self, question_index: int, option_order=None) -> str:
+        """
+        Returns the display block of a question.
+
+        Args:
+            question_index (int): The 0-based index of the question.
+            option_order (sequence, optional): Original option indices in presentation order.
+                                               The precompiled block is used when omitted.
+
+        Returns:
+            str: The formatted question, identical to Question.display().
+        """
+        if option_order is None:
+            return self.display_blocks[question_index]
+        options = self.options[question_index]
+        lines = [f"Pytanie: {self.question_texts[question_index]}"]
+        lines.extend(f"  {i + 1}. {options[option_index]}" for i, option_index in enumerate(option_order))
+        return "\n".join(lines) + "\n"
+
+    def is_correct(self, question_index: int, answer_mask: int) -> bool:
+        """
+        Grades an answer against the packed answer key.
+
+        Args:
+            question_index (int): The 0-based index of the question.
+            answer_mask (int): Bitmask of the chosen options (1 << index for a single choice).
+
+        Returns:
+            bool: True if exactly the correct options were chosen.
+        """
+        return self.answer_key[question_index] == answer_mask
+
+    def to_dict(self) -> dict:
+        """Converts the compiled quiz to a JSON-serializable dictionary."""
+        return {
+            "title": self.title,
+            "description": self.description,
+            "fingerprint": self.fingerprint,
+            "question_texts": list(self.question_texts),
+            "options": [list(opts) for opts in self.options],
+            "display_blocks": list(self.display_blocks),
+            "feedback": list(self.feedback),
+            "answer_key": list(self.answer_key),
+            "multi_answer": list(self.multi_answer),
+            "text_answers": [None if matcher is None else [list(matcher.accepted_answers), list(matcher.patterns)]
+                             for matcher in self.text_matchers]
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """Creates a compiled quiz from a dictionary produced by to_dict()."""
+        return cls(data["title"], data["description"], data["fingerprint"], data["question_texts"],
+                   data["options"], data["display_blocks"], data["feedback"], data["answer_key"],
+                   data.get("multi_answer"),
+                   [None if entry is None else AnswerMatcher(*entry) for entry in data.get("text_answers", [])] or None)
+
+
+class QuizCompiler:
+    """
+    Compiles Quiz objects into CompiledQuiz artifacts and caches them on disk.
+
+    Artifacts are stored in a '.compiled' directory next to the quiz files, one file per
+    quiz, tagged with the SHA-256 of the source file contents. A cached artifact is only
+    used while the source file is byte-for-byte unchanged.
+    """
+
+    @staticmethod
+    def pack_answer_key(masks) -> array:
+        """
+        Packs correct-option bitmasks into a compact array (1 byte per question when all
+        questions have at most 8 options).
+
+        Args:
+            masks (iterable[int]): Correct option bitmask of every question.
+
+        Returns:
+            array: The packed answer key (a tuple for questions with more than 64 options).
+        """
+        masks = list(masks)
+        largest = max(masks, default=0)
+        if largest >= 1 << 64:
+            return tuple(masks) # Ponad 64 opcje - maska nie mieści się w typie maszynowym
+        typecode = 'B' if largest < 1 << 8 else 'I' if largest < 1 << 32 else 'Q'
+        return array(typecode, masks)
+
+    @staticmethod
+    def _feedback(question) -> str:
+        """Returns the message shown after an incorrect answer to a question."""
+        if question.is_multi_answer:
+            correct = ", ".join(question.options[i] for i in question.correct_answer_indices)
+            return f"Niepoprawna odpowiedź. Poprawne to: {correct}"
+        return f"Niepoprawna odpowiedź. Poprawna to: {question.options[question.correct_answer_index]}"
+
+    @staticmethod
+    def compile(quiz: Quiz) -> CompiledQuiz:
+        """
+        Compiles a quiz into its play-ready form.
+
+        Args:
+            quiz (Quiz): The quiz to compile.
+
+        Returns:
+            CompiledQuiz: The compiled quiz.
+        """
+        questions = quiz.questions
+        return CompiledQuiz(
+            quiz.title,
+            quiz.description,
+            quiz.fingerprint(),
+            [q.question_text for q in questions],
+            [q.options for q in questions],
+            [q.display() for q in questions],
+            [QuizCompiler._feedback(q) for q in questions],
+            [q.correct_mask for q in questions],
+            [q.is_multi_answer for q in questions],
+            [q.matcher if q.is_text_answer else None for q in questions]
+        )
+
+    @staticmethod
+    def _paths(filename: str, directory: str) -> tuple[str, str]:
+        """Returns (source path, artifact path) of a quiz."""
+        name = filename[:-len(".json")] if filename.endswith(".json") else filename
+        return (os.path.join(directory, name + ".json"),
+                os.path.join(directory, COMPILED_DIRECTORY_NAME, name + ".json"))
+
+    @staticmethod
+    def _read_artifact(artifact_path: str, source_hash: str):
+        """Returns the cached artifact if it matches the source hash, otherwise None."""
+        try:
+            with open(artifact_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("v") == COMPILED_FORMAT_VERSION and data.get("source_hash") == source_hash:
+                return CompiledQuiz.from_dict(data["quiz"])
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass # Brak lub uszkodzony artefakt - zostanie skompilowany ponownie
+        return None
+
+    @staticmethod
+    def _write_artifact(artifact_path: str, source_hash: str, compiled: CompiledQuiz):
+        """Atomically stores an artifact; failures only cost a recompilation later."""
+        try:
+            os.makedirs(os.path.dirname(artifact_path), exist_ok=True)
+            # Wątek w nazwie: wczytywanie w tle i na pierwszym planie mogą zapisywać ten sam artefakt
+            tmp_path = f"{artifact_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"v": COMPILED_FORMAT_VERSION, "source_hash": source_hash, "quiz": compiled.to_dict()},
+                          f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_path, artifact_path)
+        except OSError as e:
+            print(f"Nie udało się zapisać skompilowanego quizu {artifact_path}: {e}")
+
+    @staticmethod
+    def source_hash(source_path: str):
+        """Returns the SHA-256 of a source file, or None if it cannot be read."""
+        try:
+            with open(source_path, 'rb') as f:
+                return hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            return None
+
+    @staticmethod
+    def load(filename: str, directory: str = "data/quiz_examples") -> CompiledQuiz:
+        """
+        Returns the compiled form of a quiz file, using the on-disk cache when it is current.
+        On a cache hit the source JSON is hashed but never parsed into Quiz objects.
+
+        Args:
+            filename (str): The name of the quiz file (with or without .json).
+            directory (str): The directory of the quiz file. Defaults to "data/quiz_examples".
+
+        Returns:
+            CompiledQuiz: The compiled quiz.
+
+        Raises:
+            The same exceptions as QuizDataManager.load_quiz() when the source cannot be loaded.
+        """
+        source_path, artifact_path = QuizCompiler._paths(filename, directory)
+        source_hash = QuizCompiler.source_hash(source_path)
+        if source_hash is not None:
+            compiled = QuizCompiler._read_artifact(artifact_path, source_hash)
+            if compiled is not None:
+                return compiled
+        compiled = QuizCompiler.compile(QuizDataManager.load_quiz(filename, directory, verbose=False))
+        if source_hash is not None:
+            QuizCompiler._write_artifact(artifact_path, source_hash, compiled)
+        return compiled
+
+    @staticmethod
+    def compile_cached(quiz: Quiz, filename: str, directory: str = "data/quiz_examples",
+                       source_hash: str = None) -> CompiledQuiz:
+        """
+        Returns the compiled form of an already loaded quiz, reusing or refreshing the
+        on-disk artifact of its source file. Quizzes without a source file are compiled
+        in memory only.
+
+        The artifact is written only under the hash of the content the quiz was parsed
+        from, so a file changed after loading never gets an artifact of its old content.
+
+        Args:
+            quiz (Quiz): The loaded quiz.
+            filename (str): The name of the quiz file it was loaded from.
+            directory (str): The directory of the quiz file. Defaults to "data/quiz_examples".
+            source_hash (str, optional): source_hash() of the file taken before the quiz was
+                                         loaded. Without it the artifact is reused but not written.
+
+        Returns:
+            CompiledQuiz: The compiled quiz.
+        """
+        source_path, artifact_path = QuizCompiler._paths(filename, directory)
+        current_hash = QuizCompiler.source_hash(source_path)
+        if current_hash is not None:
+            compiled = QuizCompiler._read_artifact(artifact_path, current_hash)
+            # Plik mógł zostać zmieniony po wczytaniu quizu - porównujemy odcisk treści
+            if compiled is not None and compiled.fingerprint == quiz.fingerprint():
+                return compiled
+        compiled = QuizCompiler.compile(quiz)
+        # Zapisujemy tylko, gdy plik od wczytania się nie zmienił (hash sprzed wczytania = obecny)
+        if source_hash is not None and source_hash == current_hash:
+            QuizCompiler._write_artifact(artifact_path, source_hash, compiled)
+        return compiled
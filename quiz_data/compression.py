@@ -0,0 +1,315 @@
+# quiz_project/quiz_data/compression.py
+"""
+Compressed quiz storage with a shared zlib preset dictionary.
+
+Quiz files are small, repetitive JSON documents: every file repeats the same keys and
+indentation and much of the same vocabulary, which per-file gzip cannot exploit because
+each file starts with an empty window. A preset dictionary trained from the catalog
+supplies those fragments up front, so even a short quiz compresses well.
+
+A compressed file keeps its .json name (listing, indexing, prefetching and quarantine work
+unchanged) and starts with a short header: the magic bytes b"QZD" - never the start of a
+JSON document - the version of the dictionary it was compressed with and the size of the
+JSON content (used to estimate memory, see QuizCache), followed by a zlib stream.
+Dictionaries are stored next to the quizzes in .zdict/v<version>.zdict and never modified;
+retraining adds a new version, so older files stay readable. Version 0 means no dictionary.
+A dictionary is read once per process.
+
+Compression of saved quizzes is enabled with QUIZ_COMPRESS=1; reading is always
+transparent. The whole catalog is recompressed (with a newly trained dictionary) or
+restored to plain JSON with:
+
+    python main.py compress [--plain] [--no-train]
+"""
+import json
+import os
+import re
+import struct
+import threading
+import time
+import zlib
+from collections import Counter
+from functools import lru_cache
+
+COMPRESSION_ENABLED = os.environ.get("QUIZ_COMPRESS", "0") == "1"
+COMPRESSION_LEVEL = 9
+DICTIONARY_DIRECTORY_NAME = ".zdict" # Podkatalog ze słownikami obok plików quizów
+DICTIONARY_SIZE = 32 * 1024 # Okno deflate: dalsza część słownika i tak nie byłaby używana
+TRAINING_SAMPLE_BYTES = 4 * 1024 * 1024 # Przy dużych katalogach uczymy się na równomiernej próbce plików
+MAGIC = b"QZD"
+_HEADER = struct.Struct(">3sHI") # Magia, wersja słownika i rozmiar treści JSON
+
+
+def is_compressed(data: bytes) -> bool:
+    """Returns True if the content of a quiz file is compressed."""
+    return data[:len(MAGIC)] == MAGIC
+
+
+def content_size(file_path: str, size: int) -> int:
+    """
+    Returns the size of the JSON content of a quiz file.
+
+    Args:
+        file_path (str): Path of the quiz file.
+        size (int): Size of the file in bytes.
+
+    Returns:
+        int: The uncompressed size stored in the header of a compressed file, otherwise 'size'.
+    """
+    if size < _HEADER.size:
+        return size
+    try:
+        with open(file_path, 'rb') as f:
+            header = f.read(_HEADER.size)
+    except OSError:
+        return size
+    return _HEADER.unpack(header)[2] if is_compressed(header) and len(header) == _HEADER.size else size
+
+
+def train_dictionary(samples: list, size: int = DICTIONARY_SIZE) -> bytes:
+    """
+    Trains a preset dictionary from sample quiz files.
+
+    Candidate fragments are whole lines and space-led tokens (JSON keys with their
+    indentation, words with the preceding space). Each is scored by the number of samples
+    containing it times its length; the best ones fill the dictionary, the most valuable
+    last, where deflate reaches them with the shortest distances.
+
+    Args:
+        samples (list[bytes]): Plain JSON contents of quiz files.
+        size (int): Maximum dictionary size in bytes. Defaults to 32 KiB.
+
+    Returns:
+        bytes: The dictionary (empty when there is nothing to learn from).
+    """
+    document_counts = Counter()
+    for sample in samples:
+        text = sample.decode('utf-8', errors='ignore')
+        fragments = set(text.splitlines(keepends=True))
+        fragments.update(re.findall(r"\s*\S+", text))
+        document_counts.update(fragments)
+    # Z jednego pliku nie da się odróżnić fragmentów wspólnych od przypadkowych
+    minimum = 2 if len(samples) > 1 else 1
+    scored = sorted(((count * len(fragment.encode('utf-8')), fragment)
+                     for fragment, count in document_counts.items() if count >= minimum), reverse=True)
+    chosen, covered, used = [], set(), 0
+    for _, fragment in scored:
+        data = fragment.encode('utf-8')
+        # Fragment zawarty w już wybranym (np. słowo z wybranej linii) niczego nie dodaje
+        if used + len(data) <= size and fragment not in covered:
+            chosen.append(data)
+            covered.add(fragment)
+            covered.update(re.findall(r"\s*\S+", fragment))
+            used += len(data)
+    return b"".join(reversed(chosen)) # Najcenniejsze fragmenty na końcu, najbliżej danych
+
+
+def dictionary_path(directory: str, version: int) -> str:
+    """Returns the path of a dictionary version."""
+    return os.path.join(directory, DICTIONARY_DIRECTORY_NAME, f"v{version:04d}.zdict")
+
+
+def dictionary_versions(directory: str) -> list[int]:
+    """
+    Lists the stored dictionary versions of a quiz directory.
+
+    Args:
+        directory (str): The quiz directory.
+
+    Returns:
+        list[int]: Versions in ascending order (empty when no dictionary was trained).
+    """
+    path = os.path.join(directory, DICTIONARY_DIRECTORY_NAME)
+    if not os.path.isdir(path):
+        return []
+    return sorted(int(item[1:-len(".zdict")]) for item in os.listdir(path)
+                  if re.fullmatch(r"v\d+\.zdict", item))
+
+
+@lru_cache(maxsize=None)
+def _read_dictionary(path: str, signature: tuple) -> bytes:
+    """Reads a dictionary file (cached per path and file signature)."""
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def load_dictionary(directory: str, version: int) -> bytes:
+    """
+    Returns a dictionary version, reading the file only on first use in the process.
+
+    Args:
+        directory (str): The quiz directory.
+        version (int): The dictionary version (0 = no dictionary).
+
+    Returns:
+        bytes: The dictionary.
+
+    Raises:
+        FileNotFoundError: If the version does not exist.
+    """
+    if version == 0:
+        return b""
+    path = os.path.abspath(dictionary_path(directory, version))
+    stat = os.stat(path)
+    # Sygnatura w kluczu: katalog odtworzony od nowa (np. w testach) nie zwróci starego słownika
+    return _read_dictionary(path, (stat.st_mtime_ns, stat.st_size))
+
+
+def save_dictionary(directory: str, dictionary: bytes) -> int:
+    """
+    Stores a dictionary as the next version.
+
+    Args:
+        directory (str): The quiz directory.
+        dictionary (bytes): The trained dictionary.
+
+    Returns:
+        int: The new version.
+    """
+    versions = dictionary_versions(directory)
+    version = versions[-1] + 1 if versions else 1
+    path = dictionary_path(directory, version)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + f".{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(dictionary)
+    os.replace(tmp_path, path) # Słownik pojawia się w całości albo wcale
+    return version
+
+
+def compress(plain: bytes, directory: str, version: int = None) -> bytes:
+    """
+    Compresses the content of a quiz file with a dictionary of its directory.
+
+    Args:
+        plain (bytes): The JSON content.
+        directory (str): The quiz directory.
+        version (int, optional): Dictionary version. Defaults to the newest one (0 if none).
+
+    Returns:
+        bytes: The header followed by the zlib stream.
+    """
+    if version is None:
+        versions = dictionary_versions(directory)
+        version = versions[-1] if versions else 0
+    dictionary = load_dictionary(directory, version)
+    if dictionary:
+        compressor = zlib.compressobj(COMPRESSION_LEVEL, zlib.DEFLATED, zlib.MAX_WBITS, 9,
+                                      zlib.Z_DEFAULT_STRATEGY, dictionary)
+    else:
+        compressor = zlib.compressobj(COMPRESSION_LEVEL, zlib.DEFLATED, zlib.MAX_WBITS, 9)
+    return _HEADER.pack(MAGIC, version, len(plain)) + compressor.compress(plain) + compressor.flush()
+
+
+def decompress(data: bytes, directory: str) -> bytes:
+    """
+    Decompresses the content of a compressed quiz file.
+
+    Args:
+        data (bytes): The file content (header and zlib stream).
+        directory (str): The quiz directory holding the dictionaries.
+
+    Returns:
+        bytes: The JSON content.
+
+    Raises:
+        ValueError: If the content is truncated or corrupt.
+        FileNotFoundError: If the dictionary version of the file is missing.
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError("Compressed quiz file is truncated.")
+    _, version, size = _HEADER.unpack_from(data)
+    dictionary = load_dictionary(directory, version)
+    decompressor = zlib.decompressobj(zlib.MAX_WBITS, dictionary) if dictionary else zlib.decompressobj()
+    try:
+        plain = decompressor.decompress(data[_HEADER.size:]) + decompressor.flush()
+    except zlib.error as e:
+        raise ValueError(f"Corrupt compressed quiz file: {e}") from e
+    if not decompressor.eof or len(plain) != size:
+        raise ValueError("Compressed quiz file is truncated.")
+    return plain
+
+
+def read_quiz_bytes(file_path: str) -> bytes:
+    """
+    Reads a quiz file, decompressing it when needed.
+
+    Args:
+        file_path (str): Path of the quiz file.
+
+    Returns:
+        bytes: The JSON content.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If a compressed file is corrupt.
+    """
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    if is_compressed(data):
+        return decompress(data, os.path.dirname(file_path))
+    return data
+
+
+def _training_samples(contents: list) -> list:
+    """Returns an evenly spaced sample of file contents of at most TRAINING_SAMPLE_BYTES."""
+    total = sum(len(content) for content in contents)
+    step = max(1, round(total / TRAINING_SAMPLE_BYTES)) if total else 1
+    return contents[::step]
+
+
+def recompress_catalog(directory: str, compressed: bool = True, train: bool = True) -> dict:
+    """
+    Rewrites every quiz file of a directory compressed (or as plain JSON).
+
+    The JSON content of the files is kept byte for byte; files that cannot be read or
+    are not valid JSON are left untouched and reported.
+
+    Args:
+        directory (str): The quiz directory.
+        compressed (bool): Compress the files; False restores plain JSON. Defaults to True.
+        train (bool): Train a new dictionary version from the catalog first. Defaults to True.
+
+    Returns:
+        dict: The summary: quiz count, dictionary version and size, plain and stored bytes,
+              the compression ratio, skipped files and elapsed seconds.
+    """
+    started = time.perf_counter()
+    contents, skipped = {}, []
+    for item in sorted(os.listdir(directory)) if os.path.isdir(directory) else []:
+        if item.endswith(".json"):
+            try:
+                plain = read_quiz_bytes(os.path.join(directory, item))
+                json.loads(plain) # Uszkodzone pliki nie trafiają do nauki słownika
+                contents[item] = plain
+            except (OSError, ValueError) as e:
+                skipped.append({"quiz": item[:-len(".json")], "error": str(e)})
+
+    versions = dictionary_versions(directory)
+    version = versions[-1] if versions else 0
+    if compressed and train and contents:
+        version = save_dictionary(directory, train_dictionary(_training_samples(list(contents.values()))))
+
+    stored_bytes = 0
+    for item, plain in contents.items():
+        data = compress(plain, directory, version) if compressed else plain
+        file_path = os.path.join(directory, item)
+        tmp_path = file_path + f".{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, file_path)
+        stored_bytes += len(data)
+
+    plain_bytes = sum(len(plain) for plain in contents.values())
+    return {
+        "directory": directory,
+        "quizzes": len(contents),
+        "compressed": compressed,
+        "dictionary_version": version if compressed else None,
+        "dictionary_bytes": len(load_dictionary(directory, version)) if compressed else None,
+        "plain_bytes": plain_bytes,
+        "stored_bytes": stored_bytes,
+        "ratio": round(plain_bytes / stored_bytes, 2) if stored_bytes else None,
+        "skipped": skipped,
+        "seconds": round(time.perf_counter() - started, 3)
+    }
@@ -0,0 +1,99 @@
+# quiz_project/quiz_data/csv_format.py
+"""
+Conversion of quizzes to and from CSV, for editing question banks in a spreadsheet.
+
+One row per question with the columns: type ('choice', 'multi' or 'text'), question_text,
+options (one per line within the cell; accepted answers for text questions), correct
+(1-based option numbers separated by commas; empty for text questions) and patterns
+(regular expressions of text questions, one per line).
+"""
+import csv
+from models.question import Question
+from models.quiz import Quiz
+
+CSV_COLUMNS = ("type", "question_text", "options", "correct", "patterns")
+
+
+def question_to_row(question: Question) -> dict:
+    """Converts a question to a CSV row (see the module docstring)."""
+    if question.is_text_answer:
+        return {"type": "text", "question_text": question.question_text, "options": "\n".join(question.options),
+                "correct": "", "patterns": "\n".join(question.answer_patterns)}
+    indices = question.correct_answer_indices if question.is_multi_answer else [question.correct_answer_index]
+    return {"type": "multi" if question.is_multi_answer else "choice", "question_text": question.question_text,
+            "options": "\n".join(question.options), "correct": ",".join(str(i + 1) for i in indices),
+            "patterns": ""}
+
+
+def row_to_question(row: dict) -> Question:
+    """
+    Converts a CSV row to a question.
+
+    Args:
+        row (dict): A row read by csv.DictReader.
+
+    Returns:
+        Question: The question (a subclass for 'multi' and 'text' rows).
+
+    Raises:
+        ValueError: If the row is invalid.
+    """
+    question_type = (row.get("type") or "choice").strip().lower()
+    options = [line for line in (row.get("options") or "").splitlines() if line.strip()]
+    if question_type == "text":
+        data = {"type": "text", "question_text": row.get("question_text") or "", "accepted_answers": options,
+                "answer_patterns": [line for line in (row.get("patterns") or "").splitlines() if line.strip()]}
+        return Question.from_dict(data)
+    if question_type not in ("choice", "multi"):
+        raise ValueError(f"Unknown question type: {question_type}.")
+    try:
+        indices = [int(part) - 1 for part in (row.get("correct") or "").split(",") if part.strip()]
+    except ValueError as e:
+        raise ValueError("Correct answers must be option numbers separated by commas.") from e
+    data = {"question_text": row.get("question_text") or "", "options": options}
+    if question_type == "multi":
+        data["correct_answer_indices"] = indices
+    elif len(indices) != 1:
+        raise ValueError("A 'choice' question needs exactly one correct option.")
+    else:
+        data["correct_answer_index"] = indices[0]
+    return Question.from_dict(data)
+
+
+def write_quiz_csv(quiz: Quiz, file_path: str):
+    """
+    Writes the questions of a quiz to a CSV file.
+
+    Args:
+        quiz (Quiz): The quiz.
+        file_path (str): Destination path.
+    """
+    with open(file_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS)
+        writer.writeheader()
+        writer.writerows(question_to_row(question) for question in quiz.questions)
+
+
+def read_quiz_csv(file_path: str, title: str, description: str = "") -> Quiz:
+    """
+    Reads a quiz from a CSV file.
+
+    Args:
+        file_path (str): Path to the CSV file.
+        title (str): Title of the created quiz (CSV files hold only questions).
+        description (str, optional): Description of the created quiz.
+
+    Returns:
+        Quiz: The quiz.
+
+    Raises:
+        ValueError: If a row is invalid; the message names the row.
+    """
+    questions = []
+    with open(file_path, 'r', encoding='utf-8', newline='') as f:
+        for line_number, row in enumerate(csv.DictReader(f), start=2): # Wiersz 1 to nagłówek
+            try:
+                questions.append(row_to_question(row))
+            except (ValueError, KeyError) as e:
+                raise ValueError(f"Row {line_number}: {e}") from e
+    return Quiz(title, description, questions)
@@ -2,6 +2,11 @@ import json
 import os
 from models.question import Question
 from models.quiz import Quiz
+from quiz_data.cache import PREFETCH_ENABLED, QuizCache, rank_candidates
+from quiz_data.compression import COMPRESSION_ENABLED, compress, read_quiz_bytes
+from quiz_search.index import update_index_for
+from utils.metrics import timed
+from utils.tracing import traced
 
 class QuizDataManager:
     """
@@ -12,7 +17,9 @@ class QuizDataManager:
     """
 
     @staticmethod
-    def save_quiz(quiz: Quiz, filename: str, directory: str = "data/quiz_examples"):
+    @timed("save_quiz") # Czas operacji w rejestrze metryk (gdy QUIZ_METRICS=1)
+    @traced("save_quiz")
+    def save_quiz(quiz: Quiz, filename: str, directory: str = "data/quiz_examples", verbose: bool = True):
         """
         Saves a Quiz object to a JSON file.
 
@@ -25,6 +32,8 @@ class QuizDataManager:
             filename (str): The name of the file (e.g., "my_quiz.json").
             directory (str): The directory where the quiz file will be saved.
                              Defaults to "data/quiz_examples".
+            verbose (bool): Print a confirmation after a successful save. Callers producing
+                            machine-readable output pass False. Defaults to True.
 
         Raises:
             IOError: If there's an issue writing to the file (e.g., permissions).
@@ -39,7 +48,8 @@ class QuizDataManager:
         if not os.path.exists(directory):
             try:
                 os.makedirs(directory)
-                print(f"Created directory: {directory}")
+                if verbose:
+                    print(f"Created directory: {directory}")
             except OSError as e:
                 print(f"Error creating directory {directory}: {e}")
                 raise IOError(f"Could not create directory {directory}.") from e
@@ -49,10 +59,17 @@ class QuizDataManager:
         try:
             # Convert Quiz object to a dictionary
             quiz_data = quiz.to_dict()
-            with open(file_path, 'w', encoding='utf-8') as f:
-                # Use indent for pretty-printing JSON
-                json.dump(quiz_data, f, indent=4, ensure_ascii=False)
-            print(f"Quiz '{quiz.title}' saved successfully to {file_path}")
+            if COMPRESSION_ENABLED: # Ta sama treść JSON, skompresowana słownikiem katalogu (QUIZ_COMPRESS=1)
+                content = json.dumps(quiz_data, indent=4, ensure_ascii=False).encode('utf-8')
+                with open(file_path, 'wb') as f:
+                    f.write(compress(content, directory))
+            else:
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    # Use indent for pretty-printing JSON
+                    json.dump(quiz_data, f, indent=4, ensure_ascii=False)
+            if verbose:
+                print(f"Quiz '{quiz.title}' saved successfully to {file_path}")
+            update_index_for(quiz, filename, directory) # Przyrostowa aktualizacja indeksu wyszukiwania
         except IOError as e:
             print(f"Error saving quiz to {file_path}: {e}")
             raise IOError(f"Failed to write quiz to file: {file_path}") from e
@@ -61,7 +78,9 @@ class QuizDataManager:
             raise
 
     @staticmethod
-    def load_quiz(filename: str, directory: str = "data/quiz_examples") -> Quiz:
+    @timed("load_quiz")
+    @traced("load_quiz")
+    def load_quiz(filename: str, directory: str = "data/quiz_examples", verbose: bool = True) -> Quiz:
         """
         Loads a Quiz object from a JSON file.
 
@@ -72,6 +91,8 @@ class QuizDataManager:
             filename (str): The name of the file (e.g., "my_quiz.json").
             directory (str): The directory where the quiz file is located.
                              Defaults to "data/quiz_examples".
+            verbose (bool): Print a confirmation after a successful load. Bulk
+                            readers loading many files pass False. Defaults to True.
 
         Returns:
             Quiz: The loaded Quiz object.
@@ -90,12 +111,17 @@ class QuizDataManager:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"Quiz file not found: {file_path}")
 
+        # Quiz wczytany z wyprzedzeniem, gdy użytkownik przeglądał listę (zob. prefetch())
+        quiz = QuizCache.shared().take(file_path) if PREFETCH_ENABLED else None
+        if quiz is not None:
+            if verbose:
+                print(f"Quiz '{quiz.title}' loaded successfully from {file_path}")
+            return quiz
+
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                quiz_data = json.load(f)
-            # Convert dictionary data back to Quiz object
-            quiz = Quiz.from_dict(quiz_data)
-            print(f"Quiz '{quiz.title}' loaded successfully from {file_path}")
+            quiz = QuizDataManager._read_quiz_file(file_path)
+            if verbose:
+                print(f"Quiz '{quiz.title}' loaded successfully from {file_path}")
             return quiz
         except json.JSONDecodeError as e:
             print(f"Error decoding JSON from {file_path}: {e}")
@@ -108,6 +134,44 @@ class QuizDataManager:
             raise
 
     @staticmethod
+    def _read_quiz_file(file_path: str) -> Quiz:
+        """Reads and parses a quiz file (no messages; used by load_quiz and the prefetcher)."""
+        quiz_data = json.loads(read_quiz_bytes(file_path)) # Pliki skompresowane są rozpakowywane
+        # Convert dictionary data back to Quiz object
+        return Quiz.from_dict(quiz_data)
+
+    @staticmethod
+    def prefetch(names: list, directory: str = "data/quiz_examples", play_counts=None):
+        """
+        Starts loading the most likely choices of a quiz listing in the background, so
+        that the following load_quiz() call usually finds the quiz already parsed.
+
+        Candidates are ranked in the background, by recent-play frequency and then by
+        listing order; the memory used is limited by the budget of the shared QuizCache.
+        Does nothing when prefetching is disabled (QUIZ_PREFETCH=0).
+
+        Args:
+            names (list[str]): Quiz names in listing order.
+            directory (str): The directory of the quiz files. Defaults to "data/quiz_examples".
+            play_counts (callable, optional): Returns a dict of quiz name -> number of recent sessions.
+
+        Returns:
+            concurrent.futures.Future: Resolves once the loads have been started (None when disabled).
+        """
+        if not PREFETCH_ENABLED or not names:
+            return None
+        names = list(names)
+
+        def plan():
+            candidates = rank_candidates(names, play_counts() if play_counts else {})
+            QuizCache.shared().prefetch([os.path.join(directory, name + ".json") for name in candidates],
+                                        QuizDataManager._read_quiz_file)
+
+        return QuizCache.shared().submit(plan)
+
+    @staticmethod
+    @timed("list_available_quizzes")
+    @traced("list_available_quizzes")
     def list_available_quizzes(directory: str = "data/quiz_examples") -> list[str]:
         """
         Lists all available quiz files (JSON files) in the specified directory.
@@ -0,0 +1,192 @@
+# quiz_project/quiz_data/warmup.py
+"""
+Catalog warm-up and health scan.
+
+Every quiz of a directory is loaded through QuizDataManager and validated in a bounded
+pool of worker processes, so the scan takes time proportional to the catalog size divided
+by the number of cores. Workers also refresh the compiled artifacts (see QuizCompiler),
+and the quizzes most likely to be played (recent-play frequency, then listing order) are
+sent back and stored in the shared QuizCache, within its memory budget, so the first
+load_quiz() of those quizzes does not parse the file again.
+
+Broken files (e.g. empty or invalid JSON) are reported with all their errors and, on
+request, moved to the .quarantine subdirectory, where the listing no longer shows them.
+
+Usage:
+    python main.py warmup [--workers 4] [--quarantine]
+
+Settings: QUIZ_WARMUP=1 runs the scan when the interactive menu starts, QUIZ_WARMUP_WORKERS
+is the number of worker processes (default: the CPU count).
+"""
+import contextlib
+import io
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from quiz_creator.validator import QuizValidator
+from quiz_data.cache import MEMORY_FACTOR, PREFETCH_ENABLED, QuizCache, file_signature, rank_candidates
+from quiz_data.compiled import QuizCompiler
+from quiz_data.compression import content_size
+from quiz_data.manager import QuizDataManager
+
+WARMUP_ON_START = os.environ.get("QUIZ_WARMUP", "0") == "1"
+WARMUP_WORKERS = int(os.environ.get("QUIZ_WARMUP_WORKERS", "0")) or None
+QUARANTINE_DIRECTORY_NAME = ".quarantine" # Podkatalog z uszkodzonymi plikami obok plików quizów
+
+
+def _scan_quiz(name: str, directory: str, keep: bool, compile_artifacts: bool) -> tuple:
+    """
+    Loads and validates one quiz file.
+
+    Returns:
+        tuple: (report, file signature, the Quiz when it is to be cached, otherwise None).
+    """
+    file_path = os.path.join(directory, name + ".json")
+    started = time.perf_counter()
+    signature = file_signature(file_path) # Przed odczytem: zmiana pliku w trakcie unieważni wpis
+    source_hash = QuizCompiler.source_hash(file_path) if compile_artifacts else None
+    report = {"quiz": name, "valid": False, "errors": [], "warnings": [], "questions": 0}
+    quiz = None
+    try:
+        # load_quiz wypisuje przyczynę błędu; w skanie trafia ona do raportu
+        with contextlib.redirect_stdout(io.StringIO()):
+            quiz = QuizDataManager.load_quiz(name, directory, verbose=False)
+    except Exception as e: # Każdy błąd wczytania oznacza uszkodzony plik, a nie przerwany skan
+        errors, _ = QuizValidator.validate_file(file_path)
+        report["errors"] = errors or [f"{type(e).__name__}: {e}"]
+    else:
+        report["errors"], report["warnings"] = QuizValidator.validate(quiz.to_dict())
+        report["questions"] = len(quiz.questions)
+    report["valid"] = quiz is not None and not report["errors"]
+    if report["valid"] and compile_artifacts:
+        QuizCompiler.compile_cached(quiz, name, directory, source_hash=source_hash)
+    report["seconds"] = round(time.perf_counter() - started, 6)
+    return report, signature, quiz if keep and report["valid"] else None
+
+
+def _scan_batch(tasks: list, directory: str, compile_artifacts: bool) -> list:
+    """Scans a batch of (name, keep) tasks in a worker process."""
+    return [_scan_quiz(name, directory, keep, compile_artifacts) for name, keep in tasks]
+
+
+def quarantine_file(name: str, directory: str) -> str:
+    """
+    Moves a quiz file to the quarantine subdirectory (replacing an older quarantined copy).
+
+    Args:
+        name (str): The quiz name (without .json).
+        directory (str): The directory of the quiz file.
+
+    Returns:
+        str: The new path of the file.
+
+    Raises:
+        OSError: If the file cannot be moved.
+    """
+    target_directory = os.path.join(directory, QUARANTINE_DIRECTORY_NAME)
+    os.makedirs(target_directory, exist_ok=True)
+    target = os.path.join(target_directory, name + ".json")
+    os.replace(os.path.join(directory, name + ".json"), target)
+    return target
+
+
+def warm_up(directory: str = "data/quiz_examples", workers: int = None, quarantine: bool = False,
+            cache: QuizCache = None, play_counts: dict = None, compile_artifacts: bool = True) -> dict:
+    """
+    Loads, validates and caches every quiz of a directory using a pool of worker processes.
+
+    Args:
+        directory (str): The quiz directory. Defaults to "data/quiz_examples".
+        workers (int, optional): Number of worker processes. Defaults to QUIZ_WARMUP_WORKERS
+                                 or the CPU count; 1 scans in the current process.
+        quarantine (bool): Move corrupt files to the .quarantine subdirectory. Defaults to False
+                           (corrupt files are only reported).
+        cache (QuizCache, optional): Cache to populate. Defaults to the shared cache, or no
+                                     caching when prefetching is disabled (QUIZ_PREFETCH=0).
+        play_counts (dict, optional): Quiz name -> number of recent sessions; the most played
+                                      quizzes are cached first when the budget is too small.
+        compile_artifacts (bool): Refresh the compiled artifacts of valid quizzes. Defaults to True.
+
+    Returns:
+        dict: The summary: quiz counts (valid, corrupt, with warnings), questions, cached
+              quizzes, workers, elapsed seconds, throughput, the slowest files and the reports
+              of all quizzes with errors or warnings.
+    """
+    started = time.perf_counter()
+    if cache is None and PREFETCH_ENABLED:
+        cache = QuizCache.shared()
+    names = QuizDataManager.list_available_quizzes(directory)
+
+    # Wyniki wracają z procesów roboczych tylko dla quizów, które zmieszczą się w pamięci podręcznej
+    keep = set()
+    if cache is not None:
+        room = cache.budget_bytes - cache.used_bytes
+        for name in rank_candidates(names, play_counts or {}, limit=len(names)):
+            file_path = os.path.join(directory, name + ".json")
+            signature = file_signature(file_path)
+            size = content_size(file_path, signature[1]) * MEMORY_FACTOR if signature else 0
+            if size <= room:
+                keep.add(name)
+                room -= size
+
+    workers = max(1, min(workers or WARMUP_WORKERS or os.cpu_count() or 1, len(names) or 1))
+    # Kilka paczek na proces wyrównuje obciążenie przy plikach różnej wielkości
+    chunk = max(1, math.ceil(len(names) / (workers * 4)))
+    batches = [[(name, name in keep) for name in names[start:start + chunk]] for start in range(0, len(names), chunk)]
+    if workers == 1:
+        results = [_scan_batch(batch, directory, compile_artifacts) for batch in batches]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_scan_batch, batches, [directory] * len(batches),
+                                        [compile_artifacts] * len(batches)))
+
+    reports = []
+    cached = 0
+    for report, signature, quiz in (entry for batch in results for entry in batch):
+        if quiz is not None and cache.put(os.path.join(directory, report["quiz"] + ".json"), quiz, signature):
+            cached += 1
+        if not report["valid"] and quarantine:
+            try:
+                report["quarantined"] = quarantine_file(report["quiz"], directory)
+            except OSError as e:
+                report["errors"].append(f"Cannot quarantine file: {e}")
+        reports.append(report)
+
+    seconds = time.perf_counter() - started
+    valid = sum(report["valid"] for report in reports)
+    return {
+        "directory": directory,
+        "quizzes": len(reports),
+        "valid": valid,
+        "corrupt": len(reports) - valid,
+        "with_warnings": sum(bool(report["warnings"]) for report in reports),
+        "questions": sum(report["questions"] for report in reports),
+        "cached": cached,
+        "workers": workers,
+        "seconds": round(seconds, 3),
+        "quizzes_per_second": round(len(reports) / seconds, 1) if seconds else None,
+        "slowest": [{"quiz": report["quiz"], "seconds": report["seconds"]}
+                    for report in sorted(reports, key=lambda report: -report["seconds"])[:3]],
+        "problems": [report for report in reports if report["errors"] or report["warnings"]]
+    }
+
+
+def format_summary(summary: dict) -> str:
+    """
+    Formats a warm-up summary for the console.
+
+    Args:
+        summary (dict): The result of warm_up().
+
+    Returns:
+        str: One line with the totals, followed by one line per corrupt quiz.
+    """
+    lines = [f"Sprawdzono {summary['quizzes']} quizów w {summary['seconds']:.2f} s "
+             f"({summary['workers']} proc.): poprawne {summary['valid']}, uszkodzone {summary['corrupt']}, "
+             f"w pamięci podręcznej {summary['cached']}."]
+    for report in summary["problems"]:
+        if not report["valid"]:
+            where = f" (przeniesiono do {report['quarantined']})" if "quarantined" in report else ""
+            lines.append(f"  Uszkodzony quiz '{report['quiz']}'{where}: {'; '.join(report['errors'])}")
+    return "\n".join(lines)
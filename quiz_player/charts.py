@@ -0,0 +1,254 @@
+# quiz_project/quiz_player/charts.py
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from utils.metrics import REGISTRY
+
+# Stałe opisujące wygląd wykresu wyników (wspólne dla wszystkich backendów)
+CHART_LABELS: tuple[str, str] = ('Poprawne', 'Niepoprawne')
+CHART_COLORS: tuple[str, str] = ('#4CAF50', '#F44336') # Green for correct, Red for incorrect
+CHART_EXPLODE: tuple[float, float] = (0.1, 0) # explode the 1st slice (Correct)
+
+# Backend wykresów wybierany per wdrożenie: 'matplotlib', 'svg' lub 'png' (bez zależności)
+CHART_BACKENDS: tuple[str, ...] = ('matplotlib', 'svg', 'png')
+DEFAULT_CHART_BACKEND = "matplotlib"
+
+
+def configured_chart_backend() -> str:
+    """
+    Reads the chart backend from QUIZ_CHART_BACKEND.
+
+    Returns:
+        str: The backend name; an unknown name is reported and replaced with the default,
+             so a typo in the setting cannot break the end of every session.
+    """
+    backend = os.environ.get("QUIZ_CHART_BACKEND", DEFAULT_CHART_BACKEND).lower()
+    if backend not in CHART_BACKENDS:
+        print(f"Nieznany backend wykresów '{backend}' (QUIZ_CHART_BACKEND) - używam '{DEFAULT_CHART_BACKEND}'.")
+        return DEFAULT_CHART_BACKEND
+    return backend
+
+
+CHART_BACKEND = configured_chart_backend()
+
+
+def chart_filename_for(quiz_title: str, extension: str = "png") -> str:
+    """
+    Builds the report filename used for a quiz's results chart.
+
+    Args:
+        quiz_title (str): The title of the quiz.
+        extension (str): File extension of the rendered chart. Defaults to "png".
+
+    Returns:
+        str: A filename such as 'wyniki_geografia_polski.png'.
+    """
+    return f"wyniki_{quiz_title.replace(' ', '_').lower()}.{extension}"
+
+
+def render_results_chart(correct_count: int, incorrect_count: int, quiz_title: str,
+                         reports_directory: str) -> str:
+    """
+    Renders the correct/incorrect pie chart and writes it as a PNG file.
+
+    Uses the object-oriented Figure/FigureCanvasAgg API instead of the global
+    pyplot state machine, so it is safe to call from several threads or processes
+    at the same time.
+
+    Args:
+        correct_count (int): Number of correct answers.
+        incorrect_count (int): Number of incorrect answers.
+        quiz_title (str): The title of the quiz for chart labeling.
+        reports_directory (str): Directory where the chart will be written.
+
+    Returns:
+        str: The path of the written chart file.
+    """
+    # Importy wewnątrz funkcji - matplotlib ładowany jest tylko tam, gdzie faktycznie rysujemy
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    ax.pie([correct_count, incorrect_count], explode=CHART_EXPLODE, labels=CHART_LABELS,
+           colors=CHART_COLORS, autopct='%1.1f%%', shadow=True, startangle=90,
+           textprops={'fontsize': 12, 'color': 'white'})
+    ax.axis('equal')  # Equal aspect ratio ensures that pie is drawn as a circle.
+    ax.set_title(f'Wyniki quizu: {quiz_title}', fontsize=16, color='black')
+
+    os.makedirs(reports_directory, exist_ok=True)
+    chart_filepath = os.path.join(reports_directory, chart_filename_for(quiz_title))
+    fig.savefig(chart_filepath, bbox_inches='tight', dpi=100)
+    return chart_filepath
+
+
+def get_chart_renderer(backend: str = None):
+    """
+    Returns the rendering function and file extension of a chart backend.
+
+    The 'svg' and 'png' backends are pure Python and never import matplotlib.
+
+    Args:
+        backend (str, optional): 'matplotlib', 'svg' or 'png'. Defaults to CHART_BACKEND.
+
+    Returns:
+        tuple[callable, str]: The renderer and the extension of the files it writes.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+    backend = (backend or CHART_BACKEND).lower()
+    if backend == "matplotlib":
+        return render_results_chart, "png"
+    from quiz_player import svg_chart # Import tutaj, aby uniknąć importu cyklicznego
+    if backend == "svg":
+        return svg_chart.render_results_chart_svg, "svg"
+    if backend == "png":
+        return svg_chart.render_results_chart_png, "png"
+    raise ValueError(f"Unknown chart backend: {backend}")
+
+
+def _configured_workers():
+    """
+    Reads the number of rendering workers from QUIZ_CHART_WORKERS.
+
+    Returns:
+        int: The positive number of workers, or None (the CPU count) when the setting is unset
+             or invalid; an invalid value is reported.
+    """
+    workers = os.environ.get("QUIZ_CHART_WORKERS", "").strip()
+    if not workers:
+        return None
+    try:
+        value = int(workers)
+    except ValueError:
+        value = 0
+    if value < 1:
+        print(f"Nieprawidłowa wartość QUIZ_CHART_WORKERS: '{workers}' - używam domyślnej liczby wątków/procesów.")
+        return None
+    return value
+
+
+class ChartRenderingService:
+    """
+    Renders results charts in the background using a pool of workers.
+
+    Jobs are queued in a bounded queue: when 'max_pending' charts are already
+    waiting or being rendered, submit() blocks until a slot frees up, so a burst of
+    finished sessions cannot grow memory without limit.
+
+    Attributes:
+        max_workers (int): Number of rendering workers.
+        max_pending (int): Maximum number of queued or running jobs.
+        use_processes (bool): Whether workers are processes (True) or threads (False).
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_workers: int = None, max_pending: int = None, use_processes: bool = True):
+        """
+        Initializes the rendering service.
+
+        Args:
+            max_workers (int, optional): Number of workers. Defaults to the CPU count.
+            max_pending (int, optional): Size of the job queue. Defaults to 4 * max_workers.
+            use_processes (bool): Render in worker processes (scales with cores) instead of threads.
+
+        Raises:
+            ValueError: If max_workers or max_pending is not a positive integer.
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending or 4 * self.max_workers
+        if self.max_workers < 1 or self.max_pending < 1:
+            raise ValueError("max_workers and max_pending must be positive integers.")
+        self.use_processes = use_processes
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        """Creates the worker pool on first use."""
+        with self._lock:
+            if self._executor is None:
+                executor_cls = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+                self._executor = executor_cls(max_workers=self.max_workers)
+            return self._executor
+
+    def submit(self, correct_count: int, incorrect_count: int, quiz_title: str,
+               reports_directory: str, renderer=render_results_chart):
+        """
+        Queues a chart for rendering.
+
+        Args:
+            correct_count (int): Number of correct answers.
+            incorrect_count (int): Number of incorrect answers.
+            quiz_title (str): The title of the quiz for chart labeling.
+            reports_directory (str): Directory where the chart will be written.
+            renderer (callable): Module-level function doing the actual rendering.
+
+        Returns:
+            concurrent.futures.Future: A future resolving to the chart file path.
+        """
+        executor = self._get_executor()
+        self._slots.acquire() # Blokuje, gdy kolejka zadań jest pełna
+        try:
+            future = executor.submit(renderer, correct_count, incorrect_count,
+                                     quiz_title, reports_directory)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        if REGISTRY.enabled:
+            self._observe(future)
+        return future
+
+    @staticmethod
+    def _observe(future):
+        """Records the queue + render time of a chart and the number of charts in flight."""
+        started = time.perf_counter()
+        pending = REGISTRY.gauge("quiz_charts_pending", "Charts queued or being rendered.")
+        pending.inc()
+
+        def record(done_future):
+            pending.inc(-1)
+            REGISTRY.histogram("quiz_operation_seconds", operation="render_chart").observe(
+                time.perf_counter() - started)
+            if done_future.exception() is not None:
+                REGISTRY.counter("quiz_operation_errors_total", operation="render_chart").inc()
+
+        future.add_done_callback(record)
+
+    def shutdown(self, wait: bool = True):
+        """
+        Stops the worker pool.
+
+        Args:
+            wait (bool): Whether to wait for queued charts to be rendered.
+        """
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait)
+                self._executor = None
+
+    @classmethod
+    def shared(cls):
+        """
+        Returns the process-wide rendering service, creating it on first use.
+
+        The pool can be configured with the environment variables QUIZ_CHART_WORKERS
+        (number of workers) and QUIZ_CHART_EXECUTOR ('process' or 'thread'). Worker
+        processes are the default only for the matplotlib backend; the lightweight
+        backends render fast enough for a thread pool.
+
+        Returns:
+            ChartRenderingService: The shared service instance.
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                default_kind = "process" if CHART_BACKEND == "matplotlib" else "thread"
+                executor_kind = os.environ.get("QUIZ_CHART_EXECUTOR", default_kind).lower()
+                cls._shared = cls(max_workers=_configured_workers(), use_processes=executor_kind != "thread")
+            return cls._shared
@@ -0,0 +1,101 @@
+# quiz_project/quiz_player/grading.py
+"""
+Headless grading of answer sheets against compiled quizzes.
+
+An answer sheet is a JSON list with one entry per question, in quiz order: the 1-based
+number of the chosen option, a list of numbers for multi-answer questions, the typed
+text for free-text questions, or null for a skipped question.
+"""
+import json
+from models.scoring import indices_to_mask
+from utils.metrics import timed
+
+
+def load_answer_sheet(file_path: str) -> list:
+    """
+    Reads an answer sheet from a JSON file.
+
+    Args:
+        file_path (str): Path to the answer sheet.
+
+    Returns:
+        list: The answers, one per question.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is not valid JSON or does not contain a list.
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        answers = json.load(f)
+    if not isinstance(answers, list):
+        raise ValueError("Answer sheet must be a JSON list with one answer per question.")
+    return answers
+
+
+def answer_to_mask(compiled, question_index: int, answer) -> int:
+    """
+    Converts one answer of a sheet to the bitmask used by the scoring policies.
+
+    Free-text answers become 1 when accepted and 0b10 otherwise (the same convention
+    as the interactive player); skipped questions become 0.
+
+    Args:
+        compiled (CompiledQuiz): The compiled quiz.
+        question_index (int): The 0-based index of the question.
+        answer: The answer as stored in the sheet.
+
+    Returns:
+        int: The answer bitmask.
+
+    Raises:
+        ValueError: If the answer does not fit the question (wrong type or option number).
+    """
+    if answer is None:
+        return 0
+    text_matcher = compiled.text_matchers[question_index]
+    if text_matcher is not None:
+        if not isinstance(answer, str):
+            raise ValueError(f"Question {question_index + 1}: expected a text answer.")
+        return 1 if text_matcher.matches(answer) else 0b10
+    numbers = answer if isinstance(answer, list) else [answer]
+    if len(numbers) > 1 and not compiled.multi_answer[question_index]:
+        raise ValueError(f"Question {question_index + 1}: only one option may be chosen.")
+    option_count = len(compiled.options[question_index])
+    if not all(isinstance(number, int) and not isinstance(number, bool) and 1 <= number <= option_count
+               for number in numbers):
+        raise ValueError(f"Question {question_index + 1}: option numbers must be between 1 and {option_count}.")
+    return indices_to_mask(number - 1 for number in numbers)
+
+
+@timed("grade_answers")
+def grade_answers(compiled, answers: list, policy) -> dict:
+    """
+    Grades a whole answer sheet.
+
+    Args:
+        compiled (CompiledQuiz): The compiled quiz.
+        answers (list): The answers, one per question (see the module docstring).
+        policy (ScoringPolicy): The scoring policy.
+
+    Returns:
+        dict: 'score', 'max_score', 'correct' (number of exactly correct answers),
+              'scoring' and per-question 'results' with 'question_index', 'score' and 'is_correct'.
+
+    Raises:
+        ValueError: If the number of answers differs from the number of questions
+                    or an answer does not fit its question.
+    """
+    if len(answers) != len(compiled):
+        raise ValueError(f"Expected {len(compiled)} answers, got {len(answers)}.")
+    answer_masks = [answer_to_mask(compiled, i, answer) for i, answer in enumerate(answers)]
+    correct_masks = compiled.answer_key # Pytania tekstowe mają klucz 1 (zob. answer_to_mask)
+    total, scores = policy.grade_sheet(correct_masks, answer_masks)
+    correct_flags = [answer == correct for answer, correct in zip(answer_masks, correct_masks)]
+    return {
+        "score": round(total, 4),
+        "max_score": len(compiled),
+        "correct": sum(correct_flags),
+        "scoring": policy.name,
+        "results": [{"question_index": i, "score": score, "is_correct": is_correct}
+                    for i, (score, is_correct) in enumerate(zip(scores, correct_flags))]
+    }
@@ -1,13 +1,28 @@
 import os
-import matplotlib
-import matplotlib.pyplot as plt
+import random
+import time
+from models.scoring import get_scoring_policy, indices_to_mask, mask_to_indices
+from quiz_data.cache import PREFETCH_ENABLED, RECENT_SESSIONS, QuizCache, rank_candidates
+from quiz_data.compiled import QuizCompiler
 from quiz_data.manager import QuizDataManager
-
-matplotlib.use('Agg')
+from quiz_player.charts import ChartRenderingService, chart_filename_for, get_chart_renderer
+from quiz_results.analytics import ItemAnalytics
+from quiz_results.log import ResultsLog, recent_play_counts
+from quiz_search.index import QuestionIndex
+from quiz_search.picker import QuizPicker
+from utils import console
+from utils.metrics import timed
+from utils.permutation import FeistelPermutation
+from utils.sampling import make_rng, sample_indices
+from utils.tracing import span, start_span, traced
 
 # Globalna zmienna na poziomie modułu
 # (jest dostępna dla wszystkich funkcji i metod w tym module)
 REPORTS_DIRECTORY = "reports"
+RESULTS_DIRECTORY = "data/results"
+
+# Czy każda sesja ma losową (ale odtwarzalną z ziarna) kolejność pytań i odpowiedzi
+SHUFFLE_SESSIONS = os.environ.get("QUIZ_SHUFFLE", "0") == "1"
 
 
 class QuizPlayer:
@@ -15,14 +30,31 @@ class QuizPlayer:
     Manages the process of playing a quiz, including displaying questions,
     collecting answers, calculating scores, and presenting results.
     It utilizes functional programming concepts (map, filter, lambda) for analysis
-    and matplotlib for result visualization.
+    and a background ChartRenderingService for result visualization.
     """
 
     @staticmethod
-    def play_quiz():
+    @traced()
+    def play_quiz(random_mode: bool = False, num_questions: int = None, seed=None, shuffle_seed: int = None,
+                  scoring: str = None):
         """
         Allows the user to select and play an existing quiz.
         It loads the quiz, presents questions, records answers, and shows results.
+
+        In random mode only N questions, drawn without replacement in random order,
+        are asked. The draw is reproducible: the same quiz and seed always give the
+        same questions, and the seed used is printed for auditing.
+
+        Args:
+            random_mode (bool): Ask a random subset of questions. Defaults to False.
+            num_questions (int, optional): Number of questions to draw; implies random mode.
+                                           Asked interactively when omitted in random mode.
+            seed (int, optional): Seed of the draw. A random seed is generated when omitted.
+            shuffle_seed (int, optional): Seed of the per-session shuffle of questions and
+                                          options. When omitted, sessions are shuffled with a
+                                          fresh seed only if SHUFFLE_SESSIONS is enabled.
+            scoring (str, optional): Scoring policy ('all_or_nothing', 'partial' or 'negative').
+                                     Defaults to the QUIZ_SCORING environment variable.
         """
         print("\n--- Rozpoczęcie odtwarzania quizu ---")
 
@@ -33,28 +65,19 @@ class QuizPlayer:
             print("Brak dostępnych quizów. Najpierw utwórz quiz w trybie kreatora.")
             return
 
-        print("Dostępne quizy:")
-        for i, quiz_name in enumerate(available_quizzes):
-            print(f"  {i + 1}. {quiz_name}")
-
-        selected_quiz_name = None
-        while True:
-            try:
-                choice = input("Wybierz numer quizu do odtworzenia: ").strip()
-                choice_index = int(choice) - 1
-                if 0 <= choice_index < len(available_quizzes):
-                    selected_quiz_name = available_quizzes[choice_index]
-                    break
-                else:
-                    print("Nieprawidłowy numer. Wpisz numer z listy.")
-            except ValueError:
-                print("To nie jest liczba. Wpisz numer quizu.")
-            except Exception as e:
-                print(f"Wystąpił nieoczekiwany błąd podczas wyboru quizu: {e}")
+        # Małe katalogi - numerowana lista; duże - wyszukiwanie po prefiksie/podobieństwie
+        with span("select_quiz", quizzes=len(available_quizzes)):
+            picker = QuizPicker.for_catalog(available_quizzes, QuestionIndex.load_titles())
+            # Podczas wyboru najczęściej grane quizy z listy wczytują się w tle
+            selected_quiz_name = picker.choose("Wybierz numer quizu do odtworzenia: ",
+                                               on_show=QuizPlayer._prefetch_listing)
 
-        quiz = None
+        # Skompilowana postać quizu (artefakt z dysku, kompilowany tylko po zmianie pliku):
+        # gotowe bloki pytań, klucz odpowiedzi i komunikaty
+        compiled = None
         try:
-            quiz = QuizDataManager.load_quiz(selected_quiz_name)
+            with span("load_compiled_quiz"):
+                compiled = QuizCompiler.load(selected_quiz_name)
         except FileNotFoundError:
             print(f"Błąd: Plik quizu '{selected_quiz_name}.json' nie został znaleziony.")
             return
@@ -62,39 +85,91 @@ class QuizPlayer:
             print(f"Wystąpił błąd podczas ładowania quizu '{selected_quiz_name}': {e}")
             return
 
-        if not quiz.questions:
-            print(f"Quiz '{quiz.title}' nie zawiera żadnych pytań. Nie można go odtworzyć.")
+        if not len(compiled):
+            print(f"Quiz '{compiled.title}' nie zawiera żadnych pytań. Nie można go odtworzyć.")
             return
 
-        print(f"\n--- Rozpoczęcie quizu: {quiz.title} ---")
-        if quiz.description:
-            print(f"Opis: {quiz.description}")
+        try:
+            policy = get_scoring_policy(scoring)
+        except ValueError as e:
+            print(f"{e}. Używam punktacji 'all_or_nothing'.")
+            policy = get_scoring_policy("all_or_nothing")
+
+        if shuffle_seed is None and SHUFFLE_SESSIONS:
+            shuffle_seed = random.SystemRandom().randrange(2 ** 32)
+
+        # Kolejność pytań: range/permutacja zajmują O(1) pamięci niezależnie od liczby pytań
+        question_indices = range(len(compiled))
+        if random_mode or num_questions is not None:
+            question_indices = QuizPlayer._draw_question_indices(len(compiled), num_questions, seed)
+        elif shuffle_seed is not None:
+            question_indices = FeistelPermutation(len(compiled), (shuffle_seed, "questions"))
+        if shuffle_seed is not None:
+            print(f"Pytania i odpowiedzi są przetasowane (ziarno sesji: {shuffle_seed}).")
+
+        print(f"\n--- Rozpoczęcie quizu: {compiled.title} ---")
+        if compiled.description:
+            print(f"Opis: {compiled.description}")
 
         user_answers = []
-        correct_answers_count = 0
-        total_questions = len(quiz.questions)
-
-        for i, question in enumerate(quiz.questions):
-            print(f"\n--- Pytanie {i + 1}/{total_questions} ---")
-            print(question.display())
+        total_score = 0.0
+        total_questions = len(question_indices)
+        started_at = time.time()
+
+        for position, i in enumerate(question_indices):
+            # Odcinki śladu kończone jawnie - pętla pytania ma kilka wyjść
+            question_span = start_span("question", position=position + 1, index=i)
+            options = compiled.options[i]
+            with span("display_question"):
+                print(f"\n--- Pytanie {position + 1}/{total_questions} ---")
+                text_matcher = compiled.text_matchers[i]
+                option_order = None
+                if shuffle_seed is not None and text_matcher is None:
+                    option_order = FeistelPermutation(len(options), (shuffle_seed, "options", i))
+                print(compiled.display(i, option_order))
+            multi_answer = compiled.multi_answer[i]
+
+            answer_span = start_span("answer")
+            if text_matcher is not None:
+                user_answers.append(QuizPlayer._ask_text_question(compiled, i, text_matcher, policy))
+                total_score += user_answers[-1]["score"]
+                answer_span.end()
+                question_span.end()
+                continue
 
             while True:
                 try:
-                    user_input = input("Wpisz numer odpowiedzi: ").strip()
-                    answer_index = int(user_input) - 1 # Convert to 0-based index
-                    if 0 <= answer_index < len(question.options):
+                    if multi_answer:
+                        user_input = console.input("Wpisz numery odpowiedzi oddzielone przecinkami: ").strip()
+                        positions = {int(part) - 1 for part in user_input.split(",") if part.strip()}
+                    else:
+                        user_input = console.input("Wpisz numer odpowiedzi: ").strip()
+                        positions = {int(user_input) - 1} # Convert to 0-based index
+                    if positions and all(0 <= position < len(options) for position in positions):
+                        if option_order is not None:
+                            positions = {option_order[position] for position in positions} # Pozycja na ekranie -> oryginalny indeks
+                        answer_mask = indices_to_mask(positions)
+                        correct_mask = compiled.answer_key[i]
+                        is_correct = compiled.is_correct(i, answer_mask)
+                        points = policy.score(correct_mask, answer_mask)
+                        total_score += points
+                        correct_indices = mask_to_indices(correct_mask)
                         user_answers.append({
-                            "question_text": question.question_text,
-                            "user_choice_index": answer_index,
-                            "is_correct": question.is_correct(answer_index),
-                            "correct_answer_index": question.correct_answer_index,
-                            "options": question.options
+                            "question_index": i,
+                            "question_text": compiled.question_texts[i],
+                            "user_choice_index": sorted(positions) if multi_answer else positions.pop(),
+                            "is_correct": is_correct,
+                            "score": points,
+                            "correct_answer_index": correct_indices if multi_answer else correct_indices[0],
+                            "options": options,
+                            "answered_at": time.time()
                         })
-                        if question.is_correct(answer_index):
+                        if is_correct:
                             print("Poprawna odpowiedź!")
-                            correct_answers_count += 1
                         else:
-                            print(f"Niepoprawna odpowiedź. Poprawna to: {question.options[question.correct_answer_index]}")
+                            print(compiled.feedback[i])
+                            if points:
+                                print(f"Punkty za to pytanie: {points:g}")
                         break
                     else:
                         print("Nieprawidłowy numer opcji. Wpisz numer z listy.")
@@ -102,9 +177,18 @@ class QuizPlayer:
                     print("To nie jest liczba. Wpisz numer odpowiedzi.")
                 except Exception as e:
                     print(f"Wystąpił nieoczekiwany błąd podczas udzielania odpowiedzi: {e}")
+            answer_span.end()
+            question_span.end()
 
+        finished_at = time.time()
+        QuizPlayer.record_session(None, selected_quiz_name, user_answers, started_at, finished_at,
+                                  shuffle_seed=shuffle_seed, fingerprint=compiled.fingerprint,
+                                  scoring=policy.name)
+
+        analysis_span = start_span("analyze_results")
+        total_score = round(total_score, 4) # Bez artefaktów typu 0.30000000000000004
         print("\n--- Koniec quizu! ---")
-        print(f"Twój wynik: {correct_answers_count}/{total_questions} poprawnych odpowiedzi.")
+        print(f"Twój wynik: {total_score:g}/{total_questions} poprawnych odpowiedzi.")
 
         # --- Analiza wyników z użyciem programowania funkcyjnego ---
         # 1. Użycie filter do pobrania tylko poprawnych odpowiedzi
@@ -130,53 +214,189 @@ class QuizPlayer:
             for text in incorrect_question_texts:
                 print(f"- {text}")
 
-        # --- Wizualizacja danych (matplotlib) ---
-        QuizPlayer.generate_and_save_results_chart(num_correct, num_incorrect, quiz.title)
+        # --- Wizualizacja danych (renderowanie w tle, gracz nie czeka na zapis PNG) ---
+        if policy.name != "all_or_nothing":
+            # Przy punktach cząstkowych/ujemnych wykres pokazuje zdobyte i stracone punkty
+            num_correct = max(total_score, 0)
+            num_incorrect = total_questions - num_correct
+        analysis_span.end()
+        QuizPlayer.generate_and_save_results_chart(num_correct, num_incorrect, compiled.title)
 
-        print("\nSzczegółowe wyniki zostały zapisane w raporcie graficznym.")
+        print("\nSzczegółowe wyniki zostaną zapisane w raporcie graficznym.")
 
 
     @staticmethod
-    def generate_and_save_results_chart(correct_count: int, incorrect_count: int, quiz_title: str):
+    def _prefetch_listing(names: list):
+        """
+        Refreshes in the background the compiled artifacts of the most often played quizzes
+        of a shown listing, so that QuizCompiler.load() of the chosen quiz reads a current
+        artifact instead of compiling the source file.
+        """
+        if not PREFETCH_ENABLED or not names:
+            return
+
+        def refresh_artifacts():
+            play_counts = recent_play_counts(RESULTS_DIRECTORY, RECENT_SESSIONS)
+            for name in rank_candidates(list(names), play_counts):
+                try:
+                    QuizCompiler.load(name)
+                except Exception:
+                    pass # Błąd zgłosi wczytanie quizu po wyborze
+
+        QuizCache.shared().submit(refresh_artifacts)
+
+    @staticmethod
+    def _ask_text_question(compiled, question_index: int, text_matcher, policy) -> dict:
         """
-        Generates a pie chart showing the distribution of correct vs. incorrect answers
-        and saves it to the 'reports' directory.
+        Asks a free-text question until a non-empty answer is typed and grades it.
 
         Args:
-            correct_count (int): Number of correct answers.
-            incorrect_count (int): Number of incorrect answers.
-            quiz_title (str): The title of the quiz for chart labeling.
+            compiled (CompiledQuiz): The compiled quiz.
+            question_index (int): The original index of the question.
+            text_matcher (AnswerMatcher): The precompiled matcher of the question.
+            policy (ScoringPolicy): The scoring policy of the session.
+
+        Returns:
+            dict: The answer dictionary in the format used by play_quiz().
         """
-        # Użycie krotki do przechowywania stałych etykiet
-        labels: tuple[str, str] = ('Poprawne', 'Niepoprawne')
-        sizes = [correct_count, incorrect_count]
+        while True:
+            user_input = console.input("Wpisz odpowiedź: ").strip()
+            if user_input:
+                break
+            print("Odpowiedź nie może być pusta.")
+        is_correct = text_matcher.matches(user_input)
+        # Odpowiedź tekstowa to "opcja 0" poprawna albo dowolna inna (0b10) błędna
+        points = policy.score(1, 1 if is_correct else 0b10)
+        if is_correct:
+            print("Poprawna odpowiedź!")
+        else:
+            print(compiled.feedback[question_index])
+        return {
+            "question_index": question_index,
+            "question_text": compiled.question_texts[question_index],
+            "user_choice_index": user_input,
+            "is_correct": is_correct,
+            "score": points,
+            "correct_answer_index": 0,
+            "options": compiled.options[question_index],
+            "answered_at": time.time()
+        }
 
-        # Użycie krotki do przechowywania stałych kodów kolorów
-        colors: tuple[str, str] = ('#4CAF50', '#F44336') # Green for correct, Red for incorrect
+    @staticmethod
+    def _draw_question_indices(bank_size: int, num_questions: int = None, seed=None) -> list[int]:
+        """
+        Draws the indices of the questions asked in random mode.
 
-        explode = (0.1, 0) # explode the 1st slice (Correct)
+        Args:
+            bank_size (int): Number of questions in the quiz.
+            num_questions (int, optional): How many questions to draw. Asked interactively when None.
+            seed (int, optional): Seed of the draw. Generated and printed when None.
 
-        fig1, ax1 = plt.subplots()
-        ax1.pie(sizes, explode=explode, labels=labels, colors=colors,
-                autopct='%1.1f%%', shadow=True, startangle=90,
-                textprops={'fontsize': 12, 'color': 'white'})
-        ax1.axis('equal')  # Equal aspect ratio ensures that pie is drawn as a circle.
+        Returns:
+            list[int]: Distinct question indices in the order they will be asked.
+        """
+        while num_questions is None:
+            try:
+                user_input = console.input(f"Ile pytań wylosować (1-{bank_size})? ").strip()
+                num_questions = int(user_input)
+                if not 1 <= num_questions <= bank_size:
+                    print("Nieprawidłowa liczba pytań.")
+                    num_questions = None
+            except ValueError:
+                print("To nie jest liczba. Wpisz liczbę pytań.")
+        num_questions = min(num_questions, bank_size)
 
-        plt.title(f'Wyniki quizu: {quiz_title}', fontsize=16, color='black')
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+        print(f"Wylosowano {num_questions} z {bank_size} pytań (ziarno losowania: {seed}).")
+        return sample_indices(bank_size, num_questions, make_rng(seed))
 
-        # Save the chart using the global variable for the directory
-        # REPORTS_DIRECTORY jest zmienną globalną na poziomie modułu
-        if not os.path.exists(REPORTS_DIRECTORY):
-            os.makedirs(REPORTS_DIRECTORY)
-            print(f"Created directory: {REPORTS_DIRECTORY}")
+    @staticmethod
+    @timed("record_session")
+    @traced("record_session")
+    def record_session(quiz, quiz_name: str, user_answers: list, started_at: float, finished_at: float,
+                       shuffle_seed: int = None, fingerprint: str = None, scoring: str = None):
+        """
+        Appends a finished session to the persistent results log and writes its
+        per-question analytics as a new partial file (see ItemAnalytics.save_partial()).
 
-        chart_filename = f"wyniki_{quiz_title.replace(' ', '_').lower()}.png"
-        chart_filepath = os.path.join(REPORTS_DIRECTORY, chart_filename)
+        Only a compact record is stored: the quiz fingerprint, the indices of the asked
+        questions with the chosen option index (a list of indices for multi-answer
+        questions, the typed text for free-text questions) for each of them, and
+        timestamps (answer times as millisecond offsets from the start of the session).
+        Question texts and options can be recovered from the quiz version identified by
+        the fingerprint.
 
+        Args:
+            quiz (Quiz): The quiz that was played (may be None when a fingerprint is given).
+            quiz_name (str): The name of the quiz file (without extension).
+            user_answers (list): Answer dictionaries collected by play_quiz().
+            started_at (float): Session start as a UNIX timestamp.
+            finished_at (float): Session end as a UNIX timestamp.
+            shuffle_seed (int, optional): Seed of the session's shuffle, stored so the
+                                          presented order can be reproduced during audits.
+            fingerprint (str, optional): Precomputed quiz fingerprint. Computed when omitted.
+            scoring (str, optional): Name of the scoring policy; stored unless it is the
+                                     default all-or-nothing policy.
+        """
+        record = {
+            "v": 1,
+            "quiz": fingerprint or quiz.fingerprint(),
+            "name": quiz_name,
+            "started": round(started_at, 3),
+            "finished": round(finished_at, 3),
+            "questions": [answer["question_index"] for answer in user_answers],
+            "choices": [answer["user_choice_index"] for answer in user_answers],
+            "t": [round((answer["answered_at"] - started_at) * 1000) for answer in user_answers],
+            "score": round(sum(answer.get("score", 1 if answer["is_correct"] else 0) for answer in user_answers), 4)
+        }
+        if shuffle_seed is not None:
+            record["shuffle"] = shuffle_seed
+        if scoring and scoring != "all_or_nothing":
+            record["scoring"] = scoring
         try:
-            plt.savefig(chart_filepath, bbox_inches='tight', dpi=100)
-            print(f"Wykres wyników został zapisany w: {chart_filepath}")
-        except Exception as e:
-            print(f"Błąd podczas zapisywania wykresu: {e}")
-        finally:
-            plt.close(fig1) # Close the plot to free up memory
\ No newline at end of file
+            ResultsLog.shared(RESULTS_DIRECTORY).append(record)
+            session_analytics = ItemAnalytics()
+            session_analytics.add_session(record["quiz"],
+                                          record["questions"],
+                                          record["choices"],
+                                          [answer["is_correct"] for answer in user_answers])
+            session_analytics.save_partial(RESULTS_DIRECTORY)
+        except (OSError, ValueError) as e:
+            # Brak zapisu wyników nie powinien przerywać rozgrywki
+            print(f"Nie udało się zapisać wyników sesji: {e}")
+
+    @staticmethod
+    @traced()
+    def generate_and_save_results_chart(correct_count: int, incorrect_count: int, quiz_title: str):
+        """
+        Queues a pie chart showing the distribution of correct vs. incorrect answers
+        for rendering and saving in the 'reports' directory.
+
+        Rendering happens in the shared ChartRenderingService, so the player does not
+        wait for PNG encoding. The chart backend (matplotlib, svg or png) is chosen
+        with the QUIZ_CHART_BACKEND environment variable. Errors are reported once the
+        chart has been processed.
+
+        Args:
+            correct_count (float): Number of correct answers (points earned under
+                                   partial-credit scoring).
+            incorrect_count (float): Number of incorrect answers (points lost).
+            quiz_title (str): The title of the quiz for chart labeling.
+
+        Returns:
+            concurrent.futures.Future: A future resolving to the chart file path.
+        """
+        # REPORTS_DIRECTORY jest zmienną globalną na poziomie modułu
+        renderer, extension = get_chart_renderer()
+        chart_filepath = os.path.join(REPORTS_DIRECTORY, chart_filename_for(quiz_title, extension))
+        future = ChartRenderingService.shared().submit(correct_count, incorrect_count,
+                                                       quiz_title, REPORTS_DIRECTORY, renderer=renderer)
+
+        def report_failure(done_future):
+            if done_future.exception() is not None:
+                print(f"Błąd podczas zapisywania wykresu: {done_future.exception()}")
+
+        future.add_done_callback(report_failure)
+        print(f"Wykres wyników zostanie zapisany w: {chart_filepath}")
+        return future
@@ -0,0 +1,203 @@
+# quiz_project/quiz_player/svg_chart.py
+"""
+Dependency-free renderers for the correct/incorrect results pie chart.
+
+Both renderers mirror the matplotlib chart drawn by charts.render_results_chart:
+the same labels, colors, exploded 'Poprawne' slice, start angle of 90 degrees and
+counter-clockwise slice order. The PNG renderer has no font engine, so it only
+draws the slices; use the SVG renderer when labels and the title are needed.
+"""
+import math
+import os
+import struct
+import zlib
+from xml.sax.saxutils import escape
+
+from quiz_player.charts import CHART_COLORS, CHART_EXPLODE, CHART_LABELS, chart_filename_for
+
+START_ANGLE = 90.0 # Tak jak startangle=90 w wykresie matplotlib
+SVG_SIZE = 480
+PNG_SIZE = 240
+
+
+def _slice_angles(sizes) -> list[tuple[float, float]]:
+    """
+    Computes (start, end) angles in degrees for each pie slice.
+
+    Args:
+        sizes (list): Slice values.
+
+    Returns:
+        list[tuple[float, float]]: Angles measured counter-clockwise from the x axis.
+    """
+    total = sum(sizes)
+    angles = []
+    current = START_ANGLE
+    for size in sizes:
+        span = 360.0 * size / total if total else 0.0
+        angles.append((current, current + span))
+        current += span
+    return angles
+
+
+def _point(cx: float, cy: float, radius: float, angle_deg: float) -> tuple[float, float]:
+    """Returns SVG coordinates of a point on a circle (SVG's y axis points down)."""
+    angle = math.radians(angle_deg)
+    return cx + radius * math.cos(angle), cy - radius * math.sin(angle)
+
+
+def build_results_svg(correct_count: int, incorrect_count: int, quiz_title: str) -> str:
+    """
+    Builds the SVG document of the results pie chart.
+
+    Args:
+        correct_count (int): Number of correct answers.
+        incorrect_count (int): Number of incorrect answers.
+        quiz_title (str): The title of the quiz for chart labeling.
+
+    Returns:
+        str: The SVG document.
+    """
+    sizes = [correct_count, incorrect_count]
+    total = sum(sizes)
+    cx, cy = SVG_SIZE / 2, SVG_SIZE / 2 + 20
+    radius = SVG_SIZE * 0.32
+
+    shapes = []
+    texts = []
+    for size, (start, end), label, color, explode in zip(
+            sizes, _slice_angles(sizes), CHART_LABELS, CHART_COLORS, CHART_EXPLODE):
+        if size <= 0:
+            continue
+        middle = (start + end) / 2
+        sx, sy = _point(cx, cy, radius * explode, middle) # Przesunięcie "wysuniętego" wycinka
+        if end - start >= 360.0:
+            shape = f'<circle cx="{sx:.2f}" cy="{sy:.2f}" r="{radius:.2f}"'
+        else:
+            x1, y1 = _point(sx, sy, radius, start)
+            x2, y2 = _point(sx, sy, radius, end)
+            large_arc = 1 if end - start > 180.0 else 0
+            shape = (f'<path d="M{sx:.2f},{sy:.2f} L{x1:.2f},{y1:.2f} '
+                     f'A{radius:.2f},{radius:.2f} 0 {large_arc} 0 {x2:.2f},{y2:.2f} Z"')
+        shapes.append((shape, color))
+
+        lx, ly = _point(sx, sy, radius * 1.1, middle)
+        anchor = "start" if lx >= sx else "end"
+        texts.append(f'<text x="{lx:.2f}" y="{ly:.2f}" text-anchor="{anchor}" '
+                     f'font-size="12" fill="white">{escape(label)}</text>')
+        px, py = _point(sx, sy, radius * 0.6, middle)
+        texts.append(f'<text x="{px:.2f}" y="{py:.2f}" text-anchor="middle" dominant-baseline="middle" '
+                     f'font-size="12" fill="white">{100.0 * size / total:.1f}%</text>')
+
+    # Cień (odpowiednik shadow=True) - te same kształty przesunięte i półprzezroczyste
+    shadow = "".join(f'{shape} fill="black"/>' for shape, _ in shapes)
+    slices = "".join(f'{shape} fill="{color}"/>' for shape, color in shapes)
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{SVG_SIZE}" height="{SVG_SIZE}" '
+        f'viewBox="0 0 {SVG_SIZE} {SVG_SIZE}" font-family="sans-serif">'
+        f'<rect width="100%" height="100%" fill="white"/>'
+        f'<text x="{SVG_SIZE / 2:.2f}" y="32" text-anchor="middle" font-size="16" fill="black">'
+        f'{escape(f"Wyniki quizu: {quiz_title}")}</text>'
+        f'<g transform="translate(4,4)" opacity="0.3">{shadow}</g>'
+        f'{slices}{"".join(texts)}</svg>'
+    )
+
+
+def render_results_chart_svg(correct_count: int, incorrect_count: int, quiz_title: str,
+                             reports_directory: str) -> str:
+    """
+    Renders the results pie chart as an SVG file without matplotlib.
+
+    Args:
+        correct_count (int): Number of correct answers.
+        incorrect_count (int): Number of incorrect answers.
+        quiz_title (str): The title of the quiz for chart labeling.
+        reports_directory (str): Directory where the chart will be written.
+
+    Returns:
+        str: The path of the written chart file.
+    """
+    os.makedirs(reports_directory, exist_ok=True)
+    chart_filepath = os.path.join(reports_directory, chart_filename_for(quiz_title, "svg"))
+    with open(chart_filepath, 'w', encoding='utf-8') as f:
+        f.write(build_results_svg(correct_count, incorrect_count, quiz_title))
+    return chart_filepath
+
+
+def _hex_to_rgb(color: str) -> bytes:
+    """Converts '#RRGGBB' into three bytes."""
+    return bytes.fromhex(color.lstrip('#'))
+
+
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    """Builds a single PNG chunk with its length and CRC."""
+    return (struct.pack('>I', len(data)) + chunk_type + data
+            + struct.pack('>I', zlib.crc32(chunk_type + data) & 0xFFFFFFFF))
+
+
+def build_results_png(correct_count: int, incorrect_count: int, size: int = PNG_SIZE) -> bytes:
+    """
+    Rasterizes the results pie chart into a minimal RGB PNG (slices only, no text).
+
+    Args:
+        correct_count (int): Number of correct answers.
+        incorrect_count (int): Number of incorrect answers.
+        size (int): Width and height of the image in pixels.
+
+    Returns:
+        bytes: The encoded PNG image.
+    """
+    sizes = [correct_count, incorrect_count]
+    center = size / 2
+    radius = size * 0.4
+    radius_sq = radius * radius
+    background = b'\xff\xff\xff'
+
+    slices = []
+    for value, (start, end), color, explode in zip(sizes, _slice_angles(sizes), CHART_COLORS, CHART_EXPLODE):
+        if value <= 0:
+            continue
+        middle = math.radians((start + end) / 2)
+        slices.append((center + radius * explode * math.cos(middle),
+                       center - radius * explode * math.sin(middle),
+                       start % 360.0, end - start, _hex_to_rgb(color)))
+
+    rows = []
+    for y in range(size):
+        row = bytearray(b'\x00') # Filtr PNG "None" dla każdego wiersza
+        for x in range(size):
+            pixel = background
+            for sx, sy, start, span, rgb in slices:
+                dx, dy = x + 0.5 - sx, sy - (y + 0.5)
+                if dx * dx + dy * dy > radius_sq:
+                    continue
+                if span >= 360.0 or (math.degrees(math.atan2(dy, dx)) - start) % 360.0 < span:
+                    pixel = rgb
+                    break
+            row += pixel
+        rows.append(bytes(row))
+
+    header = struct.pack('>IIBBBBB', size, size, 8, 2, 0, 0, 0) # 8-bit RGB
+    return (b'\x89PNG\r\n\x1a\n' + _png_chunk(b'IHDR', header)
+            + _png_chunk(b'IDAT', zlib.compress(b''.join(rows), 6)) + _png_chunk(b'IEND', b''))
+
+
+def render_results_chart_png(correct_count: int, incorrect_count: int, quiz_title: str,
+                             reports_directory: str) -> str:
+    """
+    Renders the results pie chart as a minimal PNG file without matplotlib.
+
+    Args:
+        correct_count (int): Number of correct answers.
+        incorrect_count (int): Number of incorrect answers.
+        quiz_title (str): The title of the quiz, used for the filename.
+        reports_directory (str): Directory where the chart will be written.
+
+    Returns:
+        str: The path of the written chart file.
+    """
+    os.makedirs(reports_directory, exist_ok=True)
+    chart_filepath = os.path.join(reports_directory, chart_filename_for(quiz_title))
+    with open(chart_filepath, 'wb') as f:
+        f.write(build_results_png(correct_count, incorrect_count))
+    return chart_filepath
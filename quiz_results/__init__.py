@@ -0,0 +1,2 @@
+# quiz_project/quiz_results/__init__.py
+# Plik inicjalizujący pakiet 'quiz_results' (zapis i analiza wyników rozegranych quizów).
@@ -0,0 +1,468 @@
+# quiz_project/quiz_results/analytics.py
+"""
+Incremental per-question (item) statistics for played quizzes.
+
+Usage:
+    python -m quiz_results.analytics [--results data/results] [--quiz python]
+"""
+import argparse
+import glob
+import json
+import math
+import os
+import sys
+import threading
+import time
+import uuid
+
+ANALYTICS_FILENAME = "analytics.json"
+PARTIAL_PATTERN = "analytics-*.json"
+COMPACT_THRESHOLD = 64 # Po przekroczeniu tej liczby plików częściowych zapis sesji scala je w analytics.json
+COMPACT_LOCK_FILENAME = "analytics.lock"
+STALE_LOCK_SECONDS = 60 # Blokada starsza niż to pochodzi z przerwanego procesu
+
+
+class ItemStats:
+    """
+    Running statistics of a single question, updated in O(1) per answer.
+
+    Besides attempts and the choice distribution, it keeps sufficient statistics of
+    the "rest score" (session score without this question), which is enough to compute
+    the corrected point-biserial discrimination without revisiting old sessions.
+    Two ItemStats for the same question can be merged by adding their fields.
+
+    Attributes:
+        attempts (int): Number of answers given to the question.
+        correct (int): Number of correct answers.
+        choice_counts (list[int]): How many times each option was chosen.
+        rest_sum (float): Sum of rest scores over all attempts.
+        rest_sq_sum (float): Sum of squared rest scores over all attempts.
+        rest_sum_correct (float): Sum of rest scores over correct attempts.
+    """
+
+    __slots__ = ("attempts", "correct", "choice_counts", "rest_sum", "rest_sq_sum", "rest_sum_correct")
+
+    def __init__(self):
+        """Initializes empty statistics."""
+        self.attempts = 0
+        self.correct = 0
+        self.choice_counts = []
+        self.rest_sum = 0.0
+        self.rest_sq_sum = 0.0
+        self.rest_sum_correct = 0.0
+
+    def add(self, choice: int, is_correct: bool, rest_score: float):
+        """
+        Records one answer.
+
+        Args:
+            choice (int | list[int] | str | None): The 0-based index of the chosen option, the
+                                                   indices of all chosen options of a multi-answer
+                                                   question, the typed answer of a free-text question,
+                                                   or None for a skipped question (headless play).
+            is_correct (bool): Whether the answer was correct.
+            rest_score (float): The session score excluding this question.
+        """
+        self.attempts += 1
+        if choice is None or isinstance(choice, str):
+            chosen = () # Odpowiedź tekstowa lub pominięte pytanie - brak rozkładu wyboru opcji
+        else:
+            chosen = choice if isinstance(choice, list) else (choice,)
+        for option in chosen:
+            if option >= len(self.choice_counts):
+                self.choice_counts.extend([0] * (option + 1 - len(self.choice_counts)))
+            self.choice_counts[option] += 1
+        self.rest_sum += rest_score
+        self.rest_sq_sum += rest_score * rest_score
+        if is_correct:
+            self.correct += 1
+            self.rest_sum_correct += rest_score
+
+    def merge(self, other: "ItemStats"):
+        """
+        Adds another partial aggregate of the same question into this one.
+
+        Args:
+            other (ItemStats): Statistics collected elsewhere (e.g. by another worker process).
+        """
+        self.attempts += other.attempts
+        self.correct += other.correct
+        if len(other.choice_counts) > len(self.choice_counts):
+            self.choice_counts.extend([0] * (len(other.choice_counts) - len(self.choice_counts)))
+        for i, count in enumerate(other.choice_counts):
+            self.choice_counts[i] += count
+        self.rest_sum += other.rest_sum
+        self.rest_sq_sum += other.rest_sq_sum
+        self.rest_sum_correct += other.rest_sum_correct
+
+    @property
+    def correct_rate(self) -> float:
+        """float: Fraction of correct answers (item difficulty), 0.0 when unanswered."""
+        return self.correct / self.attempts if self.attempts else 0.0
+
+    @property
+    def discrimination(self):
+        """
+        float | None: Corrected point-biserial correlation between answering this question
+        correctly and the rest of the session score. None when it is undefined
+        (fewer than two attempts, everyone right or wrong, or no variance in rest scores).
+        """
+        n, n1 = self.attempts, self.correct
+        n0 = n - n1
+        if n < 2 or n1 == 0 or n0 == 0:
+            return None
+        mean = self.rest_sum / n
+        variance = self.rest_sq_sum / n - mean * mean
+        if variance <= 1e-12:
+            return None
+        mean_correct = self.rest_sum_correct / n1
+        mean_incorrect = (self.rest_sum - self.rest_sum_correct) / n0
+        p = n1 / n
+        return (mean_correct - mean_incorrect) / math.sqrt(variance) * math.sqrt(p * (1 - p))
+
+    def to_dict(self) -> dict:
+        """Converts the statistics to a JSON-serializable dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """Creates statistics from a dictionary produced by to_dict()."""
+        stats = cls()
+        for name in cls.__slots__:
+            setattr(stats, name, data[name])
+        return stats
+
+
+class ItemAnalytics:
+    """
+    Per-question statistics for every quiz version, keyed by the quiz fingerprint.
+
+    Sessions are added one at a time (O(questions) per session), partial aggregates
+    from different processes are combined with merge(), and reports are computed
+    from the stored counters only, so their cost does not depend on how many
+    sessions have been played.
+
+    Attributes:
+        quizzes (dict): Maps a quiz fingerprint to {"sessions": int, "items": {index: ItemStats}}.
+    """
+
+    def __init__(self):
+        """Initializes empty analytics."""
+        self.quizzes = {}
+
+    def _summary(self, fingerprint: str) -> dict:
+        """Returns (creating if needed) the summary of one quiz version."""
+        summary = self.quizzes.get(fingerprint)
+        if summary is None:
+            summary = self.quizzes[fingerprint] = {"sessions": 0, "items": {}}
+        return summary
+
+    def add_session(self, fingerprint: str, question_indices: list, choices: list, correct_flags: list):
+        """
+        Adds one finished session.
+
+        Args:
+            fingerprint (str): Fingerprint of the played quiz version.
+            question_indices (list[int]): Original indices of the questions that were asked.
+            choices (list): The chosen option index (or list of indices) for each asked question.
+            correct_flags (list[bool]): Whether each answer was correct.
+
+        Raises:
+            ValueError: If the three lists have different lengths.
+        """
+        if not len(question_indices) == len(choices) == len(correct_flags):
+            raise ValueError("question_indices, choices and correct_flags must have equal lengths.")
+        summary = self._summary(fingerprint)
+        summary["sessions"] += 1
+        score = sum(1 for flag in correct_flags if flag)
+        items = summary["items"]
+        for question_index, choice, is_correct in zip(question_indices, choices, correct_flags):
+            stats = items.get(question_index)
+            if stats is None:
+                stats = items[question_index] = ItemStats()
+            stats.add(choice, bool(is_correct), score - (1 if is_correct else 0))
+
+    def merge(self, other: "ItemAnalytics") -> "ItemAnalytics":
+        """
+        Merges another partial aggregate into this one.
+
+        Args:
+            other (ItemAnalytics): Analytics collected elsewhere.
+
+        Returns:
+            ItemAnalytics: self, to allow chaining.
+        """
+        for fingerprint, other_summary in other.quizzes.items():
+            summary = self._summary(fingerprint)
+            summary["sessions"] += other_summary["sessions"]
+            for question_index, other_stats in other_summary["items"].items():
+                stats = summary["items"].get(question_index)
+                if stats is None:
+                    stats = summary["items"][question_index] = ItemStats()
+                stats.merge(other_stats)
+        return self
+
+    def report(self, fingerprint: str, answer_key=None) -> list[dict]:
+        """
+        Builds the per-question report of one quiz version.
+
+        Args:
+            fingerprint (str): Fingerprint of the quiz version.
+            answer_key (sequence[int], optional): Bitmask of the correct options of every question
+                                                  (CompiledQuiz.answer_key). Needed for the
+                                                  'popular_distractor' flag, which is omitted without it.
+
+        Returns:
+            list[dict]: One entry per answered question, ordered by question index, with
+                        attempts, correct rate, choice distribution, discrimination and flags
+                        ('too_easy', 'too_hard', 'low_discrimination', 'popular_distractor').
+        """
+        summary = self.quizzes.get(fingerprint)
+        if summary is None:
+            return []
+        report = []
+        for question_index in sorted(summary["items"]):
+            stats = summary["items"][question_index]
+            discrimination = stats.discrimination
+            flags = []
+            if stats.correct_rate >= 0.9:
+                flags.append("too_easy")
+            elif stats.correct_rate <= 0.2:
+                flags.append("too_hard")
+            if discrimination is not None and discrimination < 0.1:
+                flags.append("low_discrimination")
+            # Dystraktor wybierany częściej niż poprawna odpowiedź sugeruje niejednoznaczne pytanie;
+            # opcje z klucza pomijamy (w pytaniu wielokrotnego wyboru liczą się też częściowe odpowiedzi)
+            if answer_key is not None and question_index < len(answer_key):
+                distractors = [count for option, count in enumerate(stats.choice_counts)
+                               if not answer_key[question_index] >> option & 1]
+                if distractors and max(distractors) > stats.correct:
+                    flags.append("popular_distractor")
+            report.append({
+                "question_index": question_index,
+                "attempts": stats.attempts,
+                "correct_rate": round(stats.correct_rate, 4),
+                "choice_distribution": list(stats.choice_counts),
+                "discrimination": None if discrimination is None else round(discrimination, 4),
+                "flags": flags
+            })
+        return report
+
+    def to_dict(self) -> dict:
+        """Converts the analytics to a JSON-serializable dictionary."""
+        return {
+            fingerprint: {
+                "sessions": summary["sessions"],
+                "items": {str(index): stats.to_dict() for index, stats in summary["items"].items()}
+            }
+            for fingerprint, summary in self.quizzes.items()
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """Creates analytics from a dictionary produced by to_dict()."""
+        analytics = cls()
+        for fingerprint, summary in data.items():
+            analytics.quizzes[fingerprint] = {
+                "sessions": summary["sessions"],
+                "items": {int(index): ItemStats.from_dict(stats) for index, stats in summary["items"].items()}
+            }
+        return analytics
+
+    def save(self, file_path: str):
+        """
+        Atomically writes the analytics to a JSON file.
+
+        Args:
+            file_path (str): Destination path.
+        """
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+        tmp_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, separators=(',', ':'))
+        os.replace(tmp_path, file_path)
+
+    @classmethod
+    def load(cls, file_path: str):
+        """
+        Loads analytics from a JSON file.
+
+        Args:
+            file_path (str): Path written by save().
+
+        Returns:
+            ItemAnalytics: The loaded analytics (empty if the file does not exist).
+        """
+        if not os.path.exists(file_path):
+            return cls()
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+    @classmethod
+    def load_merged(cls, directory: str):
+        """
+        Loads and merges the compacted analytics file and all per-process partial files.
+
+        Args:
+            directory (str): The results directory.
+
+        Returns:
+            ItemAnalytics: The combined analytics.
+        """
+        analytics = cls.load(os.path.join(directory, ANALYTICS_FILENAME))
+        for partial_path in sorted(glob.glob(os.path.join(directory, PARTIAL_PATTERN))):
+            analytics.merge(cls.load(partial_path))
+        return analytics
+
+    def save_partial(self, directory: str) -> str:
+        """
+        Writes the analytics as a new partial file and compacts the partial files once
+        there are more than COMPACT_THRESHOLD of them.
+
+        Partial files are never rewritten, so any process may compact them at any time.
+
+        Args:
+            directory (str): The results directory.
+
+        Returns:
+            str: Path of the written partial file.
+        """
+        file_path = self.partial_path(directory)
+        self.save(file_path)
+        if len(glob.glob(os.path.join(directory, PARTIAL_PATTERN))) > COMPACT_THRESHOLD:
+            self.compact(directory, wait=False)
+        return file_path
+
+    @staticmethod
+    def _read_lock_token(lock_path: str) -> str:
+        """Returns the token written into a lock file (empty while it is being created)."""
+        with open(lock_path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    @classmethod
+    def _remove_lock_if_held(cls, lock_path: str, token: str) -> bool:
+        """
+        Removes the lock file only if it holds the given token.
+
+        The lock is first renamed to a name of our own, which only one process can do;
+        a lock that turns out to belong to someone else is put back (unless a new lock
+        was created meanwhile).
+
+        Returns:
+            bool: Whether the lock with the token was removed.
+        """
+        own_path = f"{lock_path}.{uuid.uuid4().hex}"
+        try:
+            os.rename(lock_path, own_path)
+        except FileNotFoundError:
+            return False
+        try:
+            if cls._read_lock_token(own_path) == token:
+                return True
+            try:
+                os.link(own_path, lock_path) # Cudza blokada wraca na miejsce
+            except OSError:
+                pass
+            return False
+        finally:
+            os.remove(own_path)
+
+    @classmethod
+    def _acquire_compaction_lock(cls, directory: str, wait: bool):
+        """
+        Creates the compaction lock file holding a unique token.
+
+        Returns:
+            str: The token of the lock, or None if another process holds it and wait is False.
+        """
+        lock_path = os.path.join(directory, COMPACT_LOCK_FILENAME)
+        token = f"{os.getpid()}-{uuid.uuid4().hex}"
+        while True:
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                try:
+                    # Najpierw token, potem wiek: blokada podmieniona w międzyczasie nie wygląda na przeterminowaną
+                    holder = cls._read_lock_token(lock_path)
+                    stale = time.time() - os.path.getmtime(lock_path) > STALE_LOCK_SECONDS
+                except FileNotFoundError:
+                    continue # Blokada właśnie zwolniona
+                # Blokada po przerwanym procesie - usuwamy ją tylko, jeśli to wciąż ta sama blokada
+                if stale and cls._remove_lock_if_held(lock_path, holder):
+                    continue
+                if not wait:
+                    return None
+                time.sleep(0.05)
+                continue
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(token)
+            return token
+
+    @classmethod
+    def compact(cls, directory: str, wait: bool = True):
+        """
+        Folds all partial files into the main analytics file and removes them.
+
+        Only one process compacts at a time (a lock file in the results directory); partial
+        files written meanwhile are left for the next compaction.
+
+        Args:
+            directory (str): The results directory.
+            wait (bool): Wait for a compaction running in another process. Defaults to True.
+
+        Returns:
+            ItemAnalytics: The combined analytics, or None if another process is compacting
+                           and wait is False.
+        """
+        os.makedirs(directory, exist_ok=True)
+        token = cls._acquire_compaction_lock(directory, wait)
+        if token is None:
+            return None
+        try:
+            partial_paths = sorted(glob.glob(os.path.join(directory, PARTIAL_PATTERN)))
+            analytics = cls.load(os.path.join(directory, ANALYTICS_FILENAME))
+            for partial_path in partial_paths:
+                analytics.merge(cls.load(partial_path))
+            analytics.save(os.path.join(directory, ANALYTICS_FILENAME))
+            for partial_path in partial_paths:
+                os.remove(partial_path)
+        finally:
+            # Blokadę przejętą przez inny proces (np. po zbyt długim scalaniu) zostawiamy
+            cls._remove_lock_if_held(os.path.join(directory, COMPACT_LOCK_FILENAME), token)
+        return analytics
+
+    @staticmethod
+    def partial_path(directory: str) -> str:
+        """
+        Returns a new, unique partial analytics file path. The process ID alone is not
+        enough: it is reused (e.g. PID 1 in containers) and would overwrite older partials.
+        """
+        return os.path.join(directory, f"analytics-{os.getpid()}-{uuid.uuid4().hex}.json")
+
+
+def main(argv=None):
+    """Prints per-question statistics of a quiz (or of all quiz versions) as JSON."""
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+    from quiz_data.compiled import QuizCompiler
+    from quiz_data.manager import QuizDataManager
+
+    parser = argparse.ArgumentParser(description="Statystyki pytań rozegranych quizów.")
+    parser.add_argument("--results", default="data/results", help="Katalog z wynikami.")
+    parser.add_argument("--quiz", help="Nazwa pliku quizu (bez .json); domyślnie wszystkie wersje.")
+    parser.add_argument("--compact", action="store_true", help="Scal pliki częściowe w analytics.json.")
+    args = parser.parse_args(argv)
+
+    analytics = ItemAnalytics.compact(args.results) if args.compact else ItemAnalytics.load_merged(args.results)
+    if args.quiz:
+        quiz = QuizDataManager.load_quiz(args.quiz)
+        report = analytics.report(quiz.fingerprint(), QuizCompiler.compile(quiz).answer_key)
+        for entry in report:
+            entry["question_text"] = quiz.questions[entry["question_index"]].question_text
+        output = {quiz.fingerprint(): report}
+    else:
+        output = {fingerprint: analytics.report(fingerprint) for fingerprint in analytics.quizzes}
+    print(json.dumps(output, indent=4, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+# quiz_project/quiz_results/log.py
+import atexit
+import json
+import os
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future
+
+DEFAULT_RESULTS_DIRECTORY = "data/results"
+SEGMENT_PREFIX = "results-"
+SEGMENT_SUFFIX = ".jsonl"
+
+
+def _segment_name(sequence: int) -> str:
+    """Returns the filename of the segment with the given sequence number."""
+    return f"{SEGMENT_PREFIX}{sequence:08d}{SEGMENT_SUFFIX}"
+
+
+def list_segments(directory: str) -> list[str]:
+    """
+    Lists the segment files of a results log, oldest first.
+
+    Args:
+        directory (str): The results log directory.
+
+    Returns:
+        list[str]: Segment filenames sorted by sequence number. Empty if the directory does not exist.
+    """
+    if not os.path.exists(directory):
+        return []
+    return sorted(item for item in os.listdir(directory)
+                  if item.startswith(SEGMENT_PREFIX) and item.endswith(SEGMENT_SUFFIX))
+
+
+def read_results(directory: str = DEFAULT_RESULTS_DIRECTORY):
+    """
+    Streams session records from a results log, oldest first.
+
+    Records are read one line at a time, so the whole log never has to fit in memory.
+    A torn last line (a write interrupted by a crash) is skipped.
+
+    Args:
+        directory (str): The results log directory.
+
+    Yields:
+        dict: One session record per finished session.
+    """
+    for segment in list_segments(directory):
+        with open(os.path.join(directory, segment), 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.endswith("\n"):
+                    break # Niedokończony zapis na końcu segmentu
+                yield json.loads(line)
+
+
+def recent_play_counts(directory: str = DEFAULT_RESULTS_DIRECTORY, limit: int = 200) -> dict:
+    """
+    Counts how often each quiz was played in the most recent sessions.
+
+    Only the newest segments needed to collect 'limit' records are read.
+
+    Args:
+        directory (str): The results log directory.
+        limit (int): Number of most recent sessions taken into account.
+
+    Returns:
+        dict: Quiz name -> number of sessions among the most recent ones.
+    """
+    if limit <= 0:
+        return Counter()
+    names = []
+    for segment in reversed(list_segments(directory)):
+        with open(os.path.join(directory, segment), 'r', encoding='utf-8') as f:
+            lines = [line for line in f if line.endswith("\n")]
+        names[:0] = [json.loads(line).get("name") for line in lines[-(limit - len(names)):]]
+        if len(names) >= limit:
+            break
+    return Counter(names)
+
+
+def _truncate_torn_tail(file_path: str):
+    """
+    Cuts off an unfinished last line of a segment (a write interrupted by a crash), so
+    that records appended later start on a line of their own.
+
+    Args:
+        file_path (str): Path of the segment file; a missing file is left alone.
+    """
+    if not os.path.exists(file_path):
+        return
+    with open(file_path, 'r+b') as f:
+        size = end = f.seek(0, os.SEEK_END)
+        # Szukamy ostatniego znaku nowej linii od końca, bez wczytywania całego segmentu
+        while end > 0:
+            start = max(0, end - 4096)
+            f.seek(start)
+            position = f.read(end - start).rfind(b"\n")
+            if position >= 0:
+                end = start + position + 1
+                break
+            end = start
+        if end != size:
+            f.truncate(end)
+            os.fsync(f.fileno())
+
+
+class ResultsLog:
+    """
+    Append-only, segmented log of finished quiz sessions.
+
+    Each session is stored as one compact JSON line. Segments are rotated once they
+    exceed 'segment_max_bytes', and the oldest ones are removed when 'max_segments'
+    is set. Writes use group commit: a single writer thread collects records appended
+    by concurrent sessions and makes them durable with one fsync per batch.
+
+    The log is meant to have a single writing process per directory; any number of
+    threads in that process may append concurrently. An unfinished last line left by a
+    crash is cut off when the log is opened, and bytes of a failed write are removed
+    (or the log moves on to a new segment), so later records always stay readable.
+
+    Attributes:
+        directory (str): The directory holding the segment files.
+        segment_max_bytes (int): Size after which a new segment is started.
+        max_segments (int): Number of segments to keep, or None to keep all.
+        commit_delay (float): Seconds the writer waits to gather a larger batch.
+    """
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, directory: str = DEFAULT_RESULTS_DIRECTORY, segment_max_bytes: int = 4 * 1024 * 1024,
+                 max_segments: int = None, commit_delay: float = 0.002):
+        """
+        Opens (or creates) a results log and starts its writer thread.
+
+        Args:
+            directory (str): The directory holding the segment files. Created if missing.
+            segment_max_bytes (int): Size after which a new segment is started.
+            max_segments (int, optional): Number of segments to keep. Defaults to None (keep all).
+            commit_delay (float): Seconds the writer waits to gather a larger batch.
+
+        Raises:
+            ValueError: If segment_max_bytes or max_segments is not positive.
+        """
+        if segment_max_bytes <= 0:
+            raise ValueError("segment_max_bytes must be positive.")
+        if max_segments is not None and max_segments < 1:
+            raise ValueError("max_segments must be positive.")
+        self.directory = directory
+        self.segment_max_bytes = segment_max_bytes
+        self.max_segments = max_segments
+        self.commit_delay = commit_delay
+
+        os.makedirs(directory, exist_ok=True)
+        segments = list_segments(directory)
+        self._sequence = int(segments[-1][len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]) if segments else 1
+        self._file = None
+        self._size = 0
+        self._open_segment()
+
+        self._pending = []
+        self._condition = threading.Condition()
+        self._closed = False
+        self._writer = threading.Thread(target=self._run_writer, name="ResultsLogWriter", daemon=True)
+        self._writer.start()
+
+    def append(self, record: dict, wait: bool = True) -> Future:
+        """
+        Appends a session record to the log.
+
+        Args:
+            record (dict): A JSON-serializable session record.
+            wait (bool): Block until the record has been fsynced. Defaults to True.
+
+        Returns:
+            Future: Resolves once the record is durable; carries the exception if the write failed.
+
+        Raises:
+            ValueError: If the log has already been closed.
+            OSError: If wait is True and the record could not be written (or the exception
+                     that made the write fail).
+        """
+        line = (json.dumps(record, ensure_ascii=False, separators=(',', ':')) + "\n").encode('utf-8')
+        durable = Future()
+        with self._condition:
+            if self._closed:
+                raise ValueError("Results log is closed.")
+            self._pending.append((line, durable))
+            self._condition.notify()
+        if wait:
+            durable.result()
+        return durable
+
+    def _run_writer(self):
+        """Writer thread: drains pending records in batches, one fsync per batch."""
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    return # Log zamknięty i wszystko zapisane
+            if self.commit_delay:
+                time.sleep(self.commit_delay) # Pozwala kolejnym sesjom dołączyć do tej samej grupy
+            with self._condition:
+                batch, self._pending = self._pending, []
+            try:
+                self._write_batch(batch)
+            except BaseException as e: # Wątek zapisu nie może zginąć - czekający na wynik czekaliby wiecznie
+                self._discard_failed_write()
+                for _, durable in batch:
+                    if not durable.done():
+                        durable.set_exception(e)
+
+    def _write_batch(self, batch: list[tuple]):
+        """
+        Writes a batch of (line, future) pairs, rotating segments as needed, with one fsync
+        per segment written. The futures of the lines are resolved as soon as they are durable.
+        """
+        chunk, chunk_size = [], 0
+        for line, durable in batch:
+            if self._size + chunk_size and self._size + chunk_size + len(line) > self.segment_max_bytes:
+                self._write_chunk(chunk)
+                chunk, chunk_size = [], 0
+                self._rotate()
+            chunk.append((line, durable))
+            chunk_size += len(line)
+        self._write_chunk(chunk)
+
+    def _write_chunk(self, chunk: list[tuple]):
+        """Appends lines to the current segment, fsyncs it and resolves the futures of the lines."""
+        if not chunk:
+            return
+        if self._file is None:
+            self._open_segment() # Poprzedni segment porzucony po nieudanym zapisie
+        payload = b"".join(line for line, _ in chunk)
+        data = memoryview(payload)
+        while data:
+            data = data[self._file.write(data):] # Zapis bez bufora może być częściowy
+        os.fsync(self._file.fileno())
+        self._size += len(payload)
+        for _, durable in chunk:
+            durable.set_result(None)
+
+    def _discard_failed_write(self):
+        """
+        Removes the bytes of a failed write by cutting the segment back to its last durable
+        record. If that is not possible, the segment is abandoned and the next write starts
+        a new one (readers skip the unfinished last line of the old segment).
+        """
+        if self._file is None:
+            return
+        try:
+            self._file.truncate(self._size)
+            return
+        except (OSError, ValueError):
+            pass
+        try:
+            self._file.close()
+        except (OSError, ValueError):
+            pass
+        self._file = None
+        self._sequence += 1
+        self._size = 0
+
+    def _open_segment(self):
+        """Opens the current segment for appending, cutting off an unfinished last line first."""
+        path = os.path.join(self.directory, _segment_name(self._sequence))
+        _truncate_torn_tail(path)
+        # Bez bufora: po nieudanym zapisie w pamięci nie zostają bajty, które trafiłyby do pliku później
+        self._file = open(path, 'ab', buffering=0)
+        self._size = self._file.seek(0, os.SEEK_END)
+
+    def _rotate(self):
+        """Closes the current segment, opens the next one and enforces retention."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._sequence += 1
+        self._open_segment()
+        if self.max_segments is not None:
+            for old_segment in list_segments(self.directory)[:-self.max_segments]:
+                os.remove(os.path.join(self.directory, old_segment))
+
+    def close(self):
+        """Flushes pending records, stops the writer thread and closes the current segment."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+        self._writer.join()
+        if self._file is not None:
+            self._file.close()
+
+    @classmethod
+    def shared(cls, directory: str = DEFAULT_RESULTS_DIRECTORY):
+        """
+        Returns the process-wide log for a directory, opening it on first use.
+        Shared logs are closed automatically when the interpreter exits.
+
+        Args:
+            directory (str): The results log directory.
+
+        Returns:
+            ResultsLog: The shared log instance.
+        """
+        with cls._shared_lock:
+            key = os.path.abspath(directory)
+            if key not in cls._shared:
+                cls._shared[key] = cls(directory)
+                atexit.register(cls._shared[key].close)
+            return cls._shared[key]
+
+    @classmethod
+    def close_shared(cls, directory: str = DEFAULT_RESULTS_DIRECTORY):
+        """
+        Closes the shared log of a directory (if it was opened), e.g. before the
+        directory is removed. A later shared() call opens a new log.
+
+        Args:
+            directory (str): The results log directory.
+        """
+        with cls._shared_lock:
+            log = cls._shared.pop(os.path.abspath(directory), None)
+        if log is not None:
+            log.close()
@@ -0,0 +1,2 @@
+# quiz_project/quiz_search/__init__.py
+# Plik inicjalizujący pakiet 'quiz_search' (wyszukiwanie pytań w katalogu quizów).
@@ -0,0 +1,299 @@
+# quiz_project/quiz_search/duplicates.py
+"""
+Near-duplicate question detection with MinHash signatures and locality-sensitive hashing.
+
+The signatures and LSH band keys of catalog questions are stored in the search index
+(see quiz_search.index) and kept current with it, one changed quiz file at a time, so
+checking a new question looks up its bands in the database instead of hashing the
+whole catalog again.
+
+Usage:
+    python -m quiz_search.duplicates [--directory data/quiz_examples] [--threshold 0.6]
+"""
+import argparse
+import hashlib
+import json
+import os
+import struct
+import sys
+from utils.text import tokenize
+
+_MAX_HASH = (1 << 31) - 1
+
+
+def question_shingles(question) -> set[str]:
+    """
+    Returns the shingles of a question: the stemmed terms of its text and options
+    (see utils.text.tokenize) plus adjacent term pairs of the text, so both word
+    choice and word order contribute to similarity.
+
+    Args:
+        question (Question): The question.
+
+    Returns:
+        set[str]: The shingles.
+    """
+    text_terms = tokenize(question.question_text)
+    shingles = set(text_terms)
+    shingles.update(f"{first} {second}" for first, second in zip(text_terms, text_terms[1:]))
+    for option in question.options:
+        shingles.update(f"o:{term}" for term in tokenize(option))
+    return shingles
+
+
+class NearDuplicateDetector:
+    """
+    Finds questions whose shingle sets have a high Jaccard similarity.
+
+    Every question gets a MinHash signature of num_perm values. The signature is cut into
+    bands of rows; two questions become candidates when any band is identical, which
+    happens with high probability only for similar questions. Buckets are plain dictionaries,
+    so adding a question or building clusters for a whole catalog takes roughly linear
+    time instead of comparing all pairs. Candidates are confirmed with the similarity
+    estimated from the full signatures.
+
+    A detector created with a QuestionIndex also covers every indexed catalog question:
+    their stored band keys are looked up in the database and only the signatures of the
+    candidates are read.
+
+    Attributes:
+        num_perm (int): Number of hash functions (signature length).
+        bands (int): Number of LSH bands (num_perm must be divisible by it).
+        threshold (float): Minimum estimated Jaccard similarity of a duplicate.
+        seed (int): Seed of the hash functions.
+        index (QuestionIndex): Index with the stored catalog signatures, or None.
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, threshold: float = 0.6, seed: int = 1,
+                 index=None):
+        """
+        Initializes an empty detector.
+
+        Args:
+            num_perm (int): Signature length. Defaults to 64.
+            bands (int): Number of bands. Defaults to 16 (candidate threshold around 0.5).
+            threshold (float): Minimum estimated similarity. Defaults to 0.6.
+            seed (int): Seed of the hash functions; detectors compare only with equal seeds.
+            index (QuestionIndex, optional): Index whose stored questions are also compared.
+
+        Raises:
+            ValueError: If num_perm is not a positive multiple of bands, the threshold is out of
+                        range, or an index is given with other signature parameters than it stores.
+        """
+        if bands <= 0 or num_perm <= 0 or num_perm % bands:
+            raise ValueError("num_perm must be a positive multiple of bands.")
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("Threshold must be in (0, 1].")
+        if index is not None and (num_perm, bands, seed) != (64, 16, 1):
+            raise ValueError("The search index stores signatures with num_perm=64, bands=16 and seed=1.")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.threshold = threshold
+        self.seed = seed
+        self.index = index
+        self._rows = num_perm // bands
+        self._salt = f"{seed}:".encode('utf-8')
+        self._struct = struct.Struct(f"<{num_perm}I")
+        # Maski pól 32-bitowych: 31 bitów wartości i bit strażnika (zob. signature())
+        self._value_mask = int.from_bytes(b"\xff\xff\xff\x7f" * num_perm, 'little')
+        self._guard_mask = int.from_bytes(b"\x00\x00\x00\x80" * num_perm, 'little')
+        self._buckets = {}
+        self._signatures = {}
+        self._labels = {}
+
+    def __len__(self) -> int:
+        """Returns the number of added questions, including the indexed catalog questions."""
+        return len(self._signatures) + (self.index.document_count() if self.index is not None else 0)
+
+    def signature(self, question) -> tuple:
+        """
+        Computes the MinHash signature of a question.
+
+        One SHAKE-128 digest per shingle supplies the values of all num_perm hash functions
+        at once: num_perm 31-bit values in 32-bit fields of one integer. The minima of all
+        fields are then updated together with a few integer operations per shingle, so the
+        cost does not grow with num_perm in Python code.
+
+        Args:
+            question (Question): The question.
+
+        Returns:
+            tuple[int]: num_perm minimum hash values (31-bit).
+        """
+        value_mask, guard_mask = self._value_mask, self._guard_mask
+        minimum = None
+        for shingle in question_shingles(question):
+            digest = hashlib.shake_128(self._salt + shingle.encode('utf-8')).digest(self._struct.size)
+            values = int.from_bytes(digest, 'little') & value_mask
+            if minimum is None:
+                minimum = values
+                continue
+            # Bit strażnika pola zostaje ustawiony tam, gdzie minimum >= nowa wartość (pola nie
+            # pożyczają od siebie); z niego powstaje maska pól, w których bierzemy nową wartość
+            guards = ((minimum | guard_mask) - values) & guard_mask
+            take = guards - (guards >> 31)
+            minimum = (values & take) | (minimum & (value_mask ^ take))
+        if minimum is None:
+            return (_MAX_HASH,) * self.num_perm
+        return self._struct.unpack(minimum.to_bytes(self._struct.size, 'little'))
+
+    def pack(self, signature: tuple) -> bytes:
+        """Serializes a signature (e.g. for the search index)."""
+        return self._struct.pack(*signature)
+
+    def unpack(self, data: bytes) -> tuple:
+        """Deserializes a signature stored with pack()."""
+        return self._struct.unpack(data)
+
+    def band_keys(self, signature: tuple) -> list[int]:
+        """
+        Returns the bucket key of every band of a signature.
+
+        Args:
+            signature (tuple[int]): The signature.
+
+        Returns:
+            list[int]: One signed 64-bit key per band (the band number is part of the key).
+        """
+        data = self.pack(signature)
+        width = self._rows * 4
+        return [int.from_bytes(hashlib.blake2b(data[band * width:(band + 1) * width],
+                                               digest_size=8, person=band.to_bytes(2, 'big')).digest(),
+                               'big', signed=True)
+                for band in range(self.bands)]
+
+    def similarity(self, first: tuple, second: tuple) -> float:
+        """Estimates the Jaccard similarity of two signatures."""
+        return sum(1 for a, b in zip(first, second) if a == b) / self.num_perm
+
+    def _matches(self, signature: tuple) -> list[tuple]:
+        """Returns (key, label, similarity) of the known questions similar to a signature, most similar first."""
+        band_keys = self.band_keys(signature)
+        candidates = {}
+        for band_key in band_keys:
+            for key in self._buckets.get(band_key, ()):
+                candidates[key] = (self._labels[key], self._signatures[key])
+        if self.index is not None:
+            for quiz_name, question_index, question_text, data in self.index.band_matches(band_keys):
+                candidates.setdefault((quiz_name, question_index), (question_text, self.unpack(data)))
+        matches = [(key, label, self.similarity(signature, other)) for key, (label, other) in candidates.items()]
+        matches = [match for match in matches if match[2] >= self.threshold]
+        matches.sort(key=lambda match: match[2], reverse=True)
+        return matches
+
+    def find_duplicates(self, question) -> list[tuple]:
+        """
+        Finds already added questions that are likely duplicates of a question.
+
+        Args:
+            question (Question): The question to check (it is not added).
+
+        Returns:
+            list[tuple]: (key, label, estimated similarity) of each likely duplicate, most similar first.
+        """
+        return self._matches(self.signature(question))
+
+    def add(self, key, question, label: str = None):
+        """
+        Adds a question.
+
+        Args:
+            key: Unique, hashable identifier, e.g. (quiz name, question index).
+            question (Question): The question.
+            label (str, optional): Text shown in reports. Defaults to the question text.
+        """
+        signature = self.signature(question)
+        self._signatures[key] = signature
+        self._labels[key] = label or question.question_text
+        for band_key in self.band_keys(signature):
+            self._buckets.setdefault(band_key, []).append(key)
+
+    def clusters(self) -> list[list]:
+        """
+        Groups all added (and indexed) questions into clusters of near duplicates: connected
+        components of the confirmed candidate pairs. Single questions are omitted. Only the
+        indexed questions sharing a band with another question are read from the index.
+
+        Returns:
+            list[list]: Clusters of keys, largest first.
+        """
+        signatures = dict(self._signatures)
+        buckets = {band_key: list(keys) for band_key, keys in self._buckets.items()}
+        if self.index is not None:
+            stored_buckets, documents = self.index.shared_bands(list(self._buckets))
+            for doc_id, (quiz_name, question_index, question_text, data) in documents.items():
+                key = (quiz_name, question_index)
+                signatures.setdefault(key, self.unpack(data))
+                self._labels.setdefault(key, question_text)
+            for band_key, doc_ids in stored_buckets.items():
+                buckets.setdefault(band_key, []).extend(documents[doc_id][:2] for doc_id in doc_ids)
+        parent = {key: key for key in signatures}
+
+        def find(key):
+            while parent[key] != key:
+                parent[key] = parent[parent[key]] # Kompresja ścieżki o połowę
+                key = parent[key]
+            return key
+
+        for bucket in buckets.values():
+            if len(bucket) < 2:
+                continue
+            # Wspólny kubełek to tylko kandydat; każdy element porównujemy z reprezentantami
+            # grup już znalezionych w tym kubełku, a nie ze wszystkimi elementami. Element
+            # łączymy z każdym podobnym reprezentantem - podobieństwo nie jest przechodnie,
+            # więc jedno dopasowanie nie wystarcza, żeby połączyć wszystkie pasujące grupy
+            representatives = []
+            for key in bucket:
+                matched = False
+                for representative in representatives:
+                    if find(representative) == find(key):
+                        matched = True
+                    elif self.similarity(signatures[representative], signatures[key]) >= self.threshold:
+                        parent[find(key)] = find(representative)
+                        matched = True
+                if not matched:
+                    representatives.append(key)
+
+        groups = {}
+        for key in signatures:
+            groups.setdefault(find(key), []).append(key)
+        clusters = [sorted(group, key=str) for group in groups.values() if len(group) > 1]
+        clusters.sort(key=len, reverse=True)
+        return clusters
+
+    def label(self, key) -> str:
+        """Returns the label of an added (or indexed) question."""
+        if key not in self._labels and self.index is not None:
+            self._labels[key] = self.index.question_text(*key)
+        return self._labels[key]
+
+    def close(self):
+        """Closes the index of the detector, if any."""
+        if self.index is not None:
+            self.index.close()
+
+
+def main(argv=None):
+    """Prints the clusters of near-duplicate questions of a quiz directory as JSON."""
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+    parser = argparse.ArgumentParser(description="Wykrywanie niemal identycznych pytań w katalogu quizów.")
+    parser.add_argument("--directory", default="data/quiz_examples", help="Katalog z quizami.")
+    parser.add_argument("--threshold", type=float, default=0.6, help="Minimalne podobieństwo (0-1].")
+    args = parser.parse_args(argv)
+
+    from quiz_search.index import QuestionIndex # Import lokalny - indeks importuje ten moduł
+
+    # Indeks przelicza sygnatury tylko zmienionych plików; klastry budujemy z zapisanych pasm
+    with QuestionIndex(args.directory) as index:
+        index.refresh()
+        detector = NearDuplicateDetector(threshold=args.threshold, index=index)
+        output = [[{"quiz": quiz_name, "question_index": question_index,
+                    "question_text": detector.label((quiz_name, question_index))}
+                   for quiz_name, question_index in cluster]
+                  for cluster in detector.clusters()]
+    print(json.dumps(output, indent=4, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
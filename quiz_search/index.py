@@ -0,0 +1,561 @@
+# quiz_project/quiz_search/index.py
+"""
+Persistent full-text index over the questions and options of a quiz catalog.
+
+Every posting stores its precomputed BM25 term impact, and posting lists are also kept
+sorted by impact, so a query reads only the heads of the lists of its terms and stops as
+soon as no unread document can enter the top results (see QuestionIndex.search). A
+single-term query reads a single batch of its posting list.
+
+Each question also has its MinHash signature and LSH band keys stored (see
+quiz_search.duplicates), updated together with its postings.
+
+Usage:
+    python -m quiz_search.index "stolica polski" [--directory data/quiz_examples] [--limit 10]
+"""
+import argparse
+import heapq
+import json
+import math
+import os
+import sqlite3
+import sys
+import threading
+from collections import Counter
+from quiz_search.duplicates import NearDuplicateDetector
+from utils.text import tokenize
+
+INDEX_DIRECTORY_NAME = ".index" # Podkatalog z indeksem obok plików quizów
+INDEX_FILENAME = "questions.sqlite3"
+INDEX_FORMAT_VERSION = 3 # Zmiana schematu - indeks w starszym formacie jest budowany od nowa
+
+# Czy zapis quizu aktualizuje indeks (QUIZ_SEARCH_INDEX=0 wyłącza)
+AUTO_UPDATE = os.environ.get("QUIZ_SEARCH_INDEX", "1") != "0"
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Wpływy termów liczymy ze średniej długości dokumentu z chwili indeksowania; gdy średnia
+# w katalogu odejdzie od niej o więcej niż ten ułamek, wszystkie wpływy są przeliczane
+IMPACT_REBUILD_DRIFT = 0.1
+SEARCH_BATCH_SIZE = 64 # Ile wpisów z czoła każdej listy wystąpień czytamy w pierwszym kroku
+SEARCH_MAX_BATCH_SIZE = 4096 # Kolejne kroki są dwukrotnie większe, do tej wielkości
+SEARCH_MAX_CANDIDATES = 2048 # Przy tylu kandydatach ich pełne wyniki liczy SQLite zamiast dalszego czytania list
+_SQL_VARIABLES = 500 # Bezpieczna liczba parametrów jednego zapytania SQLite
+
+# Sygnatury MinHash zapisujemy z domyślnymi parametrami detektora
+_DUPLICATE_DETECTOR = NearDuplicateDetector()
+
+# Termy obecne w ponad tej części dokumentów mają znikomy wkład w BM25, a ich listy
+# wystąpień są najdłuższe - pomijamy je, żeby czas zapytania nie rósł z rozmiarem katalogu
+# (o ile w zapytaniu zostaje jakiś rzadszy term)
+MAX_DOCUMENT_FREQUENCY_RATIO = 0.5
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (quiz TEXT PRIMARY KEY, signature TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY,
+    quiz TEXT NOT NULL,
+    question_index INTEGER NOT NULL,
+    question_text TEXT NOT NULL,
+    length INTEGER NOT NULL,
+    signature BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS docs_quiz ON docs(quiz);
+CREATE TABLE IF NOT EXISTS bands (key INTEGER NOT NULL, doc_id INTEGER NOT NULL, PRIMARY KEY (key, doc_id)) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS bands_doc ON bands(doc_id);
+CREATE TABLE IF NOT EXISTS terms (term TEXT PRIMARY KEY, df INTEGER NOT NULL) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    doc_id INTEGER NOT NULL,
+    tf INTEGER NOT NULL,
+    impact REAL NOT NULL,
+    PRIMARY KEY (term, doc_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_doc ON postings(doc_id);
+CREATE INDEX IF NOT EXISTS postings_impact ON postings(term, impact DESC);
+CREATE TABLE IF NOT EXISTS stats (key TEXT PRIMARY KEY, value NUMERIC NOT NULL);
+CREATE TABLE IF NOT EXISTS quizzes (quiz TEXT PRIMARY KEY, title TEXT NOT NULL);
+"""
+
+
+class QuestionIndex:
+    """
+    An inverted index of every question (text and options) in a quiz directory, ranked with BM25.
+
+    The index is a SQLite database stored in '<directory>/.index/questions.sqlite3'. Each
+    question is a document; postings are keyed by (term, document) and hold the BM25
+    impact of the term in the document, so a query reads only the best postings of its
+    own terms. Quizzes are (re)indexed one file at a time: QuizDataManager.save_quiz()
+    updates the saved quiz, and refresh() picks up files that were changed, added or
+    removed by other means, comparing file size and mtime. The database is in WAL mode,
+    so searching is not blocked by a refresh running in the background.
+
+    Attributes:
+        directory (str): The quiz directory covered by the index.
+        path (str): Path of the index database.
+        refreshing (threading.Thread): The last refresh started with refresh_in_background(), or None.
+    """
+
+    def __init__(self, directory: str = "data/quiz_examples", path: str = None):
+        """
+        Initializes the index (the database is opened lazily).
+
+        Args:
+            directory (str): The quiz directory. Defaults to "data/quiz_examples".
+            path (str, optional): Database path. Defaults to '<directory>/.index/questions.sqlite3'.
+        """
+        self.directory = directory
+        self.path = path or os.path.join(directory, INDEX_DIRECTORY_NAME, INDEX_FILENAME)
+        self.refreshing = None
+        self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Opens the database, creating the schema on first use (or rebuilding an older format)."""
+        if self._connection is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            connection = sqlite3.connect(self.path)
+            try:
+                connection.execute("PRAGMA journal_mode=WAL")
+                if connection.execute("PRAGMA user_version").fetchone()[0] != INDEX_FORMAT_VERSION:
+                    self._create_schema(connection)
+            except sqlite3.Error:
+                connection.close()
+                raise
+            self._connection = connection
+        return self._connection
+
+    @staticmethod
+    def _create_schema(connection):
+        """Creates the schema, dropping the tables of an older index format (they only cache the quiz files)."""
+        with connection:
+            connection.execute("BEGIN IMMEDIATE") # Inne połączenie mogło właśnie zrobić to samo
+            if connection.execute("PRAGMA user_version").fetchone()[0] == INDEX_FORMAT_VERSION:
+                return
+            tables = connection.execute("SELECT name FROM sqlite_master "
+                                        "WHERE type = 'table' AND name NOT LIKE 'sqlite_%'").fetchall()
+            for table, in tables:
+                connection.execute(f'DROP TABLE "{table}"')
+            for statement in _SCHEMA.split(";"):
+                if statement.strip():
+                    connection.execute(statement)
+            connection.execute(f"PRAGMA user_version = {INDEX_FORMAT_VERSION}")
+
+    def close(self):
+        """Closes the database connection."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @staticmethod
+    def _file_signature(file_path: str):
+        """Returns a cheap change signature of a file (size and mtime), or None if it is missing."""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+    @staticmethod
+    def _impact(tf: int, length: int, average_length: float) -> float:
+        """Returns the BM25 weight of a term in a document, without the idf factor."""
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * length / average_length)
+        return tf * (BM25_K1 + 1) / (tf + norm)
+
+    @staticmethod
+    def _add_stat(connection, key: str, delta: int):
+        """Adds delta to a counter in the stats table."""
+        connection.execute("INSERT INTO stats(key, value) VALUES (?, ?) "
+                           "ON CONFLICT(key) DO UPDATE SET value = value + excluded.value", (key, delta))
+
+    def _delete_quiz(self, connection, quiz_name: str):
+        """Removes all documents of a quiz and their postings, keeping the statistics consistent."""
+        doc_rows = connection.execute("SELECT id, length FROM docs WHERE quiz = ?", (quiz_name,)).fetchall()
+        if not doc_rows:
+            return
+        doc_ids = [(doc_id,) for doc_id, _ in doc_rows]
+        term_counts = Counter()
+        for doc_id, in doc_ids:
+            for term, in connection.execute("SELECT term FROM postings WHERE doc_id = ?", (doc_id,)):
+                term_counts[term] += 1
+        connection.executemany("UPDATE terms SET df = df - ? WHERE term = ?",
+                               [(count, term) for term, count in term_counts.items()])
+        connection.execute("DELETE FROM terms WHERE df <= 0")
+        connection.executemany("DELETE FROM postings WHERE doc_id = ?", doc_ids)
+        connection.executemany("DELETE FROM bands WHERE doc_id = ?", doc_ids)
+        connection.execute("DELETE FROM docs WHERE quiz = ?", (quiz_name,))
+        self._add_stat(connection, "documents", -len(doc_rows))
+        self._add_stat(connection, "total_length", -sum(length for _, length in doc_rows))
+
+    def index_quiz(self, quiz_name: str, quiz):
+        """
+        Replaces the indexed questions of one quiz.
+
+        Args:
+            quiz_name (str): The quiz file name (with or without .json).
+            quiz (Quiz): The quiz contents.
+        """
+        quiz_name = quiz_name[:-len(".json")] if quiz_name.endswith(".json") else quiz_name
+        documents = []
+        for question in quiz.questions:
+            terms = Counter(tokenize(question.question_text))
+            for option in question.options:
+                terms.update(tokenize(option))
+            signature = _DUPLICATE_DETECTOR.signature(question)
+            documents.append((question.question_text, terms, sum(terms.values()), signature))
+        total_length = sum(document[2] for document in documents)
+
+        connection = self._connect()
+        with connection:
+            self._delete_quiz(connection, quiz_name)
+            row = connection.execute("SELECT value FROM stats WHERE key = 'impact_length'").fetchone()
+            if row is None and documents:
+                # Pierwszy indeksowany quiz wyznacza średnią długość dla wpływów termów
+                row = (total_length / len(documents) or 1.0,)
+                connection.execute("INSERT INTO stats(key, value) VALUES ('impact_length', ?)", row)
+            term_counts = Counter()
+            for question_index, (question_text, terms, length, signature) in enumerate(documents):
+                cursor = connection.execute(
+                    "INSERT INTO docs(quiz, question_index, question_text, length, signature) VALUES (?, ?, ?, ?, ?)",
+                    (quiz_name, question_index, question_text, length, _DUPLICATE_DETECTOR.pack(signature)))
+                connection.executemany("INSERT OR IGNORE INTO bands(key, doc_id) VALUES (?, ?)",
+                                       [(key, cursor.lastrowid) for key in _DUPLICATE_DETECTOR.band_keys(signature)])
+                connection.executemany("INSERT INTO postings(term, doc_id, tf, impact) VALUES (?, ?, ?, ?)",
+                                       [(term, cursor.lastrowid, tf, self._impact(tf, length, row[0]))
+                                        for term, tf in terms.items()])
+                term_counts.update(terms.keys())
+            connection.executemany("INSERT INTO terms(term, df) VALUES (?, ?) "
+                                   "ON CONFLICT(term) DO UPDATE SET df = df + excluded.df",
+                                   list(term_counts.items()))
+            self._add_stat(connection, "documents", len(quiz.questions))
+            self._add_stat(connection, "total_length", total_length)
+            self._rebuild_impacts_on_drift(connection)
+            signature = self._file_signature(os.path.join(self.directory, quiz_name + ".json"))
+            connection.execute("INSERT OR REPLACE INTO sources(quiz, signature) VALUES (?, ?)",
+                               (quiz_name, signature or ""))
+            connection.execute("INSERT OR REPLACE INTO quizzes(quiz, title) VALUES (?, ?)", (quiz_name, quiz.title))
+
+    def _rebuild_impacts_on_drift(self, connection):
+        """
+        Recomputes every term impact when the average document length moved away from the
+        one the impacts were computed with (the caller holds the transaction).
+        """
+        stats = dict(connection.execute("SELECT key, value FROM stats"))
+        documents, impact_length = stats.get("documents", 0), stats.get("impact_length")
+        if documents <= 0 or not impact_length:
+            return
+        average_length = stats.get("total_length", 0) / documents or 1.0
+        if abs(average_length / impact_length - 1) <= IMPACT_REBUILD_DRIFT:
+            return
+        # Przeliczenie w SQLite, bez przenoszenia list wystąpień do Pythona
+        connection.execute(
+            "UPDATE postings SET impact = tf * (? + 1) / (tf + ? * (1 - ? + ? * "
+            "(SELECT length FROM docs WHERE docs.id = postings.doc_id) / ?))",
+            (BM25_K1, BM25_K1, BM25_B, BM25_B, average_length))
+        connection.execute("UPDATE stats SET value = ? WHERE key = 'impact_length'", (average_length,))
+
+    def remove_quiz(self, quiz_name: str):
+        """
+        Removes a quiz from the index.
+
+        Args:
+            quiz_name (str): The quiz file name (without .json).
+        """
+        connection = self._connect()
+        with connection:
+            self._delete_quiz(connection, quiz_name)
+            connection.execute("DELETE FROM sources WHERE quiz = ?", (quiz_name,))
+            connection.execute("DELETE FROM quizzes WHERE quiz = ?", (quiz_name,))
+
+    def titles(self) -> dict:
+        """
+        Returns the titles of the indexed quizzes.
+
+        Returns:
+            dict[str, str]: Quiz file name (without .json) -> quiz title.
+        """
+        return dict(self._connect().execute("SELECT quiz, title FROM quizzes"))
+
+    def document_count(self) -> int:
+        """Returns the number of indexed questions."""
+        row = self._connect().execute("SELECT value FROM stats WHERE key = 'documents'").fetchone()
+        return row[0] if row else 0
+
+    def question_text(self, quiz_name: str, question_index: int) -> str:
+        """
+        Returns the text of an indexed question.
+
+        Raises:
+            KeyError: If the question is not indexed.
+        """
+        row = self._connect().execute("SELECT question_text FROM docs WHERE quiz = ? AND question_index = ?",
+                                      (quiz_name, question_index)).fetchone()
+        if row is None:
+            raise KeyError((quiz_name, question_index))
+        return row[0]
+
+    def band_matches(self, band_keys: list) -> list[tuple]:
+        """
+        Finds the indexed questions sharing at least one LSH band with a signature.
+
+        Args:
+            band_keys (list[int]): Band keys of the signature (see NearDuplicateDetector.band_keys).
+
+        Returns:
+            list[tuple]: (quiz name, question index, question text, packed signature) of each candidate.
+        """
+        return self._connect().execute(
+            "SELECT quiz, question_index, question_text, signature FROM docs WHERE id IN "
+            f"(SELECT doc_id FROM bands WHERE key IN ({','.join('?' * len(band_keys))}))", band_keys).fetchall()
+
+    def shared_bands(self, extra_keys: list = ()) -> tuple[dict, dict]:
+        """
+        Returns the LSH buckets holding more than one indexed question, plus the buckets of
+        the given keys (e.g. of questions not stored in the index).
+
+        Args:
+            extra_keys (list[int]): Band keys whose buckets are returned whatever their size.
+
+        Returns:
+            tuple[dict, dict]: Band key -> document ids, and document id -> (quiz name,
+                               question index, question text, packed signature).
+        """
+        connection = self._connect()
+        buckets = {}
+        rows = connection.execute("SELECT key, doc_id FROM bands WHERE key IN "
+                                  "(SELECT key FROM bands GROUP BY key HAVING COUNT(*) > 1)").fetchall()
+        extra_keys = list(extra_keys)
+        for start in range(0, len(extra_keys), _SQL_VARIABLES):
+            chunk = extra_keys[start:start + _SQL_VARIABLES]
+            rows += connection.execute(f"SELECT key, doc_id FROM bands WHERE key IN ({','.join('?' * len(chunk))})",
+                                       chunk).fetchall()
+        for key, doc_id in sorted(set(rows)):
+            buckets.setdefault(key, []).append(doc_id)
+        doc_ids = sorted({doc_id for doc_ids in buckets.values() for doc_id in doc_ids})
+        documents = {}
+        for start in range(0, len(doc_ids), _SQL_VARIABLES):
+            chunk = doc_ids[start:start + _SQL_VARIABLES]
+            for doc_id, *document in connection.execute(
+                    "SELECT id, quiz, question_index, question_text, signature FROM docs "
+                    f"WHERE id IN ({','.join('?' * len(chunk))})", chunk):
+                documents[doc_id] = tuple(document)
+        return buckets, documents
+
+    @staticmethod
+    def load_titles(directory: str = "data/quiz_examples") -> dict:
+        """
+        Returns the quiz titles stored in an existing index without refreshing or creating it,
+        so callers that only need titles never pay for indexing.
+
+        Args:
+            directory (str): The quiz directory. Defaults to "data/quiz_examples".
+
+        Returns:
+            dict[str, str]: Quiz file name -> title; empty when there is no usable index.
+        """
+        path = os.path.join(directory, INDEX_DIRECTORY_NAME, INDEX_FILENAME)
+        if not os.path.exists(path):
+            return {}
+        try:
+            with QuestionIndex(directory, path) as index:
+                return index.titles()
+        except sqlite3.Error:
+            return {}
+
+    def refresh(self) -> tuple[int, int]:
+        """
+        Brings the index up to date with the quiz directory, reindexing only the quizzes
+        whose files changed. Unreadable quizzes are skipped with a message.
+
+        Returns:
+            tuple[int, int]: Number of (re)indexed quizzes and number of removed quizzes.
+        """
+        from quiz_data.manager import QuizDataManager # Import lokalny - manager importuje ten moduł
+
+        connection = self._connect()
+        indexed = dict(connection.execute("SELECT quiz, signature FROM sources"))
+        available = QuizDataManager.list_available_quizzes(self.directory)
+        updated = 0
+        for name in available:
+            signature = self._file_signature(os.path.join(self.directory, name + ".json"))
+            if indexed.get(name) == signature:
+                continue
+            try:
+                self.index_quiz(name, QuizDataManager.load_quiz(name, self.directory, verbose=False))
+                updated += 1
+            except Exception as e:
+                print(f"Pominięto quiz '{name}' podczas indeksowania: {e}")
+        removed = set(indexed) - set(available)
+        for name in removed:
+            self.remove_quiz(name)
+        return updated, len(removed)
+
+    def refresh_in_background(self) -> threading.Thread:
+        """
+        Starts refresh() in a background thread with its own database connection, so the
+        caller can search the index right away (a catalog changed outside the application
+        may take a while to reindex). Errors are reported and otherwise ignored.
+
+        Returns:
+            threading.Thread: The running refresh (e.g. to wait for it with join()).
+        """
+        def run():
+            try:
+                with QuestionIndex(self.directory, self.path) as index:
+                    index.refresh()
+            except (sqlite3.Error, OSError) as e:
+                print(f"Nie udało się odświeżyć indeksu wyszukiwania: {e}")
+
+        self.refreshing = threading.Thread(target=run, name="quiz-index-refresh", daemon=True)
+        self.refreshing.start()
+        return self.refreshing
+
+    def search(self, query: str, limit: int = 10) -> list[dict]:
+        """
+        Finds the questions best matching a query, ranked with BM25.
+
+        Posting lists are read best impact first, in growing batches and only sequentially:
+        every document seen has a lower bound (the impacts read so far) and an upper bound
+        (plus, for each list it was not seen in, the last impact read from that list). Reading
+        stops once no unseen document can reach the weakest of the current top results and
+        few enough seen documents still can; SQLite then computes the full scores of those
+        candidates. Lists shorter than the read batches are read whole.
+
+        Terms present in more than MAX_DOCUMENT_FREQUENCY_RATIO of the questions are left out
+        of the query when it also has rarer terms, so the ranking equals exhaustive BM25 over
+        the remaining terms.
+
+        Args:
+            query (str): Free-text query (normalized and tokenized like the documents).
+            limit (int): Maximum number of results. Defaults to 10.
+
+        Returns:
+            list[dict]: Results with 'quiz', 'question_index', 'question_text' and 'score',
+                        best first.
+        """
+        terms = set(tokenize(query))
+        if not terms or limit <= 0:
+            return []
+        connection = self._connect()
+        stats = dict(connection.execute("SELECT key, value FROM stats"))
+        documents = stats.get("documents", 0)
+        if documents <= 0:
+            return []
+
+        frequencies = {} # term -> df
+        for term in terms:
+            row = connection.execute("SELECT df FROM terms WHERE term = ?", (term,)).fetchone()
+            if row is not None:
+                frequencies[term] = row[0]
+        # Same częste termy (np. w małym katalogu) nadal szukamy - inaczej trafne pytania by zniknęły
+        rare = {term: df for term, df in frequencies.items() if df <= documents * MAX_DOCUMENT_FREQUENCY_RATIO}
+        if rare:
+            frequencies = rare
+        if not frequencies:
+            return []
+        weights = {term: math.log(1 + (documents - df + 0.5) / (df + 0.5)) for term, df in frequencies.items()}
+
+        # Kursory SQLite czytają listy leniwie - pobieramy tylko tyle, ile trzeba
+        cursors = {term: connection.execute("SELECT doc_id, impact FROM postings WHERE term = ? "
+                                            "ORDER BY impact DESC", (term,)) for term in weights}
+        bits = {term: 1 << position for position, term in enumerate(weights)}
+        bounds = dict.fromkeys(weights, 0.0) # Ważony wpływ ostatniego przeczytanego wpisu każdej listy
+        lower = {} # doc_id -> suma przeczytanych wpływów
+        seen = {} # doc_id -> maska list, w których dokument już wystąpił
+        batch_size = max(limit, SEARCH_BATCH_SIZE)
+        while True:
+            for term, cursor in list(cursors.items()):
+                weight, bit = weights[term], bits[term]
+                rows = cursor.fetchmany(batch_size)
+                for doc_id, impact in rows:
+                    lower[doc_id] = lower.get(doc_id, 0.0) + weight * impact
+                    seen[doc_id] = seen.get(doc_id, 0) | bit
+                if len(rows) < batch_size:
+                    del cursors[term] # Lista przeczytana do końca - pozostałe dokumenty nie mają termu
+                    bounds[term] = 0.0
+                else:
+                    bounds[term] = weight * rows[-1][1]
+            batch_size = min(batch_size * 2, SEARCH_MAX_BATCH_SIZE)
+
+            if not cursors:
+                break # Listy przeczytane do końca - ograniczenia dolne są pełnymi wynikami
+            if len(lower) < limit:
+                continue
+            kth = heapq.nlargest(limit, lower.values())[-1] # Najsłabszy z najlepszych wyników (dolne ograniczenie)
+            if kth < sum(bounds.values()):
+                continue # Nieprzeczytany dokument mógłby jeszcze wejść do najlepszych
+            # Kandydaci: dokumenty, których ograniczenie górne sięga tego wyniku (zależy ono
+            # tylko od maski list, w których dokument już wystąpił)
+            missing = {mask: sum(bound for term, bound in bounds.items() if not mask & bits[term])
+                       for mask in set(seen.values())}
+            candidates = [doc_id for doc_id, mask in seen.items() if lower[doc_id] + missing[mask] >= kth]
+            if len(candidates) <= SEARCH_MAX_CANDIDATES:
+                break
+        for cursor in cursors.values():
+            cursor.close()
+
+        if cursors:
+            # Pełne wyniki kandydatów liczy SQLite (dostęp po kluczu do list, których nie doczytano)
+            weight_case = "CASE term " + "WHEN ? THEN ? " * len(weights) + "END"
+            weight_params = [value for item in weights.items() for value in item]
+            lower = {}
+            for start in range(0, len(candidates), _SQL_VARIABLES):
+                chunk = candidates[start:start + _SQL_VARIABLES]
+                lower.update(connection.execute(
+                    f"SELECT doc_id, SUM(impact * {weight_case}) FROM postings "
+                    f"WHERE term IN ({','.join('?' * len(weights))}) AND doc_id IN ({','.join('?' * len(chunk))}) "
+                    f"GROUP BY doc_id", [*weight_params, *weights, *chunk]))
+        best = sorted(heapq.nlargest(limit, lower, key=lower.__getitem__), key=lambda doc_id: (-lower[doc_id], doc_id))
+
+        results = []
+        for doc_id in best:
+            quiz_name, question_index, question_text = connection.execute(
+                "SELECT quiz, question_index, question_text FROM docs WHERE id = ?", (doc_id,)).fetchone()
+            results.append({"quiz": quiz_name, "question_index": question_index,
+                            "question_text": question_text, "score": round(lower[doc_id], 4)})
+        return results
+
+
+def update_index_for(quiz, filename: str, directory: str):
+    """
+    Updates the search index after a quiz has been saved. Failures are reported but never
+    interrupt saving.
+
+    Args:
+        quiz (Quiz): The saved quiz.
+        filename (str): The file name it was saved under.
+        directory (str): The quiz directory.
+    """
+    if not AUTO_UPDATE:
+        return
+    try:
+        with QuestionIndex(directory) as index:
+            index.index_quiz(filename, quiz)
+    except (sqlite3.Error, OSError) as e:
+        print(f"Nie udało się zaktualizować indeksu wyszukiwania: {e}")
+
+
+def main(argv=None):
+    """Refreshes the index of a quiz directory and prints the best matches of a query as JSON."""
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+    parser = argparse.ArgumentParser(description="Wyszukiwanie pytań we wszystkich quizach.")
+    parser.add_argument("query", help="Szukany tekst.")
+    parser.add_argument("--directory", default="data/quiz_examples", help="Katalog z quizami.")
+    parser.add_argument("--limit", type=int, default=10, help="Maksymalna liczba wyników.")
+    args = parser.parse_args(argv)
+
+    with QuestionIndex(args.directory) as index:
+        index.refresh()
+        results = index.search(args.query, args.limit)
+    print(json.dumps(results, indent=4, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+# quiz_project/quiz_search/picker.py
+"""
+Interactive quiz selection that scales to very large catalogs.
+"""
+import bisect
+import heapq
+import re
+from collections import Counter
+from utils import console
+from utils.text import normalize_answer
+
+# Do tej liczby quizów wyświetlamy pełną, numerowaną listę (jak dotychczas)
+FULL_LIST_LIMIT = 30
+PAGE_SIZE = 10
+
+_WORD_SPLIT = re.compile(r"[^0-9a-z]+")
+
+
+# Głębokość trie; dłuższe klucze trafiają do posortowanej listy w liściu (tzw. burst trie),
+# dzięki czemu liczba węzłów nie rośnie z długością nazw
+TRIE_DEPTH = 3
+
+
+class _TrieNode:
+    """
+    A node of the prefix trie: children by character, the ids of keys ending here and,
+    at TRIE_DEPTH, the (key, id) entries of all longer keys sharing this prefix.
+    """
+
+    __slots__ = ("children", "ids", "entries", "sorted")
+
+    def __init__(self):
+        self.children = {}
+        self.ids = []
+        self.entries = []
+        self.sorted = True
+
+
+class QuizPicker:
+    """
+    Finds quizzes by the beginning of their name or title, with a fuzzy fallback.
+
+    Names and titles are normalized (case and diacritic folding) and inserted, together
+    with each of their words, into a prefix trie, so "pol" finds "geografia_polski" as
+    well as "Polska - stolice". When no key starts with the query, a trigram index ranks
+    quizzes by the Dice similarity of trigram sets, which tolerates typos. Matches are
+    produced lazily, page by page, so a query against a huge catalog prints a bounded
+    number of lines.
+
+    Attributes:
+        names (list[str]): Quiz file names (without .json), in catalog order.
+        titles (dict[str, str]): Quiz titles by name (may be incomplete).
+    """
+
+    def __init__(self, names: list, titles: dict = None):
+        """
+        Initializes the picker. The prefix trie and the trigram index are built on first
+        use, so small catalogs shown as a plain list never pay for them.
+
+        Args:
+            names (list[str]): Quiz file names.
+            titles (dict[str, str], optional): Titles by name, e.g. QuestionIndex.load_titles().
+        """
+        self.names = list(names)
+        self.titles = titles or {}
+        self._root = None
+        self._trigrams = None
+        self._trigram_counts = []
+
+    def _keys(self, quiz_id: int) -> set:
+        """Returns the normalized name and title of a quiz."""
+        name = self.names[quiz_id]
+        keys = {normalize_answer(name)}
+        title = self.titles.get(name)
+        if title:
+            keys.add(normalize_answer(title))
+        return keys
+
+    def _build_trie(self):
+        """Builds the prefix trie over names, titles and their words."""
+        self._root = _TrieNode()
+        for quiz_id in range(len(self.names)):
+            for key in self._keys(quiz_id):
+                self._insert(key, quiz_id)
+                for word in _WORD_SPLIT.split(key):
+                    if word and word != key:
+                        self._insert(word, quiz_id)
+
+    def _build_trigrams(self):
+        """Builds the trigram index used by fuzzy(); needed only when a prefix finds nothing."""
+        self._trigrams = {}
+        for quiz_id in range(len(self.names)):
+            trigrams = set()
+            for key in self._keys(quiz_id):
+                trigrams.update(self._key_trigrams(key))
+            for trigram in trigrams:
+                self._trigrams.setdefault(trigram, []).append(quiz_id)
+            self._trigram_counts.append(len(trigrams))
+
+    @classmethod
+    def for_catalog(cls, names: list, titles: dict = None) -> "QuizPicker":
+        """
+        Returns a picker for a catalog, reusing the previous one (and its built indexes)
+        while the list of quizzes and titles is unchanged.
+
+        Args:
+            names (list[str]): Quiz file names.
+            titles (dict[str, str], optional): Titles by name.
+
+        Returns:
+            QuizPicker: The picker.
+        """
+        previous = getattr(cls, "_last", None)
+        if previous is not None and previous.names == names and previous.titles == (titles or {}):
+            return previous
+        cls._last = cls(names, titles)
+        return cls._last
+
+    def __len__(self) -> int:
+        """Returns the number of quizzes."""
+        return len(self.names)
+
+    @staticmethod
+    def _key_trigrams(key: str) -> set:
+        """Returns the character trigrams of a normalized key (padded at word edges)."""
+        padded = f"  {key} "
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+    def _insert(self, key: str, quiz_id: int):
+        """Inserts a key into the trie."""
+        node = self._root
+        for char in key[:TRIE_DEPTH]:
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _TrieNode()
+            node = child
+        if len(key) <= TRIE_DEPTH:
+            node.ids.append(quiz_id)
+        else:
+            node.entries.append((key, quiz_id))
+            node.sorted = False
+
+    def _prefix_ids(self, prefix: str):
+        """Lazily yields the ids of keys starting with a prefix, in lexicographic key order."""
+        if self._root is None:
+            self._build_trie()
+        node = self._root
+        for char in prefix[:TRIE_DEPTH]:
+            node = node.children.get(char)
+            if node is None:
+                return
+        if len(prefix) > TRIE_DEPTH:
+            # Reszta prefiksu - wyszukiwanie binarne w posortowanym liściu
+            entries = self._sorted_entries(node)
+            for key, quiz_id in entries[bisect.bisect_left(entries, (prefix,)):]:
+                if not key.startswith(prefix):
+                    return
+                yield quiz_id
+            return
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            yield from node.ids
+            yield from (quiz_id for _, quiz_id in self._sorted_entries(node))
+            # Odwrócona kolejność na stosie = przejście w porządku alfabetycznym
+            stack.extend(node.children[char] for char in sorted(node.children, reverse=True))
+
+    @staticmethod
+    def _sorted_entries(node: _TrieNode) -> list:
+        """Returns the entries of a leaf, sorting them on first use."""
+        if not node.sorted:
+            node.entries.sort()
+            node.sorted = True
+        return node.entries
+
+    def fuzzy(self, query: str, k: int = PAGE_SIZE) -> list[str]:
+        """
+        Returns the k quizzes whose names or titles are most similar to a query.
+
+        Args:
+            query (str): The query (e.g. a misspelled name).
+            k (int): Number of results. Defaults to PAGE_SIZE.
+
+        Returns:
+            list[str]: Quiz names, most similar first.
+        """
+        if self._trigrams is None:
+            self._build_trigrams()
+        query_trigrams = self._key_trigrams(normalize_answer(query))
+        common = Counter()
+        for trigram in query_trigrams:
+            common.update(self._trigrams.get(trigram, ()))
+        scored = ((2 * shared / (len(query_trigrams) + self._trigram_counts[quiz_id]), quiz_id)
+                  for quiz_id, shared in common.items())
+        return [self.names[quiz_id] for _, quiz_id in heapq.nlargest(k, scored)]
+
+    def matches(self, query: str):
+        """
+        Lazily yields the names of quizzes matching a query: prefix matches first, or
+        fuzzy matches when nothing starts with the query. An empty query yields every quiz.
+
+        Args:
+            query (str): The typed query.
+
+        Yields:
+            str: Quiz names without duplicates.
+        """
+        normalized = normalize_answer(query)
+        if not normalized:
+            yield from self.names
+            return
+        seen = set()
+        for quiz_id in self._prefix_ids(normalized):
+            if quiz_id not in seen:
+                seen.add(quiz_id)
+                yield self.names[quiz_id]
+        if not seen:
+            yield from self.fuzzy(normalized)
+
+    def _label(self, name: str) -> str:
+        """Returns the text shown for a quiz in a list."""
+        title = self.titles.get(name)
+        return f"{name} ({title})" if title and title != name else name
+
+    def _choose_from_full_list(self, prompt: str, header: str, on_show=None) -> str:
+        """Numbered selection from the full list (small catalogs)."""
+        print(header)
+        for i, quiz_name in enumerate(self.names):
+            print(f"  {i + 1}. {quiz_name}")
+        if on_show is not None:
+            on_show(self.names)
+        while True:
+            try:
+                choice = console.input(prompt).strip()
+                choice_index = int(choice) - 1
+                if 0 <= choice_index < len(self.names):
+                    return self.names[choice_index]
+                else:
+                    print("Nieprawidłowy numer. Wpisz numer z listy.")
+            except ValueError:
+                print("To nie jest liczba. Wpisz numer quizu.")
+            except Exception as e:
+                print(f"Wystąpił nieoczekiwany błąd podczas wyboru quizu: {e}")
+
+    def choose(self, prompt: str, header: str = "Dostępne quizy:", on_show=None) -> str:
+        """
+        Lets the user pick a quiz interactively.
+
+        Small catalogs are shown as a numbered list. Larger ones are searched: the user
+        types the beginning of a name or title, sees one page of matches, and picks a
+        number, asks for the next page ('n') or types a new query.
+
+        Args:
+            prompt (str): Prompt asking for the quiz number.
+            header (str): Heading printed above the list of quizzes.
+            on_show (callable, optional): Called with the list of quiz names each time a
+                                          list or a page of matches is shown, before the
+                                          user answers (used to prefetch likely choices).
+
+        Returns:
+            str: The selected quiz name.
+        """
+        if len(self.names) <= FULL_LIST_LIMIT:
+            return self._choose_from_full_list(prompt, header, on_show)
+
+        print(f"{header} {len(self.names)} (wyszukiwanie po nazwie lub tytule)")
+        query_prompt = "Wpisz początek nazwy lub tytułu quizu (Enter - wszystkie): "
+        query = console.input(query_prompt).strip()
+        while True:
+            results = self.matches(query)
+            page = [name for _, name in zip(range(PAGE_SIZE), results)]
+            if not page:
+                print("Brak pasujących quizów.")
+                query = console.input(query_prompt).strip()
+                continue
+            while True:
+                for i, quiz_name in enumerate(page):
+                    print(f"  {i + 1}. {self._label(quiz_name)}")
+                if on_show is not None:
+                    on_show(page)
+                choice = console.input(f"{prompt}('n' - następna strona, inny tekst - nowe wyszukiwanie): ").strip()
+                if choice.isdigit():
+                    choice_index = int(choice) - 1
+                    if 0 <= choice_index < len(page):
+                        return page[choice_index]
+                    print("Nieprawidłowy numer. Wpisz numer z listy.")
+                elif choice.lower() == "n":
+                    next_page = [name for _, name in zip(range(PAGE_SIZE), results)]
+                    if next_page:
+                        page = next_page
+                    else:
+                        print("To jest ostatnia strona wyników.")
+                else:
+                    query = choice
+                    break
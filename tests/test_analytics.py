@@ -0,0 +1,139 @@
+import unittest
+import os
+import sys
+import shutil
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from quiz_results import analytics as analytics_module
+from quiz_results.analytics import ItemAnalytics, ItemStats
+
+
+class TestItemAnalytics(unittest.TestCase):
+    """
+    Unit tests for incremental per-question statistics and mergeable summaries.
+    """
+
+    def setUp(self):
+        """Create a temporary results directory and a few sample sessions."""
+        self.test_dir = "test_analytics_results"
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+        # (choices, correct flags) for a 3-question quiz whose key is [0, 1, 2]
+        self.sessions = [
+            ([0, 1, 2], [True, True, True]),
+            ([0, 1, 0], [True, True, False]),
+            ([0, 0, 0], [True, False, False]),
+            ([1, 0, 1], [False, False, False]),
+        ]
+
+    def tearDown(self):
+        """Remove the temporary results directory."""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def _feed(self, analytics, sessions):
+        for choices, flags in sessions:
+            analytics.add_session("fp", [0, 1, 2], choices, flags)
+        return analytics
+
+    def test_counters_and_choice_distribution(self):
+        """Test attempts, correct rate and per-option counts."""
+        report = self._feed(ItemAnalytics(), self.sessions).report("fp", [0b001, 0b010, 0b100])
+        self.assertEqual([entry["attempts"] for entry in report], [4, 4, 4])
+        self.assertEqual(report[0]["correct_rate"], 0.75)
+        self.assertEqual(report[0]["choice_distribution"], [3, 1])
+        self.assertEqual(report[2]["choice_distribution"], [2, 1, 1])
+        self.assertIn("popular_distractor", report[2]["flags"])
+        self.assertNotIn("popular_distractor", self._feed(ItemAnalytics(), self.sessions).report("fp")[2]["flags"])
+
+    def test_partially_correct_multi_answer_is_not_a_distractor(self):
+        """Test that choosing only some of the correct options does not flag a popular distractor."""
+        analytics = ItemAnalytics()
+        for _ in range(3):
+            analytics.add_session("fp", [0], [[0]], [False]) # Tylko jedna z dwóch poprawnych opcji
+        analytics.add_session("fp", [0], [[0, 1]], [True])
+        self.assertNotIn("popular_distractor", analytics.report("fp", [0b011])[0]["flags"])
+        analytics.add_session("fp", [0], [[2]], [False])
+        analytics.add_session("fp", [0], [[2]], [False])
+        self.assertIn("popular_distractor", analytics.report("fp", [0b011])[0]["flags"])
+
+    def test_discrimination_matches_direct_formula(self):
+        """Test that the incremental point-biserial equals the one computed from raw data."""
+        report = self._feed(ItemAnalytics(), self.sessions).report("fp")
+        # Question 1: rest scores of correct answers [2, 1], of incorrect ones [1, 0]
+        rest = [2, 1, 1, 0]
+        mean = sum(rest) / 4
+        std = (sum((x - mean) ** 2 for x in rest) / 4) ** 0.5
+        expected = (1.5 - 0.5) / std * (0.5 * 0.5) ** 0.5
+        self.assertAlmostEqual(report[1]["discrimination"], round(expected, 4))
+
+    def test_discrimination_undefined_without_variance(self):
+        """Test that discrimination is None when everybody answered the same way."""
+        stats = ItemStats()
+        stats.add(0, True, 1)
+        stats.add(0, True, 2)
+        self.assertIsNone(stats.discrimination)
+
+    def test_merge_equals_single_aggregate(self):
+        """Test that merging partial aggregates gives the same report as one aggregate."""
+        whole = self._feed(ItemAnalytics(), self.sessions)
+        part_a = self._feed(ItemAnalytics(), self.sessions[:1])
+        part_b = self._feed(ItemAnalytics(), self.sessions[1:])
+        self.assertEqual(part_a.merge(part_b).report("fp"), whole.report("fp"))
+        self.assertEqual(part_a.quizzes["fp"]["sessions"], 4)
+
+    def test_save_load_and_compact(self):
+        """Test round-tripping through JSON files and compacting partial files."""
+        self._feed(ItemAnalytics(), self.sessions[:2]).save(os.path.join(self.test_dir, "analytics-1.json"))
+        self._feed(ItemAnalytics(), self.sessions[2:]).save(os.path.join(self.test_dir, "analytics-2.json"))
+        expected = self._feed(ItemAnalytics(), self.sessions).report("fp")
+
+        self.assertEqual(ItemAnalytics.load_merged(self.test_dir).report("fp"), expected)
+        ItemAnalytics.compact(self.test_dir)
+        self.assertEqual(sorted(os.listdir(self.test_dir)), ["analytics.json"])
+        self.assertEqual(ItemAnalytics.load_merged(self.test_dir).report("fp"), expected)
+
+    def test_partials_are_unique_and_compacted_automatically(self):
+        """Test that partial files never overwrite each other and are folded in past the threshold."""
+        self.assertNotEqual(ItemAnalytics.partial_path(self.test_dir), ItemAnalytics.partial_path(self.test_dir))
+        with patch.object(analytics_module, "COMPACT_THRESHOLD", 2):
+            for session in self.sessions:
+                self._feed(ItemAnalytics(), [session]).save_partial(self.test_dir)
+        self.assertLessEqual(len(os.listdir(self.test_dir)), 3) # analytics.json i co najwyżej 2 pliki częściowe
+        self.assertIn("analytics.json", os.listdir(self.test_dir))
+        expected = self._feed(ItemAnalytics(), self.sessions).report("fp")
+        self.assertEqual(ItemAnalytics.load_merged(self.test_dir).report("fp"), expected)
+
+    def test_compaction_lock_is_removed_only_by_its_holder(self):
+        """Test that stale locks are taken over and a fresh lock of another process is never removed."""
+        os.makedirs(self.test_dir)
+        lock_path = os.path.join(self.test_dir, analytics_module.COMPACT_LOCK_FILENAME)
+        with open(lock_path, 'w', encoding='utf-8') as f:
+            f.write("crashed")
+        os.utime(lock_path, (0, 0))
+        token = ItemAnalytics._acquire_compaction_lock(self.test_dir, wait=False)
+        self.assertIsNotNone(token)
+        self.assertIsNone(ItemAnalytics._acquire_compaction_lock(self.test_dir, wait=False))
+
+        # Proces, który uznał za przeterminowaną poprzednią blokadę, nie usuwa nowej
+        self.assertFalse(ItemAnalytics._remove_lock_if_held(lock_path, "crashed"))
+        with open(lock_path, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), token)
+
+        with open(lock_path, 'w', encoding='utf-8') as f:
+            f.write("other") # Blokadę przejął inny proces
+        self.assertIsNone(ItemAnalytics.compact(self.test_dir, wait=False))
+        self.assertTrue(ItemAnalytics._remove_lock_if_held(lock_path, "other"))
+        self.assertIsNotNone(ItemAnalytics.compact(self.test_dir, wait=False))
+        self.assertEqual(sorted(os.listdir(self.test_dir)), ["analytics.json"])
+
+    def test_add_session_length_mismatch_raises(self):
+        """Test that inconsistent session data raises ValueError."""
+        with self.assertRaises(ValueError):
+            ItemAnalytics().add_session("fp", [0, 1], [0], [True])
+
+
+if __name__ == '__main__':
+    unittest.main()
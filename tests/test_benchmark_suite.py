@@ -0,0 +1,79 @@
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.memory import run_memory_suite, scenario_sessions
+from benchmarks.suite import compare_results, run_suite
+from utils.helpers import measure_memory
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    """
+    Unit tests for the benchmark suite runner and baseline comparison.
+    """
+
+    def test_run_selected_case(self):
+        results = run_suite("quick", ["quiz_to_dict"])["results"]
+        self.assertEqual(sorted(results, key=lambda key: results[key]["scale"]),
+                         ["quiz_to_dict@10", "quiz_to_dict@1000", "quiz_to_dict@10000"])
+        self.assertTrue(all(result["seconds"] > 0 for result in results.values()))
+
+    def test_unknown_case(self):
+        with self.assertRaises(ValueError):
+            run_suite("quick", ["brak"])
+
+    def test_compare_flags_regressions(self):
+        baseline = {"results": {"a@10": {"seconds": 1.0}, "b@10": {"seconds": 1.0}, "old@10": {"seconds": 1.0}}}
+        current = {"results": {"a@10": {"seconds": 1.2}, "b@10": {"seconds": 1.5}, "new@10": {"seconds": 9.0}}}
+        report = compare_results(baseline, current, threshold=0.25)
+        self.assertEqual([entry["key"] for entry in report["comparison"]], ["a@10", "b@10"])
+        self.assertEqual(report["regressions"], ["b@10"])
+        self.assertEqual(compare_results(baseline, current, threshold=0.6)["regressions"], [])
+
+    def test_compare_other_metric(self):
+        baseline = {"results": {"a@10": {"peak_bytes": 1000}}}
+        current = {"results": {"a@10": {"peak_bytes": 1200}}}
+        self.assertEqual(compare_results(baseline, current, 0.1, metric="peak_bytes")["regressions"], ["a@10"])
+
+
+class TestMemoryHarness(unittest.TestCase):
+    """
+    Unit tests for the tracemalloc memory harness.
+    """
+
+    def test_peak_and_retained(self):
+        def allocate():
+            temporary = [bytearray(1000) for _ in range(1000)] # ~1 MB, zwolnione przed powrotem
+            del temporary
+            return bytearray(100000)
+
+        result, report = measure_memory(allocate)
+        self.assertEqual(len(result), 100000)
+        self.assertGreater(report["peak_bytes"], 1000000)
+        self.assertTrue(100000 <= report["retained_bytes"] < 200000)
+        self.assertIn("test_benchmark_suite.py", report["top_sites"][0]["site"])
+
+    def test_catalog_scenario(self):
+        results = run_memory_suite("quick", ["catalog"], top=2)["results"]
+        self.assertEqual(set(results), {"catalog@10", "catalog@1000"})
+        self.assertGreater(results["catalog@1000"]["retained_bytes"], results["catalog@10"]["retained_bytes"])
+        self.assertLessEqual(len(results["catalog@10"]["top_sites"]), 2)
+
+    def test_sessions_scenario_uses_player_load_path(self):
+        workdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, workdir)
+        open_sessions = scenario_sessions(3, workdir)
+        # Jak odtwarzacz: sesje czytają artefakt przez QuizCompiler.load, bez ponownego parsowania quizu
+        with patch('quiz_data.compiled.QuizDataManager.load_quiz') as mock_load:
+            sessions = open_sessions()
+        mock_load.assert_not_called()
+        self.assertEqual([len(compiled) for compiled, _, _ in sessions], [50, 50, 50])
+
+
+if __name__ == '__main__':
+    unittest.main()
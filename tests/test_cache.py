@@ -0,0 +1,126 @@
+import unittest
+import os
+import sys
+import time
+import shutil
+import threading
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models.question import Question
+from models.quiz import Quiz
+from quiz_data.cache import MEMORY_FACTOR, QuizCache, rank_candidates
+from quiz_data.manager import QuizDataManager
+from quiz_results.log import ResultsLog, recent_play_counts
+from quiz_search.picker import QuizPicker
+
+
+class TestQuizCache(unittest.TestCase):
+    """
+    Unit tests for the prefetch cache and the candidate ranking.
+    """
+
+    def setUp(self):
+        self.test_dir = "test_prefetch_quizzes"
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+        for name in ("a", "b", "c"):
+            quiz = Quiz(name, "", [Question(f"Pytanie {name}?", ["Tak", "Nie"], 0)])
+            QuizDataManager.save_quiz(quiz, name, self.test_dir, verbose=False)
+        self.cache = QuizCache(budget_bytes=10 ** 6)
+        QuizCache.shared().clear() # Inne testy mogły coś wczytać z wyprzedzeniem
+
+    def tearDown(self):
+        self.cache.shutdown()
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.test_dir, name + ".json")
+
+    def test_rank_candidates(self):
+        names = ["a", "b", "c", "d"]
+        self.assertEqual(rank_candidates(names, {"c": 5, "b": 1}, limit=3), ["c", "b", "a"])
+        self.assertEqual(rank_candidates(names, {}, limit=2), ["a", "b"])
+
+    def test_take_once(self):
+        self.cache.prefetch([self.path("a")], QuizDataManager._read_quiz_file)
+        quiz = self.cache.take(self.path("a"))
+        self.assertEqual(quiz.title, "a")
+        self.assertIsNone(self.cache.take(self.path("a"))) # Właścicielem jest teraz wywołujący
+        self.assertEqual((self.cache.hits, self.cache.used_bytes), (1, 0))
+
+    def test_changed_file_is_not_served(self):
+        self.cache.prefetch([self.path("a")], QuizDataManager._read_quiz_file)
+        time.sleep(0.01)
+        QuizDataManager.save_quiz(Quiz("a2", "", []), "a", self.test_dir, verbose=False)
+        self.assertIsNone(self.cache.take(self.path("a")))
+        self.assertEqual(self.cache.wasted, 1)
+
+    def test_load_in_progress_is_not_repeated(self):
+        release = threading.Event()
+        calls = []
+
+        def slow_loader(file_path):
+            calls.append(file_path)
+            release.wait(5)
+            return QuizDataManager._read_quiz_file(file_path)
+
+        self.cache.prefetch([self.path("b")], slow_loader)
+        threading.Timer(0.05, release.set).start()
+        self.assertEqual(self.cache.take(self.path("b")).title, "b")
+        self.assertEqual(len(calls), 1)
+
+    def test_memory_budget(self):
+        size = os.path.getsize(self.path("a")) * MEMORY_FACTOR
+        cache = QuizCache(budget_bytes=int(size * 2.5))
+        started = cache.prefetch([self.path(name) for name in "abc"], QuizDataManager._read_quiz_file)
+        self.assertEqual(len(started), 2) # Trzeci quiz nie mieści się w budżecie
+        # Nowa lista: wpisy spoza niej ustępują miejsca
+        started = cache.prefetch([self.path("c")], QuizDataManager._read_quiz_file)
+        self.assertEqual(len(started), 1)
+        self.assertEqual(cache.wasted, 1)
+        self.assertLessEqual(cache.used_bytes, cache.budget_bytes)
+        cache.shutdown()
+
+    def test_load_quiz_uses_prefetched_quiz(self):
+        QuizDataManager.prefetch(["c", "a"], self.test_dir, play_counts=lambda: {"a": 3}).result()
+        with patch('quiz_data.manager.QuizDataManager._read_quiz_file') as mock_read:
+            quiz = QuizDataManager.load_quiz("a", self.test_dir, verbose=False)
+        self.assertEqual(quiz.title, "a")
+        mock_read.assert_not_called()
+
+    def test_picker_reports_shown_names(self):
+        shown = []
+        with patch('builtins.input', return_value="2"), patch('sys.stdout'):
+            choice = QuizPicker(["a", "b"]).choose("? ", on_show=shown.append)
+        self.assertEqual((choice, shown), ("b", [["a", "b"]]))
+
+
+class TestRecentPlayCounts(unittest.TestCase):
+    """
+    Tests counting recently played quizzes in the results log.
+    """
+
+    def setUp(self):
+        self.results_dir = "test_prefetch_results"
+        if os.path.exists(self.results_dir):
+            shutil.rmtree(self.results_dir)
+
+    def tearDown(self):
+        if os.path.exists(self.results_dir):
+            shutil.rmtree(self.results_dir)
+
+    def test_counts_only_recent_sessions(self):
+        log = ResultsLog(self.results_dir, segment_max_bytes=60, commit_delay=0)
+        for name in ["old"] * 3 + ["python", "geografia", "python"]:
+            log.append({"name": name, "score": 1})
+        log.close()
+        self.assertEqual(recent_play_counts(self.results_dir, limit=3), {"python": 2, "geografia": 1})
+        self.assertEqual(recent_play_counts(self.results_dir, limit=100)["old"], 3)
+        self.assertEqual(recent_play_counts("missing_results_dir"), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
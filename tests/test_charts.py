@@ -0,0 +1,150 @@
+import unittest
+import os
+import sys
+import shutil
+import threading
+import zlib
+import xml.dom.minidom
+from io import StringIO
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from quiz_player.charts import (ChartRenderingService, chart_filename_for, configured_chart_backend,
+                                get_chart_renderer, render_results_chart)
+from quiz_player.svg_chart import build_results_png, build_results_svg, render_results_chart_svg
+
+
+def _blocking_renderer(correct_count, incorrect_count, quiz_title, reports_directory):
+    """Renderer used to keep jobs in the queue until the test releases them."""
+    _blocking_renderer.release.wait(timeout=5)
+    return os.path.join(reports_directory, chart_filename_for(quiz_title))
+
+
+class TestChartRendering(unittest.TestCase):
+    """
+    Unit tests for the chart rendering function and the background rendering service.
+    """
+
+    def setUp(self):
+        """Create a temporary reports directory for each test."""
+        self.test_dir = "test_reports_charts"
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def tearDown(self):
+        """Remove the temporary reports directory."""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_chart_filename_for(self):
+        """Test that the report filename matches the existing naming scheme."""
+        self.assertEqual(chart_filename_for("Geografia Polski"), "wyniki_geografia_polski.png")
+        self.assertEqual(chart_filename_for("Test", "svg"), "wyniki_test.svg")
+
+    def test_render_results_chart_writes_png(self):
+        """Test that the object-oriented renderer writes a PNG file and creates the directory."""
+        path = render_results_chart(3, 1, "Render Test", self.test_dir)
+        self.assertEqual(path, os.path.join(self.test_dir, "wyniki_render_test.png"))
+        with open(path, 'rb') as f:
+            self.assertEqual(f.read(8), b'\x89PNG\r\n\x1a\n')
+
+    def test_service_returns_future_with_path(self):
+        """Test that a submitted job resolves to the chart path."""
+        service = ChartRenderingService(max_workers=2, use_processes=False)
+        try:
+            future = service.submit(1, 1, "Future Test", self.test_dir)
+            path = future.result(timeout=30)
+            self.assertTrue(os.path.exists(path))
+        finally:
+            service.shutdown()
+
+    def test_service_queue_is_bounded(self):
+        """Test that submit() blocks once max_pending jobs are queued."""
+        _blocking_renderer.release = threading.Event()
+        service = ChartRenderingService(max_workers=1, max_pending=2, use_processes=False)
+        try:
+            service.submit(1, 0, "a", self.test_dir, renderer=_blocking_renderer)
+            service.submit(1, 0, "b", self.test_dir, renderer=_blocking_renderer)
+
+            third_submitted = threading.Event()
+            def submit_third():
+                service.submit(1, 0, "c", self.test_dir, renderer=_blocking_renderer)
+                third_submitted.set()
+            thread = threading.Thread(target=submit_third)
+            thread.start()
+
+            self.assertFalse(third_submitted.wait(timeout=0.2))
+            _blocking_renderer.release.set()
+            self.assertTrue(third_submitted.wait(timeout=5))
+            thread.join()
+        finally:
+            _blocking_renderer.release.set()
+            service.shutdown()
+
+    def test_service_rejects_invalid_sizes(self):
+        """Test that a non-positive pool size raises ValueError."""
+        with self.assertRaises(ValueError):
+            ChartRenderingService(max_workers=-1)
+
+
+class TestLightweightChartBackends(unittest.TestCase):
+    """
+    Unit tests for the dependency-free SVG and PNG chart renderers.
+    """
+
+    def test_svg_contains_labels_colors_and_title(self):
+        """Test that the SVG is well-formed and uses the same labels, colors and title."""
+        svg = build_results_svg(3, 1, "Geografia & Historia")
+        xml.dom.minidom.parseString(svg) # Raises if the document is malformed
+        for expected in ("Poprawne", "Niepoprawne", "#4CAF50", "#F44336",
+                         "Wyniki quizu: Geografia &amp; Historia", "75.0%", "25.0%"):
+            self.assertIn(expected, svg)
+
+    def test_svg_single_slice_is_full_circle(self):
+        """Test that a 100% result is drawn as a circle instead of a degenerate arc."""
+        svg = build_results_svg(4, 0, "Full")
+        self.assertIn("<circle", svg)
+        self.assertNotIn("Niepoprawne", svg)
+
+    def test_png_is_valid_image(self):
+        """Test that the minimal PNG has a valid header and decompressible pixel data."""
+        png = build_results_png(1, 1, size=20)
+        self.assertEqual(png[:8], b'\x89PNG\r\n\x1a\n')
+        idat_start = png.index(b'IDAT') + 4
+        idat_length = int.from_bytes(png[idat_start - 8:idat_start - 4], 'big')
+        raw = zlib.decompress(png[idat_start:idat_start + idat_length])
+        self.assertEqual(len(raw), 20 * (1 + 20 * 3)) # Filter byte + RGB pixels per row
+        self.assertIn(bytes.fromhex('4CAF50'), raw)
+        self.assertIn(bytes.fromhex('F44336'), raw)
+
+    def test_get_chart_renderer(self):
+        """Test backend selection, including the SVG file extension and unknown names."""
+        renderer, extension = get_chart_renderer("svg")
+        self.assertIs(renderer, render_results_chart_svg)
+        self.assertEqual(extension, "svg")
+        self.assertIs(get_chart_renderer("matplotlib")[0], render_results_chart)
+        with self.assertRaises(ValueError):
+            get_chart_renderer("gif")
+
+    def test_invalid_worker_count_falls_back_to_default(self):
+        """Test that a non-numeric QUIZ_CHART_WORKERS does not break the shared service."""
+        with patch.object(ChartRenderingService, '_shared', None), \
+                patch.dict(os.environ, {"QUIZ_CHART_WORKERS": "dwa", "QUIZ_CHART_EXECUTOR": "thread"}), \
+                patch('sys.stdout', new=StringIO()) as out:
+            service = ChartRenderingService.shared()
+            self.assertEqual(service.max_workers, os.cpu_count() or 1)
+            service.shutdown()
+        self.assertIn("QUIZ_CHART_WORKERS", out.getvalue())
+
+    def test_unknown_configured_backend_falls_back_to_default(self):
+        """Test that a typo in QUIZ_CHART_BACKEND is reported instead of breaking rendering."""
+        with patch.dict(os.environ, {"QUIZ_CHART_BACKEND": "bogus"}), patch('sys.stdout', new=StringIO()) as out:
+            self.assertEqual(configured_chart_backend(), "matplotlib")
+        self.assertIn("bogus", out.getvalue())
+        with patch.dict(os.environ, {"QUIZ_CHART_BACKEND": "SVG"}):
+            self.assertEqual(configured_chart_backend(), "svg")
+
+
+if __name__ == '__main__':
+    unittest.main()
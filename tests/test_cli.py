@@ -0,0 +1,199 @@
+import unittest
+import os
+import sys
+import json
+import shutil
+from io import StringIO
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import main
+from models.question import Question, MultiAnswerQuestion, TextAnswerQuestion
+from models.quiz import Quiz
+from models.scoring import get_scoring_policy
+from quiz_creator.validator import QuizValidator
+from quiz_data.compiled import QuizCompiler
+from quiz_data.csv_format import read_quiz_csv, write_quiz_csv
+from quiz_data.manager import QuizDataManager
+from quiz_player.grading import grade_answers
+
+
+class TestQuizValidator(unittest.TestCase):
+    """
+    Unit tests for QuizValidator.
+    """
+
+    def test_valid_quiz(self):
+        """A quiz produced by to_dict() has no errors."""
+        quiz = Quiz("Quiz", questions=[Question("Q1", ["A", "B"], 0)])
+        self.assertEqual(QuizValidator.validate(quiz.to_dict()), ([], []))
+
+    def test_reports_every_error(self):
+        """All broken questions are reported, each with its number."""
+        data = {"title": " ", "questions": [
+            {"question_text": "Q1", "options": ["A"], "correct_answer_index": 3},
+            {"question_text": "Q2", "options": ["A", "B"]},
+            "nie pytanie"]}
+        errors, _ = QuizValidator.validate(data)
+        self.assertEqual(len(errors), 4)
+        self.assertEqual(errors[0], "Quiz title cannot be empty.")
+        self.assertTrue(errors[1].startswith("Question 1:"))
+        self.assertTrue(errors[2].startswith("Question 2: missing key"))
+        self.assertTrue(errors[3].startswith("Question 3:"))
+
+    def test_warnings_for_duplicates(self):
+        """Duplicate questions and options are warnings, not errors."""
+        data = Quiz("Quiz", questions=[Question("Q1", ["A", "a"], 0), Question("q1", ["A", "B"], 1)]).to_dict()
+        errors, warnings = QuizValidator.validate(data)
+        self.assertEqual(errors, [])
+        self.assertEqual(warnings, ["Question 1: duplicate options.", "Question 2: same text as question 1."])
+
+
+class TestGrading(unittest.TestCase):
+    """
+    Unit tests for headless grading of answer sheets.
+    """
+
+    def setUp(self):
+        self.compiled = QuizCompiler.compile(Quiz("Quiz", questions=[
+            Question("Q1", ["A", "B"], 1),
+            MultiAnswerQuestion("Q2", ["A", "B", "C"], [0, 2]),
+            TextAnswerQuestion("Q3", ["Łódź"])]))
+
+    def test_all_correct(self):
+        result = grade_answers(self.compiled, [2, [3, 1], "lodz"], get_scoring_policy("all_or_nothing"))
+        self.assertEqual(result["score"], 3)
+        self.assertEqual(result["correct"], 3)
+        self.assertEqual(result["max_score"], 3)
+
+    def test_partial_and_skipped(self):
+        result = grade_answers(self.compiled, [None, [1], "Kraków"], get_scoring_policy("partial"))
+        self.assertEqual(result["score"], 0.5)
+        self.assertEqual([entry["is_correct"] for entry in result["results"]], [False, False, False])
+
+    def test_invalid_sheets(self):
+        policy = get_scoring_policy("all_or_nothing")
+        with self.assertRaises(ValueError):
+            grade_answers(self.compiled, [1, [1]], policy)
+        with self.assertRaises(ValueError):
+            grade_answers(self.compiled, [3, [1], "x"], policy)
+        with self.assertRaises(ValueError):
+            grade_answers(self.compiled, [[1, 2], [1], "x"], policy)
+        with self.assertRaises(ValueError):
+            grade_answers(self.compiled, [1, [1], 1], policy)
+
+
+class TestCommandLine(unittest.TestCase):
+    """
+    Tests of the headless subcommands of main.py.
+    """
+
+    def setUp(self):
+        self.test_dir = "test_quizzes_cli"
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+        self.quiz = Quiz("Quiz CLI", questions=[
+            Question("Stolica Polski?", ["Kraków", "Warszawa"], 1),
+            MultiAnswerQuestion("Liczby parzyste?", ["2", "3", "4"], [0, 2]),
+            TextAnswerQuestion("Miasto włókniarzy?", ["Łódź"])])
+        QuizDataManager.save_quiz(self.quiz, "cli", self.test_dir, verbose=False)
+        os.makedirs(os.path.join(self.test_dir, "sheets"))
+        self.answers_path = os.path.join(self.test_dir, "sheets", "answers.json")
+        with open(self.answers_path, 'w', encoding='utf-8') as f:
+            json.dump([2, [1], "lodz"], f)
+
+    def tearDown(self):
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def run_main(self, *argv):
+        """Runs main() on the test directory and returns (exit code, decoded JSON output)."""
+        if argv[0] != "convert":
+            argv += ("--directory", self.test_dir)
+        with patch('sys.stdout', new_callable=StringIO) as mock_stdout, patch('sys.stderr', new_callable=StringIO):
+            exit_code = main.main(list(argv))
+        return exit_code, json.loads(mock_stdout.getvalue())
+
+    def test_list_and_show(self):
+        exit_code, output = self.run_main("list")
+        self.assertEqual(exit_code, 0)
+        self.assertEqual([entry["name"] for entry in output], ["cli"])
+        exit_code, output = self.run_main("show", "cli")
+        self.assertEqual(output["title"], "Quiz CLI")
+        self.assertEqual(output["fingerprint"], self.quiz.fingerprint())
+
+    def test_validate_sets_exit_code(self):
+        exit_code, output = self.run_main("validate")
+        self.assertEqual(exit_code, 0)
+        self.assertTrue(output["valid"])
+        with open(os.path.join(self.test_dir, "broken.json"), 'w', encoding='utf-8') as f:
+            f.write("{")
+        exit_code, output = self.run_main("validate")
+        self.assertEqual(exit_code, 1)
+        self.assertEqual([report["valid"] for report in output["quizzes"]], [False, True])
+
+    def test_grade(self):
+        exit_code, output = self.run_main("grade", "cli", "--answers", self.answers_path, "--scoring", "partial")
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(output["score"], 2.5)
+        self.assertEqual(output["correct"], 2)
+
+    def test_errors_are_reported_as_json(self):
+        exit_code, output = self.run_main("show", "brak")
+        self.assertEqual(exit_code, 1)
+        self.assertIn("error", output)
+        with open(os.path.join(self.test_dir, "bad.json"), 'w', encoding='utf-8') as f:
+            f.write("[1, 2]")
+        for argv in (("show", "bad"), ("grade", "bad", "--answers", self.answers_path)):
+            exit_code, output = self.run_main(*argv)
+            self.assertEqual(exit_code, 1)
+            self.assertIn("error", output)
+
+    def test_play_records_session(self):
+        with patch('quiz_player.player.QuizPlayer.record_session') as mock_record:
+            exit_code, output = self.run_main("play", "cli", "--answers", self.answers_path)
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(output["score"], 2)
+        args, kwargs = mock_record.call_args
+        self.assertEqual([answer["user_choice_index"] for answer in args[2]], [1, [0], "lodz"])
+        self.assertEqual(kwargs["fingerprint"], self.quiz.fingerprint())
+
+    def test_convert_round_trip(self):
+        csv_path = os.path.join(self.test_dir, "cli.csv")
+        json_path = os.path.join(self.test_dir, "out", "kopia.json")
+        self.run_main("convert", os.path.join(self.test_dir, "cli.json"), csv_path)
+        exit_code, output = self.run_main("convert", csv_path, json_path, "--title", "Quiz CLI")
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(output["questions"], 3)
+        copy = QuizDataManager.load_quiz("kopia", os.path.dirname(json_path), verbose=False)
+        self.assertEqual(copy.to_dict(), self.quiz.to_dict())
+
+
+class TestCsvFormat(unittest.TestCase):
+    """
+    Unit tests for the CSV quiz format.
+    """
+
+    def test_invalid_row_names_the_row(self):
+        path = "test_quiz_invalid.csv"
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("type,question_text,options,correct,patterns\nchoice,Q1,A,1,\nchoice,Q2,A,x,\n")
+        try:
+            with self.assertRaisesRegex(ValueError, "Row 3"):
+                read_quiz_csv(path, "Quiz")
+        finally:
+            os.remove(path)
+
+    def test_text_question_patterns(self):
+        path = "test_quiz_text.csv"
+        quiz = Quiz("Quiz", questions=[TextAnswerQuestion("Q", ["def"], [r"def\s*", "a|b"])])
+        try:
+            write_quiz_csv(quiz, path)
+            self.assertEqual(read_quiz_csv(path, "Quiz").to_dict(), quiz.to_dict())
+        finally:
+            os.remove(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+import unittest
+import os
+import sys
+import json
+import shutil
+from io import StringIO
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models.question import MultiAnswerQuestion, Question, TextAnswerQuestion
+from models.quiz import Quiz
+from quiz_data.manager import QuizDataManager
+from quiz_data.compiled import COMPILED_DIRECTORY_NAME, CompiledQuiz, QuizCompiler
+
+
+class TestQuizCompiler(unittest.TestCase):
+    """
+    Unit tests for compiling quizzes into play-ready artifacts and caching them on disk.
+    """
+
+    def setUp(self):
+        """Create a temporary directory with one saved quiz."""
+        self.test_dir = "test_quizzes_compiled"
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+        self.original_stdout = sys.stdout
+        sys.stdout = StringIO()
+        self.quiz = Quiz("Compiled", "Opis", [Question("Q1?", ["A", "B", "C"], 2), Question("Q2?", ["D", "E"], 0)])
+        QuizDataManager.save_quiz(self.quiz, "compiled_quiz", self.test_dir)
+        self.artifact_path = os.path.join(self.test_dir, COMPILED_DIRECTORY_NAME, "compiled_quiz.json")
+
+    def tearDown(self):
+        """Remove the temporary directory and restore stdout."""
+        sys.stdout = self.original_stdout
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_compile_matches_question_behaviour(self):
+        """Test that compiled blocks, grading and feedback match the Question objects."""
+        compiled = QuizCompiler.compile(self.quiz)
+        self.assertEqual(len(compiled), 2)
+        self.assertEqual(compiled.fingerprint, self.quiz.fingerprint())
+        for i, question in enumerate(self.quiz.questions):
+            self.assertEqual(compiled.display(i), question.display())
+            self.assertEqual(compiled.display(i, [1, 0]), question.display([1, 0]))
+            for answer in range(len(question.options)):
+                self.assertEqual(compiled.is_correct(i, 1 << answer), question.is_correct(answer))
+        self.assertEqual(compiled.feedback[0], "Niepoprawna odpowiedź. Poprawna to: C")
+        self.assertEqual(compiled.answer_key.typecode, 'B') # One byte per question
+
+    def test_compile_multi_answer_question(self):
+        """Test that multi-answer questions are compiled into bitmask keys."""
+        quiz = Quiz("Multi", "", [MultiAnswerQuestion("Parzyste?", ["1", "2", "3", "4"], [1, 3])])
+        compiled = QuizCompiler.compile(quiz)
+        self.assertEqual(compiled.answer_key[0], 0b1010)
+        self.assertEqual(compiled.multi_answer, (True,))
+        self.assertTrue(compiled.is_correct(0, 0b1010))
+        self.assertFalse(compiled.is_correct(0, 0b0010))
+        self.assertEqual(compiled.feedback[0], "Niepoprawna odpowiedź. Poprawne to: 2, 4")
+
+    def test_compile_text_answer_question(self):
+        """Test that free-text questions keep a working matcher through serialization."""
+        quiz = Quiz("Text", "", [TextAnswerQuestion("Miasto?", ["Łódź"], [r"lodz(ka)?"])])
+        compiled = CompiledQuiz.from_dict(json.loads(json.dumps(QuizCompiler.compile(quiz).to_dict())))
+        self.assertTrue(compiled.text_matchers[0].matches("LODZKA"))
+        self.assertEqual(compiled.display(0), "Pytanie: Miasto?\n")
+
+    def test_round_trip_dict(self):
+        """Test that an artifact survives serialization."""
+        compiled = QuizCompiler.compile(self.quiz)
+        restored = CompiledQuiz.from_dict(json.loads(json.dumps(compiled.to_dict())))
+        self.assertEqual(restored.to_dict(), compiled.to_dict())
+
+    def test_load_uses_cache_without_parsing(self):
+        """Test that a current artifact is served without loading the quiz again."""
+        first = QuizCompiler.load("compiled_quiz", self.test_dir)
+        self.assertTrue(os.path.exists(self.artifact_path))
+        with patch('quiz_data.compiled.QuizDataManager.load_quiz') as mock_load:
+            second = QuizCompiler.load("compiled_quiz", self.test_dir)
+            mock_load.assert_not_called()
+        self.assertEqual(second.to_dict(), first.to_dict())
+
+    def test_cache_invalidated_when_source_changes(self):
+        """Test that editing the quiz file makes the old artifact stale."""
+        QuizCompiler.load("compiled_quiz", self.test_dir)
+        self.quiz.add_question(Question("Q3?", ["F", "G"], 1))
+        QuizDataManager.save_quiz(self.quiz, "compiled_quiz", self.test_dir)
+        self.assertEqual(len(QuizCompiler.load("compiled_quiz", self.test_dir)), 3)
+
+    def test_non_dict_artifact_is_stale(self):
+        """Test that an artifact holding valid JSON of the wrong shape is recompiled."""
+        QuizCompiler.load("compiled_quiz", self.test_dir)
+        for content in ("[1, 2]", '"quiz"', "null"):
+            with open(self.artifact_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            self.assertEqual(len(QuizCompiler.load("compiled_quiz", self.test_dir)), 2)
+
+    def test_compile_cached_skips_file_changed_after_loading(self):
+        """Test that a quiz loaded before the file changed does not become the new file's artifact."""
+        source_path = os.path.join(self.test_dir, "compiled_quiz.json")
+        source_hash = QuizCompiler.source_hash(source_path)
+        changed = Quiz("Compiled", "Opis", self.quiz.questions + [Question("Q3?", ["F", "G"], 1)])
+        QuizDataManager.save_quiz(changed, "compiled_quiz", self.test_dir)
+        compiled = QuizCompiler.compile_cached(self.quiz, "compiled_quiz", self.test_dir, source_hash=source_hash)
+        self.assertEqual(len(compiled), 2)
+        self.assertFalse(os.path.exists(self.artifact_path))
+        self.assertEqual(len(QuizCompiler.load("compiled_quiz", self.test_dir)), 3)
+
+        QuizCompiler.compile_cached(changed, "compiled_quiz", self.test_dir,
+                                    source_hash=QuizCompiler.source_hash(source_path))
+        with patch('quiz_data.compiled.QuizDataManager.load_quiz') as mock_load:
+            self.assertEqual(len(QuizCompiler.load("compiled_quiz", self.test_dir)), 3)
+            mock_load.assert_not_called()
+
+    def test_compile_cached_without_source_file(self):
+        """Test that quizzes without a file are compiled in memory only."""
+        compiled = QuizCompiler.compile_cached(self.quiz, "missing_quiz", self.test_dir)
+        self.assertEqual(len(compiled), 2)
+        self.assertFalse(os.path.exists(os.path.join(self.test_dir, COMPILED_DIRECTORY_NAME, "missing_quiz.json")))
+
+    def test_load_missing_quiz_raises(self):
+        """Test that a missing source file raises FileNotFoundError like load_quiz()."""
+        with self.assertRaises(FileNotFoundError):
+            QuizCompiler.load("missing_quiz", self.test_dir)
+
+
+if __name__ == '__main__':
+    unittest.main()
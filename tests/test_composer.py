@@ -0,0 +1,96 @@
+import unittest
+import os
+import sys
+import shutil
+from io import StringIO
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models.question import Question
+from models.quiz import Quiz
+from quiz_data.manager import QuizDataManager
+from quiz_creator.composer import ExamComposer
+from quiz_creator.creator import QuizCreator
+
+
+class TestExamComposer(unittest.TestCase):
+    """
+    Unit tests for composing stratified exams from many quiz files.
+    """
+
+    def setUp(self):
+        """Create a temporary catalog with overlapping quizzes."""
+        self.test_dir = "test_quizzes_composer"
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+        os.makedirs(self.test_dir)
+        self.original_stdout = sys.stdout
+        sys.stdout = StringIO()
+
+        shared = Question("Stolica Polski?", ["Warszawa", "Kraków"], 0)
+        for n in range(3):
+            questions = [shared] + [Question(f"Geo {n}-{i}?", ["A", "B"], 0) for i in range(4)]
+            QuizDataManager.save_quiz(Quiz(f"Geografia {n}", questions=questions), f"geografia{n}", self.test_dir)
+        python_questions = [Question(f"Python {i}?", ["X", "Y", "Z"], 2) for i in range(10)]
+        QuizDataManager.save_quiz(Quiz("Python", questions=python_questions), "python", self.test_dir)
+
+    def tearDown(self):
+        """Remove the temporary catalog and restore stdout."""
+        sys.stdout = self.original_stdout
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_parse_spec(self):
+        """Test parsing of English and Polish specifications."""
+        self.assertEqual(ExamComposer.parse_spec("5 from geografia*, 10 z python"),
+                         [(5, "geografia*"), (10, "python")])
+        for invalid in ["", "five from python", "5 python"]:
+            with self.assertRaises(ValueError):
+                ExamComposer.parse_spec(invalid)
+
+    def test_compose_draws_per_stratum(self):
+        """Test that each stratum contributes the requested number of questions from its sources."""
+        exam = ExamComposer.compose("5 from geografia*, 3 from python", "Egzamin", directory=self.test_dir, seed=1)
+        texts = [q.question_text for q in exam.questions]
+        self.assertEqual(len(texts), 8)
+        self.assertTrue(all(t.startswith(("Geo", "Stolica")) for t in texts[:5]))
+        self.assertTrue(all(t.startswith("Python") for t in texts[5:]))
+        self.assertEqual(len(set(texts)), 8)
+
+    def test_compose_deduplicates_identical_questions(self):
+        """Test that a question repeated in several files is only counted once."""
+        # 3 files x 4 unique questions + 1 shared question = 13 distinct questions
+        exam = ExamComposer.compose("13 from geografia*", "Wszystko", directory=self.test_dir, seed=2)
+        self.assertEqual(len(exam.questions), 13)
+        with self.assertRaises(ValueError):
+            ExamComposer.compose("14 from geografia*", "Za dużo", directory=self.test_dir)
+
+    def test_compose_is_reproducible(self):
+        """Test that the same seed yields the same exam."""
+        first = ExamComposer.compose("4 from *", "A", directory=self.test_dir, seed=9)
+        second = ExamComposer.compose("4 from *", "A", directory=self.test_dir, seed=9)
+        self.assertEqual(first.to_dict(), second.to_dict())
+
+    def test_compose_unknown_pattern_raises(self):
+        """Test that a pattern matching no quizzes raises ValueError."""
+        with self.assertRaises(ValueError):
+            ExamComposer.compose("1 from historia*", "Brak", directory=self.test_dir)
+
+    @patch('quiz_data.manager.QuizDataManager.save_quiz')
+    @patch('builtins.input', side_effect=['2 from python', 'Mini egzamin', '5', 'mini_egzamin'])
+    def test_interactive_compose_exam(self, mock_input, mock_save_quiz):
+        """Test the interactive creator flow for composing an exam."""
+        real_load_quiz = QuizDataManager.load_quiz
+        with patch('quiz_creator.composer.QuizDataManager.list_available_quizzes', return_value=["python"]), \
+             patch('quiz_creator.composer.QuizDataManager.load_quiz',
+                   side_effect=lambda name, directory, verbose: real_load_quiz(name, self.test_dir, verbose)):
+            QuizCreator.compose_exam()
+        mock_save_quiz.assert_called_once()
+        saved_exam = mock_save_quiz.call_args[0][0]
+        self.assertEqual(saved_exam.title, "Mini egzamin")
+        self.assertEqual(len(saved_exam.questions), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
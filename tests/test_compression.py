@@ -0,0 +1,105 @@
+import unittest
+import os
+import sys
+import shutil
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models.question import Question
+from models.quiz import Quiz
+from quiz_creator.validator import QuizValidator
+from quiz_data import compression
+from quiz_data.manager import QuizDataManager
+
+
+class TestCompressedStorage(unittest.TestCase):
+    """
+    Tests of the compressed quiz storage with a preset dictionary.
+    """
+
+    def setUp(self):
+        self.test_dir = "test_compressed_quizzes"
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+        for number in range(4):
+            questions = [Question(f"Jaka jest stolica kraju numer {number}-{i}?", ["Warszawa", "Kraków", "Gdańsk"], i % 3)
+                         for i in range(5)]
+            QuizDataManager.save_quiz(Quiz(f"Geografia {number}", "Stolice państw", questions),
+                                      f"quiz{number}", self.test_dir, verbose=False)
+        open(os.path.join(self.test_dir, "empty.json"), 'w').close()
+
+    def tearDown(self):
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.test_dir, name + ".json")
+
+    def read(self, name: str) -> bytes:
+        with open(self.path(name), 'rb') as f:
+            return f.read()
+
+    def test_dictionary_holds_shared_fragments(self):
+        dictionary = compression.train_dictionary([self.read(f"quiz{number}") for number in range(4)])
+        self.assertIn(b'"question_text":', dictionary)
+        self.assertIn('"Kraków",'.encode('utf-8'), dictionary)
+        self.assertLessEqual(len(compression.train_dictionary([self.read("quiz0")], size=64)), 64)
+
+    def test_recompressed_catalog_loads_transparently(self):
+        plain = self.read("quiz1")
+        summary = compression.recompress_catalog(self.test_dir)
+        self.assertEqual((summary["quizzes"], summary["dictionary_version"]), (4, 1))
+        self.assertEqual([entry["quiz"] for entry in summary["skipped"]], ["empty"])
+        self.assertTrue(compression.is_compressed(self.read("quiz1")))
+        # Budżet pamięci podręcznej liczymy od rozmiaru treści JSON, nie pliku skompresowanego
+        self.assertEqual(compression.content_size(self.path("quiz1"), os.path.getsize(self.path("quiz1"))),
+                         len(plain))
+        self.assertLess(summary["stored_bytes"], summary["plain_bytes"])
+        # Słownik zmniejsza pliki bardziej niż sama kompresja każdego pliku osobno
+        self.assertLess(len(self.read("quiz1")), len(compression.compress(plain, self.test_dir, version=0)))
+
+        quiz = QuizDataManager.load_quiz("quiz1", self.test_dir, verbose=False)
+        self.assertEqual(quiz.title, "Geografia 1")
+        self.assertEqual(QuizValidator.validate_file(self.path("quiz1")), ([], []))
+
+        compression.recompress_catalog(self.test_dir, compressed=False)
+        self.assertEqual(self.read("quiz1"), plain) # Treść JSON bez zmian co do bajtu
+
+    def test_old_files_stay_readable_after_retraining(self):
+        compression.recompress_catalog(self.test_dir)
+        old_content = self.read("quiz2")
+        compression.recompress_catalog(self.test_dir)
+        self.assertEqual(compression.dictionary_versions(self.test_dir), [1, 2])
+        with open(self.path("quiz2"), 'wb') as f:
+            f.write(old_content) # Plik skompresowany pierwszą wersją słownika
+        self.assertEqual(QuizDataManager.load_quiz("quiz2", self.test_dir, verbose=False).title, "Geografia 2")
+
+    def test_save_quiz_compresses_when_enabled(self):
+        compression.recompress_catalog(self.test_dir)
+        quiz = Quiz("Nowy", "", [Question("Jaka jest stolica Polski?", ["Warszawa", "Kraków"], 0)])
+        with patch('quiz_data.manager.COMPRESSION_ENABLED', True):
+            QuizDataManager.save_quiz(quiz, "nowy", self.test_dir, verbose=False)
+        self.assertEqual(self.read("nowy")[:3], compression.MAGIC)
+        self.assertEqual(QuizDataManager.load_quiz("nowy", self.test_dir, verbose=False).questions[0].options,
+                         ["Warszawa", "Kraków"])
+
+    def test_dictionary_is_read_once(self):
+        compression.recompress_catalog(self.test_dir)
+        compression.load_dictionary(self.test_dir, 1)
+        with patch('builtins.open', side_effect=AssertionError("dictionary read again")):
+            compression.load_dictionary(self.test_dir, 1)
+
+    def test_corrupt_compressed_file(self):
+        compression.recompress_catalog(self.test_dir)
+        truncated = self.read("quiz3")[:20]
+        with open(self.path("quiz3"), 'wb') as f:
+            f.write(truncated)
+        with self.assertRaises(ValueError), patch('sys.stdout'):
+            QuizDataManager.load_quiz("quiz3", self.test_dir, verbose=False)
+        errors, _ = QuizValidator.validate_file(self.path("quiz3"))
+        self.assertIn("Cannot read file", errors[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
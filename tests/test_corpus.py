@@ -0,0 +1,65 @@
+import unittest
+import os
+import sys
+import shutil
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.corpus import CorpusSpec, generate_corpus, generate_quiz
+from quiz_creator.validator import QuizValidator
+from quiz_data.manager import QuizDataManager
+
+
+class TestCorpusGenerator(unittest.TestCase):
+    """
+    Unit tests for the synthetic corpus generator.
+    """
+
+    def setUp(self):
+        self.test_dirs = ["test_corpus_a", "test_corpus_b"]
+        for directory in self.test_dirs:
+            if os.path.exists(directory):
+                shutil.rmtree(directory)
+
+    def tearDown(self):
+        for directory in self.test_dirs:
+            if os.path.exists(directory):
+                shutil.rmtree(directory)
+
+    def test_same_seed_same_corpus_for_any_worker_count(self):
+        spec = CorpusSpec(seed=3, quizzes=6, questions=20)
+        first = generate_corpus(spec, self.test_dirs[0], workers=1)
+        second = generate_corpus(spec, self.test_dirs[1], workers=2)
+        self.assertEqual(first["digest"], second["digest"])
+        self.assertEqual(first["files"], 6)
+        self.assertEqual(first["questions"], 120)
+        self.assertNotEqual(generate_quiz(CorpusSpec(seed=4), 0).to_dict(), generate_quiz(CorpusSpec(seed=3), 0).to_dict())
+
+    def test_files_are_valid_quizzes(self):
+        spec = CorpusSpec(quizzes=2, questions=50, multi_ratio=0.3, text_ratio=0.3)
+        generate_corpus(spec, self.test_dirs[0], workers=1)
+        self.assertEqual(QuizDataManager.list_available_quizzes(self.test_dirs[0]), ["quiz_0000", "quiz_0001"])
+        for name in ("quiz_0000", "quiz_0001"):
+            errors, _ = QuizValidator.validate_file(os.path.join(self.test_dirs[0], name + ".json"))
+            self.assertEqual(errors, [])
+        quiz = QuizDataManager.load_quiz("quiz_0000", self.test_dirs[0], verbose=False)
+        self.assertTrue(any(q.is_multi_answer for q in quiz.questions))
+        self.assertTrue(any(q.is_text_answer for q in quiz.questions))
+
+    def test_duplicates_and_ascii(self):
+        spec = CorpusSpec(quizzes=1, questions=300, duplicate_ratio=0.5, polish=False)
+        quiz = generate_quiz(spec, 0)
+        pooled = [q.question_text for q in quiz.questions if q.question_text.startswith("[")]
+        self.assertTrue(100 < len(pooled) < 200)
+        text = str(quiz.to_dict())
+        self.assertFalse(any(char in text for char in "ąćęłńóśźż"))
+
+    def test_invalid_spec(self):
+        with self.assertRaises(ValueError):
+            CorpusSpec(min_options=5, max_options=3)
+        with self.assertRaises(ValueError):
+            CorpusSpec(multi_ratio=0.7, text_ratio=0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
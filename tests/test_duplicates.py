@@ -0,0 +1,114 @@
+import unittest
+import os
+import sys
+import shutil
+from io import StringIO
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models.question import Question
+from models.quiz import Quiz
+from quiz_data.manager import QuizDataManager
+from quiz_creator.creator import QuizCreator
+from quiz_search.duplicates import NearDuplicateDetector
+from quiz_search.index import QuestionIndex
+
+
+class TestNearDuplicateDetector(unittest.TestCase):
+    """
+    Unit tests for MinHash/LSH near-duplicate question detection.
+    """
+
+    def setUp(self):
+        """Redirect stdout and prepare a few questions."""
+        self.original_stdout = sys.stdout
+        sys.stdout = StringIO()
+        self.test_dir = "test_quizzes_duplicates"
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+        self.capital = Question("Jakie miasto jest stolicą Polski?", ["Kraków", "Warszawa", "Gdańsk"], 1)
+        self.reworded = Question("Jakie miasto to stolica Polski?", ["Kraków", "Warszawa", "Gdańsk"], 1)
+        self.river = Question("Jak nazywa się najdłuższa rzeka w Polsce?", ["Wisła", "Odra"], 0)
+
+    def tearDown(self):
+        """Restore stdout and remove the temporary catalog."""
+        sys.stdout = self.original_stdout
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_signature_is_deterministic(self):
+        """Test that equal questions get equal signatures and similarity 1."""
+        detector = NearDuplicateDetector()
+        first, second = detector.signature(self.capital), detector.signature(self.capital)
+        self.assertEqual(first, second)
+        self.assertEqual(len(first), 64)
+        self.assertEqual(detector.similarity(first, second), 1.0)
+
+    def test_find_duplicates(self):
+        """Test that a reworded question is flagged and an unrelated one is not."""
+        detector = NearDuplicateDetector()
+        detector.add(("geografia", 0), self.capital)
+        detector.add(("geografia2", 0), self.river)
+        duplicates = detector.find_duplicates(self.reworded)
+        self.assertEqual([key for key, _, _ in duplicates], [("geografia", 0)])
+        self.assertEqual(detector.find_duplicates(Question("Ile to 2+2?", ["3", "4"], 1)), [])
+
+    def test_clusters(self):
+        """Test that near copies form one cluster and unique questions are omitted."""
+        detector = NearDuplicateDetector()
+        detector.add(("a", 0), self.capital)
+        detector.add(("b", 0), self.reworded)
+        detector.add(("c", 0), self.capital)
+        detector.add(("d", 0), self.river)
+        self.assertEqual(detector.clusters(), [[("a", 0), ("b", 0), ("c", 0)]])
+
+    def test_clusters_are_transitive_within_a_bucket(self):
+        """Test that a question similar to several groups of one bucket joins all of them."""
+        detector = NearDuplicateDetector(num_perm=6, bands=3, threshold=0.5)
+        # A~B i B~C, ale nie A~C; jedynym wspólnym pasmem jest pierwsze, wspólne dla wszystkich trzech
+        signatures = {"A": (1, 2, 3, 4, 5, 6), "C": (1, 2, 30, 40, 50, 60), "B": (1, 2, 30, 4, 50, 99)}
+        with patch.object(detector, 'signature', side_effect=lambda question: signatures[question]):
+            for key in signatures:
+                detector.add(key, key, label=key)
+        self.assertEqual(detector.clusters(), [["A", "B", "C"]])
+
+    def test_catalog_is_looked_up_in_the_index(self):
+        """Test that stored signatures are used without loading the catalog again."""
+        QuizDataManager.save_quiz(Quiz("Geografia", questions=[self.capital, self.river]), "geografia", self.test_dir)
+        QuizDataManager.save_quiz(Quiz("Kopia", questions=[self.reworded]), "kopia", self.test_dir)
+        with QuestionIndex(self.test_dir) as index, \
+                patch('quiz_data.manager.QuizDataManager.load_quiz', side_effect=AssertionError("catalog loaded")):
+            detector = NearDuplicateDetector(index=index)
+            self.assertEqual([key for key, _, _ in detector.find_duplicates(self.reworded)],
+                             [("geografia", 0), ("kopia", 0)])
+            self.assertEqual(detector.clusters(), [[("geografia", 0), ("kopia", 0)]])
+            self.assertEqual(detector.label(("geografia", 1)), self.river.question_text)
+        # Zapis quizu zastępuje sygnatury jego pytań
+        QuizDataManager.save_quiz(Quiz("Kopia", questions=[Question("Ile to 2+2?", ["3", "4"], 1)]),
+                                  "kopia", self.test_dir)
+        with QuestionIndex(self.test_dir) as index:
+            self.assertEqual(NearDuplicateDetector(index=index).clusters(), [])
+        with self.assertRaises(ValueError):
+            NearDuplicateDetector(num_perm=32, index=index)
+
+    def test_invalid_parameters_raise_error(self):
+        """Test validation of the LSH parameters."""
+        with self.assertRaises(ValueError):
+            NearDuplicateDetector(num_perm=64, bands=10)
+        with self.assertRaises(ValueError):
+            NearDuplicateDetector(threshold=0)
+
+    def test_creator_warns_about_catalog_duplicates(self):
+        """Test that the creator flags a new question that duplicates a catalog question."""
+        QuizDataManager.save_quiz(Quiz("Geografia", questions=[self.capital]), "geografia", self.test_dir)
+        quiz = Quiz("Nowy", questions=[self.reworded])
+        detector = QuizCreator._warn_near_duplicates(self.reworded, quiz, directory=self.test_dir)
+        output = sys.stdout.getvalue()
+        self.assertIn("Uwaga: to pytanie jest bardzo podobne do:", output)
+        self.assertIn("[geografia] Jakie miasto jest stolicą Polski?", output)
+        self.assertEqual(len(detector), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,11 +9,13 @@ import matplotlib.pyplot as plt
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from models.question import Question
+from models.question import MultiAnswerQuestion, Question, TextAnswerQuestion
 from models.quiz import Quiz
+from quiz_data.compiled import QuizCompiler
 from quiz_data.manager import QuizDataManager
 from quiz_creator.creator import QuizCreator
 from quiz_player.player import QuizPlayer
+from utils.permutation import FeistelPermutation
 
 class TestQuizCreator(unittest.TestCase):
     """
@@ -37,6 +39,12 @@ class TestQuizCreator(unittest.TestCase):
         self.patcher_save = patch('quiz_data.manager.QuizDataManager.save_quiz')
         self.mock_save_quiz = self.patcher_save.start()
 
+        # Patch the similar-question lookup so tests do not index the real quiz catalog
+        self.patcher_similar = patch('quiz_creator.creator.QuizCreator._show_similar_questions', return_value=None)
+        self.mock_show_similar = self.patcher_similar.start()
+        self.patcher_duplicates = patch('quiz_creator.creator.QuizCreator._warn_near_duplicates', return_value=None)
+        self.mock_warn_duplicates = self.patcher_duplicates.start()
+
         # Redirect stdout to capture print statements
         self.held_output = StringIO()
         self.original_stdout = sys.stdout
@@ -51,6 +59,8 @@ class TestQuizCreator(unittest.TestCase):
         if os.path.exists(self.test_dir):
             shutil.rmtree(self.test_dir)
         self.patcher_save.stop() # Stop the patcher
+        self.patcher_similar.stop()
+        self.patcher_duplicates.stop()
 
         # Restore stdout
         sys.stdout = self.original_stdout
@@ -215,6 +225,14 @@ class TestQuizPlayer(unittest.TestCase):
         self.patcher_chart_gen = patch('quiz_player.player.QuizPlayer.generate_and_save_results_chart')
         self.mock_chart_gen = self.patcher_chart_gen.start()
 
+        # Patch QuizPlayer.record_session so tests do not write to the real results log
+        self.patcher_record = patch('quiz_player.player.QuizPlayer.record_session')
+        self.mock_record_session = self.patcher_record.start()
+
+        # Patch the background refresh of compiled artifacts so only the player loads the quiz
+        self.patcher_prefetch = patch('quiz_player.player.QuizPlayer._prefetch_listing')
+        self.patcher_prefetch.start()
+
         # Redirect stdout to capture print statements
         self.held_output = StringIO()
         self.original_stdout = sys.stdout
@@ -233,6 +251,8 @@ class TestQuizPlayer(unittest.TestCase):
         self.patcher_list.stop()
         self.patcher_load.stop()
         self.patcher_chart_gen.stop()
+        self.patcher_record.stop()
+        self.patcher_prefetch.stop()
 
         # Restore stdout
         sys.stdout = self.original_stdout
@@ -250,7 +270,9 @@ class TestQuizPlayer(unittest.TestCase):
 
         # Verify load and list methods were called
         self.mock_list_quizzes.assert_called_once()
-        self.mock_load_quiz.assert_called_once_with(os.path.splitext(self.sample_quiz_filename)[0])
+        # The source is parsed only by QuizCompiler.load, because no compiled artifact exists yet
+        self.mock_load_quiz.assert_called_once_with(os.path.splitext(self.sample_quiz_filename)[0],
+                                                    "data/quiz_examples", verbose=False)
 
         # Verify correct print statements
         output = self.held_output.getvalue()
@@ -261,6 +283,15 @@ class TestQuizPlayer(unittest.TestCase):
         # Verify chart generation mock was called with correct arguments
         self.mock_chart_gen.assert_called_once_with(2, 0, "Player Test Quiz")
 
+        # Verify the finished session was passed on to the results log
+        self.mock_record_session.assert_called_once()
+        args, kwargs = self.mock_record_session.call_args
+        self.assertIsNone(args[0]) # The compiled quiz carries the fingerprint instead
+        self.assertEqual(kwargs["fingerprint"], self.sample_quiz.fingerprint())
+        self.assertEqual(args[1], "player_test_quiz")
+        self.assertEqual([ans["user_choice_index"] for ans in args[2]], [0, 1])
+        self.assertLessEqual(args[3], args[4]) # started_at <= finished_at
+
 
     @patch('builtins.input', side_effect=['1', # Select the only available quiz (1 input)
                                           '2', # Answer to Q1 (incorrect) (1 input)
@@ -290,6 +321,19 @@ class TestQuizPlayer(unittest.TestCase):
         self.assertIn("Nieprawidłowy numer. Wpisz numer z listy.", output)
         self.mock_load_quiz.assert_called_once() # Should still load after retry
 
+    @patch('builtins.input', side_effect=['1', '1', '2'])
+    def test_play_quiz_from_compiled_artifact(self, mock_input):
+        """
+        Test that the player plays the compiled artifact without parsing the quiz source.
+        """
+        with patch('quiz_data.compiled.QuizCompiler.load',
+                   return_value=QuizCompiler.compile(self.sample_quiz)) as mock_compiled_load:
+            QuizPlayer.play_quiz()
+        mock_compiled_load.assert_called_once_with("player_test_quiz")
+        self.mock_load_quiz.assert_not_called()
+        self.assertIn("Twój wynik: 2/2 poprawnych odpowiedzi.", self.held_output.getvalue())
+        self.mock_chart_gen.assert_called_once_with(2, 0, "Player Test Quiz")
+
     @patch('builtins.input', side_effect=['1', # Select quiz (1 input)
                                           '99', '1', # Invalid answer index, then valid (2 inputs)
                                           '2']) # Answer Q2 (1 input)
@@ -303,6 +347,88 @@ class TestQuizPlayer(unittest.TestCase):
         # Ensure the quiz continued and was ultimately saved/processed
         self.mock_chart_gen.assert_called_once()
 
+    @patch('builtins.input', side_effect=['1', # Select quiz (1 input)
+                                          '0', '1', # Invalid count, then 1 question (2 inputs)
+                                          '1']) # Answer the drawn question (1 input)
+    def test_play_quiz_random_mode(self, mock_input):
+        """
+        Test random mode: a single question is drawn and the draw is reproducible from the seed.
+        """
+        QuizPlayer.play_quiz(random_mode=True, seed=7)
+        output = self.held_output.getvalue()
+        self.assertIn("Nieprawidłowa liczba pytań.", output)
+        self.assertIn("Wylosowano 1 z 2 pytań (ziarno losowania: 7).", output)
+        self.assertIn("--- Pytanie 1/1 ---", output)
+        self.assertNotIn("--- Pytanie 2/", output)
+
+        args, kwargs = self.mock_record_session.call_args
+        drawn_index = args[2][0]["question_index"]
+        self.assertEqual(QuizPlayer._draw_question_indices(2, 1, seed=7), [drawn_index])
+
+    def test_play_quiz_multi_answer_partial_credit(self):
+        """
+        Test a multi-answer question graded with partial credit.
+        """
+        multi_quiz = Quiz("Multi Quiz", questions=[MultiAnswerQuestion("Parzyste?", ["1", "2", "3", "4"], [1, 3]),
+                                                   Question("Q2?", ["C", "D"], 1)])
+        self.mock_load_quiz.return_value = multi_quiz
+        with patch('builtins.input', side_effect=['1', # Select quiz
+                                                  '2', # Only one of the two correct options
+                                                  '2']) as mock_input: # Answer Q2 (correct)
+            QuizPlayer.play_quiz(scoring="partial")
+
+        output = self.held_output.getvalue()
+        self.assertIn("przecinkami", mock_input.call_args_list[1][0][0]) # Multi-answer prompt
+        self.assertIn("Niepoprawna odpowiedź. Poprawne to: 2, 4", output)
+        self.assertIn("Punkty za to pytanie: 0.5", output)
+        self.assertIn("Twój wynik: 1.5/2 poprawnych odpowiedzi.", output)
+        self.mock_chart_gen.assert_called_once_with(1.5, 0.5, "Multi Quiz")
+        args, kwargs = self.mock_record_session.call_args
+        self.assertEqual([ans["user_choice_index"] for ans in args[2]], [[1], 1])
+        self.assertEqual(kwargs["scoring"], "partial")
+
+    def test_play_quiz_text_answer(self):
+        """
+        Test a free-text question: empty input is rejected and answers are normalized.
+        """
+        text_quiz = Quiz("Text Quiz", questions=[TextAnswerQuestion("Słowo kluczowe funkcji?", ["def"]),
+                                                 TextAnswerQuestion("Miasto?", ["Łódź"])])
+        self.mock_load_quiz.return_value = text_quiz
+        with patch('builtins.input', side_effect=['1', '', ' DEF ', 'Krakow']):
+            QuizPlayer.play_quiz()
+
+        output = self.held_output.getvalue()
+        self.assertIn("Odpowiedź nie może być pusta.", output)
+        self.assertIn("Niepoprawna odpowiedź. Poprawna to: Łódź", output)
+        self.assertIn("Twój wynik: 1/2 poprawnych odpowiedzi.", output)
+        args, kwargs = self.mock_record_session.call_args
+        self.assertEqual([ans["user_choice_index"] for ans in args[2]], ["DEF", "Krakow"])
+
+    def test_play_quiz_shuffled_session(self):
+        """
+        Test that a shuffled session maps displayed positions back to the original answers.
+        """
+        shuffle_seed = 1234
+        question_order = FeistelPermutation(2, (shuffle_seed, "questions"))
+        # Pick the displayed position of the correct option of each question, in the shuffled order
+        answers = ['1']
+        for i in question_order:
+            question = self.sample_quiz.questions[i]
+            option_order = FeistelPermutation(len(question.options), (shuffle_seed, "options", i))
+            answers.append(str(option_order.index(question.correct_answer_index) + 1))
+
+        with patch('builtins.input', side_effect=answers):
+            QuizPlayer.play_quiz(shuffle_seed=shuffle_seed)
+
+        output = self.held_output.getvalue()
+        self.assertIn("Twój wynik: 2/2 poprawnych odpowiedzi.", output)
+        self.assertIn("ziarno sesji: 1234", output)
+        args, kwargs = self.mock_record_session.call_args
+        self.assertEqual([ans["question_index"] for ans in args[2]], list(question_order))
+        self.assertEqual([ans["user_choice_index"] for ans in args[2]],
+                         [self.sample_quiz.questions[i].correct_answer_index for i in question_order])
+        self.assertEqual(kwargs["shuffle_seed"], shuffle_seed)
+
     @patch('quiz_data.manager.QuizDataManager.list_available_quizzes', return_value=[])
     def test_play_quiz_no_quizzes_available(self, mock_list_quizzes):
         """
@@ -0,0 +1,110 @@
+import unittest
+import os
+import sys
+import json
+import shutil
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.metrics import Histogram, MetricsRegistry
+
+
+class TestHistogram(unittest.TestCase):
+    """
+    Unit tests for the fixed-bucket histogram.
+    """
+
+    def test_quantiles_within_bucket_width(self):
+        """Quantile estimates fall into the bucket of the exact quantile."""
+        histogram = Histogram(bounds=(1, 2, 3, 4, 5, 6, 7, 8, 9, 10))
+        for value in range(1, 101):
+            histogram.observe(value / 10) # 0.1 .. 10.0
+        self.assertEqual(histogram.count, 100)
+        self.assertAlmostEqual(histogram.quantile(0.5), 5.0)
+        self.assertTrue(9 <= histogram.quantile(0.95) <= 10)
+        self.assertTrue(9 <= histogram.quantile(0.99) <= 10)
+
+    def test_overflow_bucket_uses_maximum(self):
+        histogram = Histogram(bounds=(1,))
+        histogram.observe(0.5)
+        histogram.observe(40)
+        self.assertTrue(1 < histogram.quantile(0.99) <= 40)
+        self.assertEqual(histogram.quantile(1.0), 40)
+        self.assertEqual(histogram.snapshot()["buckets"], [[1, 1], [float("inf"), 2]])
+
+    def test_empty_and_invalid(self):
+        self.assertIsNone(Histogram().quantile(0.5))
+        with self.assertRaises(ValueError):
+            Histogram(bounds=(2, 1))
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    """
+    Unit tests for MetricsRegistry.
+    """
+
+    def setUp(self):
+        self.registry = MetricsRegistry()
+        self.test_dir = "test_metrics_export"
+
+    def tearDown(self):
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_disabled_registry_leaves_functions_untouched(self):
+        registry = MetricsRegistry(enabled=False)
+
+        def load():
+            return 1
+
+        self.assertIs(registry.timed("load")(load), load)
+        with registry.timer("load"):
+            pass
+        self.assertEqual(registry.snapshot(), {})
+
+    def test_timed_records_calls_and_errors(self):
+        @self.registry.timed()
+        def load_quiz(fail=False):
+            if fail:
+                raise ValueError("broken")
+            return "quiz"
+
+        self.assertEqual(load_quiz(), "quiz")
+        with self.assertRaises(ValueError):
+            load_quiz(fail=True)
+        snapshot = self.registry.snapshot()
+        self.assertEqual(snapshot["quiz_operation_seconds"][0]["labels"], {"operation": "load_quiz"})
+        self.assertEqual(snapshot["quiz_operation_seconds"][0]["count"], 2)
+        self.assertEqual(snapshot["quiz_operation_errors_total"][0]["value"], 1)
+        self.assertIsNotNone(snapshot["quiz_operation_seconds"][0]["p99"])
+
+    def test_metric_kind_conflict(self):
+        self.registry.counter("quiz_sessions_total")
+        with self.assertRaises(ValueError):
+            self.registry.gauge("quiz_sessions_total")
+
+    def test_prometheus_format(self):
+        self.registry.counter("quiz_saved_total", "Saved quizzes.").inc(3)
+        with self.registry.timer("save_quiz"):
+            pass
+        text = self.registry.to_prometheus()
+        self.assertIn("# HELP quiz_saved_total Saved quizzes.\n# TYPE quiz_saved_total counter\nquiz_saved_total 3\n",
+                      text)
+        self.assertIn('quiz_operation_seconds_bucket{operation="save_quiz",le="+Inf"} 1\n', text)
+        self.assertIn('quiz_operation_seconds_count{operation="save_quiz"} 1\n', text)
+
+    def test_export_writes_both_files(self):
+        self.registry.gauge("quiz_charts_pending").set(2)
+        with self.registry.timer("grade_answers"):
+            pass
+        prometheus_path, snapshot_path = self.registry.export(self.test_dir)
+        with open(snapshot_path, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+        self.assertEqual(snapshot["quiz_charts_pending"][0]["value"], 2)
+        self.assertIsNone(snapshot["quiz_operation_seconds"][0]["buckets"][-1][0]) # +Inf
+        with open(prometheus_path, 'r', encoding='utf-8') as f:
+            self.assertIn("quiz_charts_pending 2", f.read())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,7 +5,7 @@ import os
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from models.question import Question
+from models.question import MultiAnswerQuestion, Question, TextAnswerQuestion
 from models.quiz import Quiz
 
 class TestQuestion(unittest.TestCase):
@@ -56,6 +56,12 @@ class TestQuestion(unittest.TestCase):
         expected_display = "Pytanie: What is the capital of France?\n  1. Berlin\n  2. Paris\n  3. Rome\n"
         self.assertEqual(question.display(), expected_display)
 
+    def test_question_display_with_option_order(self):
+        """Test that display() can present options in a shuffled order."""
+        question = Question("What is the capital of France?", ["Berlin", "Paris", "Rome"], 1)
+        expected_display = "Pytanie: What is the capital of France?\n  1. Rome\n  2. Berlin\n  3. Paris\n"
+        self.assertEqual(question.display([2, 0, 1]), expected_display)
+
     def test_question_is_correct(self):
         """Test the is_correct method for correct and incorrect answers."""
         question = Question("What is 2+2?", ["3", "4", "5"], 1)
@@ -93,6 +99,70 @@ class TestQuestion(unittest.TestCase):
         with self.assertRaises(KeyError):
             Question.from_dict({"question_text": "Q", "options": ["a"]})
 
+class TestMultiAnswerQuestion(unittest.TestCase):
+    """
+    Unit tests for the MultiAnswerQuestion class and its bitmask answer key.
+    """
+
+    def test_multi_answer_mask_and_is_correct(self):
+        """Test that the correct set is stored as a bitmask and graded exactly."""
+        question = MultiAnswerQuestion("Liczby pierwsze?", ["2", "4", "5", "9"], [2, 0])
+        self.assertEqual(question.correct_mask, 0b0101)
+        self.assertEqual(question.correct_answer_indices, [0, 2])
+        self.assertTrue(question.is_correct([0, 2]))
+        self.assertFalse(question.is_correct([0]))
+        self.assertFalse(question.is_correct([0, 1, 2]))
+        self.assertEqual(Question("Q?", ["a", "b"], 1).correct_mask, 0b10)
+
+    def test_multi_answer_invalid_indices_raise_error(self):
+        """Test validation of the correct answer indices."""
+        with self.assertRaises(ValueError):
+            MultiAnswerQuestion("Q?", ["a", "b"], [])
+        with self.assertRaises(ValueError):
+            MultiAnswerQuestion("Q?", ["a", "b"], [0, 2])
+
+    def test_multi_answer_to_dict_from_dict(self):
+        """Test that multi-answer questions round-trip and single-index data still loads."""
+        question = MultiAnswerQuestion("Q?", ["a", "b", "c"], [0, 1])
+        data = question.to_dict()
+        self.assertEqual(data["correct_answer_indices"], [0, 1])
+        restored = Question.from_dict(data)
+        self.assertIsInstance(restored, MultiAnswerQuestion)
+        self.assertEqual(restored.correct_mask, question.correct_mask)
+        single = Question.from_dict({"question_text": "Q?", "options": ["a", "b"], "correct_answer_index": 1})
+        self.assertNotIsInstance(single, MultiAnswerQuestion)
+
+
+class TestTextAnswerQuestion(unittest.TestCase):
+    """
+    Unit tests for the TextAnswerQuestion class.
+    """
+
+    def test_text_answer_grading_and_display(self):
+        """Test normalized grading and that accepted answers are not displayed."""
+        question = TextAnswerQuestion("Słowo kluczowe funkcji?", ["def"], [r"def\s*\(?"])
+        self.assertTrue(question.is_correct(" DEF "))
+        self.assertTrue(question.is_correct("def("))
+        self.assertFalse(question.is_correct("function"))
+        self.assertEqual(question.display(), "Pytanie: Słowo kluczowe funkcji?\n")
+
+    def test_text_answer_to_dict_from_dict(self):
+        """Test serialization with the "text" type marker."""
+        question = TextAnswerQuestion("Stolica?", ["Warszawa"])
+        data = question.to_dict()
+        self.assertEqual(data["type"], "text")
+        restored = Question.from_dict(data)
+        self.assertIsInstance(restored, TextAnswerQuestion)
+        self.assertTrue(restored.is_correct("warszawa"))
+
+    def test_text_answer_invalid_data_raises_error(self):
+        """Test validation of accepted answers and patterns."""
+        with self.assertRaises(ValueError):
+            TextAnswerQuestion("Q?", [])
+        with self.assertRaises(ValueError):
+            TextAnswerQuestion("Q?", ["a"], ["("])
+
+
 class TestQuiz(unittest.TestCase):
     """
     Unit tests for the Quiz class.
@@ -187,6 +257,15 @@ class TestQuiz(unittest.TestCase):
         self.assertEqual(reconstructed_quiz.questions[0].question_text, original_quiz.questions[0].question_text)
         self.assertEqual(reconstructed_quiz.questions[1].correct_answer_index, original_quiz.questions[1].correct_answer_index)
 
+    def test_quiz_fingerprint(self):
+        """Test that the fingerprint is stable for equal content and changes after an edit."""
+        quiz = Quiz("My Test Quiz", questions=[self.q1, self.q2])
+        same_quiz = Quiz.from_dict(quiz.to_dict())
+        self.assertEqual(len(quiz.fingerprint()), 16)
+        self.assertEqual(quiz.fingerprint(), same_quiz.fingerprint())
+        same_quiz.remove_question(0)
+        self.assertNotEqual(quiz.fingerprint(), same_quiz.fingerprint())
+
 
 # --- Przykład Dziedziczenia w testach ---
 
@@ -0,0 +1,87 @@
+import unittest
+import os
+import sys
+from io import StringIO
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models.question import Question
+from models.quiz import Quiz
+from quiz_creator.navigator import QuestionNavigator
+
+
+class TestQuestionNavigator(unittest.TestCase):
+    """
+    Unit tests for paged navigation, search and batch deletion in the quiz editor.
+    """
+
+    def setUp(self):
+        """Create a quiz with many questions and capture stdout."""
+        texts = [f"Pytanie numer {i} o geografii" if i % 3 == 0 else f"Pytanie numer {i} o Pythonie"
+                 for i in range(60)]
+        texts[7] = "Jaka jest stolica Polski?"
+        self.quiz = Quiz("Duży quiz", questions=[Question(text, ["a", "b"], 0) for text in texts])
+        self.navigator = QuestionNavigator(self.quiz)
+        self.original_stdout = sys.stdout
+        sys.stdout = self.held_output = StringIO()
+
+    def tearDown(self):
+        """Restore stdout."""
+        sys.stdout = self.original_stdout
+
+    def test_search_substring_and_prefix(self):
+        """Test substring search (folded) and word-prefix search for short queries."""
+        self.assertEqual(self.navigator.search("STOLICĄ"), [7])
+        self.assertEqual(self.navigator.search("stolica pol"), [7])
+        self.assertEqual(self.navigator.search("geograf"), [i for i in range(60) if i % 3 == 0])
+        self.assertEqual(self.navigator.search("st"), [7])
+        self.assertEqual(self.navigator.search(""), [])
+
+    def test_index_follows_edits_and_deletions(self):
+        """Test that edits and deletions keep search results and positions correct."""
+        question = self.quiz.questions[7]
+        question.question_text = "Jak nazywa się najdłuższa rzeka?"
+        self.navigator.replace(question, question)
+        self.assertEqual(self.navigator.search("stolica"), [])
+        self.assertEqual(self.navigator.search("rzeka"), [7])
+
+        removed = self.quiz.questions[0]
+        self.quiz.remove_question(0)
+        self.navigator.removed([removed])
+        self.assertEqual(self.navigator.search("rzeka"), [6])
+
+    def test_delete_matching(self):
+        """Test deleting all matching questions at once."""
+        self.assertEqual(self.navigator.delete_matching("geografii"), 20)
+        self.assertEqual(len(self.quiz.questions), 40)
+        self.assertEqual(self.navigator.search("geografii"), [])
+        self.assertEqual(self.navigator.search("stolica"), [4])
+
+    def test_select_pages_and_searches(self):
+        """Test paging, searching and selecting in a large quiz."""
+        with patch('builtins.input', side_effect=['n', '/stolica', '8']):
+            self.assertEqual(self.navigator.select("Wpisz numer pytania"), 7)
+        output = self.held_output.getvalue()
+        self.assertIn("strona 2/6", output)
+        self.assertIn("  8. Jaka jest stolica Polski?", output)
+        self.assertNotIn("Pytanie numer 25 ", output) # Pages 3-6 were never printed
+
+        with patch('builtins.input', side_effect=['']):
+            self.assertIsNone(self.navigator.select("Wpisz numer pytania"))
+        with patch('builtins.input', side_effect=['999']):
+            self.assertIsNone(self.navigator.select("Wpisz numer pytania"))
+        self.assertIn("Nieprawidłowy numer pytania.", self.held_output.getvalue())
+
+    def test_select_small_quiz_lists_all(self):
+        """Test that small quizzes are listed in full as before."""
+        navigator = QuestionNavigator(Quiz("Mały", questions=[Question("Q1?", ["a", "b"], 0)]))
+        with patch('builtins.input', side_effect=['x']):
+            self.assertIsNone(navigator.select("Wpisz numer pytania"))
+        output = self.held_output.getvalue()
+        self.assertIn("  1. Q1?", output)
+        self.assertIn("To nie jest liczba. Wpisz numer pytania.", output)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.permutation import FeistelPermutation
+
+
+class TestFeistelPermutation(unittest.TestCase):
+    """
+    Unit tests for the keyed, constant-memory permutation used for per-session shuffling.
+    """
+
+    def test_is_bijection_for_many_sizes(self):
+        """Test that every size yields a permutation of range(size)."""
+        for size in [0, 1, 2, 3, 4, 5, 7, 16, 17, 100, 1000, 4097]:
+            self.assertEqual(sorted(FeistelPermutation(size, ("key", size))), list(range(size)))
+
+    def test_inverse_mapping(self):
+        """Test that index() inverts item access."""
+        perm = FeistelPermutation(1234, 99)
+        for position in range(0, 1234, 7):
+            self.assertEqual(perm.index(perm[position]), position)
+
+    def test_same_key_same_order(self):
+        """Test that a seed always reproduces the same order and different seeds differ."""
+        self.assertEqual(list(FeistelPermutation(50, 7)), list(FeistelPermutation(50, 7)))
+        self.assertNotEqual(list(FeistelPermutation(50, 7)), list(FeistelPermutation(50, 8)))
+
+    def test_large_size_without_materializing(self):
+        """Test that huge permutations are usable in constant memory."""
+        perm = FeistelPermutation(10 ** 12, "big")
+        self.assertEqual(len(perm), 10 ** 12)
+        self.assertTrue(0 <= perm[123456789] < 10 ** 12)
+        self.assertEqual(perm.index(perm[-1]), 10 ** 12 - 1)
+
+    def test_invalid_arguments_raise(self):
+        """Test errors for invalid sizes, positions and values."""
+        with self.assertRaises(ValueError):
+            FeistelPermutation(-1, 0)
+        perm = FeistelPermutation(3, 0)
+        with self.assertRaises(IndexError):
+            perm[3]
+        with self.assertRaises(ValueError):
+            perm.index(5)
+
+
+if __name__ == '__main__':
+    unittest.main()
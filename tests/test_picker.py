@@ -0,0 +1,74 @@
+import unittest
+import os
+import sys
+from io import StringIO
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from quiz_search.picker import QuizPicker
+
+
+class TestQuizPicker(unittest.TestCase):
+    """
+    Unit tests for prefix/fuzzy quiz lookup and paged selection.
+    """
+
+    def setUp(self):
+        """Build a picker over a small catalog with titles and capture stdout."""
+        self.names = ["geografia", "geografia2", "historia_polski", "python", "python_zaawansowany"]
+        self.titles = {"historia_polski": "Dzieje Polski", "python": "Podstawy Pythona"}
+        self.picker = QuizPicker(self.names, self.titles)
+        self.original_stdout = sys.stdout
+        sys.stdout = self.held_output = StringIO()
+
+    def tearDown(self):
+        """Restore stdout."""
+        sys.stdout = self.original_stdout
+
+    def test_prefix_matches_names_words_and_titles(self):
+        """Test prefix lookup over names, their words and titles (diacritics folded)."""
+        self.assertEqual(list(self.picker.matches("geo")), ["geografia", "geografia2"])
+        self.assertEqual(list(self.picker.matches("pols")), ["historia_polski"])
+        self.assertEqual(list(self.picker.matches("DZIEJE")), ["historia_polski"])
+        self.assertEqual(list(self.picker.matches("podstawy pyth")), ["python"])
+        self.assertEqual(list(self.picker.matches("")), self.names)
+
+    def test_fuzzy_fallback(self):
+        """Test that a misspelled query still finds the quiz."""
+        self.assertEqual(self.picker.fuzzy("histroia")[0], "historia_polski")
+        self.assertEqual(next(self.picker.matches("pyhton")), "python")
+
+    def test_for_catalog_reuses_picker(self):
+        """Test that an unchanged catalog reuses the previous picker."""
+        first = QuizPicker.for_catalog(self.names, self.titles)
+        self.assertIs(QuizPicker.for_catalog(list(self.names), dict(self.titles)), first)
+        self.assertIsNot(QuizPicker.for_catalog(self.names + ["nowy"]), first)
+
+    def test_small_catalog_uses_numbered_list(self):
+        """Test that small catalogs keep the numbered list."""
+        with patch('builtins.input', side_effect=['9', '2']):
+            self.assertEqual(self.picker.choose("Wybierz numer quizu: "), "geografia2")
+        output = self.held_output.getvalue()
+        self.assertIn("  5. python_zaawansowany", output)
+        self.assertIn("Nieprawidłowy numer. Wpisz numer z listy.", output)
+
+    def test_large_catalog_pages_results(self):
+        """Test searching and paging in a catalog too large to list."""
+        names = [f"quiz_{i:03d}" for i in range(25)] + ["python"]
+        picker = QuizPicker(names)
+        with patch('quiz_search.picker.FULL_LIST_LIMIT', 5), \
+                patch('builtins.input', side_effect=['quiz', 'n', '3']):
+            self.assertEqual(picker.choose("Wybierz numer quizu: "), "quiz_012")
+        output = self.held_output.getvalue()
+        self.assertNotIn("quiz_020", output) # Only the first two pages were printed
+        self.assertNotIn("python", output)
+
+        with patch('quiz_search.picker.FULL_LIST_LIMIT', 5), \
+                patch('builtins.input', side_effect=['xyz!!', 'quiz_02', 'pyt', '1']):
+            self.assertEqual(picker.choose("Wybierz numer quizu: "), "python")
+        self.assertIn("Brak pasujących quizów.", self.held_output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+import os
+import sys
+import glob
+import pstats
+import shutil
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import main
+from utils.profiling import SamplingProfiler, get_profiler, profiled
+
+
+def busy_loop(seconds: float):
+    """Keeps the CPU busy for a while (profiled in the tests)."""
+    import time
+    end = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < end:
+        total += sum(range(100))
+    return total
+
+
+class TestSamplingProfiler(unittest.TestCase):
+    """
+    Unit tests for the sampling profiler.
+    """
+
+    def test_samples_the_profiled_thread(self):
+        profiler = SamplingProfiler(interval=0.001)
+        profiler.start()
+        busy_loop(0.1)
+        profiler.stop()
+        self.assertGreater(profiler.samples, 5)
+        self.assertTrue(any("busy_loop (tests/test_profiling.py" in line for line in profiler.collapsed()))
+        self.assertEqual(sys.getswitchinterval(), profiler._switch_interval) # Przywrócony po zakończeniu
+        stats = profiler.pstats_data()
+        busy = [value for key, value in stats.items() if key[2] == "busy_loop"]
+        self.assertEqual(len(busy), 1)
+        self.assertGreater(busy[0][3], 0.05) # Czas łączny busy_loop
+
+    def test_overhead_budget_backs_off(self):
+        profiler = SamplingProfiler(interval=0.001, budget=1e-9)
+        profiler.start()
+        busy_loop(0.1)
+        profiler.stop()
+        self.assertGreater(profiler.effective_interval, profiler.interval)
+
+    def test_invalid_settings(self):
+        with self.assertRaises(ValueError):
+            get_profiler("dtrace")
+        with self.assertRaises(ValueError):
+            SamplingProfiler(interval=-1)
+
+
+class TestProfiled(unittest.TestCase):
+    """
+    Tests of the profiled() context manager and the --profile option of main.py.
+    """
+
+    def setUp(self):
+        self.test_dir = "test_profiles"
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def tearDown(self):
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_disabled_by_default(self):
+        with patch('utils.profiling.PROFILE_MODE', ""):
+            with profiled("noop", directory=self.test_dir) as profiler:
+                self.assertIsNone(profiler)
+        self.assertFalse(os.path.exists(self.test_dir))
+
+    def test_sample_mode_writes_collapsed_stacks_and_pstats(self):
+        with profiled("session", "sample", self.test_dir, interval=0.001):
+            busy_loop(0.05)
+        collapsed, = glob.glob(os.path.join(self.test_dir, "session-*.collapsed"))
+        with open(collapsed, 'r', encoding='utf-8') as f:
+            first_line = f.readline()
+        stack, weight = first_line.rsplit(" ", 1)
+        self.assertIn(";", stack)
+        self.assertGreater(int(weight), 0)
+        stats = pstats.Stats(glob.glob(os.path.join(self.test_dir, "session-*.prof"))[0])
+        self.assertGreater(stats.total_tt, 0)
+
+    def test_main_profile_option(self):
+        with patch('utils.profiling.PROFILE_DIRECTORY', self.test_dir), patch('sys.stdout'):
+            exit_code = main.main(["--profile", "cprofile", "list", "--directory", "data/quiz_examples"])
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(len(glob.glob(os.path.join(self.test_dir, "list-*.prof"))), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
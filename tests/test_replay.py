@@ -0,0 +1,101 @@
+import unittest
+import os
+import sys
+import shutil
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.replay import run_load, step_label
+from models.question import Question
+from models.quiz import Quiz
+from quiz_data.manager import QuizDataManager
+from utils import console
+
+
+class TestConsole(unittest.TestCase):
+    """
+    Unit tests for the injectable console input.
+    """
+
+    def test_default_console_uses_builtins_input(self):
+        with patch('builtins.input', return_value="tak") as mock_input:
+            self.assertEqual(console.input("Kontynuować? "), "tak")
+        mock_input.assert_called_once_with("Kontynuować? ")
+
+    def test_scripted_console_feeds_answers_and_records_steps(self):
+        scripted = console.ScriptedInput(["1", "2"])
+        with console.use_console(scripted):
+            self.assertEqual(console.input("A: "), "1")
+            self.assertEqual(console.input("B: "), "2")
+            with self.assertRaises(console.TranscriptExhausted):
+                console.input("C: ")
+        self.assertEqual([prompt for prompt, _ in scripted.steps], ["A: ", "B: ", "C: "])
+        # Poza blokiem with znów odpowiada klawiatura
+        with patch('builtins.input', return_value="x"):
+            self.assertEqual(console.input(), "x")
+
+    def test_recording_console(self):
+        recorder = console.RecordingInput(console.ScriptedInput(["python", "3"]))
+        with console.use_console(recorder):
+            console.input()
+            console.input()
+        self.assertEqual(recorder.answers, ["python", "3"])
+
+    def test_step_label(self):
+        self.assertEqual(step_label("Opcja 12: "), "Opcja #:")
+        self.assertEqual(step_label("Nowy tytuł quizu (obecny: 'Geografia'): "), "Nowy tytuł quizu (obecny: '…'):")
+
+
+class TestReplay(unittest.TestCase):
+    """
+    Tests replaying transcripts of the interactive flows against a sandboxed catalog.
+    """
+
+    def setUp(self):
+        self.catalog = "test_replay_catalog"
+        if os.path.exists(self.catalog):
+            shutil.rmtree(self.catalog)
+        quiz = Quiz("Stolice", "", [Question("Stolica Polski?", ["Kraków", "Warszawa"], 1),
+                                    Question("Stolica Francji?", ["Paryż", "Lyon"], 0)])
+        QuizDataManager.save_quiz(quiz, "stolice", self.catalog, verbose=False)
+        self.patcher_chart = patch('quiz_player.player.QuizPlayer.generate_and_save_results_chart')
+        self.patcher_chart.start()
+
+    def tearDown(self):
+        self.patcher_chart.stop()
+        if os.path.exists(self.catalog):
+            shutil.rmtree(self.catalog)
+
+    def test_play_and_create_transcripts(self):
+        transcripts = [
+            {"name": "play", "flow": "play", "inputs": ["1", "2", "1"], "expect": ["Twój wynik: 2/2"]},
+            {"name": "create", "flow": "create",
+             "inputs": ["Nowy", "", "Pytanie?", "Tak", "Nie", "", "1", "", "nowy"],
+             "expect": ["Quiz został pomyślnie zapisany!"]},
+        ]
+        report = run_load(transcripts, users=1, iterations=2, catalog=self.catalog)
+        self.assertEqual(report["sessions"], 4)
+        self.assertEqual(report["errors"], 0, report["error_samples"])
+        self.assertEqual(report["flows"]["play"]["sessions"], 2)
+        self.assertEqual(report["steps"]["play: Wpisz numer odpowiedzi:"]["count"], 4)
+        self.assertIn("create: (koniec)", report["steps"])
+        # Piaskownica nie zmienia źródłowego katalogu
+        self.assertEqual(QuizDataManager.list_available_quizzes(self.catalog), ["stolice"])
+
+    def test_exhausted_transcript_is_reported_not_looped(self):
+        # Pętla wyboru poprawnej odpowiedzi łapie Exception - transkrypt musi ją przerwać
+        transcripts = [{"name": "short", "flow": "create", "inputs": ["Nowy", "", "Pytanie?", "Tak", "Nie", ""]}]
+        report = run_load(transcripts, catalog=self.catalog)
+        self.assertEqual(report["errors"], 1)
+        self.assertIn("No answer left", report["error_samples"][0])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            run_load([{"flow": "dance", "inputs": []}], catalog=self.catalog)
+        with self.assertRaises(ValueError):
+            run_load([], users=0, catalog=self.catalog)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+import unittest
+import os
+import sys
+import shutil
+import threading
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models.question import Question
+from models.quiz import Quiz
+from quiz_results.analytics import ItemAnalytics
+from quiz_results.log import ResultsLog, list_segments, read_results, recent_play_counts
+import quiz_player.player as player_module
+from quiz_player.player import QuizPlayer
+
+
+class TestResultsLog(unittest.TestCase):
+    """
+    Unit tests for the append-only results log: appending, rotation, group commit and reading.
+    """
+
+    def setUp(self):
+        """Create a clean temporary directory for the log."""
+        self.test_dir = "test_results_log"
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def tearDown(self):
+        """Remove the temporary log directory."""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_append_and_read_back(self):
+        """Test that appended records are durable and streamed back in order."""
+        log = ResultsLog(self.test_dir)
+        log.append({"quiz": "abc", "choices": [0, 1]})
+        log.append({"quiz": "def", "choices": [2]})
+        log.close()
+        self.assertEqual([r["quiz"] for r in read_results(self.test_dir)], ["abc", "def"])
+
+    def test_reopen_continues_last_segment(self):
+        """Test that reopening a log appends to the existing last segment."""
+        log = ResultsLog(self.test_dir)
+        log.append({"n": 1})
+        log.close()
+        log = ResultsLog(self.test_dir)
+        log.append({"n": 2})
+        log.close()
+        self.assertEqual(len(list_segments(self.test_dir)), 1)
+        self.assertEqual([r["n"] for r in read_results(self.test_dir)], [1, 2])
+
+    def test_rotation_and_retention(self):
+        """Test that segments rotate by size and only max_segments are kept."""
+        log = ResultsLog(self.test_dir, segment_max_bytes=40, max_segments=2)
+        for n in range(6):
+            log.append({"n": n, "pad": "x" * 10})
+        log.close()
+        segments = list_segments(self.test_dir)
+        self.assertEqual(len(segments), 2)
+        self.assertEqual(segments[-1], "results-00000006.jsonl")
+        self.assertEqual([r["n"] for r in read_results(self.test_dir)], [4, 5])
+
+    def test_group_commit_batches_fsyncs(self):
+        """Test that concurrent appends share fsyncs instead of syncing each record."""
+        log = ResultsLog(self.test_dir, commit_delay=0.05)
+        real_fsync = os.fsync
+        with patch('quiz_results.log.os.fsync', side_effect=real_fsync) as mock_fsync:
+            threads = [threading.Thread(target=log.append, args=({"n": n},)) for n in range(20)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertLess(mock_fsync.call_count, 20)
+        log.close()
+        self.assertEqual(sorted(r["n"] for r in read_results(self.test_dir)), list(range(20)))
+
+    def test_torn_last_line_is_skipped(self):
+        """Test that a partially written last line does not break the reader."""
+        log = ResultsLog(self.test_dir)
+        log.append({"n": 1})
+        log.close()
+        with open(os.path.join(self.test_dir, list_segments(self.test_dir)[0]), 'a', encoding='utf-8') as f:
+            f.write('{"n": 2')
+        self.assertEqual(list(read_results(self.test_dir)), [{"n": 1}])
+
+    def test_reopen_cuts_off_torn_last_line(self):
+        """Test that records appended after a crash do not merge with the torn last line."""
+        log = ResultsLog(self.test_dir)
+        log.append({"a": 1})
+        log.close()
+        with open(os.path.join(self.test_dir, list_segments(self.test_dir)[0]), 'a', encoding='utf-8') as f:
+            f.write('{"a":2')
+        log = ResultsLog(self.test_dir)
+        log.append({"a": 3})
+        log.close()
+        self.assertEqual(list(read_results(self.test_dir)), [{"a": 1}, {"a": 3}])
+        self.assertEqual(recent_play_counts(self.test_dir, limit=0), {})
+
+    def test_failed_write_is_removed_and_writer_survives(self):
+        """Test that a failed write leaves no partial bytes and later appends still work."""
+        log = ResultsLog(self.test_dir, commit_delay=0)
+        log.append({"n": 1})
+        real_fsync = os.fsync
+        for error in (OSError(28, "No space left on device"), RuntimeError("boom")):
+            with patch('quiz_results.log.os.fsync', side_effect=error):
+                with self.assertRaises(type(error)):
+                    log.append({"n": 2})
+        with patch('quiz_results.log.os.fsync', side_effect=real_fsync):
+            log.append({"n": 3})
+        log.close()
+        self.assertEqual([r["n"] for r in read_results(self.test_dir)], [1, 3])
+
+    def test_append_after_close_raises(self):
+        """Test that appending to a closed log raises ValueError."""
+        log = ResultsLog(self.test_dir)
+        log.close()
+        with self.assertRaises(ValueError):
+            log.append({"n": 1})
+
+    def test_record_session_writes_compact_record(self):
+        """Test that QuizPlayer.record_session stores the fingerprint, choices and timings."""
+        quiz = Quiz("Log Quiz", questions=[Question("Q1?", ["A", "B"], 0), Question("Q2?", ["C", "D"], 1)])
+        answers = [
+            {"question_index": 0, "user_choice_index": 0, "is_correct": True, "answered_at": 100.5},
+            {"question_index": 1, "user_choice_index": 0, "is_correct": False, "answered_at": 101.25},
+        ]
+        with patch.object(player_module, 'RESULTS_DIRECTORY', self.test_dir):
+            QuizPlayer.record_session(quiz, "log_quiz", answers, 100.0, 102.0)
+            ResultsLog.shared(self.test_dir).close()
+        ResultsLog._shared.pop(os.path.abspath(self.test_dir), None)
+
+        (record,) = read_results(self.test_dir)
+        self.assertEqual(record["quiz"], quiz.fingerprint())
+        self.assertEqual(record["name"], "log_quiz")
+        self.assertEqual(record["choices"], [0, 0])
+        self.assertEqual(record["t"], [500, 1250])
+        self.assertEqual(record["score"], 1)
+        self.assertEqual((record["started"], record["finished"]), (100.0, 102.0))
+
+        # The session also reaches this process's partial analytics file
+        analytics = ItemAnalytics.load_merged(self.test_dir)
+        self.assertEqual(analytics.quizzes[quiz.fingerprint()]["sessions"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.sampling import floyd_sample, make_rng, reservoir_sample, sample_indices, sample_questions
+from utils.helpers import select_unique_questions_recursive
+
+
+class TestSampling(unittest.TestCase):
+    """
+    Unit tests for sampling without replacement, reservoir sampling and seeded draws.
+    """
+
+    def test_sample_indices_distinct_and_in_range(self):
+        """Test that sampled indices are distinct and within the population."""
+        indices = sample_indices(1000, 200, make_rng(1))
+        self.assertEqual(len(indices), 200)
+        self.assertEqual(len(set(indices)), 200)
+        self.assertTrue(all(0 <= i < 1000 for i in indices))
+
+    def test_sample_indices_full_permutation(self):
+        """Test that sampling the whole population yields a permutation."""
+        self.assertEqual(sorted(sample_indices(50, 50, make_rng(2))), list(range(50)))
+
+    def test_floyd_sample(self):
+        """Test Floyd's algorithm returns k distinct indices in range."""
+        selected = floyd_sample(10 ** 9, 100, make_rng(3))
+        self.assertEqual(len(selected), 100)
+        self.assertTrue(all(0 <= i < 10 ** 9 for i in selected))
+
+    def test_invalid_sample_sizes_raise(self):
+        """Test that negative or too large sample sizes raise ValueError."""
+        with self.assertRaises(ValueError):
+            sample_indices(5, 6)
+        with self.assertRaises(ValueError):
+            floyd_sample(5, -1)
+        with self.assertRaises(ValueError):
+            reservoir_sample([1, 2], -1)
+
+    def test_seeded_draws_are_reproducible(self):
+        """Test that the same seed always draws the same questions in the same order."""
+        bank = [f"Q{i}" for i in range(500)]
+        self.assertEqual(sample_questions(bank, 20, seed=42), sample_questions(bank, 20, seed=42))
+        self.assertNotEqual(sample_questions(bank, 20, seed=42), sample_questions(bank, 20, seed=43))
+
+    def test_reservoir_sample_stream(self):
+        """Test reservoir sampling over a generator, including short streams."""
+        sample = reservoir_sample((i for i in range(100000)), 10, make_rng(4))
+        self.assertEqual(len(set(sample)), 10)
+        self.assertEqual(sorted(reservoir_sample(iter([1, 2, 3]), 5, make_rng(5))), [1, 2, 3])
+        self.assertEqual(reservoir_sample(iter([1, 2, 3]), 0), [])
+
+    def test_reservoir_sample_is_uniform(self):
+        """Test that every stream position is selected with roughly equal frequency."""
+        rng = make_rng(6)
+        counts = [0] * 10
+        for _ in range(6000):
+            for item in reservoir_sample(range(10), 3, rng):
+                counts[item] += 1
+        for count in counts: # Expected 1800 per item
+            self.assertTrue(1600 < count < 2000, counts)
+
+    def test_select_unique_questions_large_bank(self):
+        """Test that the legacy helper now handles thousands of picks without recursion errors."""
+        bank = list(range(20000))
+        selected = select_unique_questions_recursive(bank, 5000)
+        self.assertEqual(len(set(selected)), 5000)
+        with self.assertRaises(ValueError):
+            select_unique_questions_recursive(bank, 20001)
+
+
+if __name__ == '__main__':
+    unittest.main()
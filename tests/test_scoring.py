@@ -0,0 +1,67 @@
+import unittest
+import os
+import sys
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models.scoring import (AllOrNothingScoring, NegativeMarkingScoring, PartialCreditScoring,
+                            get_scoring_policy, indices_to_mask, mask_to_indices)
+
+
+class TestScoring(unittest.TestCase):
+    """
+    Unit tests for bitmask answer keys and the scoring policies.
+    """
+
+    def test_mask_conversions(self):
+        """Test converting between option indices and bitmasks."""
+        self.assertEqual(indices_to_mask([0, 3]), 0b1001)
+        self.assertEqual(mask_to_indices(0b1001), [0, 3])
+        self.assertEqual(mask_to_indices(indices_to_mask([70, 2])), [2, 70])
+        self.assertEqual(indices_to_mask([]), 0)
+        with self.assertRaises(ValueError):
+            indices_to_mask([-1])
+
+    def test_all_or_nothing(self):
+        """Test that only the exact set of options earns the point."""
+        policy = AllOrNothingScoring()
+        self.assertEqual(policy.score(0b0101, 0b0101), 1.0)
+        self.assertEqual(policy.score(0b0101, 0b0001), 0.0)
+
+    def test_partial_credit(self):
+        """Test that correct picks earn shares and wrong picks cancel them."""
+        policy = PartialCreditScoring()
+        self.assertEqual(policy.score(0b0101, 0b0001), 0.5)
+        self.assertEqual(policy.score(0b0101, 0b0011), 0.0)
+        self.assertEqual(policy.score(0b0101, 0b1010), 0.0) # Never negative
+        self.assertEqual(policy.score(0b0101, 0b0101), 1.0)
+
+    def test_negative_marking(self):
+        """Test penalties for wrong answers and no penalty for skipped questions."""
+        policy = NegativeMarkingScoring(penalty=0.5)
+        self.assertEqual(policy.score(0b10, 0b10), 1.0)
+        self.assertEqual(policy.score(0b10, 0b01), -0.5)
+        self.assertEqual(policy.score(0b10, 0), 0.0)
+
+    def test_grade_sheet(self):
+        """Test grading a whole answer sheet."""
+        total, scores = PartialCreditScoring().grade_sheet([0b0101, 0b10, 0b1], [0b0001, 0b10, 0b10])
+        self.assertEqual(scores, [0.5, 1.0, 0.0])
+        self.assertEqual(total, 1.5)
+        with self.assertRaises(ValueError):
+            AllOrNothingScoring().grade_sheet([1, 2], [1])
+
+    def test_get_scoring_policy(self):
+        """Test selecting a policy by name and from the environment."""
+        self.assertIsInstance(get_scoring_policy("partial"), PartialCreditScoring)
+        with patch.dict(os.environ, {"QUIZ_SCORING": "negative"}):
+            self.assertIsInstance(get_scoring_policy(), NegativeMarkingScoring)
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertIsInstance(get_scoring_policy(), AllOrNothingScoring)
+        with self.assertRaises(ValueError):
+            get_scoring_policy("unknown")
+
+
+if __name__ == '__main__':
+    unittest.main()
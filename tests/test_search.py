@@ -0,0 +1,170 @@
+import unittest
+import os
+import sys
+import math
+import random
+import shutil
+import sqlite3
+from io import StringIO
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models.question import Question
+from models.quiz import Quiz
+from quiz_data.manager import QuizDataManager
+from quiz_creator.creator import QuizCreator
+from quiz_search import index as index_module
+from quiz_search.index import QuestionIndex
+from utils.text import tokenize
+
+
+class TestQuestionIndex(unittest.TestCase):
+    """
+    Unit tests for the persistent BM25 question index.
+    """
+
+    def setUp(self):
+        """Create a temporary catalog with two quizzes."""
+        self.test_dir = "test_quizzes_search"
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+        self.original_stdout = sys.stdout
+        sys.stdout = StringIO()
+        geography = Quiz("Geografia", questions=[
+            Question("Jaka jest stolica Polski?", ["Kraków", "Warszawa"], 1),
+            Question("Najdłuższa rzeka w Polsce?", ["Wisła", "Odra"], 0)])
+        python = Quiz("Python", questions=[
+            Question("Jakiego słowa kluczowego używa się do zdefiniowania funkcji?", ["def", "fun"], 0)])
+        QuizDataManager.save_quiz(geography, "geografia", self.test_dir)
+        QuizDataManager.save_quiz(python, "python", self.test_dir)
+        self.index = QuestionIndex(self.test_dir)
+
+    def tearDown(self):
+        """Close the index and remove the temporary catalog."""
+        self.index.close()
+        sys.stdout = self.original_stdout
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_tokenize_folds_and_stems(self):
+        """Test Polish-aware tokenization: stopwords dropped, diacritics folded, inflections joined."""
+        self.assertEqual(tokenize("Jaka jest stolica Polski?"), ["stolic", "polski"])
+        self.assertEqual(tokenize("Stolicą"), tokenize("stolicy"))
+        self.assertEqual(tokenize("Wisła"), ["wisla"])
+
+    def test_save_quiz_updates_index(self):
+        """Test that saved quizzes are searchable without a full rebuild."""
+        results = self.index.search("stolicą polski")
+        self.assertEqual(results[0]["quiz"], "geografia")
+        self.assertEqual(results[0]["question_index"], 0)
+        self.assertEqual(self.index.search("wisla")[0]["question_text"], "Najdłuższa rzeka w Polsce?")
+        self.assertEqual(self.index.search("zupełnie nieznane"), [])
+
+    def test_reindex_replaces_old_questions(self):
+        """Test that saving a quiz again replaces its previous postings."""
+        QuizDataManager.save_quiz(Quiz("Python", questions=[Question("Co robi lambda?", ["a", "b"], 0)]),
+                                  "python", self.test_dir)
+        self.assertEqual(self.index.search("funkcji"), [])
+        self.assertEqual(self.index.search("lambda")[0]["quiz"], "python")
+
+    def test_refresh_picks_up_external_changes(self):
+        """Test that refresh() indexes new files and drops removed ones."""
+        os.remove(os.path.join(self.test_dir, "python.json"))
+        with patch('quiz_search.index.AUTO_UPDATE', False):
+            QuizDataManager.save_quiz(Quiz("Nowy", questions=[Question("Ile nóg ma pająk?", ["6", "8"], 1)]),
+                                      "nowy", self.test_dir)
+        self.assertEqual(self.index.search("pająk"), [])
+        self.assertEqual(self.index.refresh(), (1, 1))
+        self.assertEqual(self.index.search("pajak")[0]["quiz"], "nowy")
+        self.assertEqual(self.index.search("funkcji"), [])
+        self.assertEqual(self.index.refresh(), (0, 0)) # Nothing changed
+
+    def exhaustive_scores(self, query: str) -> list:
+        """Scores every posting of the query terms (the reference for the early-terminating search)."""
+        connection = self.index._connect()
+        documents = connection.execute("SELECT value FROM stats WHERE key = 'documents'").fetchone()[0]
+        scores = {}
+        for term in set(tokenize(query)):
+            row = connection.execute("SELECT df FROM terms WHERE term = ?", (term,)).fetchone()
+            if row is None:
+                continue
+            weight = math.log(1 + (documents - row[0] + 0.5) / (row[0] + 0.5))
+            for doc_id, impact in connection.execute("SELECT doc_id, impact FROM postings WHERE term = ?", (term,)):
+                scores[doc_id] = scores.get(doc_id, 0.0) + weight * impact
+        return sorted((round(score, 4) for score in scores.values()), reverse=True)
+
+    def test_early_termination_matches_exhaustive_ranking(self):
+        """Test that reading only the heads of impact-ordered lists gives the exact top results."""
+        rng = random.Random(5)
+        words = ["rzeka", "góra", "miasto", "zamek", "król", "morze", "las", "wyspa", "jezioro", "wieś",
+                 "most", "kościół", "rynek", "port", "dolina", "pałac", "wojna", "pokój", "ziemia", "niebo"]
+        for number in range(6):
+            questions = [Question(" ".join(rng.choices(words, k=rng.randint(2, 6))) + "?", ["tak", "nie"], 0)
+                         for _ in range(40)]
+            QuizDataManager.save_quiz(Quiz(f"Losowy {number}", questions=questions), f"losowy{number}", self.test_dir)
+        # Małe paczki: listy czytane do końca albo (bez limitu kandydatów) przerwane po kilku paczkach
+        for max_candidates in (0, 10 ** 6):
+            with patch.multiple(index_module, SEARCH_BATCH_SIZE=4, SEARCH_MAX_BATCH_SIZE=8,
+                                SEARCH_MAX_CANDIDATES=max_candidates):
+                for query in ["rzeka", "zamek król", "morze las wyspa góra", "miasto rzeka morze"]:
+                    results = self.index.search(query, limit=5)
+                    self.assertEqual([result["score"] for result in results], self.exhaustive_scores(query)[:5])
+
+    def test_query_of_only_common_terms_keeps_them(self):
+        """Test that a query whose every term is very common still finds the matching questions."""
+        questions = [Question(f"Jaka jest stolica kraju numer {number}?", ["a", "b"], 0) for number in range(4)]
+        QuizDataManager.save_quiz(Quiz("Stolice", questions=questions), "stolice", self.test_dir)
+        results = self.index.search("stolica kraju", limit=5)
+        self.assertEqual(len(results), 5) # Cztery nowe pytania i "Jaka jest stolica Polski?"
+        self.assertEqual([result["score"] for result in results], self.exhaustive_scores("stolica kraju")[:5])
+        # Z rzadszym termem w zapytaniu bardzo częste termy są pomijane
+        self.assertEqual([result["question_text"] for result in self.index.search("stolica kraju wisla")],
+                         ["Najdłuższa rzeka w Polsce?"])
+
+    def test_impacts_follow_average_length(self):
+        """Test that term impacts are recomputed when the average question length drifts."""
+        long_text = " ".join(["długie pytanie o historię"] * 10) + "?"
+        QuizDataManager.save_quiz(Quiz("Długi", questions=[Question(long_text, ["a", "b"], 0)] * 5),
+                                  "dlugi", self.test_dir)
+        connection = self.index._connect()
+        average_length = connection.execute("SELECT (SELECT value FROM stats WHERE key = 'total_length') * 1.0 / "
+                                            "(SELECT value FROM stats WHERE key = 'documents')").fetchone()[0]
+        for tf, length, impact in connection.execute("SELECT p.tf, d.length, p.impact FROM postings p "
+                                                     "JOIN docs d ON d.id = p.doc_id"):
+            self.assertAlmostEqual(impact, QuestionIndex._impact(tf, length, average_length))
+
+    def test_older_index_format_is_rebuilt(self):
+        """Test that an index created by an older version is rebuilt instead of failing."""
+        self.index.close()
+        os.remove(self.index.path)
+        connection = sqlite3.connect(self.index.path)
+        connection.executescript("CREATE TABLE postings (term TEXT, doc_id INTEGER, tf INTEGER);"
+                                 "CREATE TABLE sources (quiz TEXT PRIMARY KEY, signature TEXT NOT NULL);"
+                                 "INSERT INTO sources VALUES ('geografia', 'x');")
+        connection.close()
+        self.assertEqual(self.index.refresh(), (2, 0))
+        self.assertEqual(self.index.search("wisla")[0]["quiz"], "geografia")
+
+    def test_refresh_in_background(self):
+        """Test that a background refresh reindexes external changes while the index stays usable."""
+        with patch('quiz_search.index.AUTO_UPDATE', False):
+            QuizDataManager.save_quiz(Quiz("Nowy", questions=[Question("Ile nóg ma pająk?", ["6", "8"], 1)]),
+                                      "nowy", self.test_dir)
+        self.index.refresh_in_background()
+        self.assertEqual(self.index.search("stolica")[0]["quiz"], "geografia")
+        self.index.refreshing.join()
+        self.assertEqual(self.index.search("pajak")[0]["quiz"], "nowy")
+
+    def test_creator_shows_similar_questions(self):
+        """Test the "find similar before adding" hint of the quiz creator."""
+        search_index = QuizCreator._show_similar_questions("Stolica Polski to?", directory=self.test_dir)
+        search_index.refreshing.join()
+        search_index.close()
+        output = sys.stdout.getvalue()
+        self.assertIn("Podobne pytania w katalogu:", output)
+        self.assertIn("[geografia] Jaka jest stolica Polski?", output)
+
+
+if __name__ == '__main__':
+    unittest.main()
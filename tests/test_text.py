@@ -0,0 +1,58 @@
+import unittest
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.text import AnswerMatcher, compile_answer_patterns, normalize_answer
+
+
+class TestAnswerNormalization(unittest.TestCase):
+    """
+    Unit tests for normalizing and matching typed answers.
+    """
+
+    def test_normalize_answer(self):
+        """Test case folding, Polish diacritic folding and whitespace collapse."""
+        self.assertEqual(normalize_answer("  Żółta   Łódź "), "zolta lodz")
+        self.assertEqual(normalize_answer("ĄĆĘŁŃÓŚŹŻ"), "acelnoszz")
+        self.assertEqual(normalize_answer("DEF\t"), "def")
+
+    def test_matcher_accepts_normalized_variants(self):
+        """Test that accepted answers match regardless of case, diacritics and spacing."""
+        matcher = AnswerMatcher(["Łódź", "def"])
+        self.assertTrue(matcher.matches("lodz"))
+        self.assertTrue(matcher.matches("  DEF "))
+        self.assertFalse(matcher.matches("lambda"))
+
+    def test_matcher_patterns(self):
+        """Test that patterns match the whole normalized answer."""
+        matcher = AnswerMatcher(["def"], [r"def(inicja)?", r"\d+ ?zl"])
+        self.assertTrue(matcher.matches("Definicja"))
+        self.assertTrue(matcher.matches("12 zł"))
+        self.assertFalse(matcher.matches("undef"))
+
+    def test_many_variants(self):
+        """Test a matcher with thousands of accepted answers."""
+        matcher = AnswerMatcher([f"odpowiedź {i}" for i in range(5000)])
+        self.assertTrue(matcher.matches("ODPOWIEDZ 4999"))
+        self.assertFalse(matcher.matches("odpowiedz 5000"))
+
+    def test_patterns_with_diacritics(self):
+        """Test that patterns written with Polish letters match the normalized answers."""
+        matcher = AnswerMatcher([], [r"łódź(ka)?", r"Żółw\W*błotny"])
+        self.assertTrue(matcher.matches("Łódź"))
+        self.assertTrue(matcher.matches("lodzka"))
+        self.assertTrue(matcher.matches("żółw - błotny"))
+        self.assertFalse(matcher.matches("Łęczyca"))
+
+    def test_patterns_compiled_once(self):
+        """Test that identical pattern sets share one compiled expression."""
+        self.assertIs(compile_answer_patterns(("a+",)), compile_answer_patterns(("a+",)))
+        self.assertIsNone(compile_answer_patterns(()))
+        with self.assertRaises(ValueError):
+            compile_answer_patterns(("(",))
+
+
+if __name__ == '__main__':
+    unittest.main()
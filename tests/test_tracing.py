@@ -0,0 +1,88 @@
+import unittest
+import os
+import sys
+import json
+import shutil
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.tracing import Tracer
+
+
+class TestTracer(unittest.TestCase):
+    """
+    Unit tests for the span tracer and its Chrome trace export.
+    """
+
+    def setUp(self):
+        self.tracer = Tracer(capacity=100)
+        self.test_dir = "test_traces"
+
+    def tearDown(self):
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_disabled_tracer_is_a_no_op(self):
+        tracer = Tracer(enabled=False)
+
+        def load():
+            return 1
+
+        self.assertIs(tracer.traced()(load), load)
+        with tracer.span("load_quiz") as span:
+            pass
+        span.end()
+        self.assertIs(tracer.span("a"), tracer.start_span("b")) # Wspólny pusty odcinek
+        self.assertEqual(tracer.to_chrome_trace()["traceEvents"][1:], [])
+
+    def test_nested_spans_in_chrome_format(self):
+        @self.tracer.traced("play_quiz")
+        def play():
+            with self.tracer.span("question", position=1):
+                answer = self.tracer.start_span("answer")
+                answer.end()
+                answer.end() # Ponowne zakończenie nic nie zmienia
+
+        play()
+        events = {event["name"]: event for event in self.tracer.to_chrome_trace()["traceEvents"]}
+        self.assertEqual(set(events), {"process_name", "play_quiz", "question", "answer"})
+        outer, inner = events["play_quiz"], events["question"]
+        self.assertEqual(outer["ph"], "X")
+        self.assertEqual(inner["args"], {"position": 1})
+        self.assertEqual(outer["tid"], inner["tid"])
+        # Zagnieżdżenie wynika ze znaczników czasu
+        self.assertLessEqual(outer["ts"], inner["ts"])
+        self.assertGreaterEqual(outer["ts"] + outer["dur"], inner["ts"] + inner["dur"])
+        self.assertLessEqual(inner["ts"], events["answer"]["ts"])
+
+    def test_error_is_recorded(self):
+        with self.assertRaises(ValueError):
+            with self.tracer.span("load_quiz"):
+                raise ValueError("broken")
+        event = self.tracer.to_chrome_trace()["traceEvents"][1]
+        self.assertEqual(event["args"], {"error": "ValueError"})
+
+    def test_ring_buffer_drops_oldest(self):
+        tracer = Tracer(capacity=3)
+        for i in range(5):
+            with tracer.span(f"span{i}"):
+                pass
+        trace = tracer.to_chrome_trace()
+        self.assertEqual([event["name"] for event in trace["traceEvents"][1:]], ["span2", "span3", "span4"])
+        self.assertEqual(trace["otherData"]["dropped_spans"], 2)
+        tracer.clear()
+        self.assertEqual(tracer.dropped, 0)
+
+    def test_export(self):
+        with self.tracer.span("save_quiz", quiz="python"):
+            pass
+        file_path = self.tracer.export(self.test_dir)
+        with open(file_path, 'r', encoding='utf-8') as f:
+            trace = json.load(f)
+        self.assertEqual(trace["traceEvents"][1]["args"], {"quiz": "python"})
+        with self.assertRaises(ValueError):
+            Tracer(capacity=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
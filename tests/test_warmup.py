@@ -0,0 +1,87 @@
+import unittest
+import os
+import sys
+import json
+import shutil
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import main
+from models.question import Question
+from models.quiz import Quiz
+from quiz_data.cache import MEMORY_FACTOR, QuizCache
+from quiz_data.manager import QuizDataManager
+from quiz_data.warmup import QUARANTINE_DIRECTORY_NAME, format_summary, warm_up
+
+
+class TestWarmUp(unittest.TestCase):
+    """
+    Tests of the catalog warm-up and health scan.
+    """
+
+    def setUp(self):
+        self.test_dir = "test_warmup_quizzes"
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+        for name in ("a", "b", "c"):
+            quiz = Quiz(name, "", [Question(f"Pytanie {name}?", ["Tak", "Nie"], 0)])
+            QuizDataManager.save_quiz(quiz, name, self.test_dir, verbose=False)
+        open(os.path.join(self.test_dir, "empty.json"), 'w').close()
+        with open(os.path.join(self.test_dir, "broken.json"), 'w', encoding='utf-8') as f:
+            json.dump({"title": "Zepsuty", "questions": [{"question_text": "Bez opcji?"}]}, f)
+        self.cache = QuizCache(budget_bytes=10 ** 6)
+
+    def tearDown(self):
+        self.cache.shutdown()
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_reports_corrupt_files_and_caches_valid_quizzes(self):
+        summary = warm_up(self.test_dir, workers=1, cache=self.cache)
+        self.assertEqual((summary["quizzes"], summary["valid"], summary["corrupt"]), (5, 3, 2))
+        problems = {report["quiz"]: report for report in summary["problems"]}
+        self.assertEqual(set(problems), {"empty", "broken"})
+        self.assertIn("Invalid JSON format", problems["empty"]["errors"][0])
+        self.assertIn("Question 1", problems["broken"]["errors"][0])
+        self.assertEqual(summary["cached"], 3)
+        self.assertTrue(os.path.exists(os.path.join(self.test_dir, "empty.json"))) # Tylko raport
+        self.assertIn("Uszkodzony quiz 'empty'", format_summary(summary))
+
+        quiz = self.cache.take(os.path.join(self.test_dir, "a.json"))
+        self.assertEqual(quiz.title, "a")
+
+    def test_worker_processes_give_the_same_result(self):
+        summary = warm_up(self.test_dir, workers=2, cache=self.cache)
+        self.assertEqual(summary["workers"], 2)
+        self.assertEqual((summary["valid"], summary["corrupt"], summary["cached"]), (3, 2, 3))
+        self.assertEqual(self.cache.take(os.path.join(self.test_dir, "c.json")).questions[0].question_text,
+                         "Pytanie c?")
+
+    def test_quarantine_moves_corrupt_files(self):
+        summary = warm_up(self.test_dir, workers=1, quarantine=True, cache=self.cache)
+        quarantined = os.path.join(self.test_dir, QUARANTINE_DIRECTORY_NAME, "empty.json")
+        self.assertEqual({report["quiz"]: report.get("quarantined") for report in summary["problems"]}["empty"],
+                         quarantined)
+        self.assertTrue(os.path.exists(quarantined))
+        self.assertEqual(QuizDataManager.list_available_quizzes(self.test_dir), ["a", "b", "c"])
+
+    def test_budget_keeps_the_most_played_quizzes(self):
+        size = os.path.getsize(os.path.join(self.test_dir, "c.json")) * MEMORY_FACTOR
+        cache = QuizCache(budget_bytes=size + 1)
+        try:
+            summary = warm_up(self.test_dir, workers=1, cache=cache, play_counts={"c": 5})
+            self.assertEqual(summary["cached"], 1)
+            self.assertIsNotNone(cache.take(os.path.join(self.test_dir, "c.json")))
+        finally:
+            cache.shutdown()
+
+    def test_main_warmup_command(self):
+        with patch('sys.stdout'), patch('quiz_data.cache.QuizCache.shared', return_value=self.cache):
+            exit_code = main.main(["warmup", "--directory", self.test_dir, "--workers", "1",
+                                   "--results", os.path.join(self.test_dir, "results")])
+        self.assertEqual(exit_code, 1) # Uszkodzone pliki = kod błędu, jak w 'validate'
+
+
+if __name__ == '__main__':
+    unittest.main()
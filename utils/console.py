@@ -0,0 +1,140 @@
+# quiz_project/utils/console.py
+"""
+Injectable console input for the interactive flows.
+
+The creator, player and pickers read every answer through console.input(). By default it
+calls builtins.input at call time (so tests patching 'builtins.input' keep working); a
+different source of answers - e.g. a recorded transcript replayed by benchmarks.replay -
+can be installed for the current context with use_console().
+"""
+import builtins
+import contextlib
+import contextvars
+import time
+
+
+class ConsoleInput:
+    """Reads answers from the keyboard (builtins.input)."""
+
+    def input(self, prompt: str = "") -> str:
+        """Shows the prompt and returns the line typed by the user."""
+        return builtins.input(prompt)
+
+
+class TranscriptExhausted(BaseException):
+    """
+    Raised when a scripted console runs out of answers.
+
+    Derives from BaseException (like KeyboardInterrupt), because the interactive loops
+    catch Exception and would otherwise keep asking forever.
+    """
+
+
+class ScriptedInput(ConsoleInput):
+    """
+    Feeds a recorded sequence of answers and measures the time spent between prompts.
+
+    A step is the work done by the flow after an answer was given (or after the start)
+    until the next prompt; steps are recorded as (prompt, seconds) pairs.
+
+    Attributes:
+        answers (list[str]): The answers, in the order they are given.
+        position (int): Number of answers consumed so far.
+        steps (list[tuple[str, float]]): Measured steps.
+    """
+
+    def __init__(self, answers, clock=time.perf_counter):
+        """
+        Initializes the scripted console.
+
+        Args:
+            answers (iterable[str]): Answers given to consecutive prompts.
+            clock (callable): Monotonic clock in seconds. Defaults to time.perf_counter.
+        """
+        self.answers = list(answers)
+        self.position = 0
+        self.steps = []
+        self._clock = clock
+        self._last = clock()
+
+    def input(self, prompt: str = "") -> str:
+        """
+        Returns the next recorded answer.
+
+        Raises:
+            TranscriptExhausted: If all answers have been consumed.
+        """
+        now = self._clock()
+        self.steps.append((prompt, now - self._last))
+        if self.position >= len(self.answers):
+            raise TranscriptExhausted(f"No answer left for the prompt: {prompt!r}")
+        answer = self.answers[self.position]
+        self.position += 1
+        self._last = self._clock()
+        return answer
+
+    def finish(self, label: str = "") -> float:
+        """Records the work done after the last answer as a final step and returns its duration."""
+        seconds = self._clock() - self._last
+        self.steps.append((label, seconds))
+        return seconds
+
+
+class RecordingInput(ConsoleInput):
+    """
+    Passes prompts to another console and records the answers, e.g. to save a transcript.
+
+    Attributes:
+        answers (list[str]): The answers given so far.
+    """
+
+    def __init__(self, source: ConsoleInput = None):
+        """
+        Initializes the recorder.
+
+        Args:
+            source (ConsoleInput, optional): Console actually answering. Defaults to the keyboard.
+        """
+        self.source = source or ConsoleInput()
+        self.answers = []
+
+    def input(self, prompt: str = "") -> str:
+        """Asks the wrapped console and records the answer."""
+        answer = self.source.input(prompt)
+        self.answers.append(answer)
+        return answer
+
+
+_DEFAULT_CONSOLE = ConsoleInput()
+_current_console = contextvars.ContextVar("quiz_console", default=_DEFAULT_CONSOLE)
+
+
+def input(prompt: str = "") -> str:
+    """
+    Reads an answer from the console installed for the current context.
+
+    Args:
+        prompt (str): Text shown before the answer.
+
+    Returns:
+        str: The answer (without the trailing newline).
+    """
+    return _current_console.get().input(prompt)
+
+
+@contextlib.contextmanager
+def use_console(console: ConsoleInput):
+    """
+    Installs a console for the current context (thread or task) within a with block.
+
+    Args:
+        console (ConsoleInput): Source of the answers.
+
+    Yields:
+        ConsoleInput: The installed console.
+    """
+    token = _current_console.set(console)
+    try:
+        yield console
+    finally:
+        _current_console.reset(token)
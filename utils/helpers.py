@@ -3,21 +3,15 @@
 
 
 # quiz_project/utils/helpers.py
-import random
+import gc
 import time
+import tracemalloc
 from functools import wraps # Do poprawnego kopiowania metadanych funkcji
 from functools import reduce # Importujemy funkcję reduce
 import timeit # Nowy import dla testów wydajności
 import os # Importujemy os do wykonywania poleceń systemowych
-
-# Należy zainstalować 'memory_profiler': pip install memory_profiler
-try:
-    from memory_profiler import profile
-except ImportError:
-    # Zastępczy dekorator, jeśli memory_profiler nie jest zainstalowany,
-    # aby uniknąć błędów w działaniu aplikacji.
-    def profile(func):
-        return func
+from utils.metrics import REGISTRY
+from utils.sampling import sample_indices
 
 # Należy zainstalować 'pylint': pip install pylint
 try:
@@ -82,20 +76,21 @@ def select_unique_questions_recursive(
     _result_questions: list = None   # Lista pytań do zwrócenia
 ) -> list:
     """
-    Recursively selects a specified number of unique questions from a list.
+    Selects a specified number of unique questions from a list.
 
-    Note: While this demonstrates recursion, for practical purposes,
-    an iterative approach using random.sample or a loop with a set
-    is often more efficient and less prone to stack overflow for large N.
+    Note: Kept for backward compatibility. The original recursive version rebuilt
+    the list of remaining indices on every call (O(n*k)) and hit the recursion limit
+    past about 1000 picks; it now delegates to utils.sampling.sample_indices, which
+    runs in O(k). New code should use utils.sampling directly.
 
     Args:
         all_questions (list): The list of all available question objects.
         num_to_select (int): The number of unique questions to select.
-        _selected_indices (set, optional): Internal parameter, set of indices
-                                           of questions already selected in current path.
-                                           Defaults to None (initialized on first call).
-        _result_questions (list, optional): Internal parameter, list of question objects
-                                            selected so far. Defaults to None.
+        _selected_indices (set, optional): Indices that must not be selected again.
+                                           Defaults to None.
+        _result_questions (list, optional): Questions already selected; the returned list
+                                            starts with a copy of them (the given list is
+                                            not modified). Defaults to None.
 
     Returns:
         list: A list of unique question objects.
@@ -103,56 +98,34 @@ def select_unique_questions_recursive(
     Raises:
         ValueError: If num_to_select is negative or greater than available questions.
     """
-    if _selected_indices is None:
-        _selected_indices = set()
-    if _result_questions is None:
-        _result_questions = []
-
     if not isinstance(num_to_select, int) or num_to_select < 0:
         raise ValueError("Number of questions to select must be a non-negative integer.")
     if num_to_select > len(all_questions):
         raise ValueError("Cannot select more questions than available.")
 
-    # Base Case 1: If we have selected enough questions
-    if len(_result_questions) == num_to_select:
-        return _result_questions
-
-    # Base Case 2: If no more unique questions are available but we still need more
-    if len(_selected_indices) == len(all_questions):
-        # We've exhausted all questions but haven't met num_to_select
-        # This can happen if num_to_select was greater than actual unique questions
-        return _result_questions # Return what we could select
-
-    # Recursive Step: Select a random unique question
-    available_to_pick_indices = [i for i in range(len(all_questions)) if i not in _selected_indices]
-
-    if not available_to_pick_indices:
-        # No more unselected questions (should be caught by Base Case 2, but for robustness)
-        return _result_questions
-
-    # Randomly pick one index from the remaining available questions
-    chosen_index = random.choice(available_to_pick_indices)
-    
-    # Add the chosen index to the set of selected indices
-    _selected_indices.add(chosen_index)
-    
-    # Add the corresponding question object to our result list
-    _result_questions.append(all_questions[chosen_index])
-
-    # Recursive call: try to select one less question
-    return select_unique_questions_recursive(
-        all_questions,
-        num_to_select,
-        _selected_indices=_selected_indices,
-        _result_questions=_result_questions
-    )
+    result = list(_result_questions) if _result_questions else []
+    excluded = _selected_indices or set()
+    candidates = [i for i in range(len(all_questions)) if i not in excluded] if excluded else None
+    available = len(candidates) if candidates is not None else len(all_questions)
+    # Jeśli zabraknie pytań, zwracamy tyle, ile udało się wybrać (jak wersja rekurencyjna)
+    missing = min(num_to_select - len(result), available)
+    for i in sample_indices(available, max(missing, 0)):
+        result.append(all_questions[candidates[i] if candidates is not None else i])
+    return result
 
 
 def timing_decorator(func):
     """
     A decorator that measures the execution time of a function.
     This demonstrates the use of decorators in Python.
+
+    When metrics are enabled (QUIZ_METRICS=1) every call is recorded in the latency
+    histogram of utils.metrics (with p50/p95/p99) instead of being printed; otherwise
+    the decorator prints one line per call, as before.
     """
+    if REGISTRY.enabled:
+        return REGISTRY.timed(func.__name__)(func)
+
     @wraps(func) # Zachowuje nazwę funkcji i docstring oryginalnej funkcji
     def wrapper(*args, **kwargs):
         start_time = time.perf_counter() # Precyzyjny pomiar czasu
@@ -214,45 +187,106 @@ def perform_factorial_calculation():
     """Funkcja pomocnicza do wykonania obliczeń silni (do testu wydajności)."""
     factorial_recursive(10) # Testujemy wydajność dla n=10
 
-def measure_function_performance(func_name: str, setup_code: str, num_runs: int = 100000) -> float:
+def measure_function_performance(func_name, setup_code: str = "pass", num_runs: int = 100000,
+                                 repeat: int = 1, verbose: bool = True) -> float:
     """
     Measures the execution time of a given function using timeit.
     This demonstrates performance testing using timeit.
 
     Args:
-        func_name (str): The name of the function to measure (as a string).
-        setup_code (str): Setup code for the timeit environment (e.g., imports).
+        func_name (str | callable): The name of the function to measure (as a string),
+                                    or a zero-argument callable (used by benchmarks/suite.py).
+        setup_code (str): Setup code for the timeit environment (e.g., imports); only
+                          used when func_name is a string. Defaults to "pass".
         num_runs (int): Number of times to execute the function for measurement.
+        repeat (int): Number of measurements; the fastest one is used, as it is the
+                      least disturbed by other processes. Defaults to 1.
+        verbose (bool): Print the result. Defaults to True.
 
     Returns:
         float: The average execution time in seconds.
     """
     # timeit.timeit wykonuje dany kod 'number' razy
     # setup to kod, który jest wykonywany raz przed pomiarem
-    time_taken = timeit.timeit(stmt=f"{func_name}()", setup=setup_code, number=num_runs)
+    if callable(func_name):
+        timer = timeit.Timer(func_name)
+        label = getattr(func_name, "__name__", repr(func_name))
+    else:
+        timer = timeit.Timer(stmt=f"{func_name}()", setup=setup_code)
+        label = func_name
+    time_taken = min(timer.repeat(repeat=repeat, number=num_runs))
     average_time = time_taken / num_runs
-    print(f"[{func_name}] Średni czas wykonania ({num_runs} przebiegów): {average_time:.6f} sekund")
+    if verbose:
+        print(f"[{label}] Średni czas wykonania ({num_runs} przebiegów): {average_time:.6f} sekund")
     return average_time
 
-# --- Przykład testu pamięci z memory_profiler ---
+# --- Przykład testu pamięci z tracemalloc ---
+
+def measure_memory(func, top: int = 5, frames: int = 1) -> tuple:
+    """
+    Measures the memory allocated by a function with tracemalloc snapshots.
+
+    Peak is the highest traced memory while the function ran; retained is what is still
+    allocated when it returns, while its result is kept alive (e.g. a loaded quiz).
+    The allocation sites are taken from the difference between snapshots taken before
+    and after the call.
+
+    Args:
+        func (callable): A zero-argument function to measure.
+        top (int): Number of allocation sites to report. Defaults to 5.
+        frames (int): Traceback depth stored per allocation (more is slower). Defaults to 1.
+
+    Returns:
+        tuple[object, dict]: The result of func and a report with 'peak_bytes',
+                             'retained_bytes' and 'top_sites' ('site', 'size_bytes', 'count').
+    """
+    gc.collect()
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start(frames)
+    try:
+        before = tracemalloc.take_snapshot()
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = func()
+        current, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    filters = [tracemalloc.Filter(False, tracemalloc.__file__)] # Bez alokacji samego tracemalloc
+    stats = after.filter_traces(filters).compare_to(before.filter_traces(filters), "lineno")
+    stats = sorted((stat for stat in stats if stat.size_diff > 0), key=lambda stat: stat.size_diff, reverse=True)
+    report = {
+        "peak_bytes": peak - baseline,
+        "retained_bytes": current - baseline,
+        "top_sites": [{"site": f"{os.path.relpath(stat.traceback[0].filename)}:{stat.traceback[0].lineno}",
+                       "size_bytes": stat.size_diff, "count": stat.count_diff}
+                      for stat in stats[:top]]
+    }
+    return result, report
 
-@profile # Dekorator z memory_profiler do mierzenia zużycia pamięci
 def generate_large_data(size_mb: int):
     """
     Generates a large list to demonstrate memory usage.
-    This function is used for memory profiling with memory_profiler.
+    The memory used is measured with tracemalloc (see measure_memory).
 
     Args:
         size_mb (int): Desired size of the data in megabytes.
+
+    Returns:
+        dict: The memory report of measure_memory().
     """
-    print(f"\n[memory_profiler] Generowanie danych o rozmiarze {size_mb} MB...")
+    print(f"\n[tracemalloc] Generowanie danych o rozmiarze {size_mb} MB...")
     # Każdy int w Pythonie zajmuje ok. 28 bajtów
     # 1 MB = 1024 * 1024 bajtów
     # Liczba intów potrzebna = size_mb * 1024 * 1024 / 28
     num_elements = int(size_mb * 1024 * 1024 / 28)
-    data = [i for i in range(num_elements)]
-    print(f"[memory_profiler] Wygenerowano listę z {len(data)} elementami.")
+    data, report = measure_memory(lambda: [i for i in range(num_elements)])
+    print(f"[tracemalloc] Wygenerowano listę z {len(data)} elementami "
+          f"(szczyt: {report['peak_bytes'] / 2 ** 20:.1f} MB).")
     # Zmienna 'data' zostanie usunięta po zakończeniu funkcji, zwalniając pamięć.
+    return report
 
 # --- Funkcja do demonstracji testu jakości kodu (Pylint) ---
 
@@ -0,0 +1,391 @@
+# quiz_project/utils/metrics.py
+"""
+In-process metrics: counters, gauges and fixed-bucket latency histograms.
+
+Metrics are collected only when the QUIZ_METRICS environment variable is set to 1.
+When disabled, timed() returns the decorated function unchanged and timer() returns a
+shared no-op context manager, so instrumented code pays practically nothing. When
+enabled, a Prometheus text file and a JSON snapshot are written to QUIZ_METRICS_DIRECTORY
+(default: data/metrics) when the process exits.
+"""
+import atexit
+import bisect
+import json
+import os
+import threading
+import time
+from functools import wraps
+
+METRICS_ENABLED = os.environ.get("QUIZ_METRICS", "0") == "1"
+METRICS_DIRECTORY = os.environ.get("QUIZ_METRICS_DIRECTORY", "data/metrics")
+PROMETHEUS_FILENAME = "metrics.prom"
+SNAPSHOT_FILENAME = "metrics.json"
+
+# Granice kubełków w sekundach: od 0.1 ms do 10 s, ok. 2.5 kubełka na rząd wielkości
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                   0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+class Counter:
+    """A monotonically increasing value, e.g. the number of saved quizzes."""
+
+    kind = "counter"
+
+    def __init__(self):
+        """Initializes the counter at 0."""
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1):
+        """Increases the counter."""
+        with self._lock:
+            self.value += amount
+
+    def snapshot(self) -> dict:
+        """Returns the current value as a dictionary."""
+        return {"value": self.value}
+
+
+class Gauge:
+    """A value that can go up and down, e.g. the number of queued charts."""
+
+    kind = "gauge"
+
+    def __init__(self):
+        """Initializes the gauge at 0."""
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def set(self, value: float):
+        """Sets the gauge."""
+        self.value = value
+
+    def inc(self, amount: float = 1):
+        """Increases (or, with a negative amount, decreases) the gauge."""
+        with self._lock:
+            self.value += amount
+
+    def snapshot(self) -> dict:
+        """Returns the current value as a dictionary."""
+        return {"value": self.value}
+
+
+class Histogram:
+    """
+    Distribution of observed values in fixed buckets.
+
+    Observing a value costs one binary search and one increment, and memory does not
+    grow with the number of observations. Quantiles are estimated by linear
+    interpolation inside the bucket holding the requested rank (as Prometheus'
+    histogram_quantile does), so they are exact up to the bucket width.
+
+    Attributes:
+        bounds (tuple[float]): Upper bounds of the buckets, ascending.
+    """
+
+    kind = "histogram"
+
+    def __init__(self, bounds: tuple = LATENCY_BUCKETS):
+        """
+        Initializes an empty histogram.
+
+        Args:
+            bounds (tuple[float]): Ascending upper bounds of the buckets. Defaults to LATENCY_BUCKETS.
+
+        Raises:
+            ValueError: If the bounds are empty or not strictly ascending.
+        """
+        if not bounds or any(a >= b for a, b in zip(bounds, bounds[1:])):
+            raise ValueError("Histogram bounds must be a non-empty, strictly ascending sequence.")
+        self.bounds = tuple(bounds)
+        self._counts = [0] * (len(self.bounds) + 1) # Ostatni kubełek: powyżej najwyższej granicy
+        self._sum = 0.0
+        self._count = 0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        """Records one value."""
+        bucket = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            self._counts[bucket] += 1
+            self._sum += value
+            self._count += 1
+            if value > self._max:
+                self._max = value
+
+    @property
+    def count(self) -> int:
+        """int: Number of observed values."""
+        return self._count
+
+    def quantile(self, q: float):
+        """
+        Estimates a quantile of the observed values.
+
+        Args:
+            q (float): The quantile, between 0 and 1.
+
+        Returns:
+            float | None: The estimate, or None when nothing was observed.
+        """
+        with self._lock:
+            counts, total, maximum = list(self._counts), self._count, self._max
+        if not total:
+            return None
+        rank = q * total
+        cumulative = 0
+        for bucket, count in enumerate(counts):
+            if count and cumulative + count >= rank:
+                lower = self.bounds[bucket - 1] if bucket else 0.0
+                upper = self.bounds[bucket] if bucket < len(self.bounds) else maximum
+                return min(lower + (upper - lower) * (rank - cumulative) / count, maximum)
+            cumulative += count
+        return maximum
+
+    def snapshot(self) -> dict:
+        """Returns count, sum, max, the p50/p95/p99 estimates and cumulative bucket counts."""
+        with self._lock:
+            counts, total, value_sum, maximum = list(self._counts), self._count, self._sum, self._max
+        cumulative, buckets = 0, []
+        for bound, count in zip(self.bounds + (float("inf"),), counts):
+            cumulative += count
+            buckets.append([bound, cumulative])
+        snapshot = {"count": total, "sum": value_sum, "max": maximum, "buckets": buckets}
+        for q in QUANTILES:
+            snapshot[f"p{round(q * 100)}"] = self.quantile(q)
+        return snapshot
+
+
+class _NullTimer:
+    """Context manager doing nothing; returned by timer() when metrics are disabled."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    """Context manager observing its duration (and counting failures) on exit."""
+
+    __slots__ = ("_histogram", "_errors", "_start")
+
+    def __init__(self, histogram: Histogram, errors: Counter):
+        """Initializes the timer with the metrics it updates."""
+        self._histogram = histogram
+        self._errors = errors
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._histogram.observe(time.perf_counter() - self._start)
+        if exc_type is not None:
+            self._errors.inc()
+        return False
+
+
+class MetricsRegistry:
+    """
+    A named collection of metrics with Prometheus and JSON export.
+
+    Metrics are identified by a name and optional labels, e.g.
+    registry.histogram("quiz_operation_seconds", operation="load_quiz"), and are created
+    on first use.
+
+    Attributes:
+        enabled (bool): Whether instrumentation records anything.
+    """
+
+    def __init__(self, enabled: bool = True):
+        """
+        Initializes an empty registry.
+
+        Args:
+            enabled (bool): Whether instrumentation records anything. Defaults to True.
+        """
+        self.enabled = enabled
+        self._metrics = {}
+        self._help = {}
+        self._lock = threading.Lock()
+
+    def _get(self, metric_class, name: str, labels: dict, help_text: str):
+        """Returns the metric with a name and labels, creating it when missing."""
+        key = (name, tuple(sorted(labels.items())))
+        metric = self._metrics.get(key)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(key)
+                if metric is None:
+                    metric = self._metrics[key] = metric_class()
+                    if help_text:
+                        self._help.setdefault(name, help_text)
+        if not isinstance(metric, metric_class):
+            raise ValueError(f"Metric '{name}' is already registered as a {metric.kind}.")
+        return metric
+
+    def counter(self, name: str, help_text: str = "", **labels) -> Counter:
+        """Returns (creating on first use) a counter."""
+        return self._get(Counter, name, labels, help_text)
+
+    def gauge(self, name: str, help_text: str = "", **labels) -> Gauge:
+        """Returns (creating on first use) a gauge."""
+        return self._get(Gauge, name, labels, help_text)
+
+    def histogram(self, name: str, help_text: str = "", **labels) -> Histogram:
+        """Returns (creating on first use) a latency histogram with LATENCY_BUCKETS."""
+        return self._get(Histogram, name, labels, help_text)
+
+    def timer(self, operation: str):
+        """
+        Returns a context manager timing a block of code as an operation.
+
+        The duration is observed in the histogram 'quiz_operation_seconds' and exceptions
+        are counted in 'quiz_operation_errors_total', both labelled with the operation.
+
+        Args:
+            operation (str): Name of the operation, e.g. "load_quiz".
+
+        Returns:
+            A context manager (a shared no-op one when the registry is disabled).
+        """
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self.histogram("quiz_operation_seconds", "Duration of operations.", operation=operation),
+                      self.counter("quiz_operation_errors_total", "Operations that raised.", operation=operation))
+
+    def timed(self, operation: str = None):
+        """
+        Decorator timing every call of a function (see timer()).
+
+        When the registry is disabled the function is returned unchanged, so the
+        decorator costs nothing at call time.
+
+        Args:
+            operation (str, optional): Name of the operation. Defaults to the function name.
+
+        Returns:
+            callable: The decorator.
+        """
+        def decorator(func):
+            if not self.enabled:
+                return func
+            histogram = self.histogram("quiz_operation_seconds", "Duration of operations.",
+                                       operation=operation or func.__name__)
+            errors = self.counter("quiz_operation_errors_total", "Operations that raised.",
+                                  operation=operation or func.__name__)
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                with _Timer(histogram, errors):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def snapshot(self) -> dict:
+        """
+        Returns the current values of all metrics.
+
+        Returns:
+            dict: Metric name -> list of {"labels": {...}, "type": ..., **values}.
+        """
+        with self._lock:
+            items = sorted(self._metrics.items())
+        snapshot = {}
+        for (name, labels), metric in items:
+            snapshot.setdefault(name, []).append({"labels": dict(labels), "type": metric.kind, **metric.snapshot()})
+        return snapshot
+
+    def to_prometheus(self) -> str:
+        """
+        Formats all metrics in the Prometheus text exposition format. Histograms are
+        exported with their cumulative buckets, _sum and _count.
+
+        Returns:
+            str: The exposition text.
+        """
+        lines = []
+        for name, series in self.snapshot().items():
+            if name in self._help:
+                lines.append(f"# HELP {name} {self._help[name]}")
+            lines.append(f"# TYPE {name} {series[0]['type']}")
+            for entry in series:
+                labels = entry["labels"]
+                if entry["type"] != "histogram":
+                    lines.append(f"{name}{_format_labels(labels)} {entry['value']}")
+                    continue
+                for bound, cumulative in entry["buckets"]:
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f"{name}_bucket{_format_labels({**labels, 'le': le})} {cumulative}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {entry['sum']}")
+                lines.append(f"{name}_count{_format_labels(labels)} {entry['count']}")
+        return "\n".join(lines) + "\n"
+
+    def export(self, directory: str = None) -> tuple[str, str]:
+        """
+        Atomically writes the Prometheus text file and the JSON snapshot.
+
+        Args:
+            directory (str, optional): Destination directory. Defaults to METRICS_DIRECTORY.
+
+        Returns:
+            tuple[str, str]: Paths of the Prometheus file and of the JSON snapshot.
+        """
+        directory = directory or METRICS_DIRECTORY
+        os.makedirs(directory, exist_ok=True)
+        snapshot = self.snapshot()
+        for filename in (PROMETHEUS_FILENAME, SNAPSHOT_FILENAME):
+            tmp_path = os.path.join(directory, f"{filename}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                if filename == PROMETHEUS_FILENAME:
+                    f.write(self.to_prometheus())
+                else:
+                    # Nieskończoność (kubełek +Inf) zapisujemy jako null - JSON jej nie obsługuje
+                    json.dump(_json_safe(snapshot), f, indent=4)
+            os.replace(tmp_path, os.path.join(directory, filename))
+        return os.path.join(directory, PROMETHEUS_FILENAME), os.path.join(directory, SNAPSHOT_FILENAME)
+
+
+def _format_labels(labels: dict) -> str:
+    """Formats labels as {key="value",...} (empty for no labels)."""
+    if not labels:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for value in labels.values())
+    return "{" + ",".join(f'{key}="{value}"' for key, value in zip(labels, escaped)) + "}"
+
+
+def _json_safe(value):
+    """Replaces infinite floats (the +Inf bucket bound) with None for JSON output."""
+    if isinstance(value, float) and value == float("inf"):
+        return None
+    if isinstance(value, dict):
+        return {key: _json_safe(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_json_safe(item) for item in value]
+    return value
+
+
+# Rejestr procesu; moduły aplikacji używają funkcji poniżej
+REGISTRY = MetricsRegistry(enabled=METRICS_ENABLED)
+timed = REGISTRY.timed
+timer = REGISTRY.timer
+
+
+def _export_at_exit():
+    """Writes the metrics of this process when it exits (only if anything was recorded)."""
+    if REGISTRY.snapshot():
+        try:
+            REGISTRY.export()
+        except OSError as e:
+            print(f"Nie udało się zapisać metryk: {e}")
+
+
+if METRICS_ENABLED:
+    atexit.register(_export_at_exit)
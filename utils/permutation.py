@@ -0,0 +1,124 @@
+# quiz_project/utils/permutation.py
+import hashlib
+
+_MIX_MULTIPLIER = 0xBF58476D1CE4E5B9
+_MASK_64 = (1 << 64) - 1
+
+
+class FeistelPermutation:
+    """
+    A keyed, bijective permutation of range(size) that uses O(1) memory.
+
+    Instead of copying and shuffling a list, the position of every element is computed
+    on demand with a small balanced Feistel network over the bits of the index. Indices
+    that fall outside range(size) are mapped again ("cycle walking") until they land
+    inside it, which keeps the mapping a bijection for any size. The same key always
+    produces the same order, so a session can be replayed from its seed.
+
+    The permutation behaves like a read-only sequence: perm[i] is the original index
+    shown at position i, and perm.index(original) inverts the mapping.
+
+    Attributes:
+        size (int): Number of elements being permuted.
+    """
+
+    __slots__ = ("size", "_half_bits", "_half_mask", "_round_keys")
+
+    def __init__(self, size: int, key, rounds: int = 4):
+        """
+        Initializes the permutation.
+
+        Args:
+            size (int): Number of elements (must be non-negative).
+            key: Any value with a stable repr (int, str, tuple) selecting the permutation.
+            rounds (int): Number of Feistel rounds. Defaults to 4.
+
+        Raises:
+            ValueError: If size is negative or rounds is not positive.
+        """
+        if not isinstance(size, int) or size < 0:
+            raise ValueError("Permutation size must be a non-negative integer.")
+        if rounds < 1:
+            raise ValueError("Number of rounds must be positive.")
+        self.size = size
+        # Dziedzina sieci to 2^(2*half_bits) >= size, więc cycle walking wykonuje średnio < 4 kroki
+        self._half_bits = max(1, ((size - 1).bit_length() + 1) // 2) if size > 1 else 1
+        self._half_mask = (1 << self._half_bits) - 1
+        digest = hashlib.blake2b(repr(key).encode('utf-8'), digest_size=8 * rounds).digest()
+        self._round_keys = tuple(int.from_bytes(digest[8 * r:8 * r + 8], 'big') for r in range(rounds))
+
+    def _round(self, value: int, round_key: int) -> int:
+        """Round function: a cheap 64-bit mix of the half block and the round key."""
+        x = (value ^ round_key) & _MASK_64
+        x = ((x ^ (x >> 30)) * _MIX_MULTIPLIER) & _MASK_64
+        x ^= x >> 27
+        return x & self._half_mask
+
+    def _encrypt(self, value: int) -> int:
+        """Maps a value of the 2*half_bits domain forward through the Feistel rounds."""
+        left, right = value >> self._half_bits, value & self._half_mask
+        for round_key in self._round_keys:
+            left, right = right, left ^ self._round(right, round_key)
+        return (left << self._half_bits) | right
+
+    def _decrypt(self, value: int) -> int:
+        """Inverse of _encrypt()."""
+        left, right = value >> self._half_bits, value & self._half_mask
+        for round_key in reversed(self._round_keys):
+            left, right = right ^ self._round(left, round_key), left
+        return (left << self._half_bits) | right
+
+    def __len__(self) -> int:
+        """Returns the number of permuted elements."""
+        return self.size
+
+    def __getitem__(self, position: int) -> int:
+        """
+        Returns the original index placed at a position.
+
+        Args:
+            position (int): Position in the permuted order (negative values count from the end).
+
+        Returns:
+            int: The original index.
+
+        Raises:
+            IndexError: If the position is out of range.
+        """
+        if position < 0:
+            position += self.size
+        if not 0 <= position < self.size:
+            raise IndexError("Permutation index out of range.")
+        value = self._encrypt(position)
+        while value >= self.size:
+            value = self._encrypt(value)
+        return value
+
+    def index(self, original: int) -> int:
+        """
+        Returns the position at which an original index is placed (inverse mapping).
+
+        Args:
+            original (int): The original index.
+
+        Returns:
+            int: Its position in the permuted order.
+
+        Raises:
+            ValueError: If the index is outside range(size).
+        """
+        if not 0 <= original < self.size:
+            raise ValueError("Value is not part of the permutation.")
+        value = self._decrypt(original)
+        while value >= self.size:
+            value = self._decrypt(value)
+        return value
+
+    def __iter__(self):
+        """Yields the original indices in permuted order without materializing a list."""
+        for position in range(self.size):
+            yield self[position]
+
+    def __repr__(self):
+        """Returns an official string representation of the permutation for debugging."""
+        return f"FeistelPermutation(size={self.size})"
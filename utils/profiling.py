@@ -0,0 +1,294 @@
+# quiz_project/utils/profiling.py
+"""
+Built-in profiling of commands and interactive sessions.
+
+Two profilers are available:
+    cprofile - deterministic cProfile; writes a pstats file (<label>-<time>-<pid>.prof).
+    sample   - a sampling profiler running on a background thread that periodically
+               captures the stack of the profiled thread (sys._current_frames). Writes
+               flamegraph-compatible collapsed stacks (.collapsed, one "a;b;c weight"
+               line per stack, weights in microseconds of wall time) and a pstats file
+               synthesized from the samples, so both can be inspected with the same tools.
+
+The sampler keeps its own cost within an overhead budget: whenever the time spent taking
+samples exceeds the budget fraction of the elapsed time, the interval is doubled.
+
+Profiling is enabled with main.py --profile or, for long-running processes, with the
+QUIZ_PROFILE environment variable ('cprofile' or 'sample'). Further settings:
+QUIZ_PROFILE_DIRECTORY (default: data/profiles), QUIZ_PROFILE_INTERVAL (sampling interval
+in seconds, default 0.005) and QUIZ_PROFILE_BUDGET (overhead budget, default 0.02 = 2%).
+"""
+import contextlib
+import cProfile
+import marshal
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+PROFILE_MODE = os.environ.get("QUIZ_PROFILE", "").lower()
+PROFILE_DIRECTORY = os.environ.get("QUIZ_PROFILE_DIRECTORY", "data/profiles")
+PROFILE_INTERVAL = float(os.environ.get("QUIZ_PROFILE_INTERVAL", "0.005"))
+PROFILE_BUDGET = float(os.environ.get("QUIZ_PROFILE_BUDGET", "0.02"))
+PROFILE_MODES = ("cprofile", "sample")
+
+MAX_INTERVAL = 1.0 # Górna granica odstępu próbek przy przekroczonym budżecie narzutu
+MIN_BUDGET_SAMPLES = 10 # Budżet sprawdzamy dopiero po kilku próbkach (pierwsze są droższe)
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+def _output_path(directory: str, label: str, extension: str, stamp: str) -> str:
+    """Returns the path of a profile file."""
+    return os.path.join(directory, f"{label}-{stamp}-{os.getpid()}.{extension}")
+
+
+class CProfileProfiler:
+    """Deterministic profiler based on cProfile."""
+
+    mode = "cprofile"
+
+    def __init__(self):
+        """Initializes the profiler."""
+        self._profile = cProfile.Profile()
+
+    def start(self):
+        """Starts profiling the calling thread."""
+        self._profile.enable()
+
+    def stop(self):
+        """Stops profiling."""
+        self._profile.disable()
+
+    def write(self, directory: str, label: str, stamp: str) -> list:
+        """Writes the pstats file and returns its path in a list."""
+        path = _output_path(directory, label, "prof", stamp)
+        self._profile.dump_stats(path)
+        return [path]
+
+    def summary(self) -> str:
+        """Returns a one-line description of the profile."""
+        return "cProfile"
+
+
+class SamplingProfiler:
+    """
+    Sampling profiler: a background thread captures the stack of the profiled thread
+    every 'interval' seconds.
+
+    Attributes:
+        interval (float): Requested sampling interval in seconds.
+        budget (float): Maximum fraction of wall time spent taking samples.
+        stacks (Counter): Wall time in seconds per stack (a tuple of frame keys, root first).
+        stack_samples (Counter): Number of samples per stack.
+        samples (int): Number of samples taken.
+        sampling_seconds (float): Time spent taking samples.
+        effective_interval (float): Interval in use when sampling stopped (after back-offs).
+    """
+
+    mode = "sample"
+
+    def __init__(self, interval: float = None, budget: float = None):
+        """
+        Initializes the profiler.
+
+        Args:
+            interval (float, optional): Sampling interval in seconds. Defaults to QUIZ_PROFILE_INTERVAL.
+            budget (float, optional): Overhead budget (0-1). Defaults to QUIZ_PROFILE_BUDGET.
+
+        Raises:
+            ValueError: If the interval or the budget is not positive.
+        """
+        self.interval = interval or PROFILE_INTERVAL
+        self.budget = budget or PROFILE_BUDGET
+        if self.interval <= 0 or self.budget <= 0:
+            raise ValueError("The sampling interval and the overhead budget must be positive.")
+        self.stacks = Counter()
+        self.stack_samples = Counter()
+        self.samples = 0
+        self.sampling_seconds = 0.0
+        self.effective_interval = self.interval
+        self.wall_seconds = 0.0
+        self._target = None
+        self._stopped = threading.Event()
+        self._thread = None
+        self._switch_interval = None
+
+    def start(self):
+        """
+        Starts sampling the calling thread.
+
+        The interpreter's thread switch interval (5 ms by default) is lowered to the
+        sampling interval while sampling, otherwise the sampler thread could not wake up
+        more often than that while the profiled thread holds the GIL.
+        """
+        self._target = threading.get_ident()
+        self._stopped.clear()
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._switch_interval, self.interval))
+        self._thread = threading.Thread(target=self._run, name="quiz-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stops sampling, waits for the sampler thread and restores the switch interval."""
+        self._stopped.set()
+        self._thread.join()
+        sys.setswitchinterval(self._switch_interval)
+
+    def _run(self):
+        """Sampler loop."""
+        interval = self.interval
+        started = last = time.perf_counter()
+        while not self._stopped.wait(interval):
+            now = time.perf_counter()
+            frame = sys._current_frames().get(self._target)
+            if frame is None: # Profilowany wątek się zakończył
+                break
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+                frame = frame.f_back
+            stack = tuple(reversed(stack))
+            # Waga próbki to rzeczywisty czas od poprzedniej (odporne na opóźnienia wątku)
+            self.stacks[stack] += now - last
+            self.stack_samples[stack] += 1
+            self.samples += 1
+            last = time.perf_counter()
+            self.sampling_seconds += last - now
+            if (self.samples >= MIN_BUDGET_SAMPLES and interval < MAX_INTERVAL
+                    and self.sampling_seconds > self.budget * (last - started)):
+                interval = min(interval * 2, MAX_INTERVAL)
+        self.effective_interval = interval
+        self.wall_seconds = time.perf_counter() - started
+
+    @staticmethod
+    def frame_label(key: tuple) -> str:
+        """Returns the collapsed-stack label of a frame key (no ';', paths relative to the project)."""
+        filename, line, name = key
+        if filename.startswith(_PROJECT_ROOT):
+            filename = os.path.relpath(filename, _PROJECT_ROOT)
+        else:
+            filename = os.path.basename(filename)
+        return f"{name} ({filename}:{line})".replace(";", ",")
+
+    def collapsed(self) -> list:
+        """
+        Returns the collapsed stacks.
+
+        Returns:
+            list[str]: Lines "frame;frame;frame weight" (weight in microseconds), heaviest first.
+        """
+        lines = []
+        for stack, seconds in self.stacks.most_common():
+            weight = round(seconds * 1e6)
+            if weight:
+                lines.append(";".join(self.frame_label(key) for key in stack) + f" {weight}")
+        return lines
+
+    def pstats_data(self) -> dict:
+        """
+        Builds pstats data from the samples: self time of the leaf frame, cumulative time
+        of every frame on the stack (counted once per sample) and caller edges. Call counts
+        are numbers of samples.
+
+        Returns:
+            dict: {(file, line, name): (cc, nc, tt, ct, callers)}, the format read by pstats.Stats.
+        """
+        stats = {}
+        for stack, seconds in self.stacks.items():
+            count = self.stack_samples[stack]
+            seen = set()
+            for depth, key in enumerate(stack):
+                cc, nc, tt, ct, callers = stats.get(key, (0, 0, 0.0, 0.0, {}))
+                leaf = depth == len(stack) - 1
+                first = key not in seen # Rekurencja: czas łączny liczymy raz na próbkę
+                seen.add(key)
+                if depth:
+                    c_cc, c_nc, c_tt, c_ct = callers.get(stack[depth - 1], (0, 0, 0.0, 0.0))
+                    callers[stack[depth - 1]] = (c_cc + count, c_nc + count, c_tt + (seconds if leaf else 0.0),
+                                                 c_ct + seconds)
+                stats[key] = (cc + (count if first else 0), nc + count, tt + (seconds if leaf else 0.0),
+                              ct + (seconds if first else 0.0), callers)
+        return stats
+
+    def write(self, directory: str, label: str, stamp: str) -> list:
+        """Writes the collapsed stacks and the pstats file; returns their paths."""
+        collapsed_path = _output_path(directory, label, "collapsed", stamp)
+        with open(collapsed_path, 'w', encoding='utf-8') as f:
+            f.writelines(line + "\n" for line in self.collapsed())
+        pstats_path = _output_path(directory, label, "prof", stamp)
+        with open(pstats_path, 'wb') as f:
+            marshal.dump(self.pstats_data(), f)
+        return [collapsed_path, pstats_path]
+
+    def overhead(self) -> float:
+        """Returns the fraction of wall time spent taking samples."""
+        return self.sampling_seconds / self.wall_seconds if self.wall_seconds else 0.0
+
+    def summary(self) -> str:
+        """Returns a one-line description of the profile."""
+        return (f"{self.samples} próbek, odstęp {self.effective_interval * 1000:g} ms, "
+                f"narzut {self.overhead():.2%}")
+
+
+def get_profiler(mode: str, interval: float = None, budget: float = None):
+    """
+    Creates a profiler.
+
+    Args:
+        mode (str): 'cprofile' or 'sample'.
+        interval (float, optional): Sampling interval (sampling profiler only).
+        budget (float, optional): Overhead budget (sampling profiler only).
+
+    Returns:
+        CProfileProfiler | SamplingProfiler: The profiler (not started).
+
+    Raises:
+        ValueError: If the mode is unknown.
+    """
+    if mode == "cprofile":
+        return CProfileProfiler()
+    if mode == "sample":
+        return SamplingProfiler(interval, budget)
+    raise ValueError(f"Unknown profiling mode: {mode} (expected one of: {', '.join(PROFILE_MODES)})")
+
+
+@contextlib.contextmanager
+def profiled(label: str, mode: str = None, directory: str = None, interval: float = None, budget: float = None):
+    """
+    Profiles the code in a with block and writes the profile files when it ends.
+
+    Does nothing when no mode is given and QUIZ_PROFILE is not set.
+
+    Args:
+        label (str): Name of the command or session, used in the file names.
+        mode (str, optional): 'cprofile' or 'sample'. Defaults to QUIZ_PROFILE.
+        directory (str, optional): Output directory. Defaults to QUIZ_PROFILE_DIRECTORY.
+        interval (float, optional): Sampling interval in seconds.
+        budget (float, optional): Overhead budget of the sampling profiler.
+
+    Yields:
+        The running profiler, or None when profiling is disabled.
+
+    Raises:
+        ValueError: If the mode is unknown.
+    """
+    mode = mode or PROFILE_MODE
+    if not mode:
+        yield None
+        return
+    profiler = get_profiler(mode, interval, budget)
+    directory = directory or PROFILE_DIRECTORY
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        try:
+            os.makedirs(directory, exist_ok=True)
+            paths = profiler.write(directory, label, stamp)
+            print(f"Profil '{label}' ({profiler.summary()}) zapisano w: {', '.join(paths)}", file=sys.stderr)
+        except OSError as e:
+            print(f"Nie udało się zapisać profilu: {e}", file=sys.stderr)
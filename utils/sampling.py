@@ -0,0 +1,155 @@
+# quiz_project/utils/sampling.py
+"""
+Random sampling helpers for drawing questions from (possibly very large) question banks.
+
+All functions accept a 'rng' (random.Random) so draws can be reproduced from a seed.
+"""
+import math
+import random
+
+_END = object() # Znacznik końca strumienia
+
+
+def make_rng(seed=None) -> random.Random:
+    """
+    Creates an independent random generator.
+
+    Args:
+        seed (int | str, optional): Seed for reproducible draws. None seeds from the OS.
+
+    Returns:
+        random.Random: The generator.
+    """
+    return random.Random(seed)
+
+
+def _check_sample_size(population_size: int, k: int):
+    """Validates the arguments shared by the index samplers."""
+    if not isinstance(k, int) or k < 0:
+        raise ValueError("Number of questions to select must be a non-negative integer.")
+    if k > population_size:
+        raise ValueError("Cannot select more questions than available.")
+
+
+def floyd_sample(population_size: int, k: int, rng: random.Random = None) -> set[int]:
+    """
+    Selects k distinct indices from range(population_size) using Robert Floyd's algorithm.
+
+    Runs in O(k) time and memory regardless of the population size. The result is an
+    unordered set; use sample_indices() when a random order is needed as well.
+
+    Args:
+        population_size (int): Size of the population.
+        k (int): Number of indices to select.
+        rng (random.Random, optional): Random generator. Defaults to the module generator.
+
+    Returns:
+        set[int]: k distinct indices.
+
+    Raises:
+        ValueError: If k is negative or greater than population_size.
+    """
+    _check_sample_size(population_size, k)
+    rng = rng or random
+    selected = set()
+    for j in range(population_size - k, population_size):
+        candidate = rng.randint(0, j)
+        selected.add(j if candidate in selected else candidate)
+    return selected
+
+
+def sample_indices(population_size: int, k: int, rng: random.Random = None) -> list[int]:
+    """
+    Selects k distinct indices in random order with a sparse partial Fisher-Yates shuffle.
+
+    Only the swapped positions are remembered (in a dictionary), so the cost is O(k)
+    time and memory even for populations of millions of questions.
+
+    Args:
+        population_size (int): Size of the population.
+        k (int): Number of indices to select.
+        rng (random.Random, optional): Random generator. Defaults to the module generator.
+
+    Returns:
+        list[int]: k distinct indices in random order.
+
+    Raises:
+        ValueError: If k is negative or greater than population_size.
+    """
+    _check_sample_size(population_size, k)
+    rng = rng or random
+    swapped = {} # Pozycja -> wartość, tylko dla pozycji zmienionych przez zamiany
+    result = []
+    for i in range(k):
+        j = rng.randrange(i, population_size)
+        value_j = swapped.get(j, j)
+        swapped[j] = swapped.get(i, i)
+        result.append(value_j)
+    return result
+
+
+def reservoir_sample(items, k: int, rng: random.Random = None) -> list:
+    """
+    Selects k items uniformly from a stream of unknown length (reservoir sampling, Algorithm L).
+
+    Only the reservoir is kept in memory, and the generator skips over items instead of
+    drawing a random number for each one, so long streams are consumed quickly.
+
+    Args:
+        items (iterable): The stream of items (e.g. questions read file by file).
+        k (int): Reservoir size.
+        rng (random.Random, optional): Random generator. Defaults to the module generator.
+
+    Returns:
+        list: Up to k items (fewer if the stream is shorter), in random order.
+
+    Raises:
+        ValueError: If k is negative.
+    """
+    if not isinstance(k, int) or k < 0:
+        raise ValueError("Reservoir size must be a non-negative integer.")
+    rng = rng or random
+    if k == 0:
+        return []
+    iterator = iter(items)
+    reservoir = []
+    for item in iterator:
+        reservoir.append(item)
+        if len(reservoir) == k:
+            break
+    if len(reservoir) < k:
+        rng.shuffle(reservoir)
+        return reservoir
+
+    # 1 - rng.random() należy do (0, 1], więc logarytm jest zawsze określony
+    w = math.exp(math.log(1.0 - rng.random()) / k)
+    while True:
+        skip = int(math.log(1.0 - rng.random()) / math.log(1.0 - w)) if w < 1.0 else 0
+        for _ in range(skip):
+            if next(iterator, _END) is _END:
+                rng.shuffle(reservoir)
+                return reservoir
+        item = next(iterator, _END)
+        if item is _END:
+            rng.shuffle(reservoir)
+            return reservoir
+        reservoir[rng.randrange(k)] = item
+        w *= math.exp(math.log(1.0 - rng.random()) / k)
+
+
+def sample_questions(questions: list, k: int, seed=None) -> list:
+    """
+    Draws k distinct questions in random order, reproducibly for a given seed.
+
+    Args:
+        questions (list): The question bank.
+        k (int): Number of questions to draw.
+        seed (int | str, optional): Seed; the same seed and bank always give the same draw.
+
+    Returns:
+        list: The drawn questions.
+
+    Raises:
+        ValueError: If k is negative or greater than the number of questions.
+    """
+    return [questions[i] for i in sample_indices(len(questions), k, make_rng(seed))]
@@ -0,0 +1,143 @@
+# quiz_project/utils/text.py
+"""
+Normalization and matching of typed (free-text) answers, and tokenization for search.
+"""
+import re
+import unicodedata
+from functools import lru_cache
+
+# Litery, których NFKD nie rozkłada na literę bazową i znak diakrytyczny
+_EXTRA_FOLDS = str.maketrans({"ł": "l", "đ": "d", "ø": "o", "ß": "ss", "æ": "ae", "œ": "oe"})
+
+
+def normalize_answer(text: str) -> str:
+    """
+    Normalizes an answer for comparison: case folding, diacritic folding (including
+    Polish letters such as 'ł' and 'ż') and collapsing of whitespace.
+
+    Args:
+        text (str): The answer as typed or as written in the quiz file.
+
+    Returns:
+        str: The normalized answer, e.g. "  Żółta   Łódź " -> "zolta lodz".
+    """
+    folded = text.casefold().translate(_EXTRA_FOLDS)
+    if not folded.isascii():
+        folded = "".join(ch for ch in unicodedata.normalize("NFKD", folded) if not unicodedata.combining(ch))
+    return " ".join(folded.split())
+
+
+def _fold_pattern(pattern: str) -> str:
+    """
+    Folds the non-ASCII letters of an answer pattern the way normalize_answer() folds
+    answers. ASCII characters are kept as written: they include regex syntax such as
+    '\\W', and their case is already ignored by the compiled expression.
+    """
+    if pattern.isascii():
+        return pattern
+    return "".join(ch if ch.isascii() or ch.isspace() else normalize_answer(ch) for ch in pattern)
+
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+# Najczęstsze polskie słowa funkcyjne (po złożeniu znaków diakrytycznych) - nie niosą treści
+STOPWORDS = frozenset("""
+a aby ale bo by co czy dla do go i ich ile im jak jaka jaki jakie jakiego jakim jako jest
+ktora ktore ktory ktorego ktorym lub ma mi na nie niz o od oraz po pod przez przy sa sie
+ta tak te tego to tu w we z za ze
+""".split())
+
+# Długość rdzenia: obcięcie końcówek fleksyjnych łączy np. "stolica", "stolicy", "stolicą"
+STEM_LENGTH = 6
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Splits text into search terms: normalized words without stopwords, truncated to a
+    common stem so that inflected Polish forms of a word produce the same term.
+
+    Args:
+        text (str): Question text, option or search query.
+
+    Returns:
+        list[str]: The terms in order of appearance (duplicates preserved).
+    """
+    return [word[:STEM_LENGTH] for word in _WORD_PATTERN.findall(normalize_answer(text))
+            if word not in STOPWORDS]
+
+
+@lru_cache(maxsize=256)
+def compile_answer_patterns(patterns: tuple):
+    """
+    Compiles answer patterns into a single regular expression.
+
+    Answers are matched in normalized form, so the letters of the patterns are folded
+    the same way: a pattern may be written as "łódź" or "lodz". The result is cached,
+    so quizzes (or questions) sharing the same patterns compile them only once per process.
+
+    Args:
+        patterns (tuple[str]): Regular expressions matched against normalized answers.
+
+    Returns:
+        re.Pattern | None: The combined pattern, or None when there are no patterns.
+
+    Raises:
+        ValueError: If a pattern is not a valid regular expression.
+    """
+    if not patterns:
+        return None
+    try:
+        return re.compile("|".join(f"(?:{_fold_pattern(pattern)})" for pattern in patterns), re.IGNORECASE)
+    except re.error as e:
+        raise ValueError(f"Invalid answer pattern: {e}") from e
+
+
+class AnswerMatcher:
+    """
+    Grades typed answers against a set of accepted answers and optional patterns.
+
+    Accepted answers are normalized once into a frozenset, so checking an answer is a
+    single set lookup regardless of how many variants are accepted; patterns are
+    combined into one precompiled expression tried only when the lookup misses.
+
+    Attributes:
+        accepted_answers (tuple[str]): Accepted answers as written in the quiz.
+        patterns (tuple[str]): Regular expressions matched against the whole normalized answer.
+    """
+
+    __slots__ = ("accepted_answers", "patterns", "_normalized", "_regex")
+
+    def __init__(self, accepted_answers, patterns=()):
+        """
+        Initializes the matcher.
+
+        Args:
+            accepted_answers (iterable[str]): Accepted answers.
+            patterns (iterable[str], optional): Regular expressions of further accepted answers.
+
+        Raises:
+            ValueError: If a pattern is invalid.
+        """
+        self.accepted_answers = tuple(accepted_answers)
+        self.patterns = tuple(patterns)
+        self._normalized = frozenset(normalize_answer(answer) for answer in self.accepted_answers)
+        self._regex = compile_answer_patterns(self.patterns)
+
+    def matches(self, answer: str) -> bool:
+        """
+        Checks a typed answer.
+
+        Args:
+            answer (str): The answer typed by the user.
+
+        Returns:
+            bool: True if the normalized answer is accepted.
+        """
+        normalized = normalize_answer(answer)
+        if normalized in self._normalized:
+            return True
+        return self._regex is not None and self._regex.fullmatch(normalized) is not None
+
+    def __repr__(self):
+        """Returns an official string representation of the matcher for debugging."""
+        return f"AnswerMatcher({list(self.accepted_answers)}, {list(self.patterns)})"
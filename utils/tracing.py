@@ -0,0 +1,224 @@
+# quiz_project/utils/tracing.py
+"""
+Lightweight tracing: nested spans with monotonic timestamps, exported as Chrome Trace
+Event JSON (open the file in chrome://tracing or https://ui.perfetto.dev).
+
+Tracing is enabled with the QUIZ_TRACE environment variable set to 1. Finished spans are
+kept in a ring buffer of QUIZ_TRACE_BUFFER spans (default 65536; the oldest are dropped)
+and written to QUIZ_TRACE_DIRECTORY (default: data/traces) when the process exits.
+When disabled, traced() returns the decorated function unchanged and span()/start_span()
+return a shared no-op span, so instrumented code pays practically nothing.
+"""
+import atexit
+import json
+import os
+import threading
+import time
+from collections import deque
+from functools import wraps
+
+TRACING_ENABLED = os.environ.get("QUIZ_TRACE", "0") == "1"
+TRACE_DIRECTORY = os.environ.get("QUIZ_TRACE_DIRECTORY", "data/traces")
+TRACE_BUFFER_SIZE = int(os.environ.get("QUIZ_TRACE_BUFFER", "65536"))
+
+
+class _NullSpan:
+    """Span doing nothing; returned when tracing is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+    def end(self):
+        """Does nothing."""
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """
+    A running span; recorded in the tracer's buffer when it ends.
+
+    Can be used as a context manager or ended explicitly with end().
+    """
+
+    __slots__ = ("_tracer", "name", "args", "start", "thread", "_ended")
+
+    def __init__(self, tracer, name: str, args: dict):
+        """Starts the span."""
+        self._tracer = tracer
+        self.name = name
+        self.args = args
+        self.thread = threading.get_ident()
+        self._ended = False
+        self.start = time.perf_counter_ns()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.end()
+        return False
+
+    def end(self):
+        """Ends the span (later calls do nothing)."""
+        if not self._ended:
+            self._ended = True
+            self._tracer._record(self.name, self.start, time.perf_counter_ns() - self.start, self.thread, self.args)
+
+
+class Tracer:
+    """
+    Records finished spans in a ring buffer and exports them as Chrome trace events.
+
+    Spans of one thread nest by their timestamps, so a span started inside another one
+    is shown below it on the timeline.
+
+    Attributes:
+        enabled (bool): Whether spans are recorded.
+        capacity (int): Maximum number of spans kept (the oldest are dropped).
+    """
+
+    def __init__(self, enabled: bool = True, capacity: int = TRACE_BUFFER_SIZE):
+        """
+        Initializes an empty tracer.
+
+        Args:
+            enabled (bool): Whether spans are recorded. Defaults to True.
+            capacity (int): Size of the ring buffer. Defaults to QUIZ_TRACE_BUFFER.
+
+        Raises:
+            ValueError: If the capacity is not positive.
+        """
+        if capacity < 1:
+            raise ValueError("The trace buffer capacity must be a positive integer.")
+        self.enabled = enabled
+        self.capacity = capacity
+        self._events = deque(maxlen=capacity) # Bufor cykliczny: najstarsze odcinki wypadają
+        self._recorded = 0
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter_ns()
+
+    def _record(self, name: str, start: int, duration: int, thread: int, args: dict):
+        """Appends a finished span to the ring buffer."""
+        with self._lock:
+            self._events.append((name, start, duration, thread, args))
+            self._recorded += 1
+
+    def span(self, name: str, **args):
+        """
+        Returns a context manager tracing a block of code.
+
+        Args:
+            name (str): Name of the span, e.g. "load_quiz".
+            **args: Values shown with the span (e.g. the question number).
+
+        Returns:
+            Span: The started span (a shared no-op span when tracing is disabled).
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return Span(self, name, args)
+
+    start_span = span # Dla odcinków kończonych jawnie przez end(), bez bloku with
+
+    def traced(self, name: str = None):
+        """
+        Decorator tracing every call of a function as a span.
+
+        When the tracer is disabled the function is returned unchanged.
+
+        Args:
+            name (str, optional): Name of the span. Defaults to the function name.
+
+        Returns:
+            callable: The decorator.
+        """
+        def decorator(func):
+            if not self.enabled:
+                return func
+            span_name = name or func.__name__
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                with Span(self, span_name, {}):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    @property
+    def dropped(self) -> int:
+        """Number of spans dropped from the full ring buffer."""
+        with self._lock:
+            return self._recorded - len(self._events)
+
+    def clear(self):
+        """Removes all recorded spans."""
+        with self._lock:
+            self._events.clear()
+            self._recorded = 0
+
+    def to_chrome_trace(self) -> dict:
+        """
+        Returns the recorded spans in the Chrome Trace Event format: complete ("X") events
+        with timestamps and durations in microseconds since the tracer was created.
+
+        Returns:
+            dict: {"traceEvents": [...], "displayTimeUnit": "ms", "otherData": {...}}.
+        """
+        pid = os.getpid()
+        events = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": "quiz"}}]
+        threads = {}
+        with self._lock:
+            recorded = list(self._events)
+        for name, start, duration, thread, args in recorded:
+            tid = threads.setdefault(thread, len(threads) + 1) # Krótkie, stabilne numery wątków
+            event = {"name": name, "cat": "quiz", "ph": "X", "pid": pid, "tid": tid,
+                     "ts": (start - self._origin) / 1000, "dur": duration / 1000}
+            if args:
+                event["args"] = args
+            events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms", "otherData": {"dropped_spans": self.dropped}}
+
+    def export(self, directory: str = None) -> str:
+        """
+        Writes the Chrome trace JSON file.
+
+        Args:
+            directory (str, optional): Target directory. Defaults to QUIZ_TRACE_DIRECTORY.
+
+        Returns:
+            str: Path of the written file.
+        """
+        directory = directory or TRACE_DIRECTORY
+        os.makedirs(directory, exist_ok=True)
+        file_path = os.path.join(directory, f"trace-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}.json")
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_chrome_trace(), f, ensure_ascii=False, default=str)
+        return file_path
+
+
+TRACER = Tracer(enabled=TRACING_ENABLED)
+span = TRACER.span
+start_span = TRACER.start_span
+traced = TRACER.traced
+
+
+def _export_at_exit():
+    """Writes the trace of this process when it exits (only if anything was recorded)."""
+    if TRACER._events:
+        try:
+            TRACER.export()
+        except OSError as e:
+            print(f"Nie udało się zapisać śladu: {e}")
+
+
+if TRACING_ENABLED:
+    atexit.register(_export_at_exit)